@@ -0,0 +1,127 @@
+-- Migration 035: Server-side season aggregates for the projection runner.
+--
+-- Every target season, `run_models` / `collect_training_data` reduce the
+-- history window (thousands of player_stats / nfl_stats rows) to per-team
+-- usage totals and per-position PPG baselines, and `available_model_seasons`
+-- pages every model_projections / player_stats row just to list distinct
+-- seasons. These functions return the reductions themselves — tens of rows —
+-- over PostgREST RPC (`supabase.rpc(...)`). The Python reductions in
+-- `scripts/feature_projections/season_aggregates.py` compute the same frames
+-- and remain the fallback when these functions are not deployed.
+--
+-- NULL semantics match the typed frames the Python path reads: NULL
+-- games_played / ppg / counting stats count as 0.
+--
+-- SECURITY INVOKER (the default): callers see only the rows RLS lets them
+-- read, exactly as with the equivalent table reads.
+
+-- Per (team, season) sums of fantasy points, targets and rushing attempts.
+-- Team = nfl_stats.recent_team when the window has any, else players.nfl_team.
+CREATE OR REPLACE FUNCTION public.team_season_totals(p_seasons integer[])
+RETURNS TABLE (
+  team text,
+  season integer,
+  total_points double precision,
+  targets bigint,
+  rushing_attempts bigint
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+  WITH window_rows AS (
+    SELECT n.season AS row_season, n.recent_team, p.nfl_team,
+           n.total_points AS row_points, n.targets AS row_targets,
+           n.rushing_attempts AS row_carries
+    FROM nfl_stats n
+    LEFT JOIN players p ON p.id = n.player_id
+    WHERE n.season = ANY (p_seasons)
+  ),
+  source AS (
+    SELECT coalesce(bool_or(recent_team IS NOT NULL), false) AS use_recent FROM window_rows
+  ),
+  labelled AS (
+    SELECT CASE WHEN s.use_recent THEN w.recent_team ELSE w.nfl_team END AS row_team, w.*
+    FROM window_rows w CROSS JOIN source s
+  )
+  SELECT l.row_team,
+         l.row_season,
+         sum(coalesce(l.row_points, 0))::double precision,
+         sum(coalesce(l.row_targets, 0))::bigint,
+         sum(coalesce(l.row_carries, 0))::bigint
+  FROM labelled l
+  WHERE l.row_team IS NOT NULL AND l.row_team <> ''
+  GROUP BY l.row_team, l.row_season
+  ORDER BY l.row_team, l.row_season;
+$$;
+
+-- Per-position statistics of per-player mean PPG over player-seasons with
+-- games_played >= p_min_games: mean of player means (positional mean), the
+-- p_starter_rank-th best player mean (starter floor; the minimum when the
+-- position has fewer players), and the empirical-Bayes pooling moments —
+-- mean within-player sample variance over players with 2+ seasons, sample
+-- variance of player means, and mean seasons per player.
+CREATE OR REPLACE FUNCTION public.position_ppg_moments(
+  p_seasons integer[],
+  p_min_games integer,
+  p_starter_rank integer DEFAULT 24
+)
+RETURNS TABLE (
+  "position" text,
+  n_players integer,
+  mean_ppg double precision,
+  starter_floor double precision,
+  within_var double precision,
+  n_within integer,
+  means_var double precision,
+  mean_seasons double precision
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+  WITH per_player AS (
+    SELECT pl.position AS pos,
+           s.player_id,
+           avg(coalesce(s.ppg, 0))::double precision AS player_mean,
+           var_samp(coalesce(s.ppg, 0))::double precision AS player_var,
+           count(*) AS player_seasons
+    FROM player_stats s
+    JOIN players pl ON pl.id = s.player_id
+    WHERE s.season = ANY (p_seasons)
+      AND coalesce(s.games_played, 0) >= p_min_games
+      AND pl.position IS NOT NULL
+    GROUP BY pl.position, s.player_id
+  ),
+  ranked AS (
+    SELECT pp.*,
+           row_number() OVER (PARTITION BY pp.pos ORDER BY pp.player_mean DESC) AS player_rank
+    FROM per_player pp
+  )
+  SELECT r.pos,
+         count(*)::integer,
+         avg(r.player_mean),
+         coalesce(max(r.player_mean) FILTER (WHERE r.player_rank = p_starter_rank),
+                  min(r.player_mean)),
+         avg(r.player_var) FILTER (WHERE r.player_seasons >= 2),
+         (count(*) FILTER (WHERE r.player_seasons >= 2))::integer,
+         var_samp(r.player_mean),
+         avg(r.player_seasons)::double precision
+  FROM ranked r
+  GROUP BY r.pos
+  ORDER BY r.pos;
+$$;
+
+-- Seasons with both model_projections for the model and player_stats actuals.
+CREATE OR REPLACE FUNCTION public.model_seasons_with_actuals(p_model_id uuid)
+RETURNS TABLE (season integer)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+  SELECT DISTINCT mp.season
+  FROM model_projections mp
+  WHERE mp.model_id = p_model_id
+    AND EXISTS (SELECT 1 FROM player_stats ps WHERE ps.season = mp.season)
+  ORDER BY mp.season DESC;
+$$;
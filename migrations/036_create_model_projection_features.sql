@@ -0,0 +1,75 @@
+-- Migration 036: Narrow, typed storage for model_projections.feature_values.
+--
+-- The runner wrote each projection's feature values as a json.dumps() string,
+-- so the jsonb column held a JSON *string* scalar and every reader
+-- (diagnostics, residual analysis, the web analysis page) re-parsed it row by
+-- row. This migration:
+--
+--   1. rewrites those string scalars as jsonb objects (the runner now sends
+--      the dict itself);
+--   2. adds model_projection_features — one typed row per
+--      (model, player, season, feature) — so a season's feature values read
+--      back as numbers, and a single feature can be selected server-side with
+--      a plain `feature = '...'` filter;
+--   3. keeps it in sync with model_projections.feature_values through a
+--      trigger, so writers keep issuing one upsert per projection row, and a
+--      projection's feature rows are replaced wholesale (no stale features)
+--      and deleted with it (ON DELETE CASCADE).
+--
+-- Non-numeric values (e.g. legacy strings) are stored as NULL.
+
+UPDATE model_projections
+SET feature_values = (feature_values #>> '{}')::jsonb
+WHERE jsonb_typeof(feature_values) = 'string';
+
+CREATE TABLE model_projection_features (
+  id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+  model_id uuid NOT NULL,
+  player_id uuid NOT NULL,
+  season integer NOT NULL,
+  feature text NOT NULL,
+  value double precision,
+  UNIQUE (model_id, season, feature, player_id),
+  FOREIGN KEY (model_id, player_id, season)
+    REFERENCES model_projections (model_id, player_id, season) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_model_projection_features_projection
+  ON model_projection_features (model_id, player_id, season);
+
+ALTER TABLE model_projection_features ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Allow public read access on model_projection_features" ON model_projection_features
+  FOR SELECT TO anon USING (true);
+
+CREATE OR REPLACE FUNCTION public.sync_model_projection_features()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'UPDATE' AND NEW.feature_values IS NOT DISTINCT FROM OLD.feature_values THEN
+    RETURN NEW;
+  END IF;
+  DELETE FROM model_projection_features
+  WHERE model_id = NEW.model_id AND player_id = NEW.player_id AND season = NEW.season;
+  IF jsonb_typeof(NEW.feature_values) = 'object' THEN
+    INSERT INTO model_projection_features (model_id, player_id, season, feature, value)
+    SELECT NEW.model_id, NEW.player_id, NEW.season, kv.key,
+           CASE WHEN jsonb_typeof(kv.value) = 'number' THEN (kv.value #>> '{}')::double precision END
+    FROM jsonb_each(NEW.feature_values) AS kv;
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER model_projections_sync_features
+  AFTER INSERT OR UPDATE OF feature_values ON model_projections
+  FOR EACH ROW EXECUTE FUNCTION public.sync_model_projection_features();
+
+-- Backfill from the existing projections.
+INSERT INTO model_projection_features (model_id, player_id, season, feature, value)
+SELECT mp.model_id, mp.player_id, mp.season, kv.key,
+       CASE WHEN jsonb_typeof(kv.value) = 'number' THEN (kv.value #>> '{}')::double precision END
+FROM model_projections mp
+CROSS JOIN LATERAL jsonb_each(mp.feature_values) AS kv
+WHERE jsonb_typeof(mp.feature_values) = 'object';
@@ -6,9 +6,14 @@ the TypeScript web UI (``web/lib/``). This module retains only the data-fetch
 helper still consumed by the projection pipeline.
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
 from scripts.config import get_supabase_client
+from scripts.db_io import FETCH_WORKERS, QUERY_CACHE, call_aggregate, fetch_all_rows
 
 
 def _fetch_seasons_paginated(supabase, table: str, select: str,
@@ -20,22 +25,135 @@ def _fetch_seasons_paginated(supabase, table: str, select: str,
     (~800/season) easily exceeds that, and a silent truncation randomly drops
     player-season rows — corrupting weighted-PPG bases and team aggregates.
     """
-    page_size = 1000
-    offset = 0
-    rows: list = []
-    while True:
-        batch = (
-            supabase.table(table).select(select)
-            .in_('season', seasons)
-            .range(offset, offset + page_size - 1)
-            .execute()
-            .data or []
-        )
-        rows.extend(batch)
-        if len(batch) < page_size:
-            break
-        offset += page_size
-    return rows
+    return fetch_all_rows(supabase, table, select, filters=[('in_', 'season', seasons)],
+                          workers=FETCH_WORKERS)
+
+
+# Select only Ottoneu-relevant columns; raw NFL stat columns live in nfl_stats.
+PLAYER_STATS_SELECT = (
+    'player_id, season, total_points, games_played, snaps, ppg, pps, '
+    'h1_snaps, h1_games, h2_snaps, h2_games'
+)
+
+
+@dataclass(frozen=True)
+class StatsSchema:
+    """Declared pandas dtypes for a stats table, applied once at load.
+
+    PostgREST rows become object columns of Python ints / floats / None; every
+    consumer used to re-run ``pd.to_numeric(...).fillna(0)`` over the columns
+    it read. ``load_typed`` does that once per fetch instead, into compact
+    dtypes:
+
+    * integer counts the features read as "0 when missing" -> ``int16``
+      (widened to ``int32`` if a value doesn't fit), NULL -> 0;
+    * counts whose NULL means "not recorded" (pre-2018 air yards, seasons
+      without snap data, kicking) and fractional rates / shares ->
+      ``float32``, NULL kept as NaN so it stays distinguishable from a real 0;
+    * fantasy points (``ppg`` / ``pps`` / ``total_points``) stay ``float64`` —
+      they are projection bases, and float32 rounding would perturb every
+      projection built on them;
+    * low-cardinality text -> ``category``.
+
+    ``fill_zero`` lists the float columns that also load NULL as 0.
+    Columns not in ``dtypes`` (ids, timestamps) are left as returned.
+    """
+
+    dtypes: dict[str, str]
+    fill_zero: frozenset[str] = frozenset()
+
+    def categorical(self) -> list[str]:
+        return [col for col, dtype in self.dtypes.items() if dtype == 'category']
+
+
+PLAYER_STATS_SCHEMA = StatsSchema(
+    dtypes={
+        'season': 'int16',
+        'games_played': 'int16',
+        'snaps': 'int16',
+        'h1_snaps': 'float32',
+        'h1_games': 'float32',
+        'h2_snaps': 'float32',
+        'h2_games': 'float32',
+        'total_points': 'float64',
+        'ppg': 'float64',
+        'pps': 'float64',
+    },
+    fill_zero=frozenset({'total_points', 'ppg', 'pps'}),
+)
+
+NFL_STATS_SCHEMA = StatsSchema(
+    dtypes={
+        'season': 'int16',
+        'games_played': 'int16',
+        'passing_attempts': 'int16',
+        'completions': 'int16',
+        'passing_yards': 'int16',
+        'passing_tds': 'int16',
+        'interceptions': 'int16',
+        'rushing_attempts': 'int16',
+        'rushing_yards': 'int16',
+        'rushing_tds': 'int16',
+        'targets': 'int16',
+        'receptions': 'int16',
+        'receiving_yards': 'int16',
+        'receiving_tds': 'int16',
+        'offense_snaps': 'int16',
+        'receiving_air_yards': 'float32',
+        'fg_made_0_39': 'float32',
+        'fg_made_40_49': 'float32',
+        'fg_made_50_plus': 'float32',
+        'pat_made': 'float32',
+        'defense_snaps': 'float32',
+        'st_snaps': 'float32',
+        'total_snaps': 'float32',
+        'target_share': 'float32',
+        'air_yards_share': 'float32',
+        'wopr': 'float32',
+        'racr': 'float32',
+        'total_points': 'float64',
+        'ppg': 'float64',
+        'recent_team': 'category',
+    },
+    fill_zero=frozenset({'total_points'}),
+)
+
+
+def load_typed(rows: list, schema: StatsSchema) -> pd.DataFrame:
+    """PostgREST rows -> a DataFrame with ``schema``'s dtypes applied."""
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+    for col, dtype in schema.dtypes.items():
+        if col not in df.columns:
+            continue
+        if dtype == 'category':
+            df[col] = df[col].astype('category')
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        kind = np.dtype(dtype).kind
+        if kind in 'iu':
+            values = values.fillna(0)
+            info = np.iinfo(dtype)
+            if values.min() < info.min or values.max() > info.max:
+                dtype = 'int32'
+        elif col in schema.fill_zero:
+            values = values.fillna(0)
+        df[col] = values.astype(dtype)
+    return df
+
+
+def concat_typed(frames: list[pd.DataFrame], schema: StatsSchema) -> pd.DataFrame:
+    """``pd.concat`` that keeps ``schema``'s categorical columns categorical.
+
+    Frames loaded by separate fetches carry different category sets, which
+    ``pd.concat`` silently widens back to object.
+    """
+    df = pd.concat(frames, ignore_index=True)
+    for col in schema.categorical():
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
 
 
 def fetch_multi_season_stats(seasons: list[int]) -> pd.DataFrame:
@@ -49,20 +167,8 @@ def fetch_multi_season_stats(seasons: list[int]) -> pd.DataFrame:
     """
     supabase = get_supabase_client()
     print(f"Fetching multi-season stats for seasons {seasons}...")
-    # Select only Ottoneu-relevant columns; raw NFL stat columns live in nfl_stats.
-    select = (
-        'player_id, season, total_points, games_played, snaps, ppg, pps, '
-        'h1_snaps, h1_games, h2_snaps, h2_games'
-    )
-    rows = _fetch_seasons_paginated(supabase, 'player_stats', select, seasons)
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
-    for col in ['ppg', 'pps', 'total_points', 'games_played', 'snaps']:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-    df['season'] = pd.to_numeric(df['season'], errors='coerce')
-    return df
+    rows = _fetch_seasons_paginated(supabase, 'player_stats', PLAYER_STATS_SELECT, seasons)
+    return load_typed(rows, PLAYER_STATS_SCHEMA)
 
 
 def available_model_seasons(supabase, model_id: str) -> list:
@@ -72,21 +178,16 @@ def available_model_seasons(supabase, model_id: str) -> list:
     Paginates both distinct-season reads past the 1000-row cap — model_projections
     across all seasons (~2k rows) and player_stats (~3k) both exceed it, so a
     plain ``.execute()`` could silently drop a season from default-season
-    auto-detection (GH #562).
+    auto-detection (GH #562). Answered by the ``model_seasons_with_actuals``
+    SQL function (migration 035) when it is deployed.
     """
+    rows = call_aggregate(supabase, "model_seasons_with_actuals", {"p_model_id": model_id})
+    if rows is not None:
+        return sorted((int(r["season"]) for r in rows), reverse=True)
+
     def _seasons(table: str, eq=None) -> set:
-        out: set = set()
-        offset, page = 0, 1000
-        while True:
-            query = supabase.table(table).select("season")
-            if eq is not None:
-                query = query.eq(eq[0], eq[1])
-            batch = query.range(offset, offset + page - 1).execute().data or []
-            out.update(r["season"] for r in batch)
-            if len(batch) < page:
-                break
-            offset += page
-        return out
+        filters = [("eq", eq[0], eq[1])] if eq is not None else None
+        return {r["season"] for r in fetch_all_rows(supabase, table, "season", filters=filters)}
 
     proj = _seasons("model_projections", ("model_id", model_id))
     stats = _seasons("player_stats")
@@ -99,9 +200,117 @@ def fetch_multi_season_nfl_stats(seasons: list[int]) -> pd.DataFrame:
     nfl_stats holds ~800 rows/season, so any multi-season window exceeds the
     1000-row PostgREST cap. Truncation here silently drops players, corrupting
     the team aggregates and usage/target-share features built from this data
-    in the projection runner and learned-model trainer. Returns the raw rows
-    as a DataFrame (``select *``); callers coerce the numeric columns they use.
+    in the projection runner and learned-model trainer. Returns every column
+    (``select *``) typed per ``NFL_STATS_SCHEMA``.
     """
     supabase = get_supabase_client()
     rows = _fetch_seasons_paginated(supabase, 'nfl_stats', '*', seasons)
-    return pd.DataFrame(rows)
+    return load_typed(rows, NFL_STATS_SCHEMA)
+
+
+class SeasonDataStore:
+    """Per-process cache of season-keyed player_stats / nfl_stats frames.
+
+    The projection loops fetch a rolling history window per target season
+    (2021-23 for 2024, 2022-24 for 2025, ...), so the same seasons were fetched
+    and parsed once per window. The store fetches every missing season of a
+    window in one paginated read, types it once (``load_typed``), keeps one
+    frame per season, and answers each window by concatenating the cached
+    season frames — only seasons it has never seen cost a PostgREST round-trip.
+
+    Returned frames are fresh concatenations, so callers may mutate them
+    without corrupting the cache. Use ``get_season_data_store()`` for the
+    process-wide instance.
+    """
+
+    def __init__(self, supabase=None):
+        self._supabase = supabase
+        # season -> (frame, fetched columns; None = the table's full select)
+        self._player_stats: dict[int, tuple[pd.DataFrame, Optional[frozenset]]] = {}
+        self._nfl_stats: dict[int, tuple[pd.DataFrame, Optional[frozenset]]] = {}
+        self.fetches = 0  # round-trip batches issued (one per cache miss set)
+
+    def _client(self):
+        if self._supabase is None:
+            self._supabase = get_supabase_client()
+        return self._supabase
+
+    def _load(self, table: str, select: str, cache: dict, seasons: list[int],
+              schema: StatsSchema, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        wanted = [int(s) for s in seasons]
+        wanted_cols = list(dict.fromkeys(columns)) if columns is not None else None
+
+        def covered(season: int) -> bool:
+            if season not in cache:
+                return False
+            have = cache[season][1]
+            return have is None or (wanted_cols is not None and set(wanted_cols) <= have)
+
+        missing = sorted({s for s in wanted if not covered(s)})
+        if missing:
+            self.fetches += 1
+            fetched = None
+            if wanted_cols is not None:
+                # Keep whatever a season already had, so alternating column
+                # sets don't evict each other.
+                union = set(wanted_cols)
+                for season in missing:
+                    if season in cache:
+                        union |= cache[season][1]
+                fetched = frozenset(union)
+                select = ', '.join(sorted(fetched))
+            rows = _fetch_seasons_paginated(self._client(), table, select, missing)
+            df = load_typed(rows, schema)
+            for season in missing:
+                frame = (
+                    df[df['season'] == season].reset_index(drop=True)
+                    if not df.empty else pd.DataFrame()
+                )
+                cache[season] = (frame, fetched)
+        frames = [cache[s][0] for s in dict.fromkeys(wanted) if not cache[s][0].empty]
+        if not frames:
+            return pd.DataFrame()
+        df = concat_typed(frames, schema)
+        if wanted_cols is not None:
+            df = df[[c for c in wanted_cols if c in df.columns]]
+        return df
+
+    def player_stats(self, seasons: list[int], columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """``fetch_multi_season_stats`` equivalent served from the cache.
+
+        ``columns`` narrows the fetch (and the returned frame) to those
+        columns; default: ``PLAYER_STATS_SELECT``.
+        """
+        return self._load('player_stats', PLAYER_STATS_SELECT, self._player_stats,
+                          seasons, PLAYER_STATS_SCHEMA, columns)
+
+    def nfl_stats(self, seasons: list[int], columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """``fetch_multi_season_nfl_stats`` equivalent served from the cache.
+
+        ``columns`` narrows the fetch (and the returned frame) to those
+        columns; default: every column.
+        """
+        return self._load('nfl_stats', '*', self._nfl_stats, seasons, NFL_STATS_SCHEMA, columns)
+
+    def clear(self) -> None:
+        self._player_stats.clear()
+        self._nfl_stats.clear()
+
+    def invalidate(self, table: Optional[str]) -> None:
+        """``QUERY_CACHE`` listener: drop seasons of a table that was written."""
+        if table in (None, 'player_stats'):
+            self._player_stats.clear()
+        if table in (None, 'nfl_stats'):
+            self._nfl_stats.clear()
+
+
+_SEASON_DATA_STORE: Optional[SeasonDataStore] = None
+
+
+def get_season_data_store() -> SeasonDataStore:
+    """The process-wide SeasonDataStore (created on first use)."""
+    global _SEASON_DATA_STORE
+    if _SEASON_DATA_STORE is None:
+        _SEASON_DATA_STORE = SeasonDataStore()
+        QUERY_CACHE.add_listener(_SEASON_DATA_STORE.invalidate)
+    return _SEASON_DATA_STORE
@@ -30,7 +30,8 @@ from typing import Dict, Optional
 
 import pandas as pd
 
-from scripts.config import fetch_all_rows, get_supabase_client
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 from scripts.name_utils import normalize_player_name
 
 DEFAULT_SINCE_SEASON = 2016
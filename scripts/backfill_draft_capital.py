@@ -24,7 +24,8 @@ import hashlib
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 from scripts.name_utils import normalize_player_name
 
 # nflverse uses different team abbreviations than Ottoneu/our DB.
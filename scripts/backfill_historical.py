@@ -22,7 +22,7 @@ import sys
 from scripts.backfill_nfl_stats import backfill_seasons
 from scripts.config import get_supabase_client
 from scripts.feature_projections.model_config import MODELS
-from scripts.feature_projections.runner import run_model
+from scripts.feature_projections.runner import run_models
 from scripts.feature_projections.backtest import backtest_model
 from scripts.tasks.pull_player_stats import run as pull_player_stats_run
 
@@ -61,10 +61,10 @@ def step3_generate_projections(target_seasons: list[int], dry_run: bool) -> None
             print(f"  - {model_name}")
         return
 
-    for model_name in MODELS:
-        print(f"\nRunning model: {model_name}")
-        count = run_model(model_name, seasons=target_seasons)
-        print(f"  Generated {count} projections")
+    # One pass over every model: inputs and shared features load once.
+    counts = run_models(list(MODELS), seasons=target_seasons)
+    for model_name, count in counts.items():
+        print(f"  {model_name}: generated {count} projections")
 
 
 def step4_run_backtests(target_seasons: list[int], dry_run: bool) -> None:
@@ -23,6 +23,7 @@ from typing import Any
 import pandas as pd
 
 from scripts.config import get_supabase_client
+from scripts.db_io import bulk_upsert
 from scripts.name_utils import normalize_player_name
 
 # --- Constants ---
@@ -148,7 +149,7 @@ def load_rosters(year: int) -> pd.DataFrame | None:
 
 def build_player_lookup(supabase) -> dict[str, str]:
     """Fetch all players from DB and return normalized_name -> uuid dict."""
-    from scripts.config import fetch_all_rows
+    from scripts.db_io import fetch_all_rows
     players = fetch_all_rows(supabase, "players", "id, name")
     lookup: dict[str, str] = {}
     for p in players:
@@ -159,7 +160,7 @@ def build_player_lookup(supabase) -> dict[str, str]:
 
 def build_ottoneu_id_set(supabase) -> set[int]:
     """Fetch all existing ottoneu_ids to avoid collisions."""
-    from scripts.config import fetch_all_rows
+    from scripts.db_io import fetch_all_rows
     rows = fetch_all_rows(supabase, "players", "ottoneu_id")
     return {r["ottoneu_id"] for r in rows}
 
@@ -553,14 +554,7 @@ def backfill_seasons(
 
     # Phase 4: Upsert to nfl_stats
     print(f"\n=== Phase 4: Upserting {len(upsert_rows)} rows to nfl_stats ===")
-    batch_size = 200
-    for i in range(0, len(upsert_rows), batch_size):
-        batch = upsert_rows[i:i + batch_size]
-        supabase.table("nfl_stats").upsert(
-            batch, on_conflict="player_id,season"
-        ).execute()
-        if (i // batch_size) % 10 == 0:
-            print(f"  Batch {i // batch_size + 1} / {(len(upsert_rows) + batch_size - 1) // batch_size}")
+    bulk_upsert(supabase, "nfl_stats", upsert_rows, on_conflict="player_id,season", batch_size=200)
 
     print(f"\nDone! Upserted {len(upsert_rows)} rows to nfl_stats.")
 
@@ -33,7 +33,8 @@ import argparse
 import nfl_data_py as nfl
 import pandas as pd
 
-from scripts.config import fetch_all_rows, get_supabase_client
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 from scripts.name_utils import normalize_player_name
 
 RED_ZONE_YARDLINE = 20
@@ -0,0 +1,109 @@
+"""Throughput of bulk reads / upserts: PostgREST vs the direct Postgres backend — `just bench-bulk-io`.
+
+Times ``fetch_all_rows`` over a table through both paths (the rows must match),
+and with ``--write`` upserts those same rows back through ``bulk_upsert`` on
+both paths. Writing rows back with their current values leaves the table
+unchanged, but it does rewrite them — point ``DATABASE_URL`` / ``SUPABASE_URL``
+at a local or staging database for ``--write``.
+
+Needs ``SUPABASE_URL`` / ``SUPABASE_KEY`` and ``DATABASE_URL`` for the same
+database, plus the optional ``psycopg`` dependency (``pip install -e .[postgres]``).
+
+Usage:
+    venv/bin/python -m scripts.bench_bulk_io                     # or: just bench-bulk-io
+    venv/bin/python -m scripts.bench_bulk_io --table model_projections --write --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from scripts.config import get_supabase_client, use_data_source
+from scripts.db_io import (
+    DATABASE_URL_ENV,
+    FETCH_WORKERS,
+    QUERY_CACHE,
+    bulk_upsert,
+    fetch_all_rows,
+    keyset_key,
+)
+
+# Table -> upsert conflict key.
+BENCH_TABLES = {
+    "nfl_stats": "player_id,season",
+    "player_stats": "player_id,season",
+    "model_projections": "model_id,player_id,season",
+}
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _report(label: str, rows: int, seconds: float) -> None:
+    rate = rows / seconds if seconds > 0 else float("inf")
+    print(f"  {label:<22} {rows:>8} rows  {seconds:>8.2f}s  {rate:>10.0f} rows/s")
+
+
+def run_benchmark(client, table: str, write: bool, limit: int | None) -> dict:
+    """Time both paths on ``client`` (which must carry a Postgres backend)."""
+    backend = client.postgres
+    key = keyset_key(table)
+    results: dict[str, float] = {}
+
+    client.postgres = None
+    rest_rows, results["rest_read"] = _timed(
+        lambda: fetch_all_rows(client, table, workers=FETCH_WORKERS)
+    )
+    client.postgres = backend
+    pg_rows, results["postgres_read"] = _timed(lambda: fetch_all_rows(client, table))
+    _report("read  PostgREST", len(rest_rows), results["rest_read"])
+    _report("read  Postgres", len(pg_rows), results["postgres_read"])
+    if key is not None:
+        rest_rows.sort(key=lambda r: r[key])
+    if rest_rows != pg_rows:
+        print("  WARNING: the two reads returned different rows")
+
+    if write:
+        rows = pg_rows[:limit] if limit else pg_rows
+        client.postgres = None
+        _, results["rest_write"] = _timed(
+            lambda: bulk_upsert(client, table, rows, on_conflict=BENCH_TABLES[table])
+        )
+        client.postgres = backend
+        _, results["postgres_write"] = _timed(
+            lambda: bulk_upsert(client, table, rows, on_conflict=BENCH_TABLES[table])
+        )
+        _report("upsert PostgREST", len(rows), results["rest_write"])
+        _report("upsert Postgres", len(rows), results["postgres_write"])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare PostgREST and direct-Postgres bulk read/upsert throughput"
+    )
+    parser.add_argument("--table", choices=sorted(BENCH_TABLES), default="nfl_stats")
+    parser.add_argument("--write", action="store_true",
+                        help="Also upsert the rows back (same values) through both paths")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="Cap the rows written with --write (default: all rows read)")
+    args = parser.parse_args()
+
+    use_data_source("supabase")
+    client = get_supabase_client()
+    if getattr(client, "postgres", None) is None:
+        print(f"{DATABASE_URL_ENV} is not set — nothing to compare against.")
+        sys.exit(1)
+    # Every read must hit the database, not the memo.
+    QUERY_CACHE.enabled = False
+    print(f"Benchmarking {args.table} ...")
+    run_benchmark(client, args.table, args.write, args.rows)
+
+
+if __name__ == "__main__":
+    main()
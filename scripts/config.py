@@ -6,11 +6,16 @@ Supabase client factory to eliminate duplication across scripts.
 Configuration values are loaded from the shared config.json in the repo root.
 """
 
+import argparse
 import os
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
-from supabase import create_client, Client
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 load_dotenv()
 
@@ -57,66 +62,81 @@ NFL_TEAM_CODES = set(_config["NFL_TEAM_CODES"])
 # --- END GENERATED CONFIG ---
 
 
-def get_supabase_client() -> Client:
+def get_supabase_client() -> "Client":
     """Return a configured Supabase client.
 
     Reads SUPABASE_URL and SUPABASE_KEY from environment variables.
     Exits with error message if credentials are not configured.
 
+    With the ``mirror`` data source selected (``OTTONEU_DATA_SOURCE=mirror`` or
+    ``--source mirror``) this returns a read-only
+    :class:`scripts.mirror_client.MirrorClient` over the local parquet snapshot
+    instead, and no credentials are needed.
+
+    With ``DATABASE_URL`` set, the client also carries a
+    :class:`scripts.db_io.PostgresBackend`: ``fetch_all_rows`` and
+    ``bulk_upsert`` then read and write over a direct Postgres connection
+    instead of PostgREST.
+
+    The client is a process-wide singleton over one pooled keep-alive HTTP
+    connection pool (see :func:`scripts.db_client.shared_client`), so calling
+    this per fetch is cheap and the client is safe to share between threads.
+    Both are imported on first use, so scripts that only need the league
+    constants don't load pandas or httpx.
+
     Returns:
         Client: Configured Supabase client instance
     """
+    if data_source() == "mirror":
+        from scripts.mirror_client import MirrorClient
+
+        return MirrorClient()
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_KEY")
     if not url or not key:
         print("Error: SUPABASE_URL and SUPABASE_KEY must be set in .env")
         exit(1)
-    return create_client(url, key)
+    from scripts.db_client import shared_client
 
+    return shared_client(url, key)
 
-def fetch_all_rows(supabase, table: str, select: str = "*",
-                   filters=None, page_size: int = 1000) -> list[dict]:
-    """Fetch all rows from a Supabase table, paginating past the PostgREST limit.
 
-    PostgREST defaults to returning at most 1000 rows. This helper pages
-    through all results transparently, so callers never need to write a manual
-    ``.range()`` loop. It is the canonical way to read a query that may exceed
-    1000 rows (see the "Supabase pagination" guidance in CLAUDE.md) and is
-    enforced by ``scripts/tests/test_architecture.py::TestSupabasePagination``.
+# ---------------------------------------------------------------------------
+# Data source
+# ---------------------------------------------------------------------------
+# get_supabase_client() reads from Supabase, or — with the mirror selected —
+# from the local parquet snapshot written by `just sync-mirror`
+# (scripts/mirror.py; read side in scripts/mirror_client.py).
 
-    Args:
-        supabase: Supabase client instance.
-        table: Table name to query.
-        select: Column selection string (default "*").
-        filters: Optional iterable of ``(op, column, value)`` tuples applied to
-            the query before paging, where ``op`` is a PostgREST filter method
-            name such as ``"eq"``, ``"in_"``, ``"lt"``, ``"gte"``, ``"lte"``.
-            Examples::
+DATA_SOURCE_ENV = "OTTONEU_DATA_SOURCE"
+DATA_SOURCES = ("supabase", "mirror")
 
-                fetch_all_rows(sb, "player_stats", "ppg",
-                               filters=[("eq", "season", 2025)])
-                fetch_all_rows(sb, "model_projections", "player_id",
-                               filters=[("eq", "model_id", mid), ("eq", "season", s)])
 
-        page_size: Rows per page (default 1000).
+def data_source() -> str:
+    """The selected data source: ``"supabase"`` (default) or ``"mirror"``."""
+    source = os.environ.get(DATA_SOURCE_ENV, "supabase").strip().lower() or "supabase"
+    if source not in DATA_SOURCES:
+        raise ValueError(f"{DATA_SOURCE_ENV} must be one of {DATA_SOURCES}, got {source!r}")
+    return source
 
-    Returns:
-        List of row dicts.
-    """
-    all_data: list[dict] = []
-    offset = 0
-    while True:
-        query = supabase.table(table).select(select)
-        for op, column, value in (filters or []):
-            query = getattr(query, op)(column, value)
-        batch = (
-            query
-            .range(offset, offset + page_size - 1)
-            .execute()
-            .data or []
-        )
-        all_data.extend(batch)
-        if len(batch) < page_size:
-            break
-        offset += page_size
-    return all_data
+
+def use_data_source(source: str) -> None:
+    """Select the data source for this process (and any children it starts)."""
+    if source not in DATA_SOURCES:
+        raise ValueError(f"data source must be one of {DATA_SOURCES}, got {source!r}")
+    os.environ[DATA_SOURCE_ENV] = source
+
+
+class _SourceAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        use_data_source(values)
+        setattr(namespace, self.dest, values)
+
+
+def add_source_arg(parser: argparse.ArgumentParser) -> None:
+    """Add ``--source {supabase,mirror}`` to a command's parser."""
+    parser.add_argument(
+        "--source", choices=DATA_SOURCES, default=None, action=_SourceAction,
+        help=f"Read from Supabase or the local parquet mirror (`just sync-mirror`); "
+             f"default: ${DATA_SOURCE_ENV} or supabase",
+    )
@@ -0,0 +1,126 @@
+"""The process-wide, pooled Supabase client behind ``get_supabase_client()``.
+
+``get_supabase_client()`` used to build a new client (and so a new HTTP
+client, TLS handshake included) on every call, and ``fetch_multi_season_*``
+call it once per target season / fold / combo. One client per process now
+shares a keep-alive connection pool, and every response is counted per table
+in :data:`POSTGREST_TRAFFIC` (reported by ``--profile``).
+"""
+
+import os
+import threading
+from typing import Optional
+
+import httpx
+from supabase import ClientOptions, create_client
+
+from scripts.db_io import DATABASE_URL_ENV, WriteInvalidatingClient, postgres_backend
+
+HTTP_POOL_SIZE = int(os.getenv("OTTONEU_HTTP_POOL_SIZE", "16"))
+HTTP_TIMEOUT = float(os.getenv("OTTONEU_HTTP_TIMEOUT", "120"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("OTTONEU_HTTP_CONNECT_TIMEOUT", "10"))
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+
+class TrafficCounter:
+    """Thread-safe per-table counts of PostgREST requests and wire bytes."""
+
+    def __init__(self):
+        # table -> [requests, bytes sent, bytes received]
+        self._tables: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, table: str, sent: int, received: int) -> None:
+        with self._lock:
+            entry = self._tables.setdefault(table, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += sent
+            entry[2] += received
+
+    def snapshot(self) -> dict[str, tuple[int, int, int]]:
+        with self._lock:
+            return {table: tuple(entry) for table, entry in self._tables.items()}
+
+    @staticmethod
+    def since(before: dict[str, tuple[int, int, int]],
+              after: dict[str, tuple[int, int, int]]) -> dict[str, tuple[int, int, int]]:
+        """Per-table traffic between two snapshots (tables with none omitted)."""
+        delta = {}
+        for table, counts in after.items():
+            base = before.get(table, (0, 0, 0))
+            diff = tuple(a - b for a, b in zip(counts, base))
+            if diff[0]:
+                delta[table] = diff
+        return delta
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+
+POSTGREST_TRAFFIC = TrafficCounter()
+
+
+def _table_of(url: httpx.URL) -> str:
+    """``players`` for ``.../rest/v1/players?...``; ``rpc/<fn>`` for RPCs; else the path."""
+    path = url.path
+    marker = "/rest/v1/"
+    if marker not in path:
+        return path
+    parts = path.split(marker, 1)[1].split("/")
+    return "/".join(parts[:2]) if parts[0] == "rpc" else parts[0]
+
+
+def _count_response(response: httpx.Response) -> None:
+    response.read()
+    request = response.request
+    POSTGREST_TRAFFIC.record(
+        _table_of(request.url),
+        int(request.headers.get("content-length", 0)),
+        # Wire bytes (compressed); a pre-loaded response has only its content.
+        response.num_bytes_downloaded or len(response.content),
+    )
+
+
+def _pooled_http_client(transport: Optional[httpx.BaseTransport] = None) -> httpx.Client:
+    """The keep-alive HTTP client shared by every request of the process's client."""
+    return httpx.Client(
+        http2=transport is None,
+        transport=transport,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_POOL_SIZE,
+            max_keepalive_connections=HTTP_POOL_SIZE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        event_hooks={"response": [_count_response]},
+    )
+
+
+_shared_clients: dict[tuple[str, str, str], WriteInvalidatingClient] = {}
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client(url: str, key: str) -> WriteInvalidatingClient:
+    """The process's client for (url, key, DATABASE_URL), built on first use.
+
+    A forked child (``run --workers``) builds its own: pooled connections must
+    not be shared across processes.
+    """
+    global _shared_pid
+    with _shared_lock:
+        if _shared_pid != os.getpid():
+            _shared_clients.clear()
+            _shared_pid = os.getpid()
+        cache_key = (url, key, os.getenv(DATABASE_URL_ENV, "").strip())
+        client = _shared_clients.get(cache_key)
+        if client is None:
+            options = ClientOptions(httpx_client=_pooled_http_client())
+            # Writes through the client drop that table's memoized fetch_all_rows reads.
+            client = WriteInvalidatingClient(
+                create_client(url, key, options=options), postgres=postgres_backend()
+            )
+            _shared_clients[cache_key] = client
+        return client
@@ -0,0 +1,710 @@
+"""Bulk reads and writes against the Supabase tables.
+
+``fetch_all_rows`` pages a read past PostgREST's 1000-row cap (by keyset where
+the table has a unique key, concurrently when asked), memoizes it in
+:data:`QUERY_CACHE`, and — with ``DATABASE_URL`` set — streams it through a
+direct Postgres connection instead. ``bulk_upsert`` is the matching write
+path. The clients ``scripts.config.get_supabase_client()`` hands out route
+their writes through :class:`WriteInvalidatingClient`, so a written table's
+memoized reads are dropped.
+
+Standard library only (``psycopg`` is imported when a direct connection is
+first opened), so importing it stays cheap for the scrapers and tasks.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+# Thread count for fetch_all_rows(..., workers=FETCH_WORKERS) concurrent reads,
+# and how many times a single failed page is retried before the read fails.
+FETCH_WORKERS = int(os.getenv("OTTONEU_FETCH_WORKERS", "4"))
+FETCH_PAGE_RETRIES = 3
+
+# Unique, orderable key per table for keyset pagination in fetch_all_rows.
+# Every app table has a uuid ``id`` primary key except those listed with a
+# different key; a table mapped to None (league_calendar's key is composite)
+# falls back to offset paging.
+_KEYSET_KEYS: dict[str, Optional[str]] = {
+    "league_calendar": None,
+    "oauth_authorization_codes": "code_hash",
+    "oauth_refresh_tokens": "token_hash",
+}
+_ID_KEY_TABLES = frozenset({
+    "players", "player_stats", "nfl_stats", "league_prices", "transactions",
+    "surplus_adjustments", "player_projections", "arbitration_plans",
+    "arbitration_plan_allocations", "scraper_jobs", "projection_models",
+    "model_projections", "model_projection_features", "backtest_results",
+    "arbitration_progress", "arbitration_progress_teams", "arbitration_allocation_details",
+    "draft_capital", "draft_sharks_values", "team_vegas_lines", "team_coaching",
+    "depth_charts", "red_zone_usage", "ngs_passing", "users", "oauth_clients",
+})
+
+
+def keyset_key(table: str) -> Optional[str]:
+    """The unique column ``fetch_all_rows`` pages ``table`` by (None = offset paging)."""
+    if table in _KEYSET_KEYS:
+        return _KEYSET_KEYS[table]
+    return "id" if table in _ID_KEY_TABLES else None
+
+
+def fetch_all_rows(supabase, table: str, select: str = "*",
+                   filters=None, page_size: int = 1000,
+                   key: Optional[str] = "auto", workers: int = 1) -> list[dict]:
+    """Fetch all rows from a Supabase table, paginating past the PostgREST limit.
+
+    PostgREST defaults to returning at most 1000 rows. This helper pages
+    through all results transparently, so callers never need to write a manual
+    ``.range()`` loop. It is the canonical way to read a query that may exceed
+    1000 rows (see the "Supabase pagination" guidance in CLAUDE.md) and is
+    enforced by ``scripts/tests/test_architecture.py::TestSupabasePagination``.
+
+    Pages are read by **keyset** where the table has a unique key: ordered by
+    the key and continued with ``gt(key, <last key seen>)``. Each page is then
+    an index range scan instead of an ``OFFSET`` that Postgres re-walks from
+    the start (quadratic over a large read like ``model_projections``), and
+    rows can't be skipped or duplicated between pages the way an unordered
+    ``.range()`` allows. The key column is added to ``select`` for paging and
+    dropped from the returned rows if the caller didn't ask for it.
+
+    Large reads (``model_projections`` or ``nfl_stats`` across all seasons)
+    can pass ``workers=FETCH_WORKERS`` to fetch their pages concurrently
+    instead of N sequential round-trips.
+
+    With a :class:`PostgresBackend` on the client (``DATABASE_URL``), the
+    read is one server-side cursor over a direct connection instead of paged
+    REST requests; selects or filters it can't translate stay on PostgREST.
+
+    Where :data:`QUERY_CACHE` is enabled (the holdout / significance entry
+    points), results are memoized per client (keyed by table, select and
+    filters; LRU + TTL), so repeated identical reads in one process — the
+    players / player_stats / projection_models reads each holdout fold
+    repeats — are free. Writes through ``get_supabase_client()`` invalidate
+    the written table's entries once they execute. Callers get their own row
+    dicts.
+
+    Args:
+        supabase: Supabase client instance.
+        table: Table name to query.
+        select: Column selection string (default "*").
+        filters: Optional iterable of ``(op, column, value)`` tuples applied to
+            the query before paging, where ``op`` is a PostgREST filter method
+            name such as ``"eq"``, ``"in_"``, ``"lt"``, ``"gte"``, ``"lte"``.
+            Examples::
+
+                fetch_all_rows(sb, "player_stats", "ppg",
+                               filters=[("eq", "season", 2025)])
+                fetch_all_rows(sb, "model_projections", "player_id",
+                               filters=[("eq", "model_id", mid), ("eq", "season", s)])
+
+        page_size: Rows per page (default 1000).
+        key: Unique column to page by. ``"auto"`` (default) uses the table's
+            primary key (:func:`keyset_key`); ``None`` forces offset paging.
+        workers: Fetch pages concurrently through this many threads (pass
+            ``FETCH_WORKERS`` for large reads). One ``count=exact`` head
+            request sizes the read, then every key-ordered ``.range()`` page is
+            fetched in parallel, reassembled in order and retried individually
+            on failure. Needs a key; offset-paged tables stay sequential.
+
+    Returns:
+        List of row dicts (in key order when paged by keyset).
+    """
+    cache_key = (table, select, _freeze(filters), key)
+    cached = QUERY_CACHE.get(supabase, cache_key)
+    if cached is not None:
+        return cached
+    generation = QUERY_CACHE.generation(table)
+    rows = _fetch_all_rows(supabase, table, select, filters, page_size, key, workers)
+    QUERY_CACHE.put(supabase, cache_key, rows, generation)
+    return [dict(row) for row in rows]
+
+
+def _fetch_all_rows(supabase, table: str, select: str, filters, page_size: int,
+                    key: Optional[str], workers: int) -> list[dict]:
+    if getattr(supabase, "in_memory", False):
+        # Local snapshot (MirrorClient): one in-memory filter, no paging needed.
+        return _query(supabase, table, select, filters).execute().data
+    if key == "auto":
+        key = keyset_key(table)
+    if key is None:
+        postgres = getattr(supabase, "postgres", None)
+        if postgres is not None and postgres.can_fetch(select, filters):
+            return postgres.fetch(table, select, filters)
+        return _fetch_all_rows_offset(supabase, table, select, filters, page_size)
+
+    columns = [c.strip() for c in select.split(",")]
+    drop_key = "*" not in columns and key not in columns
+    paged_select = f"{select}, {key}" if drop_key else select
+    postgres = getattr(supabase, "postgres", None)
+    if postgres is not None and postgres.can_fetch(paged_select, filters):
+        rows = postgres.fetch(table, paged_select, filters, order_by=key)
+    elif workers > 1:
+        rows = _fetch_all_rows_concurrent(
+            supabase, table, paged_select, filters, page_size, key, workers
+        )
+    else:
+        rows = _fetch_all_rows_keyset(supabase, table, paged_select, filters, page_size, key)
+    if drop_key:
+        for row in rows:
+            del row[key]
+    return rows
+
+
+def _query(supabase, table: str, select: str, filters, **select_kwargs):
+    query = supabase.table(table).select(select, **select_kwargs)
+    for op, column, value in (filters or []):
+        query = getattr(query, op)(column, value)
+    return query
+
+
+def _fetch_all_rows_keyset(supabase, table: str, select: str, filters,
+                           page_size: int, key: str, last: Any = None) -> list[dict]:
+    """Sequential keyset pages (``order(key)`` + ``gt(key, last)``) after ``last``."""
+    all_data: list[dict] = []
+    while True:
+        query = _query(supabase, table, select, filters)
+        if last is not None:
+            query = query.gt(key, last)
+        batch = query.order(key).limit(page_size).execute().data or []
+        if batch:
+            last = batch[-1][key]
+        all_data.extend(batch)
+        if len(batch) < page_size:
+            break
+    return all_data
+
+
+def _fetch_page(supabase, table: str, select: str, filters, key: str,
+                offset: int, page_size: int) -> list[dict]:
+    """One ``order(key).range(...)`` page, retried with backoff on failure."""
+    for attempt in range(FETCH_PAGE_RETRIES):
+        try:
+            return (
+                _query(supabase, table, select, filters)
+                .order(key)
+                .range(offset, offset + page_size - 1)
+                .execute()
+                .data or []
+            )
+        except Exception:
+            if attempt == FETCH_PAGE_RETRIES - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+    return []  # unreachable
+
+
+def _fetch_all_rows_concurrent(supabase, table: str, select: str, filters,
+                               page_size: int, key: str, workers: int) -> list[dict]:
+    """Count once, then fetch every key-ordered page through a thread pool.
+
+    Truncation safety matches the sequential path: a non-final page shorter
+    than ``page_size`` means the server capped it (PostgREST ``max-rows`` below
+    ``page_size``) or rows vanished mid-read, so the read is redone
+    sequentially; a full final page means rows arrived after the count, so
+    keyset paging continues from the last key.
+    """
+    total = _query(supabase, table, select, filters, count="exact", head=True).execute().count
+    if total is None or total <= page_size:
+        return _fetch_all_rows_keyset(supabase, table, select, filters, page_size, key)
+    offsets = list(range(0, total, page_size))
+    with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as pool:
+        pages = list(pool.map(
+            lambda offset: _fetch_page(supabase, table, select, filters, key, offset, page_size),
+            offsets,
+        ))
+    if any(len(page) < page_size for page in pages[:-1]):
+        return _fetch_all_rows_keyset(supabase, table, select, filters, page_size, key)
+    rows = [row for page in pages for row in page]
+    if len(pages[-1]) == page_size:
+        rows.extend(_fetch_all_rows_keyset(
+            supabase, table, select, filters, page_size, key, last=rows[-1][key]
+        ))
+    return rows
+
+
+def _fetch_all_rows_offset(supabase, table: str, select: str,
+                           filters, page_size: int) -> list[dict]:
+    """``fetch_all_rows`` by ``.range()`` offsets, for tables without a unique key."""
+    all_data: list[dict] = []
+    offset = 0
+    while True:
+        batch = (
+            _query(supabase, table, select, filters)
+            .range(offset, offset + page_size - 1)
+            .execute()
+            .data or []
+        )
+        all_data.extend(batch)
+        if len(batch) < page_size:
+            break
+        offset += page_size
+    return all_data
+
+
+# ---------------------------------------------------------------------------
+# SQL functions over RPC
+# ---------------------------------------------------------------------------
+# Aggregates migrations ship as SQL functions (035: team_season_totals,
+# position_ppg_moments, model_seasons_with_actuals). Callers keep a Python
+# fallback for when a function isn't deployed or the client can't RPC (the
+# parquet mirror, test fakes); OTTONEU_SERVER_AGGREGATES=off forces it.
+
+# PostgREST "function not in schema cache" / Postgres undefined_function.
+_MISSING_FUNCTION_CODES = {"PGRST202", "42883"}
+# Functions found missing in this process (not retried per season).
+_unavailable: set[str] = set()
+
+
+def server_aggregates_enabled() -> bool:
+    return os.getenv("OTTONEU_SERVER_AGGREGATES", "on").lower() not in {"0", "off", "false", "no"}
+
+
+def call_aggregate(supabase, function: str, params: dict[str, Any]) -> Optional[list[dict]]:
+    """Rows from SQL function ``function``, or None when it isn't available."""
+    if not server_aggregates_enabled() or function in _unavailable:
+        return None
+    rpc = getattr(supabase, "rpc", None)
+    if rpc is None:
+        return None
+    try:
+        return rpc(function, params).execute().data or []
+    except Exception as exc:
+        if getattr(exc, "code", None) in _MISSING_FUNCTION_CODES:
+            _unavailable.add(function)
+            return None
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Memoized reads
+# ---------------------------------------------------------------------------
+
+def _freeze(value: Any) -> Any:
+    """A hashable form of a ``filters`` list (lists/sets/dicts -> tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+
+_OFF = {"0", "off", "false", "no"}
+
+
+class QueryCache:
+    """Process-wide LRU + TTL memo of ``fetch_all_rows`` results.
+
+    Entries are keyed by the client's ``cache_scope`` plus (table, select,
+    filters, key). Clients from ``get_supabase_client()`` share a scope per
+    data source, so a fresh client per call still hits; any other client
+    (tests' fakes) is scoped to its instance, and the entry keeps a reference
+    to it so a recycled ``id()`` can't serve another client's rows. ``invalidate(table)`` drops a table's
+    entries and notifies listeners (e.g. the SeasonDataStore) so their own
+    caches follow.
+
+    Off by default: a long-running job that reads back its own writes through
+    the raw client must not see a stale memo. The read-only analysis entry
+    points (``holdout_eval``, ``significance``) turn it on with
+    :meth:`enable`; ``OTTONEU_QUERY_CACHE=on`` enables it process-wide and
+    ``OTTONEU_QUERY_CACHE=off`` keeps it off everywhere.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = os.getenv("OTTONEU_QUERY_CACHE", "off").lower() not in _OFF
+        self._entries: "OrderedDict[tuple, tuple[Any, float, list[dict]]]" = OrderedDict()
+        self._listeners: list = []
+        self._lock = threading.Lock()
+        # Bumped per table on every invalidation; a read that started before
+        # a write finished carries the old value and isn't stored.
+        self._generations: dict[Optional[str], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _scope(client: Any) -> tuple[Any, Any]:
+        """(scope, owner): the owner must match on lookup (None = any client of the scope)."""
+        scope = getattr(client, "cache_scope", None)
+        if scope is not None:
+            return scope, None
+        return ("client", id(client)), client
+
+    def enable(self) -> None:
+        """Memoize reads for the rest of the process unless ``OTTONEU_QUERY_CACHE=off``."""
+        if os.getenv("OTTONEU_QUERY_CACHE", "").lower() not in _OFF:
+            self.enabled = True
+
+    def get(self, client: Any, key: tuple) -> Optional[list[dict]]:
+        if not self.enabled:
+            return None
+        scope, owner = self._scope(client)
+        cache_key = (scope, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] is not owner or time.monotonic() - entry[1] > self.ttl:
+                if entry is not None:
+                    del self._entries[cache_key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            rows = entry[2]
+        return [dict(row) for row in rows]
+
+    def generation(self, table: str) -> tuple[int, int]:
+        """Token for :meth:`put`: changes whenever ``table`` (or everything) is invalidated."""
+        with self._lock:
+            return self._generations.get(table, 0), self._generations.get(None, 0)
+
+    def put(self, client: Any, key: tuple, rows: list[dict],
+            generation: Optional[tuple[int, int]] = None) -> None:
+        """Store ``rows`` — unless the table was invalidated since ``generation`` was taken."""
+        if not self.enabled:
+            return
+        scope, owner = self._scope(client)
+        with self._lock:
+            if generation is not None and generation != (
+                self._generations.get(key[0], 0), self._generations.get(None, 0)
+            ):
+                return
+            self._entries[(scope, key)] = (owner, time.monotonic(), rows)
+            self._entries.move_to_end((scope, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Drop ``table``'s entries (every entry when ``table`` is None)."""
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            if table is None:
+                self._entries.clear()
+            else:
+                for cache_key in [k for k in self._entries if k[1][0] == table]:
+                    del self._entries[cache_key]
+        for listener in list(self._listeners):
+            listener(table)
+
+    def add_listener(self, listener) -> None:
+        """Call ``listener(table)`` on every invalidation (``None`` = all tables)."""
+        self._listeners.append(listener)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+QUERY_CACHE = QueryCache(
+    maxsize=int(os.getenv("OTTONEU_QUERY_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("OTTONEU_QUERY_CACHE_TTL", "600")),
+)
+
+_WRITE_METHODS = ("insert", "upsert", "update", "delete")
+
+
+class _InvalidateOnExecute:
+    """A write request builder that drops the table's memoized reads once it executes.
+
+    Filter calls chained after the write (``.update(...).eq(...)``) keep the
+    wrapper; the invalidation runs after ``execute()`` returns, so a read
+    racing the write (another thread, or a fetch between building and
+    executing it) can't re-cache the pre-write rows.
+    """
+
+    def __init__(self, builder: Any, table: str):
+        self._builder = builder
+        self._table = table
+
+    def execute(self, *args, **kwargs) -> Any:
+        response = self._builder.execute(*args, **kwargs)
+        QUERY_CACHE.invalidate(self._table)
+        return response
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._builder, attr)
+        if not callable(value):
+            return value
+
+        def chained(*args, **kwargs):
+            result = value(*args, **kwargs)
+            return _InvalidateOnExecute(result, self._table) if hasattr(result, "execute") else result
+
+        return chained
+
+
+class _WriteInvalidatingTable:
+    """A table request builder whose writes invalidate the table's memoized reads."""
+
+    def __init__(self, builder: Any, table: str):
+        self._builder = builder
+        self._table = table
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._builder, attr)
+        if attr not in _WRITE_METHODS:
+            return value
+
+        def write(*args, **kwargs):
+            return _InvalidateOnExecute(value(*args, **kwargs), self._table)
+
+        return write
+
+
+class WriteInvalidatingClient:
+    """Supabase client proxy routing ``.table()`` through :class:`_WriteInvalidatingTable`.
+
+    ``postgres`` is the optional direct-connection backend used by
+    ``fetch_all_rows`` / ``bulk_upsert`` for bulk reads and writes.
+    """
+
+    cache_scope = ("supabase",)
+
+    def __init__(self, client: Any, postgres: Optional["PostgresBackend"] = None):
+        self._client = client
+        self.postgres = postgres
+
+    def table(self, name: str) -> Any:
+        return _WriteInvalidatingTable(self._client.table(name), name)
+
+    from_ = table
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._client, attr)
+
+
+def bulk_upsert(supabase, table: str, rows: list[dict], on_conflict: str,
+                batch_size: int = 500) -> int:
+    """Upsert ``rows`` into ``table``, keyed on the ``on_conflict`` columns.
+
+    The shared write path for bulk upserts (backfills, ``run_model``,
+    ``promote``). Over PostgREST the rows go out in ``batch_size`` JSON
+    requests; with a :class:`PostgresBackend` on the client (``DATABASE_URL``)
+    they are COPYed into a temp table and merged with one
+    ``INSERT ... ON CONFLICT DO UPDATE``. Either way the table's memoized
+    reads are invalidated. Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+    postgres = getattr(supabase, "postgres", None)
+    if postgres is not None:
+        postgres.upsert(table, rows, on_conflict)
+        QUERY_CACHE.invalidate(table)
+        return len(rows)
+    for i in range(0, len(rows), batch_size):
+        supabase.table(table).upsert(rows[i:i + batch_size], on_conflict=on_conflict).execute()
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Direct Postgres backend (bulk I/O)
+# ---------------------------------------------------------------------------
+# PostgREST caps reads at 1000 rows per request and upserts go out as JSON
+# batches, which dominates backfills and full projection runs. With
+# DATABASE_URL set (the Supabase pooler / direct connection string, or a local
+# docker Postgres), get_supabase_client() attaches a PostgresBackend and the
+# bulk helpers above use it: reads stream through one server-side cursor and
+# upserts go through COPY + INSERT ... ON CONFLICT. Everything else (filters
+# chained on .table(), deletes, updates, RPCs) stays on PostgREST. Needs the
+# optional ``psycopg`` dependency (``pip install -e .[postgres]``).
+
+DATABASE_URL_ENV = "DATABASE_URL"
+
+_FILTER_SQL = {"eq": "=", "neq": "<>", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_IDENTIFIER = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def _is_identifier(name: str) -> bool:
+    return bool(name) and not name[0].isdigit() and set(name) <= _IDENTIFIER
+
+
+class PostgresBackend:
+    """Bulk reads and upserts over a direct Postgres connection.
+
+    Reads wrap each row in ``row_to_json`` so values come back exactly as
+    PostgREST's JSON would return them (numerics as numbers, uuids, dates and
+    timestamps as strings). One connection per process, reopened after a fork.
+
+    Args:
+        dsn: Postgres connection string (``DATABASE_URL``).
+        connect: Connection factory (default ``psycopg.connect``); tests pass
+            a stand-in.
+        itersize: Rows per server-side cursor round-trip.
+    """
+
+    def __init__(self, dsn: str, connect=None, itersize: int = 10_000):
+        self.dsn = dsn
+        self.itersize = itersize
+        self._connect = connect
+        self._conn = None
+        self._pid: Optional[int] = None
+        self._json_columns: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            connect = self._connect
+            if connect is None:
+                try:
+                    import psycopg
+                except ImportError as exc:
+                    raise ImportError(
+                        f"{DATABASE_URL_ENV} is set but psycopg is not installed; "
+                        "run `pip install -e .[postgres]` or unset it."
+                    ) from exc
+                connect = psycopg.connect
+            self._conn = connect(self.dsn)
+            self._pid = os.getpid()
+        return self._conn
+
+    # -- reads ---------------------------------------------------------------
+
+    @staticmethod
+    def can_fetch(select: str, filters) -> bool:
+        """Whether a ``fetch_all_rows`` read translates to plain SQL.
+
+        Embedded resources, aliases, casts and filter ops beyond the basic
+        comparisons stay on PostgREST.
+        """
+        columns = [c.strip() for c in select.split(",")]
+        if columns != ["*"] and not all(_is_identifier(c) for c in columns):
+            return False
+        return all(
+            (op in _FILTER_SQL or op in ("in_", "is_")) and _is_identifier(column)
+            for op, column, _value in (filters or [])
+        )
+
+    @staticmethod
+    def _where(filters) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        for op, column, value in (filters or []):
+            if op == "in_":
+                values = list(value)
+                if not values:
+                    clauses.append("FALSE")
+                    continue
+                clauses.append(f'"{column}" IN ({", ".join(["%s"] * len(values))})')
+                params.extend(values)
+            elif op == "is_":
+                text = "null" if value is None else str(value).lower()
+                if text not in ("null", "true", "false"):
+                    raise ValueError(f"is_ filter on {column!r} takes null/true/false, got {value!r}")
+                clauses.append(f'"{column}" IS {text.upper()}')
+            else:
+                clauses.append(f'"{column}" {_FILTER_SQL[op]} %s')
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def fetch_sql(self, table: str, select: str, filters=None,
+                  order_by: Optional[str] = None) -> tuple[str, list]:
+        """The ``SELECT row_to_json(...)`` statement and params for a read."""
+        columns = [c.strip() for c in select.split(",")]
+        projection = "*" if columns == ["*"] else ", ".join(f'"{c}"' for c in columns)
+        where, params = self._where(filters)
+        query = f'SELECT row_to_json(t) FROM (SELECT {projection} FROM "{table}"{where}) t'
+        if order_by is not None:
+            query += f' ORDER BY t."{order_by}"'
+        return query, params
+
+    def fetch(self, table: str, select: str = "*", filters=None,
+              order_by: Optional[str] = None) -> list[dict]:
+        """All matching rows through one server-side cursor."""
+        query, params = self.fetch_sql(table, select, filters, order_by)
+        with self._lock:
+            conn = self._connection()
+            try:
+                with conn.cursor(name=f"fetch_{table}") as cur:
+                    cur.itersize = self.itersize
+                    cur.execute(query, params)
+                    rows = [row[0] for row in cur]
+            finally:
+                conn.rollback()  # end the read transaction the named cursor opened
+        return rows
+
+    # -- writes --------------------------------------------------------------
+
+    def _json_columns_of(self, conn, table: str) -> frozenset[str]:
+        """json/jsonb columns of ``table`` (their dict/list values are sent as JSON)."""
+        if table not in self._json_columns:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT column_name FROM information_schema.columns "
+                    "WHERE table_schema = 'public' AND table_name = %s "
+                    "AND data_type IN ('json', 'jsonb')",
+                    [table],
+                )
+                self._json_columns[table] = frozenset(row[0] for row in cur.fetchall())
+        return self._json_columns[table]
+
+    @staticmethod
+    def upsert_sql(table: str, columns: list[str], on_conflict: str) -> tuple[str, str, str]:
+        """(create temp table, COPY, merge) statements for an upsert."""
+        keys = [k.strip() for k in on_conflict.split(",")]
+        for name in [table, *columns, *keys]:
+            if not _is_identifier(name):
+                raise ValueError(f"Not a plain column/table name: {name!r}")
+        staging = f"_upsert_{table}"
+        quoted = ", ".join(f'"{c}"' for c in columns)
+        create = (
+            f'CREATE TEMP TABLE "{staging}" ON COMMIT DROP AS '
+            f'SELECT {quoted} FROM "{table}" WITH NO DATA'
+        )
+        copy = f'COPY "{staging}" ({quoted}) FROM STDIN'
+        updates = [c for c in columns if c not in keys]
+        action = (
+            "DO UPDATE SET " + ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in updates)
+            if updates else "DO NOTHING"
+        )
+        conflict = ", ".join(f'"{k}"' for k in keys)
+        merge = (
+            f'INSERT INTO "{table}" ({quoted}) SELECT {quoted} FROM "{staging}" '
+            f"ON CONFLICT ({conflict}) {action}"
+        )
+        return create, copy, merge
+
+    def upsert(self, table: str, rows: list[dict], on_conflict: str) -> None:
+        """COPY ``rows`` into a temp table and merge them in one transaction.
+
+        Columns are the union of the rows' keys; a row missing one writes NULL,
+        as PostgREST's upsert does.
+        """
+        columns = list(dict.fromkeys(k for row in rows for k in row))
+        create, copy_sql, merge = self.upsert_sql(table, columns, on_conflict)
+        with self._lock:
+            conn = self._connection()
+            try:
+                # Inside the try: a failed lookup must not leave the shared
+                # connection in an aborted transaction.
+                json_columns = self._json_columns_of(conn, table)
+                wrap = [c in json_columns for c in columns]
+                with conn.cursor() as cur:
+                    cur.execute(create)
+                    with cur.copy(copy_sql) as copy:
+                        for row in rows:
+                            copy.write_row([
+                                json.dumps(value) if is_json and value is not None else value
+                                for value, is_json in zip((row.get(c) for c in columns), wrap)
+                            ])
+                    cur.execute(merge)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+
+_postgres_backends: dict[str, PostgresBackend] = {}
+
+
+def postgres_backend() -> Optional[PostgresBackend]:
+    """The process's :class:`PostgresBackend` for ``DATABASE_URL`` (None if unset)."""
+    dsn = os.getenv(DATABASE_URL_ENV, "").strip()
+    if not dsn:
+        return None
+    if dsn not in _postgres_backends:
+        _postgres_backends[dsn] = PostgresBackend(dsn)
+    return _postgres_backends[dsn]
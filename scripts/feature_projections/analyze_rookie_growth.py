@@ -15,7 +15,8 @@ import argparse
 import statistics
 from collections import defaultdict
 
-from scripts.config import get_supabase_client, fetch_all_rows, MIN_GAMES
+from scripts.config import get_supabase_client, MIN_GAMES
+from scripts.db_io import fetch_all_rows
 
 
 def compute_rookie_growth_ratios(
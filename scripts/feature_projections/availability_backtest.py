@@ -41,7 +41,8 @@ import os
 from datetime import datetime
 from typing import Optional
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS
+from scripts.db_io import fetch_all_rows
 from scripts.feature_projections.expected_games import MODES, build_expected_games
 from scripts.feature_projections.backtest import (
     TOP_N_BY_POSITION,
@@ -348,6 +349,7 @@ def main() -> None:
                              "(player recency-weighted games). Scales the avail prediction only.")
     parser.add_argument("--output",
                         default=os.path.join(repo_root, "docs", "generated", "projection-availability-eval.md"))
+    add_source_arg(parser)
     args = parser.parse_args()
 
     seasons = [int(s) for s in args.seasons.split(",")]
@@ -7,7 +7,8 @@ import math
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
+from scripts.config import get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
 
 
 def _fetch_season_rows(supabase, table, select, season, extra_eq=None, page_size=1000):
@@ -17,18 +18,10 @@ def _fetch_season_rows(supabase, table, select, season, extra_eq=None, page_size
     exceed 1000 rows; a plain .execute() would silently truncate and corrupt
     backtest metrics. extra_eq is an optional (column, value) equality filter.
     """
-    all_rows: list[dict] = []
-    offset = 0
-    while True:
-        query = supabase.table(table).select(select).eq("season", season)
-        if extra_eq is not None:
-            query = query.eq(extra_eq[0], extra_eq[1])
-        batch = query.range(offset, offset + page_size - 1).execute().data or []
-        all_rows.extend(batch)
-        if len(batch) < page_size:
-            break
-        offset += page_size
-    return all_rows
+    filters = [("eq", "season", season)]
+    if extra_eq is not None:
+        filters.append(("eq", extra_eq[0], extra_eq[1]))
+    return fetch_all_rows(supabase, table, select, filters=filters, page_size=page_size)
 
 
 # Decision-relevant top-N per position: roughly the starter pool in a 12-team
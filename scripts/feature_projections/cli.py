@@ -1,7 +1,7 @@
 """CLI for the feature-based projection system.
 
 Commands:
-    run                — Generate projections for a model
+    run                — Generate projections for one model, several (--models) or all (--all)
     backtest           — Compare projections to actuals
     compare            — Side-by-side model comparison
     promote            — Copy model projections to production table
@@ -20,11 +20,22 @@ repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fi
 
 
 def cmd_run(args: argparse.Namespace) -> None:
-    from scripts.feature_projections.runner import run_model
+    from scripts.feature_projections import profiling
+    from scripts.feature_projections.model_config import MODELS
+    from scripts.feature_projections.runner import run_models
 
     seasons = [int(s.strip()) for s in args.seasons.split(",")]
-    count = run_model(args.model, seasons)
-    print(f"\nDone. Generated {count} projections.")
+    if args.all:
+        model_names = list(MODELS)
+    elif args.models:
+        model_names = [m.strip() for m in args.models.split(",") if m.strip()]
+    else:
+        model_names = [args.model]
+    with profiling.profiled(args, "run"):
+        counts = run_models(
+            model_names, seasons, incremental=args.incremental, workers=args.workers
+        )
+    print(f"\nDone. Generated {sum(counts.values())} projections across {len(counts)} model(s).")
 
 
 def cmd_backtest(args: argparse.Namespace) -> None:
@@ -145,15 +156,42 @@ def cmd_list(args: argparse.Namespace) -> None:
 
 
 def main() -> None:
+    from scripts.config import add_source_arg
+
     parser = argparse.ArgumentParser(
         description="Feature-based projection system CLI"
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # run
-    run_parser = subparsers.add_parser("run", help="Generate projections for a model")
-    run_parser.add_argument("--model", required=True, help="Model name (e.g., v1_baseline_weighted_ppg)")
+    run_parser = subparsers.add_parser("run", help="Generate projections for one or more models")
+    run_target = run_parser.add_mutually_exclusive_group(required=True)
+    run_target.add_argument("--model", help="Model name (e.g., v1_baseline_weighted_ppg)")
+    run_target.add_argument(
+        "--models",
+        help="Comma-separated model names, run in a single pass sharing inputs and features",
+    )
+    run_target.add_argument("--all", action="store_true", help="Run every model in MODELS in a single pass")
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Recompute only players whose inputs changed; upsert only changed rows",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Project (season, player shard) chunks on N worker processes (default: 1, serial)",
+    )
     run_parser.add_argument("--seasons", required=True, help="Comma-separated seasons (e.g., 2024,2025,2026)")
+    run_parser.add_argument(
+        "--profile", action="store_true",
+        help="Print wall time / call counts per stage and per feature",
+    )
+    run_parser.add_argument(
+        "--profile-json", action="store_true",
+        help="With --profile, also write the profile to .cache/profiles/",
+    )
     run_parser.set_defaults(func=cmd_run)
 
     # backtest
@@ -179,6 +217,7 @@ def main() -> None:
     diag_parser.add_argument("--season", type=int, default=None, help="Season (default: latest with data)")
     diag_parser.add_argument("--top", type=int, default=20, help="Number of worst projections (default: 20)")
     diag_parser.add_argument("--output", default=None, help="Output markdown file path")
+    add_source_arg(diag_parser)
     diag_parser.set_defaults(func=cmd_diagnostics)
 
     # segment-analysis
@@ -203,6 +242,7 @@ def main() -> None:
         default=os.path.join(repo_root, "docs", "generated", "segment-analysis.md"),
         help="Output file path",
     )
+    add_source_arg(seg_parser)
     seg_parser.set_defaults(func=cmd_segment_analysis)
 
     # list
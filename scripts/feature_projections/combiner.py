@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 import pandas as pd
 
+from scripts.feature_projections.context import with_base_ppg
 from scripts.feature_projections.features.base import ProjectionFeature
 
 
+def compute_feature(
+    feature: ProjectionFeature,
+    player_id: str,
+    position: str,
+    history_df: pd.DataFrame,
+    nfl_stats_df: pd.DataFrame,
+    context: dict[str, Any],
+    precomputed: Mapping[str, Optional[float]],
+) -> Optional[float]:
+    """One feature's value: the batch result when present, else ``compute()``."""
+    if feature.name in precomputed:
+        return precomputed[feature.name]
+    return feature.compute(player_id, position, history_df, nfl_stats_df, context)
+
+
 def combine_features(
     features: list[ProjectionFeature],
     player_id: str,
@@ -17,6 +33,7 @@ def combine_features(
     nfl_stats_df: pd.DataFrame,
     context: dict[str, Any],
     weights: dict[str, float] | None = None,
+    precomputed: Mapping[str, Optional[float]] | None = None,
 ) -> tuple[Optional[float], dict[str, Optional[float]]]:
     """Compute all features and combine into a final PPG projection.
 
@@ -30,12 +47,17 @@ def combine_features(
         nfl_stats_df: Player's nfl_stats rows.
         context: Shared context dict.
         weights: Optional feature name → weight mapping. Defaults to 1.0.
+        precomputed: Optional feature name → raw (unweighted) value already
+            produced by a feature's ``compute_batch``. Features listed here are
+            not recomputed; all others fall back to ``compute()``.
 
     Returns:
         (final_ppg, feature_values) where feature_values maps name → computed value.
     """
     if weights is None:
         weights = {}
+    if precomputed is None:
+        precomputed = {}
 
     feature_values: dict[str, Optional[float]] = {}
     base_value: Optional[float] = None
@@ -44,7 +66,8 @@ def combine_features(
     # First pass: compute base feature
     for feature in features:
         if feature.is_base:
-            val = feature.compute(player_id, position, history_df, nfl_stats_df, context)
+            val = compute_feature(feature, player_id, position, history_df,
+                                  nfl_stats_df, context, precomputed)
             feature_values[feature.name] = val
             if val is not None:
                 w = weights.get(feature.name, 1.0)
@@ -57,14 +80,15 @@ def combine_features(
         return None, feature_values
 
     # Update context with base_ppg so adjustment features can use it
-    context_with_base = {**context, "base_ppg": base_value}
+    context_with_base = with_base_ppg(context, base_value)
 
     # Second pass: compute adjustment features
     total_adjustment = 0.0
     for feature in features:
         if feature.is_base:
             continue
-        val = feature.compute(player_id, position, history_df, nfl_stats_df, context_with_base)
+        val = compute_feature(feature, player_id, position, history_df,
+                              nfl_stats_df, context_with_base, precomputed)
         feature_values[feature.name] = val
         if val is not None:
             w = weights.get(feature.name, 1.0)
@@ -0,0 +1,201 @@
+"""Two-level feature context: one immutable season context + slim per-player views.
+
+Features read their inputs from ``context.get(...)`` / ``context[...]``. The
+runner used to build a fresh dict per player, rebuilding ``all_team_ratings``
+over every team and copying a dozen season-wide lookup references (vegas lines,
+depth charts, red zone, NGS passing, QB ecosystem, coaching, ...) each time,
+and the combiners then copied it again as ``{**context, "base_ppg": ...}``.
+
+* :class:`SeasonContext` is built once per target season and holds every
+  season-wide value, plus the per-position and per-team values players pick
+  from (positional means / floors, pooling k, team offense rating / usage).
+* :class:`PlayerContext` is a ``__slots__`` view holding only the player's own
+  fields and ``base_ppg``; everything else is read through to the season.
+  :meth:`PlayerContext.with_base_ppg` is a slot copy rather than a dict copy.
+
+Both are read-only ``Mapping`` s, so every feature (and plain-dict callers such
+as the sweeps and tests) keep working unchanged. Keys are present exactly when
+the old per-player dict had them.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Optional
+
+import pandas as pd
+
+from scripts.feature_projections.qb_starters import is_qb_starter
+
+_MISSING: Any = object()
+
+# ``SeasonContext`` keyword -> context key for the season-wide lookups.
+_LOOKUP_KEYS = {
+    "vegas_lines": "vegas_lines",
+    "vegas_league_means": "vegas_league_mean_implied",
+    "depth_charts": "depth_charts",
+    "red_zone": "red_zone",
+    "ngs_passing": "ngs_passing",
+    "qb1_by_team": "qb1_by_team",
+    "player_team_by_season": "player_team_by_season",
+    "qb_quality": "qb_quality",
+    "team_coaching": "team_coaching",
+}
+
+
+class SeasonContext(Mapping[str, Any]):
+    """Season-wide feature context, built once per target season."""
+
+    __slots__ = (
+        "_values", "_teams", "_positional_means", "_positional_starter_floors",
+        "_pooling_k", "_qb_starters", "_draft_capital",
+    )
+
+    def __init__(
+        self,
+        target_season: int,
+        team_aggregates: dict[str, Any],
+        positional_means: dict[str, float] | None = None,
+        positional_starter_floors: dict[str, float] | None = None,
+        qb_starters: dict[int, dict[str, str | None]] | None = None,
+        draft_capital: dict[str, dict[str, int]] | None = None,
+        pooling_k: dict[str, float] | None = None,
+        **lookups: Any,
+    ):
+        unknown = set(lookups) - set(_LOOKUP_KEYS)
+        if unknown:
+            raise TypeError(f"Unknown season context lookups: {sorted(unknown)}")
+        values: dict[str, Any] = {
+            "target_season": target_season,
+            # Per-team offense ratings (all teams) for historical lookups
+            "all_team_ratings": {
+                team: data.get("offense_rating", 0.0)
+                for team, data in team_aggregates.items()
+            },
+        }
+        for arg, key in _LOOKUP_KEYS.items():
+            if lookups.get(arg) is not None:
+                values[key] = lookups[arg]
+        self._values = MappingProxyType(values)
+        self._teams = {
+            team: (data.get("offense_rating", 0.0), data.get("usage_by_season", {}))
+            for team, data in team_aggregates.items()
+        }
+        self._positional_means = positional_means or {}
+        self._positional_starter_floors = positional_starter_floors or {}
+        self._pooling_k = pooling_k or {}
+        self._qb_starters = qb_starters
+        self._draft_capital = draft_capital
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def player(
+        self,
+        player_id: str,
+        position: str,
+        birth_date: Any = None,
+        nfl_team: Optional[str] = None,
+        team_history: Optional[dict[int, str]] = None,
+    ) -> "PlayerContext":
+        """The per-player view (what ``_build_context`` used to return)."""
+        ctx = PlayerContext(self)
+        if birth_date is not None and pd.notna(birth_date):
+            ctx.birth_date = birth_date
+        ctx.nfl_team = nfl_team
+        if nfl_team and nfl_team in self._teams:
+            ctx.team_offense_rating, ctx.team_usage = self._teams[nfl_team]
+        ctx.team_history = team_history if team_history is not None else {}
+        if position in self._positional_means:
+            ctx.positional_mean_ppg = self._positional_means[position]
+        if position in self._positional_starter_floors:
+            ctx.positional_starter_floor = self._positional_starter_floors[position]
+        # Empirical-Bayes pooling strength k_g (GH #667, L3); falls back to the
+        # feature default if absent.
+        if position in self._pooling_k:
+            ctx.pooling_k = self._pooling_k[position]
+        if self._draft_capital is not None:
+            record = self._draft_capital.get(player_id)
+            if record:
+                ctx.draft_capital = record
+        if self._qb_starters and position == "QB":
+            # Designated starter in any historical season
+            ctx.is_qb_starter = any(
+                is_qb_starter(player_id, s, self._qb_starters) for s in self._qb_starters
+            )
+            ctx.qb_starters = self._qb_starters
+        return ctx
+
+
+class PlayerContext(Mapping[str, Any]):
+    """A player's own context fields over a shared :class:`SeasonContext`.
+
+    Unset slots are absent keys (``KeyError`` / ``.get`` default), matching
+    the per-player dicts this replaces.
+    """
+
+    __slots__ = (
+        "season", "birth_date", "nfl_team", "team_offense_rating", "team_usage",
+        "team_history", "positional_mean_ppg", "positional_starter_floor",
+        "pooling_k", "draft_capital", "is_qb_starter", "qb_starters", "base_ppg",
+    )
+
+    def __init__(self, season: SeasonContext):
+        self.season = season
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _PLAYER_KEYS:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        return self.season[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _PLAYER_KEYS:
+            return getattr(self, key, default)
+        return self.season._values.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _PLAYER_KEYS:
+            return hasattr(self, key)  # type: ignore[arg-type]
+        return key in self.season._values
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.season
+        for key in _PLAYER_KEY_ORDER:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.season) + sum(hasattr(self, key) for key in _PLAYER_KEY_ORDER)
+
+    def with_base_ppg(self, base_ppg: Optional[float]) -> "PlayerContext":
+        """Copy with ``base_ppg`` set (the combiners' second pass)."""
+        ctx = PlayerContext.__new__(PlayerContext)
+        for key in PlayerContext.__slots__:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                setattr(ctx, key, value)
+        ctx.base_ppg = base_ppg
+        return ctx
+
+    def __repr__(self) -> str:
+        return f"PlayerContext({dict(self)!r})"
+
+
+_PLAYER_KEY_ORDER = PlayerContext.__slots__[1:]
+_PLAYER_KEYS = frozenset(_PLAYER_KEY_ORDER)
+
+
+def with_base_ppg(context: Mapping[str, Any], base_ppg: Optional[float]) -> Mapping[str, Any]:
+    """``context`` plus ``base_ppg``, for either context flavour."""
+    if isinstance(context, PlayerContext):
+        return context.with_base_ppg(base_ppg)
+    return {**context, "base_ppg": base_ppg}
@@ -28,7 +28,8 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
+from scripts.config import get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows, FETCH_WORKERS
 
 repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -61,8 +62,10 @@ def gather(min_games: int = MIN_GAMES) -> dict:
     sb = get_supabase_client()
     players = fetch_all_rows(sb, "players", "id, position")
     pos_map = {p["id"]: p["position"] for p in players}
-    ps = fetch_all_rows(sb, "player_stats", "player_id, season, games_played, ppg")
-    ns = fetch_all_rows(sb, "nfl_stats", "player_id, season, games_played, ppg")
+    ps = fetch_all_rows(sb, "player_stats", "player_id, season, games_played, ppg",
+                        workers=FETCH_WORKERS)
+    ns = fetch_all_rows(sb, "nfl_stats", "player_id, season, games_played, ppg",
+                        workers=FETCH_WORKERS)
 
     ps_total, ps_qual, ps_ppg, ps_qpos = _per_season(ps, pos_map, min_games)
     ns_total, ns_qual, ns_ppg, ns_qpos = _per_season(ns, pos_map, min_games)
@@ -16,7 +16,6 @@ Options:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from datetime import datetime
@@ -24,8 +23,10 @@ from datetime import datetime
 # Repo root — used to compute the default report output path below.
 repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scripts.config import get_supabase_client, fetch_all_rows, MIN_GAMES, POSITIONS
+from scripts.config import add_source_arg, get_supabase_client, MIN_GAMES, POSITIONS
+from scripts.db_io import fetch_all_rows
 from scripts.analysis_utils import available_model_seasons
+from scripts.feature_projections.feature_values import feature_dicts, fetch_feature_frame
 from scripts.feature_projections.model_config import MODELS
 
 
@@ -100,23 +101,21 @@ def run_diagnostics(
 
     model_id = model_res.data[0]["id"]
 
-    # Fetch projections with feature values (paginated — a model+season can
-    # exceed the 1000-row PostgREST cap).
+    # Fetch projections (paginated — a model+season can exceed the 1000-row
+    # PostgREST cap); feature values come back typed, in one wide frame.
     proj_rows = fetch_all_rows(
-        supabase, "model_projections", "player_id, projected_ppg, feature_values",
+        supabase, "model_projections", "player_id, projected_ppg",
         filters=[("eq", "model_id", model_id), ("eq", "season", season)],
     )
     if not proj_rows:
         raise ValueError(f"No projections found for model '{model_name}', season {season}")
+    features = feature_dicts(fetch_feature_frame(supabase, model_id, [season]))
 
     proj_map = {}
     for row in proj_rows:
-        fv = row.get("feature_values") or {}
-        if isinstance(fv, str):
-            fv = json.loads(fv)
         proj_map[row["player_id"]] = {
             "projected_ppg": float(row["projected_ppg"]),
-            "feature_values": fv,
+            "feature_values": features.get((row["player_id"], season), {}),
         }
 
     # Fetch actuals (paginated — a single season of player_stats can exceed
@@ -326,6 +325,7 @@ def main() -> None:
         default=os.path.join(repo_root, "docs", "generated", "player-diagnostics.md"),
         help="Output file path (default: docs/generated/player-diagnostics.md)",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
 
     model_name = args.model or _get_default_model()
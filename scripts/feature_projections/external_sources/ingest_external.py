@@ -27,7 +27,8 @@ except ImportError:
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows  # noqa: E402
+from scripts.config import get_supabase_client  # noqa: E402
+from scripts.db_io import fetch_all_rows  # noqa: E402
 
 from scripts.feature_projections.external_sources.fantasypros_fetcher import (  # noqa: E402
     fetch_all_positions,
@@ -170,7 +171,7 @@ def ingest_fantasypros(seasons: list[int]) -> int:
                     "player_id": str(row["player_id"]),
                     "season": season,
                     "projected_ppg": round(float(ppg), 4),
-                    "feature_values": json.dumps(stat_snapshot),
+                    "feature_values": stat_snapshot,
                 }
             )
 
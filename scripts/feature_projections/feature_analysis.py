@@ -25,8 +25,8 @@ from scripts.config import get_supabase_client, MIN_GAMES
 from scripts.feature_projections.model_config import get_model, MODELS
 from scripts.feature_projections.train_model import collect_training_data
 from scripts.feature_projections.learned_combiner import (
-    build_feature_vector,
-    get_feature_column_names,
+    DesignMatrixSpec,
+    feature_value_frame,
     load_model_params,
 )
 
@@ -43,25 +43,12 @@ def build_feature_matrix(
     Returns a DataFrame where columns are feature names and rows are samples,
     or None if the matrix is empty.
     """
-    feature_names = None  # type: Optional[List[str]]
-    all_vectors = []  # type: List[List[float]]
-
-    for _, row in training_data.iterrows():
-        fv = row["feature_values"]
-        if not fv:
-            continue
-        position = row["position"]
-        vec = build_feature_vector(fv, position, interaction_terms)
-        if vec is None:
-            continue
-        if feature_names is None:
-            feature_names = get_feature_column_names(list(fv.keys()), interaction_terms)
-        all_vectors.append(vec)
-
-    if not all_vectors or feature_names is None:
+    rows = training_data[training_data["feature_values"].map(bool)]
+    if rows.empty:
         return None
-
-    return pd.DataFrame(all_vectors, columns=feature_names)
+    spec = DesignMatrixSpec.compile(list(rows["feature_values"].iloc[0].keys()), interaction_terms)
+    matrix = spec.matrix(feature_value_frame(rows["feature_values"]), rows["position"])
+    return pd.DataFrame(matrix, columns=spec.column_names)
 
 
 def compute_correlation_matrix(feature_df: pd.DataFrame) -> pd.DataFrame:
@@ -286,17 +273,8 @@ def run_analysis(
 
     print("Feature matrix: %d samples x %d features\n" % (feature_df.shape[0], feature_df.shape[1]))
 
-    # Align actuals with the feature matrix (only rows that produced valid vectors)
-    valid_indices = []
-    for i, (_, row) in enumerate(training_data.iterrows()):
-        fv = row["feature_values"]
-        if not fv:
-            continue
-        vec = build_feature_vector(fv, row["position"], interaction_terms)
-        if vec is not None:
-            valid_indices.append(i)
-
-    actuals = training_data.iloc[valid_indices]["actual_ppg"].reset_index(drop=True)
+    # Align actuals with the feature matrix (only rows with feature values)
+    actuals = training_data[training_data["feature_values"].map(bool)]["actual_ppg"].reset_index(drop=True)
 
     # 1. Correlation matrix
     print("=" * 60)
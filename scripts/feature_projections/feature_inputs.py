@@ -0,0 +1,102 @@
+"""Which stats columns and season-wide lookups a set of features reads.
+
+``run_models`` / ``collect_training_data`` used to fetch ``nfl_stats`` with
+``select *`` (advanced receiving, snap and kicking columns a small model never
+reads) and build every lookup (draft capital, Vegas lines, depth charts, red
+zone, NGS, QB ecosystem, coaching) at startup whatever the model. Each
+:class:`ProjectionFeature` now declares its inputs as class attributes:
+
+* ``player_stats_columns`` / ``nfl_stats_columns`` — columns ``compute()`` /
+  ``compute_batch()`` read beyond the ``*_CORE`` columns the runner itself uses
+  (team aggregates, positional means, team history, actuals);
+* ``lookups`` — names from :data:`LOOKUPS`.
+
+``None`` (the base-class default) means undeclared: the runner falls back to
+every column / every lookup for that run. :func:`resolve_inputs` takes the
+union over a model's resolved features; the runner fetches only those columns
+and builds only those lookups (the rest are passed as empty).
+
+The declarations also scope the feature store's input fingerprint
+(:func:`feature_inputs`), so a feature's stored values stay valid across
+models that fetch different column sets.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+# Columns the runner / trainer read themselves, whatever the features.
+PLAYER_STATS_CORE = ("player_id", "season", "ppg", "games_played")
+NFL_STATS_CORE = (
+    "player_id", "season", "recent_team", "games_played",
+    "total_points", "targets", "rushing_attempts",
+)
+
+# Lookup name -> context keys it populates (see context._LOOKUP_KEYS).
+LOOKUP_CONTEXT_KEYS: dict[str, tuple[str, ...]] = {
+    "draft_capital": ("draft_capital",),
+    "vegas_lines": ("vegas_lines", "vegas_league_mean_implied"),
+    "depth_charts": ("depth_charts",),
+    "red_zone": ("red_zone",),
+    "ngs_passing": ("ngs_passing",),
+    "qb_ecosystem": ("qb1_by_team", "player_team_by_season", "qb_quality"),
+    "team_coaching": ("team_coaching",),
+}
+LOOKUPS = tuple(LOOKUP_CONTEXT_KEYS)
+
+
+@dataclass(frozen=True)
+class FeatureInputs:
+    """Resolved inputs; ``None`` columns = fetch every column of the table."""
+
+    player_stats_columns: Optional[tuple[str, ...]]
+    nfl_stats_columns: Optional[tuple[str, ...]]
+    lookups: frozenset[str]
+
+    def excluded_context_keys(self) -> frozenset[str]:
+        """Context keys of the lookups these inputs don't use."""
+        return frozenset(
+            key
+            for lookup, keys in LOOKUP_CONTEXT_KEYS.items()
+            if lookup not in self.lookups
+            for key in keys
+        )
+
+
+ALL_INPUTS = FeatureInputs(None, None, frozenset(LOOKUPS))
+
+
+def _columns(core: tuple[str, ...], declared: list[Optional[tuple[str, ...]]]):
+    if any(cols is None for cols in declared):
+        return None
+    return tuple(dict.fromkeys(core + tuple(c for cols in declared for c in cols)))
+
+
+def resolve_inputs(features: Iterable[Any]) -> FeatureInputs:
+    """Union of the inputs of ``features`` (classes or instances)."""
+    features = list(features)
+    lookups: set[str] = set()
+    for feature in features:
+        declared = getattr(feature, "lookups", None)
+        if declared is None:
+            lookups = set(LOOKUPS)
+            break
+        unknown = set(declared) - set(LOOKUPS)
+        if unknown:
+            raise ValueError(f"{feature!r} declares unknown lookups: {sorted(unknown)}")
+        lookups |= set(declared)
+    return FeatureInputs(
+        player_stats_columns=_columns(
+            PLAYER_STATS_CORE, [getattr(f, "player_stats_columns", None) for f in features]
+        ),
+        nfl_stats_columns=_columns(
+            NFL_STATS_CORE, [getattr(f, "nfl_stats_columns", None) for f in features]
+        ),
+        lookups=frozenset(lookups),
+    )
+
+
+def feature_inputs(feature: Any) -> FeatureInputs:
+    """One feature's inputs (core columns included)."""
+    return resolve_inputs([feature])
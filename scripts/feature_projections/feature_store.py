@@ -0,0 +1,393 @@
+"""Persistent per-feature value store under ``.cache/features``.
+
+Re-running a model (or training a learned one) recomputes every feature for
+every player-season even when only one feature's code changed. This store
+materializes raw ``compute()`` outputs in a local SQLite table keyed by
+
+    (feature name, feature code hash, player_id, target_season, input fingerprint)
+
+so a re-run only recomputes what actually changed:
+
+* **feature code hash** — per feature, the source of every module in the
+  feature class's MRO that lives under ``features/`` (so editing
+  ``weighted_ppg.py`` also invalidates the xFP / red-zone subclasses built on
+  it) plus the class's tunable UPPERCASE constants (sweeps patch those at
+  runtime). Same idea as ``holdout_cache.feature_code_version``, but per
+  feature: editing ``age_curve.py`` recomputes only ``age_curve``. The hash
+  also covers ``SCORING_SETTINGS`` (config.json): feature modules bake it into
+  module-level tables (``_TD_POINTS``), so a scoring change recomputes
+  everything.
+* **input fingerprint** — the player's history + nfl_stats rows and every
+  context value (including the combiner-injected ``base_ppg``), so a stats
+  backfill or a changed upstream lookup misses the cache instead of serving a
+  stale value. Scoped to the columns and lookups the feature declares
+  (``feature_inputs.py``), so runs that fetch different column sets for
+  different models still share a feature's stored values.
+
+Features are wrapped in :class:`StoredFeature` proxies, so ``combine_features``
+/ ``compute_features_for_player`` read and write the store without any change
+to their signatures. Values produced by ``compute_batch`` bypass the store
+(they are already one vectorized pass per season).
+
+Disable with ``OTTONEU_FEATURE_STORE=off``; relocate with
+``OTTONEU_FEATURE_STORE_DIR``. Clear with
+``python -m scripts.feature_projections.feature_store --clear``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from scripts import config
+from scripts.feature_projections import holdout_cache
+from scripts.feature_projections.feature_inputs import ALL_INPUTS, FeatureInputs, feature_inputs
+from scripts.feature_projections.features.base import ProjectionFeature
+
+_FEATURE_DIR = Path(os.path.dirname(os.path.abspath(__file__))) / "features"
+
+# Containers at least this large are treated as shared lookups (vegas lines,
+# depth charts, QB starters, ...): digested once per object and reused.
+_SHARED_MIN_LEN = 64
+
+
+def resolve_store_dir() -> Path:
+    """``OTTONEU_FEATURE_STORE_DIR`` or a sibling of the (worktree-shared) holdout cache."""
+    env = os.environ.get("OTTONEU_FEATURE_STORE_DIR")
+    if env:
+        return Path(env).expanduser()
+    return holdout_cache.CACHE_DIR.parent / "features"
+
+
+def store_enabled() -> bool:
+    return os.environ.get("OTTONEU_FEATURE_STORE", "on").lower() not in {"0", "off", "false", "no"}
+
+
+_source_hash_cache: dict[type, str] = {}
+
+
+def _source_hash(cls: type) -> str:
+    """Hash of every module in ``cls.__mro__`` that lives under ``features/``."""
+    cached = _source_hash_cache.get(cls)
+    if cached is not None:
+        return cached
+    h = hashlib.sha256()
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        try:
+            src = inspect.getsourcefile(klass)
+        except TypeError:
+            continue  # builtins (object, ABC)
+        if not src or src in seen:
+            continue
+        if Path(src).resolve().parent != _FEATURE_DIR.resolve():
+            continue
+        seen.add(src)
+        h.update(Path(src).name.encode())
+        h.update(Path(src).read_bytes())
+    digest = h.hexdigest()
+    _source_hash_cache[cls] = digest
+    return digest
+
+
+def scoring_digest() -> str:
+    """Digest of the league ``SCORING_SETTINGS`` the feature modules were built with."""
+    payload = json.dumps(config.SCORING_SETTINGS, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def feature_code_hash(feature: ProjectionFeature) -> str:
+    """Hash of the feature's own modules + its current tunable class constants
+    + the scoring settings.
+
+    Source hashes are memoized per class; the UPPERCASE constants and scoring
+    settings are re-read on every call because sweeps and tests patch them at
+    runtime.
+    """
+    cls = type(feature)
+    constants = {
+        attr: repr(getattr(cls, attr))
+        for attr in dir(cls)
+        if attr.isupper() and not attr.startswith("_")
+    }
+    h = hashlib.sha256(_source_hash(cls).encode())
+    h.update(repr(sorted(constants.items())).encode())
+    h.update(scoring_digest().encode())
+    return h.hexdigest()[:16]
+
+
+def _canonical(value: Any) -> Any:
+    """Order-independent, hashable-by-repr form of a context value."""
+    if isinstance(value, dict):
+        return tuple(sorted((repr(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(v) for v in value))
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value
+
+
+def _project(df: pd.DataFrame, columns: Optional[tuple[str, ...]]) -> pd.DataFrame:
+    """``df`` narrowed to ``columns`` (in a fixed order); None = unchanged."""
+    if columns is None or df is None or df.empty:
+        return df
+    wanted = set(columns)
+    return df[sorted(c for c in df.columns if c in wanted)]
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    if df is None or df.empty:
+        return "empty"
+    h = hashlib.sha256()
+    h.update(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+class InputFingerprinter:
+    """Stable digests of a player's feature inputs (rows + context values).
+
+    Shared lookups (containers of ``_SHARED_MIN_LEN``+ entries: vegas lines,
+    depth charts, QB starters, ...) are digested once per object for the whole
+    run; per-player values are memoized until the player changes. References
+    are held so ``id()`` keys can't be recycled while memoized — the lookups
+    must not be mutated after they are first digested.
+    """
+
+    def __init__(self) -> None:
+        self._shared_digests: dict[int, tuple[Any, str]] = {}
+        self._player_key: Optional[tuple[Any, ...]] = None
+        self._player_refs: tuple[Any, ...] = ()
+        self._player_digests: dict[int, tuple[Any, str]] = {}
+        self._frames_digests: dict[Any, str] = {}
+
+    def value_digest(self, value: Any) -> str:
+        if isinstance(value, (dict, list, tuple, set, frozenset)):
+            memo = self._shared_digests if len(value) >= _SHARED_MIN_LEN else self._player_digests
+            hit = memo.get(id(value))
+            if hit is not None and hit[0] is value:
+                return hit[1]
+            digest = hashlib.sha256(repr(_canonical(value)).encode()).hexdigest()[:16]
+            memo[id(value)] = (value, digest)
+            return digest
+        return repr(_canonical(value))
+
+    def mapping_digest(self, values: dict[str, Any]) -> str:
+        """Digest of a str-keyed mapping, one memoized value digest per key."""
+        h = hashlib.sha256()
+        for k in sorted(values):
+            h.update(k.encode())
+            h.update(self.value_digest(values[k]).encode())
+        return h.hexdigest()[:24]
+
+    def player_digest(
+        self,
+        player_id: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+        inputs: Optional[FeatureInputs] = None,
+    ) -> str:
+        """Digest of everything a feature's compute() can read for this player.
+
+        With ``inputs`` only those stats columns and the context keys of
+        those lookups count.
+        """
+        key = (player_id, id(history_df), id(nfl_stats_df))
+        if key != self._player_key:
+            self._player_key = key
+            self._player_refs = (history_df, nfl_stats_df)
+            self._player_digests = {}
+            self._frames_digests = {}
+        columns = (
+            (None, None) if inputs is None
+            else (inputs.player_stats_columns, inputs.nfl_stats_columns)
+        )
+        frames = self._frames_digests.get(columns)
+        if frames is None:
+            frames = (_frame_digest(_project(history_df, columns[0]))
+                      + _frame_digest(_project(nfl_stats_df, columns[1])))
+            self._frames_digests[columns] = frames
+        if inputs is not None and inputs.lookups != ALL_INPUTS.lookups:
+            excluded = inputs.excluded_context_keys()
+            context = {k: v for k, v in context.items() if k not in excluded}
+        h = hashlib.sha256(frames.encode())
+        h.update(self.mapping_digest(context).encode())
+        return h.hexdigest()[:24]
+
+
+class FeatureStore:
+    """SQLite-backed materialization of raw feature values.
+
+    Reads are served from an in-memory dict loaded once per
+    ``(feature, code hash, target_season)``; writes are buffered and flushed in
+    one transaction by :meth:`flush` (call it after each season / at the end).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else resolve_store_dir() / "features.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS feature_values ("
+            " feature TEXT NOT NULL, code_hash TEXT NOT NULL,"
+            " player_id TEXT NOT NULL, target_season INTEGER NOT NULL,"
+            " input_fp TEXT NOT NULL, value REAL,"
+            " PRIMARY KEY (feature, code_hash, player_id, target_season, input_fp))"
+        )
+        self._conn.commit()
+        self._loaded: dict[tuple[str, str, int], dict[tuple[str, str], Optional[float]]] = {}
+        self._pending: list[tuple[str, str, str, int, str, Optional[float]]] = []
+        self._fingerprinter = InputFingerprinter()
+        self.fingerprint = self._fingerprinter.player_digest
+        self.hits = 0
+        self.misses = 0
+
+    # -- storage ----------------------------------------------------------
+
+    def _season_values(self, feature: str, code_hash: str, season: int):
+        bucket_key = (feature, code_hash, season)
+        bucket = self._loaded.get(bucket_key)
+        if bucket is None:
+            rows = self._conn.execute(
+                "SELECT player_id, input_fp, value FROM feature_values"
+                " WHERE feature = ? AND code_hash = ? AND target_season = ?",
+                bucket_key,
+            ).fetchall()
+            bucket = {(pid, fp): val for pid, fp, val in rows}
+            self._loaded[bucket_key] = bucket
+        return bucket
+
+    def get(self, feature: str, code_hash: str, player_id: str, season: int, input_fp: str):
+        """``(found, value)`` — ``value`` may legitimately be None."""
+        bucket = self._season_values(feature, code_hash, season)
+        key = (player_id, input_fp)
+        if key in bucket:
+            return True, bucket[key]
+        return False, None
+
+    def put(self, feature: str, code_hash: str, player_id: str, season: int,
+            input_fp: str, value: Optional[float]) -> None:
+        self._season_values(feature, code_hash, season)[(player_id, input_fp)] = value
+        self._pending.append((feature, code_hash, player_id, season, input_fp, value))
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO feature_values"
+            " (feature, code_hash, player_id, target_season, input_fp, value)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending = []
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def reopen(self) -> None:
+        """Replace the connection in a forked child (SQLite handles can't cross a fork).
+
+        Pending writes belong to the parent and are dropped; loaded buckets are
+        kept, they're read-only snapshots of the same table.
+        """
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._pending = []
+
+    def wrap(self, feature_pool: dict[str, Any]) -> dict[str, Any]:
+        """Wrap every feature of a pool in a :class:`StoredFeature` proxy."""
+        return {name: StoredFeature(feature, self) for name, feature in feature_pool.items()}
+
+
+class StoredFeature(ProjectionFeature):
+    """Proxy that serves ``compute()`` from / into a :class:`FeatureStore`."""
+
+    def __init__(self, feature: ProjectionFeature, store: FeatureStore):
+        self._feature = feature
+        self._store = store
+        self._code_hash = feature_code_hash(feature)
+        self._inputs = feature_inputs(feature)
+
+    @property
+    def name(self) -> str:
+        return self._feature.name
+
+    @property
+    def is_base(self) -> bool:
+        return self._feature.is_base
+
+    def compute(
+        self,
+        player_id: str,
+        position: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[float]:
+        season = context.get("target_season")
+        if season is None:
+            return self._feature.compute(player_id, position, history_df, nfl_stats_df, context)
+        fp = self._store.fingerprint(
+            player_id, history_df, nfl_stats_df, dict(context, _position=position),
+            self._inputs,
+        )
+        found, value = self._store.get(self.name, self._code_hash, player_id, int(season), fp)
+        if found:
+            self._store.hits += 1
+            return value
+        self._store.misses += 1
+        value = self._feature.compute(player_id, position, history_df, nfl_stats_df, context)
+        self._store.put(
+            self.name, self._code_hash, player_id, int(season), fp,
+            None if value is None else float(value),
+        )
+        return value
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        return self._feature.compute_batch(season_frame, context)
+
+
+def open_store() -> Optional[FeatureStore]:
+    """The on-disk store, or None when disabled / unavailable."""
+    if not store_enabled():
+        return None
+    try:
+        return FeatureStore()
+    except (OSError, sqlite3.Error) as exc:
+        print(f"Feature store unavailable ({exc}); computing without it.")
+        return None
+
+
+if __name__ == "__main__":
+    import argparse
+    import shutil
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the feature store.")
+    parser.add_argument("--clear", action="store_true", help="Delete the store directory.")
+    args = parser.parse_args()
+    store_dir = resolve_store_dir()
+    if args.clear:
+        shutil.rmtree(store_dir, ignore_errors=True)
+        print(f"Cleared feature store: {store_dir}")
+    else:
+        print(store_dir)
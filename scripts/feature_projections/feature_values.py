@@ -0,0 +1,113 @@
+"""Stored projection feature values as a wide numeric DataFrame.
+
+``model_projections.feature_values`` holds one jsonb object per projection.
+Migration 036 mirrors it into ``model_projection_features`` — one typed row per
+(model, player, season, feature), kept in sync by a trigger — so reading a
+season's feature values is a paged read of numbers, and a subset of features
+is selected server-side with a plain ``feature IN (...)`` filter.
+
+``fetch_feature_frame`` pivots those rows into one float64 column per feature.
+Where the table isn't there (the migration isn't applied, or a mirror synced
+before it) it falls back to the jsonb column, decoding the JSON-string rows
+written before migration 036.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from scripts.db_io import fetch_all_rows
+
+FEATURES_TABLE = "model_projection_features"
+
+# PostgREST "table not in schema cache" / Postgres undefined_table.
+_MISSING_TABLE_CODES = {"PGRST205", "42P01"}
+
+
+def decode_feature_values(feature_values: Any) -> dict[str, Any]:
+    """A ``feature_values`` cell as a dict (jsonb object, legacy JSON string or NULL)."""
+    if isinstance(feature_values, str):
+        try:
+            return json.loads(feature_values)
+        except json.JSONDecodeError:
+            return {}
+    return dict(feature_values or {})
+
+
+def _wide(index: pd.DataFrame, values: pd.DataFrame, features: Optional[list[str]]) -> pd.DataFrame:
+    if features is not None:
+        values = values.reindex(columns=features)
+    else:
+        values = values.reindex(columns=sorted(values.columns))
+    values = values.apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    return pd.concat([index.reset_index(drop=True), values.reset_index(drop=True)], axis=1)
+
+
+def feature_frame_from_rows(rows: list[dict], features: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Wide frame from ``model_projections`` rows carrying ``feature_values``."""
+    features = list(features) if features is not None else None
+    index = pd.DataFrame(
+        [(r["player_id"], int(r["season"])) for r in rows], columns=["player_id", "season"]
+    )
+    values = pd.DataFrame.from_records([decode_feature_values(r.get("feature_values")) for r in rows])
+    return _wide(index, values, features)
+
+
+def feature_frame_from_narrow(rows: list[dict], features: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Wide frame from ``model_projection_features`` rows."""
+    features = list(features) if features is not None else None
+    narrow = pd.DataFrame(rows, columns=["player_id", "season", "feature", "value"])
+    narrow["value"] = pd.to_numeric(narrow["value"], errors="coerce")
+    wide = narrow.pivot(index=["player_id", "season"], columns="feature", values="value")
+    wide.columns.name = None
+    index = wide.index.to_frame(index=False)
+    index["season"] = index["season"].astype(int)
+    return _wide(index, wide, features)
+
+
+def fetch_feature_frame(
+    supabase,
+    model_id: str,
+    seasons: Iterable[int],
+    features: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Feature values of ``model_id``'s projections for ``seasons``, one column per feature.
+
+    Columns: ``player_id``, ``season``, then each feature (float64, NaN where
+    the stored value is null or absent). ``features`` restricts — and orders —
+    the feature columns; the filter is applied in the database.
+    """
+    seasons = [int(s) for s in seasons]
+    features = list(features) if features is not None else None
+    filters = [("eq", "model_id", model_id), ("in_", "season", seasons)]
+    try:
+        rows = fetch_all_rows(
+            supabase, FEATURES_TABLE, "player_id, season, feature, value",
+            filters=filters + ([("in_", "feature", features)] if features is not None else []),
+        )
+    except FileNotFoundError:  # mirror synced before migration 036
+        rows = None
+    except Exception as exc:
+        if getattr(exc, "code", None) not in _MISSING_TABLE_CODES:
+            raise
+        rows = None
+    if rows is not None:
+        return feature_frame_from_narrow(rows, features)
+
+    rows = fetch_all_rows(supabase, "model_projections", "player_id, season, feature_values",
+                          filters=filters)
+    return feature_frame_from_rows(rows, features)
+
+
+def feature_dicts(frame: pd.DataFrame) -> dict[tuple[str, int], dict[str, Optional[float]]]:
+    """``(player_id, season) -> {feature: value or None}`` from a wide frame."""
+    features = [c for c in frame.columns if c not in ("player_id", "season")]
+    values = frame[features].astype(object).where(frame[features].notna(), None)
+    return {
+        (pid, int(season)): dict(zip(features, row))
+        for pid, season, row in zip(frame["player_id"], frame["season"], values.itertuples(index=False))
+    }
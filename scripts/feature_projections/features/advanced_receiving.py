@@ -54,6 +54,9 @@ def _weighted_recent_value(
 class _AdvancedReceivingBase(ProjectionFeature):
     """Shared logic for advanced-receiving raw features."""
 
+    player_stats_columns = ()
+    lookups = ()
+
     COLUMN: str = ""
 
     def compute(
@@ -73,6 +76,7 @@ class TargetShareRawFeature(_AdvancedReceivingBase):
     """Recency-weighted target share (fraction of team targets)."""
 
     COLUMN = "target_share"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -83,6 +87,7 @@ class AirYardsShareRawFeature(_AdvancedReceivingBase):
     """Recency-weighted air-yards share (fraction of team air yards)."""
 
     COLUMN = "air_yards_share"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -93,6 +98,7 @@ class WOPRRawFeature(_AdvancedReceivingBase):
     """Recency-weighted Weighted Opportunity Rating: 1.5*target_share + 0.7*air_yards_share."""
 
     COLUMN = "wopr"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -103,6 +109,7 @@ class RACRRawFeature(_AdvancedReceivingBase):
     """Recency-weighted Receiver Air Conversion Ratio: receiving_yards / air_yards."""
 
     COLUMN = "racr"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -27,6 +27,10 @@ class AgeCurveFeature(ProjectionFeature):
     then applies positional growth/decline curve.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     @property
     def name(self) -> str:
         return "age_curve"
@@ -69,3 +73,30 @@ class AgeCurveFeature(ProjectionFeature):
             delta = curve["growth_per_year"] * min(years_to_peak, 3.0)
 
         return delta * scale
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        """Vectorized compute(): one age per player, one curve per position."""
+        target_season = context.get("target_season")
+        if season_frame.empty or not target_season:
+            return pd.Series(dtype="float64")
+
+        players = season_frame.groupby("player_id", sort=False)[["position", "birth_date"]].first()
+        birth = pd.to_datetime(players["birth_date"], errors="coerce", format="ISO8601")
+        season_start = pd.Timestamp(f"{target_season}-09-01")
+        age = (season_start - birth).dt.days / 365.25
+
+        out = pd.Series(float("nan"), index=players.index, dtype="float64")
+        for position, curve in POSITION_AGE_CURVES.items():
+            mask = (players["position"] == position) & age.notna()
+            if not mask.any():
+                continue
+            years_from_peak = age[mask] - curve["peak_age"]
+            decline = -curve["decline_per_year"] * years_from_peak
+            growth = curve["growth_per_year"] * (-years_from_peak).clip(upper=3.0)
+            delta = decline.where(years_from_peak > 0, growth)
+            out[mask] = delta * curve.get("scale", 1.0)
+        return out
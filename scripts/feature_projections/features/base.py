@@ -14,8 +14,17 @@ class ProjectionFeature(ABC):
     Each feature computes a PPG-scale value:
     - Base features return absolute PPG estimates
     - Adjustment features return PPG deltas (positive = boost, negative = penalty)
+
+    Subclasses declare the inputs they read so runs fetch only those (see
+    ``feature_inputs.py``): ``player_stats_columns`` / ``nfl_stats_columns``
+    beyond the runner's core columns, and the season-wide ``lookups`` read
+    from ``context``. ``None`` = undeclared (fetch / build everything).
     """
 
+    player_stats_columns: Optional[tuple[str, ...]] = None
+    nfl_stats_columns: Optional[tuple[str, ...]] = None
+    lookups: Optional[tuple[str, ...]] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -50,3 +59,31 @@ class ProjectionFeature(ABC):
             or None if insufficient data.
         """
         ...
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        """Compute this feature for every player in a target season at once.
+
+        Optional vectorized counterpart of :meth:`compute`. The runner calls it
+        once per target season and falls back to per-player ``compute()`` for
+        any feature that returns None here (the default) and for any player
+        missing from the returned Series. Implementations must return exactly
+        the values ``compute()`` would, and may only be provided by features
+        that do not read the per-player ``base_ppg`` — that value only exists
+        once a model's base feature has been combined.
+
+        Args:
+            season_frame: Every player's player_stats history rows for the
+                target season's window, joined with the player metadata
+                columns ``position`` and ``birth_date``.
+            context: Season-level context: ``target_season`` plus the
+                per-position lookups (``positional_means``).
+
+        Returns:
+            Series indexed by player_id (NaN where ``compute()`` returns None),
+            or None when the feature has no batch path.
+        """
+        return None
@@ -42,6 +42,10 @@ def _player_team(context: dict[str, Any], player_id: str) -> Optional[str]:
 class CoachingChangeFeature(ProjectionFeature):
     """Indicator that the player's team changed its head coach this offseason."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("qb_ecosystem", "team_coaching")
+
     @property
     def name(self) -> str:
         return "coaching_change_raw"
@@ -73,6 +77,10 @@ class CoachingChangeFeature(ProjectionFeature):
 class CoachTenureFeature(ProjectionFeature):
     """Consecutive seasons the player's team's head coach has been in place."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("qb_ecosystem", "team_coaching")
+
     @property
     def name(self) -> str:
         return "coach_tenure_raw"
@@ -42,6 +42,10 @@ def _target_depth(context: dict[str, Any], player_id: str) -> Optional[int]:
 class DepthChartPositionFeature(ProjectionFeature):
     """Opening-day starter score (2 - depth_team) for the target season."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("depth_charts",)
+
     @property
     def name(self) -> str:
         return "depth_chart_position_raw"
@@ -65,6 +69,10 @@ class DepthChartPositionFeature(ProjectionFeature):
 class RoleChangeFeature(ProjectionFeature):
     """Year-over-year depth-tier change vs the most recent prior depth season."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("depth_charts",)
+
     @property
     def name(self) -> str:
         return "role_change_raw"
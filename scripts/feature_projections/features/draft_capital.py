@@ -30,6 +30,10 @@ TOTAL_PICKS = 257  # Roughly modern draft length, used to anchor log scaling
 class DraftCapitalRawFeature(ProjectionFeature):
     """Log-scaled overall pick for players in their first three NFL seasons."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("draft_capital",)
+
     @property
     def name(self) -> str:
         return "draft_capital_raw"
@@ -26,6 +26,10 @@ class GamesPlayedFeature(ProjectionFeature):
     Penalty only applies if 2+ recent seasons were below the availability threshold.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     RECENCY_WEIGHTS = [0.60, 0.25, 0.15]
 
     @property
@@ -18,6 +18,10 @@ from scripts.feature_projections.features.base import ProjectionFeature
 class NaivePriorSeasonPPGFeature(ProjectionFeature):
     """Absolute PPG = the player's most recent prior season's PPG."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     @property
     def name(self) -> str:
         return "naive_prior_ppg"
@@ -44,3 +48,18 @@ class NaivePriorSeasonPPGFeature(ProjectionFeature):
             return None
         latest = df.loc[df["season"].idxmax()]
         return float(latest["ppg"])
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        """Vectorized compute(): each player's latest season's PPG."""
+        df = season_frame[["player_id", "season", "ppg"]].copy()
+        df["season"] = pd.to_numeric(df["season"], errors="coerce")
+        df["ppg"] = pd.to_numeric(df["ppg"], errors="coerce")
+        df = df.dropna(subset=["season", "ppg"])
+        if df.empty:
+            return pd.Series(dtype="float64")
+        latest = df.loc[df.groupby("player_id", sort=False)["season"].idxmax()]
+        return latest.set_index("player_id")["ppg"].astype("float64")
@@ -81,6 +81,10 @@ def weighted_recent_ngs(
 class _NGSPassingBase(ProjectionFeature):
     """Shared logic for the QB-only NGS passing raw features."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("ngs_passing",)
+
     COLUMN: str = ""
 
     def compute(
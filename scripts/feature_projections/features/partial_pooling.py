@@ -40,6 +40,10 @@ from scripts.feature_projections.features.base import ProjectionFeature
 class PartialPoolingFeature(ProjectionFeature):
     """Sample-size-scaled shrinkage toward the positional mean (empirical Bayes)."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     # Prior strength k, in effective-full-season units: a player with one full
     # season of history (n_p ≈ 1) lands at w_p = 0.5 (pulled halfway), a three-
     # full-season vet (n_p ≈ 3) at w_p = 0.75 (pulled a quarter), a 3-game sample
@@ -19,6 +19,10 @@ from scripts.feature_projections.features.base import ProjectionFeature
 class PositionMeanFeature(ProjectionFeature):
     """Absolute PPG = the position's mean PPG from the history window."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     @property
     def name(self) -> str:
         return "position_mean"
@@ -37,3 +41,13 @@ class PositionMeanFeature(ProjectionFeature):
     ) -> Optional[float]:
         val = context.get("positional_mean_ppg")
         return float(val) if val is not None else None
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        """Vectorized compute(): map each player's position to its mean."""
+        positional_means = context.get("positional_means") or {}
+        positions = season_frame.groupby("player_id", sort=False)["position"].first()
+        return positions.map(positional_means).astype("float64")
@@ -20,6 +20,10 @@ class QBStarterUsageFeature(ProjectionFeature):
     trending up or down.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ("passing_attempts",)
+    lookups = ()
+
     TREND_SCALING = 0.3  # Conservative scaling for volume trend
     CLAMP = 0.15
     MIN_GAMES = 4
@@ -99,6 +103,10 @@ class QBStarterBackupPenaltyFeature(ProjectionFeature):
     trend tuning for starters added only noise.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     BACKUP_PENALTY_PCT = 0.15  # 15% penalty for non-starters
 
     @property
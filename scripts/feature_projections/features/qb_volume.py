@@ -59,6 +59,9 @@ def _weighted_per_game_rate(
 class _QBVolumeBase(ProjectionFeature):
     """Shared logic for QB volume raw features."""
 
+    player_stats_columns = ()
+    lookups = ()
+
     COLUMN: str = ""
 
     def compute(
@@ -82,6 +85,7 @@ class QBRushVolumeRawFeature(_QBVolumeBase):
     """
 
     COLUMN = "rushing_attempts"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -96,6 +100,7 @@ class QBPassVolumeRawFeature(_QBVolumeBase):
     """
 
     COLUMN = "passing_attempts"
+    nfl_stats_columns = (COLUMN,)
 
     @property
     def name(self) -> str:
@@ -70,6 +70,11 @@ def _shrink(player_rate: float, opp: float, beta: float, pop_rate: float) -> flo
 class WeightedQBVolumeEfficiencyFeature(WeightedPPGTunedNoQBFeature):
     """Tuned base, but QB seasons are reconstructed as volume × regressed efficiency."""
 
+    nfl_stats_columns = (
+        "passing_attempts", "passing_yards", "passing_tds", "interceptions",
+        "rushing_attempts", "rushing_yards", "rushing_tds",
+    )
+
     @property
     def name(self) -> str:
         return "weighted_qb_volume_efficiency"
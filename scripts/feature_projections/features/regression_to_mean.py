@@ -22,6 +22,10 @@ class RegressionToMeanFeature(ProjectionFeature):
     and gets a boost; negative means above mean and gets pulled down.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     REGRESSION_FACTOR = 0.12
 
     @property
@@ -71,6 +75,10 @@ class RegressionToMeanTieredFeature(ProjectionFeature):
     minimally affecting starter-tier accuracy.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     REGRESSION_FACTOR_ABOVE = 0.12
     REGRESSION_FACTOR_MID = -0.05
     REGRESSION_FACTOR_BENCH = -0.20
@@ -16,6 +16,10 @@ class SnapTrendFeature(ProjectionFeature):
     players with increasing or decreasing roles.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ("offense_snaps",)
+    lookups = ()
+
     TREND_SCALING = 0.3
 
     @property
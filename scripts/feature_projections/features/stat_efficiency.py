@@ -104,6 +104,15 @@ class StatEfficiencyFeature(ProjectionFeature):
     4. Convert deviation to a small PPG delta, clamped to ±10% of base_ppg
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = tuple(dict.fromkeys(
+        col
+        for metrics in POSITION_METRICS.values()
+        for _, numer, denom in metrics
+        for col in (numer, denom)
+    ))
+    lookups = ()
+
     @property
     def name(self) -> str:
         return "stat_efficiency"
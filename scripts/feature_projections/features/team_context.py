@@ -27,6 +27,10 @@ class TeamContextFeature(ProjectionFeature):
     the adjustment for players who recently changed teams.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ()
+
     # Position-specific scaling factors: how much team quality affects
     # individual production. QBs are most coupled to team offense,
     # TEs are least affected.
@@ -48,6 +48,10 @@ def _player_team(context: dict[str, Any], player_id: str) -> Optional[str]:
 class TeamQBQualityFeature(ProjectionFeature):
     """Centered recency-weighted prior PPG of the WR/TE's projected QB1."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("qb_ecosystem",)
+
     @property
     def name(self) -> str:
         return "team_qb_quality_raw"
@@ -75,6 +79,10 @@ class TeamQBQualityFeature(ProjectionFeature):
 class TeamQBChangedFeature(ProjectionFeature):
     """Indicator that the WR/TE's team changed its projected QB1 year over year."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("qb_ecosystem",)
+
     @property
     def name(self) -> str:
         return "team_qb_changed_raw"
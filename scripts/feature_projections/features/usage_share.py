@@ -116,6 +116,10 @@ class UsageShareFeature(ProjectionFeature):
     Low share → role is fragile, production less reliable → negative delta.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = tuple(dict.fromkeys(USAGE_STAT_BY_POSITION.values()))
+    lookups = ()
+
     SCALING = 0.06  # How much of the share deviation to apply (conservative)
     MAX_ADJ = 0.06  # Clamp to ±6% of base_ppg
 
@@ -163,6 +167,10 @@ class UsageShareRawFeature(ProjectionFeature):
     nonlinear mapping from share → PPG adjustment. See GH #367.
     """
 
+    player_stats_columns = ()
+    nfl_stats_columns = tuple(dict.fromkeys(USAGE_STAT_BY_POSITION.values()))
+    lookups = ()
+
     @property
     def name(self) -> str:
         return "usage_share_raw"
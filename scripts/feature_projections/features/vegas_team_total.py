@@ -39,6 +39,10 @@ from scripts.feature_projections.features.base import ProjectionFeature
 class ImpliedTeamTotalRawFeature(ProjectionFeature):
     """Centered Vegas implied team total for the player's target-season team."""
 
+    player_stats_columns = ()
+    nfl_stats_columns = ()
+    lookups = ("vegas_lines",)
+
     @property
     def name(self) -> str:
         return "implied_team_total_raw"
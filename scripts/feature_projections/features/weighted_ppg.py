@@ -37,6 +37,10 @@ class WeightedPPGFeature(ProjectionFeature):
     This is the baseline feature — an exact port of the existing projection_methods.py.
     """
 
+    player_stats_columns = ("h1_snaps", "h1_games", "h2_snaps", "h2_games")
+    nfl_stats_columns = ()
+    lookups = ()
+
     RECENCY_WEIGHTS = [0.55, 0.25, 0.20]
     ROOKIE_MIN_FACTOR = 0.75
     ROOKIE_MAX_FACTOR = 1.50
@@ -81,6 +85,65 @@ class WeightedPPGFeature(ProjectionFeature):
         else:
             return self._weighted_average(recent, weights)
 
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        """Vectorized compute() over a whole season window.
+
+        The veteran weighted average is accumulated column-by-column in the
+        same most-recent-first order as ``_weighted_average`` so every value is
+        bit-identical to the per-player path. A NULL ``ppg`` / ``games_played``
+        in the window makes the result NaN, as it does there; only seasons a
+        player doesn't have contribute zero. One-season players still go
+        through ``_rookie_trajectory`` (so subclass overrides apply). Subclasses
+        that rewrite the history before averaging (xFP, red-zone, QB volume)
+        override compute() and therefore fall back to the per-player path.
+        """
+        if type(self).compute is not WeightedPPGFeature.compute:
+            return None
+        if season_frame.empty:
+            return pd.Series(dtype="float64")
+
+        frame = season_frame.sort_values(["player_id", "season"])
+        # 0 = most recent season, 1 = the one before, ...
+        frame = frame.assign(_rank=frame.groupby("player_id").cumcount(ascending=False))
+        position_by_player = frame.groupby("player_id", sort=False)["position"].first()
+
+        out: dict[str, Optional[float]] = {}
+        for position, pids in position_by_player.groupby(position_by_player, sort=False):
+            weights = self._recency_weights(position)
+            pos_frame = frame[frame["player_id"].isin(pids.index) & (frame["_rank"] < len(weights))]
+            n_by_player = pos_frame.groupby("player_id")["_rank"].size()
+
+            rookie_rows = pos_frame[pos_frame["player_id"].isin(n_by_player.index[n_by_player == 1])]
+            for _, row in rookie_rows.iterrows():
+                out[str(row["player_id"])] = self._rookie_trajectory(row, position)
+
+            vets = pos_frame[pos_frame["player_id"].isin(n_by_player.index[n_by_player > 1])]
+            if vets.empty:
+                continue
+            vet_ids = vets["player_id"].unique()
+            numerator = pd.Series(0.0, index=vet_ids)
+            denominator = pd.Series(0.0, index=vet_ids)
+            for i, recency_w in enumerate(weights):
+                rows = vets[vets["_rank"] == i].set_index("player_id")
+                if rows.empty:
+                    continue
+                games_scale = (rows["games_played"].astype("float64") / 17.0) ** self.GAMES_RELIABILITY_EXPONENT
+                effective_w = recency_w * games_scale
+                # reindex zero-fills only players without this season; a NULL
+                # ppg / games_played stays NaN (add(fill_value=0) would zero it).
+                weighted_ppg = rows["ppg"].astype("float64") * effective_w
+                numerator = numerator + weighted_ppg.reindex(vet_ids, fill_value=0.0)
+                denominator = denominator + effective_w.reindex(vet_ids, fill_value=0.0)
+            for pid, num in numerator.items():
+                den = denominator[pid]
+                out[str(pid)] = None if den == 0 else float(num / den)
+
+        return pd.Series(out, dtype="float64")
+
     def _recency_weights(self, position: str) -> list[float]:
         """Recency weights for this player's position (most recent season first).
 
@@ -331,6 +394,11 @@ class WeightedXFPTunedNoQBFeature(WeightedPPGTunedNoQBFeature):
     it simply operates on the xFP-adjusted per-season values.
     """
 
+    nfl_stats_columns = (
+        "passing_tds", "rushing_tds", "receiving_tds",
+        "passing_attempts", "rushing_attempts", "receptions",
+    )
+
     @property
     def name(self) -> str:
         return "weighted_xfp_tuned_no_qb"
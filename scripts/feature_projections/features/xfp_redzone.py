@@ -51,6 +51,9 @@ _PASS_TD_PTS = SCORING_SETTINGS["passing_tds"]
 class WeightedXFPRedZoneFeature(WeightedPPGTunedNoQBFeature):
     """Tuned base, but each season's TDs are reconstructed from red-zone usage."""
 
+    nfl_stats_columns = ("rushing_tds", "receiving_tds", "passing_tds")
+    lookups = ("red_zone",)
+
     @property
     def name(self) -> str:
         return "weighted_xfp_redzone"
@@ -12,11 +12,15 @@ Design:
 - Learned/residual models are **retrained on the training window only**
   (default 2021–2023) and then predict the eval seasons (default 2024–2025)
   in memory. Their coefficients never see the eval seasons.
-- Retraining writes to a temporary directory and monkeypatches
-  ``learned_combiner.TRAINED_MODELS_DIR`` for the duration of the run, so the
-  production ``trained_models/*.json`` files and ``model_projections`` table are
-  never touched. Residual models load their (also-held-out) base from the temp
-  dir, so the whole stack is clean.
+- Every (fold × model) retrain runs in its own temporary models directory,
+  passed down as ``models_dir`` rather than patched into
+  ``learned_combiner.TRAINED_MODELS_DIR``, so the production
+  ``trained_models/*.json`` files and ``model_projections`` table are never
+  touched. A residual model's sandbox holds only its (also-held-out) base, so
+  the whole stack is clean.
+- Retrains form a DAG — folds are independent, and within a fold a residual
+  waits only for its base — which ``--workers N`` runs on a fork-based process
+  pool (GH #597's cache is consulted first, in the parent).
 - Additive and external (FantasyPros) models are parameter-free w.r.t. our
   training seasons — a model's projection for 2024 depends only on 2021–2023
   history — so their existing ``model_projections`` rows are already the
@@ -34,18 +38,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
 import os
 import shutil
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
-from scripts.feature_projections import holdout_cache, learned_combiner
-from scripts.feature_projections.learned_combiner import predict, predict_residual
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import QUERY_CACHE, fetch_all_rows
+from scripts.feature_projections import holdout_cache, learned_combiner, profiling
+from scripts.feature_projections.model_plan import PlanCache
 from scripts.feature_projections.model_config import MODELS, get_model
 from scripts.feature_projections.backtest import (
     TOP_N_BY_POSITION,
@@ -138,16 +146,14 @@ def _learned_preds_for_eval(
     model_name: str,
     train_seasons: list[int],
     eval_seasons: list[int],
-    temp_dir: Path,
+    models_dir: Path,
 ) -> tuple[dict[int, dict[str, float]], Optional[dict]]:
     """Retrain a learned/residual model on train_seasons; predict eval_seasons.
 
-    Returns ``({season: {player_id: predicted_ppg}}, params)``. Saves the
-    held-out params to temp_dir so dependent residual models can load this as
-    their base; the returned params are also persisted to the prediction cache.
+    Returns ``({season: {player_id: predicted_ppg}}, params)``. A residual
+    model loads its base from ``models_dir``; the returned params are what a
+    dependent residual gets as its base, and what the prediction cache stores.
     """
-    # Imported here so the monkeypatched TRAINED_MODELS_DIR is in effect when
-    # train_ridge_residual calls load_model_params.
     from scripts.feature_projections.train_model import (
         collect_training_data,
         train_ridge_loso,
@@ -165,41 +171,37 @@ def _learned_preds_for_eval(
         print(f"  {model_name}: no rows in training window {train_seasons}, skipping")
         return {}, None
 
-    is_residual = model_def.combiner_type == "residual"
-    if is_residual:
-        params = train_ridge_residual(
-            train_df,
-            base_model_name=model_def.base_model_name,
-            residual_features=model_def.features,
-            interaction_terms=model_def.interaction_terms,
-            training_filter=model_def.training_filter,
-        )
-    else:
-        params = train_ridge_loso(
-            train_df,
-            model_def.interaction_terms,
-            sample_weight_spec=model_def.sample_weight_spec,
-            regressor_spec=model_def.regressor_spec,
-        )
-
-    # Persist so a dependent residual can use this held-out model as its base.
-    (temp_dir / f"{model_name}.json").write_text(json.dumps(params))
+    with profiling.stage("train: ridge"):
+        if model_def.combiner_type == "residual":
+            params = train_ridge_residual(
+                train_df,
+                base_model_name=model_def.base_model_name,
+                residual_features=model_def.features,
+                interaction_terms=model_def.interaction_terms,
+                training_filter=model_def.training_filter,
+                models_dir=models_dir,
+            )
+        else:
+            params = train_ridge_loso(
+                train_df,
+                model_def.interaction_terms,
+                sample_weight_spec=model_def.sample_weight_spec,
+                regressor_spec=model_def.regressor_spec,
+            )
 
+    # The held-out Ridge chain, scored a season at a time.
+    plans = PlanCache(model_def, {}, params)
     preds_by_season: dict[int, dict[str, float]] = {}
-    for season in eval_seasons:
-        rows = td[td["season"] == season]
-        season_preds: dict[str, float] = {}
-        for _, r in rows.iterrows():
-            fv = r["feature_values"]
-            pos = r["position"]
-            pred = (
-                predict_residual(fv, pos, params)
-                if is_residual
-                else predict(fv, pos, params)
+    with profiling.stage("holdout: predict"):
+        for season in eval_seasons:
+            rows = td[td["season"] == season]
+            preds = plans.predict_batch(
+                learned_combiner.feature_value_frame(rows["feature_values"]), rows["position"]
             )
-            if pred is not None:
-                season_preds[str(r["player_id"])] = float(pred)
-        preds_by_season[season] = season_preds
+            preds_by_season[season] = {
+                str(pid): float(pred)
+                for pid, pred in zip(rows["player_id"], preds) if not np.isnan(pred)
+            }
     return preds_by_season, params
 
 
@@ -297,80 +299,206 @@ def _balanced_mae(pos_metrics: dict[str, dict]) -> Optional[float]:
     return sum(maes) / len(maes) if maes else None
 
 
-def gather_predictions(
+def _retrain_task(
+    model_name: str,
     train_seasons: list[int],
     eval_seasons: list[int],
-    only_models: Optional[list[str]] = None,
+    base_params: Optional[dict],
+) -> tuple[dict[int, dict[str, float]], Optional[dict]]:
+    """Held-out retrain of one model for one fold, in its own models directory.
+
+    The sandbox starts with only the model's base params (if it's a residual),
+    so concurrent tasks never share — or race on — a trained-models directory.
+    """
+    models_dir = Path(tempfile.mkdtemp(prefix="holdout_models_"))
+    try:
+        base = get_model(model_name).base_model_name
+        if base is not None and base_params is not None:
+            (models_dir / f"{base}.json").write_text(json.dumps(base_params))
+        return _learned_preds_for_eval(model_name, train_seasons, eval_seasons, models_dir)
+    finally:
+        shutil.rmtree(models_dir, ignore_errors=True)
+
+
+def _init_retrain_worker() -> None:
+    profiler = profiling.active()
+    if profiler is not None:
+        profiler.drain()  # the parent's counters so far stay with the parent
+
+
+def _run_retrain_task(*args) -> tuple[dict[int, dict[str, float]], Optional[dict], Optional[dict]]:
+    preds_by_season, params = _retrain_task(*args)
+    profiler = profiling.active()
+    return preds_by_season, params, profiler.drain() if profiler is not None else None
+
+
+def _retrain_learned(
+    folds: list[tuple[list[int], list[int]]],
+    learned: list[str],
     use_cache: bool = True,
-) -> tuple[dict[str, dict[int, dict[str, float]]], dict[int, dict[str, float]], dict[str, str]]:
-    """Produce held-out predictions for every model on the eval seasons.
+    workers: int = 1,
+) -> list[dict[str, dict[int, dict[str, float]]]]:
+    """Held-out predictions of every learned/residual model, per fold.
+
+    Each (fold, model) pair is a node; a residual depends on its base's node in
+    the same fold (when the base is being retrained too), and nothing crosses
+    folds. Ready nodes are resolved from the prediction cache in this process or
+    retrained — serially, or on ``workers`` fork-based processes — and a
+    finished node's params become its dependents' base. Returns, per fold,
+    ``{model_name: {season: {player_id: predicted_ppg}}}`` in dependency order.
+    """
+    order = _dependency_order(learned)
+    deps: dict[tuple[int, str], Optional[tuple[int, str]]] = {}
+    for i in range(len(folds)):
+        for name in order:
+            base = get_model(name).base_model_name
+            deps[(i, name)] = (i, base) if base in learned else None
 
-    Returns (preds, actuals_by_season, pos_map) where
-    preds = {model_name: {season: {player_id: predicted_ppg}}}. Learned/residual
-    models are retrained on train_seasons in a sandboxed temp dir; parameter-free
-    models are read from their already-held-out model_projections. This is the
-    shared machinery behind both the held-out report and the significance test.
+    params: dict[tuple[int, str], Optional[dict]] = {}
+    fold_preds: list[dict[str, dict[int, dict[str, float]]]] = [
+        {name: {} for name in order} for _ in folds
+    ]
 
-    Learned/residual predictions are cached per (model, train window, eval
-    window, model-definition fingerprint) under ``.cache/holdout`` (GH #597), so
-    a second invocation skips retraining. ``use_cache=False`` forces a retrain.
+    def finish(node, preds_by_season, node_params, store: bool) -> None:
+        i, name = node
+        params[node] = node_params
+        fold_preds[i][name] = preds_by_season
+        train_seasons, eval_seasons = folds[i]
+        if store and use_cache and preds_by_season and node_params is not None:
+            holdout_cache.store(name, train_seasons, eval_seasons, node_params, preds_by_season)
+
+    use_pool = workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+    pool = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_retrain_worker,
+        )
+        if use_pool else None
+    )
+    pending = list(deps)
+    running: dict[Any, tuple[int, str]] = {}
+    try:
+        while pending or running:
+            ready = [n for n in pending if deps[n] is None or deps[n] in params]
+            if not ready and not running:
+                raise ValueError(f"residual base cycle among {sorted({n for _, n in pending})}")
+            for node in ready:
+                pending.remove(node)
+                i, name = node
+                train_seasons, eval_seasons = folds[i]
+                cached = (
+                    holdout_cache.load(name, train_seasons, eval_seasons) if use_cache else None
+                )
+                if cached is not None:
+                    print(f"\n=== Held-out cache hit: {name} (train {train_seasons}) ===")
+                    finish(node, cached["preds"], cached.get("params"), store=False)
+                    continue
+                print(f"\n=== Held-out retrain: {name} (train {train_seasons}) ===")
+                base_params = params.get(deps[node]) if deps[node] is not None else None
+                args = (name, train_seasons, eval_seasons, base_params)
+                if pool is None:
+                    finish(node, *_retrain_task(*args), store=True)
+                else:
+                    running[pool.submit(_run_retrain_task, *args)] = node
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    preds_by_season, node_params, profile = future.result()
+                    profiler = profiling.active()
+                    if profiler is not None and profile is not None:
+                        profiler.merge(profile)
+                    finish(running.pop(future), preds_by_season, node_params, store=True)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return [
+        {name: preds for name, preds in by_model.items() if preds}
+        for by_model in fold_preds
+    ]
+
+
+def _gather_folds(
+    folds: list[tuple[list[int], list[int]]],
+    only_models: Optional[list[str]] = None,
+    use_cache: bool = True,
+    workers: int = 1,
+) -> tuple[list[dict[str, dict[int, dict[str, float]]]], dict[int, dict[str, float]], dict[str, str]]:
+    """Held-out predictions per fold, plus the shared actuals and position map.
+
+    Actuals, positions and the parameter-free models' stored projections are
+    fetched once for every eval season across the folds; only learned/residual
+    models depend on a fold's training window.
     """
     supabase = get_supabase_client()
 
     players_data = fetch_all_rows(supabase, "players", "id, position")
     pos_map = {row["id"]: row["position"] for row in players_data}
     all_stats = fetch_all_rows(supabase, "player_stats", "player_id, games_played, season")
+    all_eval_seasons = sorted({s for _, eval_seasons in folds for s in eval_seasons})
 
     # Shared actuals + rookie filter per eval season — identical for every model.
     actuals_by_season: dict[int, dict[str, float]] = {}
-    for season in eval_seasons:
-        actuals, _ = _build_actuals_and_rookies(supabase, season, all_stats, MIN_GAMES)
-        actuals_by_season[season] = actuals
-        print(f"Eval season {season}: {len(actuals)} qualifying non-rookie players")
+    with profiling.stage("fetch: actuals"):
+        for season in all_eval_seasons:
+            actuals, _ = _build_actuals_and_rookies(supabase, season, all_stats, MIN_GAMES)
+            actuals_by_season[season] = actuals
+            print(f"Eval season {season}: {len(actuals)} qualifying non-rookie players")
 
     model_names = list(MODELS.keys()) if only_models is None else only_models
     learned = [m for m in model_names if get_model(m).combiner_type in ("learned", "residual")]
     others = [m for m in model_names if m not in learned]
 
-    preds: dict[str, dict[int, dict[str, float]]] = {}
-
     # --- Parameter-free models: read held-out projections from the DB ---
-    for model_name in others:
-        res = supabase.table("projection_models").select("id").eq("name", model_name).execute()
-        if not res.data:
-            continue
-        model_id = res.data[0]["id"]
-        preds[model_name] = _db_preds_for_eval(supabase, model_id, eval_seasons)
-
-    # --- Learned/residual models: retrain on the held-out window in a temp dir ---
-    temp_dir = Path(tempfile.mkdtemp(prefix="holdout_models_"))
-    orig_dir = learned_combiner.TRAINED_MODELS_DIR
-    learned_combiner.TRAINED_MODELS_DIR = temp_dir
-    try:
-        for model_name in _dependency_order(learned):
-            cached = holdout_cache.load(model_name, train_seasons, eval_seasons) if use_cache else None
-            if cached is not None:
-                print(f"\n=== Held-out cache hit: {model_name} (train {train_seasons}) ===")
-                # Re-materialize params so a dependent residual can load this base.
-                if cached.get("params") is not None:
-                    (temp_dir / f"{model_name}.json").write_text(json.dumps(cached["params"]))
-                if cached["preds"]:
-                    preds[model_name] = cached["preds"]
+    stored: dict[str, dict[int, dict[str, float]]] = {}
+    with profiling.stage("fetch: stored projections"):
+        for model_name in others:
+            res = fetch_all_rows(supabase, "projection_models", "id", filters=[("eq", "name", model_name)])
+            if not res:
                 continue
-            print(f"\n=== Held-out retrain: {model_name} (train {train_seasons}) ===")
-            preds_by_season, params = _learned_preds_for_eval(
-                model_name, train_seasons, eval_seasons, temp_dir
-            )
-            if preds_by_season:
-                preds[model_name] = preds_by_season
-                if use_cache and params is not None:
-                    holdout_cache.store(
-                        model_name, train_seasons, eval_seasons, params, preds_by_season
-                    )
-    finally:
-        learned_combiner.TRAINED_MODELS_DIR = orig_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            model_id = res[0]["id"]
+            stored[model_name] = _db_preds_for_eval(supabase, model_id, all_eval_seasons)
+
+    # --- Learned/residual models: retrain on each fold's window, sandboxed ---
+    learned_preds = _retrain_learned(folds, learned, use_cache=use_cache, workers=workers)
+
+    fold_preds = [
+        {
+            **{
+                name: {s: by_season[s] for s in eval_seasons}
+                for name, by_season in stored.items()
+            },
+            **by_model,
+        }
+        for (_, eval_seasons), by_model in zip(folds, learned_preds)
+    ]
+    return fold_preds, actuals_by_season, pos_map
+
+
+def gather_predictions(
+    train_seasons: list[int],
+    eval_seasons: list[int],
+    only_models: Optional[list[str]] = None,
+    use_cache: bool = True,
+    workers: int = 1,
+) -> tuple[dict[str, dict[int, dict[str, float]]], dict[int, dict[str, float]], dict[str, str]]:
+    """Produce held-out predictions for every model on the eval seasons.
+
+    Returns (preds, actuals_by_season, pos_map) where
+    preds = {model_name: {season: {player_id: predicted_ppg}}}. Learned/residual
+    models are retrained on train_seasons in sandboxed temp dirs; parameter-free
+    models are read from their already-held-out model_projections. This is the
+    shared machinery behind both the held-out report and the significance test.
 
+    Learned/residual predictions are cached per (model, train window, eval
+    window, model-definition fingerprint) under ``.cache/holdout`` (GH #597), so
+    a second invocation skips retraining. ``use_cache=False`` forces a retrain.
+    ``workers > 1`` retrains independent models concurrently.
+    """
+    (preds,), actuals_by_season, pos_map = _gather_folds(
+        [(train_seasons, eval_seasons)], only_models, use_cache=use_cache, workers=workers
+    )
     return preds, actuals_by_season, pos_map
 
 
@@ -401,33 +529,34 @@ def gather_predictions_rolling(
     folds: list[tuple[list[int], int]],
     only_models: Optional[list[str]] = None,
     use_cache: bool = True,
+    workers: int = 1,
 ) -> tuple[
     dict[str, dict[int, dict[str, float]]],
     dict[int, dict[str, float]],
     dict[str, str],
     dict[int, list[int]],
 ]:
-    """Run ``gather_predictions`` once per rolling fold and merge by eval season.
+    """Held-out predictions for every rolling fold, merged by eval season.
 
     Each fold retrains learned models on its own (expanding) training window, so
     a model's 2025 prediction was produced by a model that never saw 2025 — and,
-    unlike the fixed protocol, also never saw 2024 when predicting 2024. Returns
+    unlike the fixed protocol, also never saw 2024 when predicting 2024. Folds
+    are independent, so with ``workers > 1`` they retrain concurrently. Returns
     the same ``(preds, actuals_by_season, pos_map)`` shape as
     ``gather_predictions`` plus a ``{eval_season: train_seasons}`` map for the
     report header.
     """
+    for train_seasons, eval_season in folds:
+        print(f"Rolling fold: train {train_seasons} → eval {eval_season}")
+    fold_preds, actuals_by_season, pos_map = _gather_folds(
+        [(train_seasons, [eval_season]) for train_seasons, eval_season in folds],
+        only_models, use_cache=use_cache, workers=workers,
+    )
+
     merged_preds: dict[str, dict[int, dict[str, float]]] = {}
     merged_actuals: dict[int, dict[str, float]] = {}
-    pos_map: dict[str, str] = {}
     fold_train: dict[int, list[int]] = {}
-
-    for train_seasons, eval_season in folds:
-        print(f"\n########## Rolling fold: train {train_seasons} → eval {eval_season} ##########")
-        preds, actuals_by_season, pmap = gather_predictions(
-            train_seasons, [eval_season], only_models, use_cache=use_cache
-        )
-        if pmap:
-            pos_map = pmap
+    for (train_seasons, eval_season), preds in zip(folds, fold_preds):
         merged_actuals[eval_season] = actuals_by_season.get(eval_season, {})
         fold_train[eval_season] = train_seasons
         for model_name, by_season in preds.items():
@@ -528,18 +657,19 @@ def run(
     min_train_season: Optional[int] = None,
     use_cache: bool = True,
     population: str = "all",
+    workers: int = 1,
 ) -> str:
     if protocol == "rolling":
         if min_train_season is None:
             min_train_season = min(train_seasons)
         folds = rolling_folds(eval_seasons, min_train_season)
         preds, actuals_by_season, pos_map, fold_train = gather_predictions_rolling(
-            folds, only_models, use_cache=use_cache
+            folds, only_models, use_cache=use_cache, workers=workers
         )
         eval_seasons = [s for _, s in folds]
     else:
         preds, actuals_by_season, pos_map = gather_predictions(
-            train_seasons, eval_seasons, only_models, use_cache=use_cache
+            train_seasons, eval_seasons, only_models, use_cache=use_cache, workers=workers
         )
         fold_train = {s: train_seasons for s in eval_seasons}
 
@@ -786,8 +916,15 @@ def main() -> None:
                         help="all: every qualifying non-rookie (default). harmonized: "
                              "top-N per position by actual total points, fixed across seasons "
                              "to neutralise the 2021–2023 coverage drift (#599).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Retrain independent (fold, model) pairs on N worker processes "
+                             "(default: 1, serial)")
     parser.add_argument("--output", default=None)
+    profiling.add_profile_args(parser)
+    add_source_arg(parser)
     args = parser.parse_args()
+    # Read-only evaluation: every fold repeats the same players / stats reads.
+    QUERY_CACHE.enable()
 
     train_seasons = [int(s) for s in args.train_seasons.split(",")]
     eval_seasons = [int(s) for s in args.eval_seasons.split(",")]
@@ -815,11 +952,13 @@ def main() -> None:
         default_name = f"projection-holdout-eval{harmonized_tag}.md"
     output = args.output or os.path.join(repo_root, "docs", "generated", default_name)
 
-    table = run(
-        train_seasons, eval_seasons, only_models, matched=args.matched,
-        protocol=args.protocol, min_train_season=args.min_train_season,
-        use_cache=not args.no_cache, population=args.population,
-    )
+    with profiling.profiled(args, "holdout_eval"):
+        table = run(
+            train_seasons, eval_seasons, only_models, matched=args.matched,
+            protocol=args.protocol, min_train_season=args.min_train_season,
+            use_cache=not args.no_cache, population=args.population,
+            workers=args.workers,
+        )
 
     os.makedirs(os.path.dirname(output), exist_ok=True)
     with open(output, "w") as f:
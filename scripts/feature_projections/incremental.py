@@ -0,0 +1,100 @@
+"""Incremental projection refresh helpers for ``run_models(incremental=True)``.
+
+During the season the nightly ``update_projections`` job regenerates every
+projection for the target seasons although only a handful of players'
+player_stats / nfl_stats rows changed. Incremental mode:
+
+1. **Skips unchanged players.** Each player-season's inputs (their history and
+   nfl_stats rows, their full feature context, expected games and batch
+   feature values) are fingerprinted, along with a per-(model, season) *shared*
+   fingerprint (model definition chain + feature code version, trained params
+   and the season-level aggregates: team aggregates, positional means/floors,
+   pooling k, QB quality). A player is recomputed only if their fingerprint
+   changed — or everyone, if the shared fingerprint moved. Fingerprints are
+   kept next to the feature store (``.cache/projection_fingerprints``); with
+   no local fingerprints (e.g. a fresh CI runner) every player is recomputed.
+2. **Writes only real changes.** Recomputed rows are diffed against the rows
+   already in ``model_projections`` and only rows whose ``projected_ppg`` /
+   ``projected_games`` / ``feature_values`` differ are upserted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from scripts.db_io import fetch_all_rows
+from scripts.feature_projections import holdout_cache
+from scripts.feature_projections.feature_store import InputFingerprinter, resolve_store_dir
+from scripts.feature_projections.feature_values import decode_feature_values
+
+
+def _fingerprint_dir() -> Path:
+    return resolve_store_dir().parent / "projection_fingerprints"
+
+
+def _fingerprint_path(model_name: str, season: int) -> Path:
+    return _fingerprint_dir() / f"{model_name}__{int(season)}.json"
+
+
+def load_fingerprints(model_name: str, season: int) -> dict[str, Any]:
+    """``{"shared": digest | None, "players": {player_id: digest}}``."""
+    path = _fingerprint_path(model_name, season)
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {"shared": None, "players": {}}
+    return {"shared": raw.get("shared"), "players": dict(raw.get("players", {}))}
+
+
+def save_fingerprints(model_name: str, season: int, shared: str, players: dict[str, str]) -> None:
+    path = _fingerprint_path(model_name, season)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps({"shared": shared, "players": players}, sort_keys=True))
+    tmp.replace(path)
+
+
+def shared_digest(
+    fingerprinter: InputFingerprinter,
+    model_name: str,
+    learned_params: Optional[dict[str, Any]],
+    aggregates: dict[str, Any],
+) -> str:
+    """Fingerprint of everything every player of a (model, season) depends on."""
+    h = hashlib.sha256(holdout_cache.model_fingerprint(model_name).encode())
+    h.update(json.dumps(learned_params, sort_keys=True, default=str).encode())
+    h.update(fingerprinter.mapping_digest(aggregates).encode())
+    return h.hexdigest()[:24]
+
+
+def load_existing_projections(supabase, model_id: str, season: int) -> dict[str, dict[str, Any]]:
+    """Current ``model_projections`` rows for (model, season), keyed by player."""
+    rows = fetch_all_rows(
+        supabase, "model_projections",
+        "player_id, projected_ppg, projected_games, feature_values",
+        filters=[("eq", "model_id", model_id), ("eq", "season", season)],
+    )
+    return {str(r["player_id"]): r for r in rows}
+
+
+def _close(a: Any, b: Any) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return abs(float(a) - float(b)) < 1e-9
+
+
+def record_changed(new: dict[str, Any], old: Optional[dict[str, Any]]) -> bool:
+    """True when ``new`` differs from the stored row (or there is none)."""
+    if old is None:
+        return True
+    if not _close(new["projected_ppg"], old.get("projected_ppg")):
+        return True
+    if not _close(new.get("projected_games"), old.get("projected_games")):
+        return True
+    new_fv, old_fv = decode_feature_values(new.get("feature_values")), decode_feature_values(old.get("feature_values"))
+    if new_fv.keys() != old_fv.keys():
+        return True
+    return any(not _close(new_fv[k], old_fv[k]) for k in new_fv)
@@ -11,12 +11,15 @@ See GH #367 for motivation. This is the scaffolding for the full ML ensemble (#2
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 import numpy as np
 import pandas as pd
 
+from scripts.feature_projections.combiner import compute_feature
+from scripts.feature_projections.context import with_base_ppg
 from scripts.feature_projections.features.base import ProjectionFeature
 
 # Positions that get dummy variables in interaction terms
@@ -60,7 +63,7 @@ def build_feature_vector(
             feat_name = term.replace("^2", "")
             feat_val = feature_values.get(feat_name)
             if feat_val is not None:
-                values.append(float(feat_val) ** 2)
+                values.append(float(feat_val) * float(feat_val))
             else:
                 values.append(0.0)
         elif "*position" in term:
@@ -112,6 +115,97 @@ def get_feature_column_names(
     return columns
 
 
+# Design-matrix column ops, mirroring build_feature_vector's branch order.
+RAW, SQUARE, BY_POSITION, PRODUCT, ZERO = range(5)
+
+
+@dataclass(frozen=True)
+class DesignMatrixSpec:
+    """``build_feature_vector``'s layout, compiled once for whole-frame use.
+
+    ``ops`` is one ``(op, feature_a, feature_b)`` per output block: a raw
+    column, a square, a 4-column position interaction, a product of two
+    features, or a constant zero (an unrecognised term, or one referencing a
+    feature outside ``feature_names`` — which ``build_feature_vector`` reads as
+    None). :meth:`matrix` builds every row at once with column-wise numpy ops
+    and matches the per-row vectors, except that a NaN feature value counts
+    as missing (0.0) like None.
+    """
+
+    feature_names: tuple[str, ...]
+    interaction_terms: tuple[str, ...]
+    ops: tuple[tuple[int, str, str], ...]
+
+    @classmethod
+    def compile(cls, feature_names, interaction_terms) -> "DesignMatrixSpec":
+        names = tuple(sorted(feature_names))
+        known = set(names)
+        ops: list[tuple[int, str, str]] = [(RAW, name, "") for name in names]
+        for term in interaction_terms:
+            if "^2" in term:
+                name = term.replace("^2", "")
+                ops.append((SQUARE, name, "") if name in known else (ZERO, "", ""))
+            elif "*position" in term:
+                name = term.replace("*position", "")
+                if name in known:
+                    ops.append((BY_POSITION, name, ""))
+                else:
+                    ops.extend([(ZERO, "", "")] * len(POSITIONS))
+            elif "*" in term:
+                a, b = term.split("*", 1)
+                ops.append((PRODUCT, a, b) if a in known and b in known else (ZERO, "", ""))
+            else:
+                ops.append((ZERO, "", ""))
+        return cls(feature_names=names, interaction_terms=tuple(interaction_terms), ops=tuple(ops))
+
+    @property
+    def column_names(self) -> list[str]:
+        """Same as ``get_feature_column_names(feature_names, interaction_terms)``."""
+        return get_feature_column_names(list(self.feature_names), list(self.interaction_terms))
+
+    @property
+    def n_columns(self) -> int:
+        return sum(len(POSITIONS) if op == BY_POSITION else 1 for op, _a, _b in self.ops)
+
+    def matrix(self, features: pd.DataFrame, positions) -> np.ndarray:
+        """``(len(features), n_columns)`` design matrix.
+
+        ``features`` is a wide frame with one column per feature (absent
+        columns and null values are 0.0); ``positions`` aligns with its rows.
+        """
+        n = len(features)
+        raw = {}
+        for name in self.feature_names:
+            if name in features.columns:
+                col = pd.to_numeric(features[name], errors="coerce").to_numpy(dtype=np.float64)
+                raw[name] = np.where(np.isnan(col), 0.0, col)
+            else:
+                raw[name] = np.zeros(n)
+        position_arr = np.asarray(positions, dtype=object)
+        out = np.zeros((n, self.n_columns), dtype=np.float64)
+        j = 0
+        for op, a, b in self.ops:
+            if op == RAW:
+                out[:, j] = raw[a]
+            elif op == SQUARE:
+                out[:, j] = raw[a] * raw[a]
+            elif op == BY_POSITION:
+                for pos in POSITIONS:
+                    out[:, j] = np.where(position_arr == pos, raw[a], 0.0)
+                    j += 1
+                continue
+            elif op == PRODUCT:
+                out[:, j] = raw[a] * raw[b]
+            j += 1
+        return out
+
+
+def feature_value_frame(feature_values) -> pd.DataFrame:
+    """Wide frame (one column per feature) from a sequence of feature-value dicts."""
+    index = feature_values.index if isinstance(feature_values, pd.Series) else None
+    return pd.DataFrame.from_records(list(feature_values), index=index)
+
+
 def compute_features_for_player(
     features: list[ProjectionFeature],
     player_id: str,
@@ -120,21 +214,26 @@ def compute_features_for_player(
     nfl_stats_df: pd.DataFrame,
     context: dict[str, Any],
     weights: dict[str, float] | None = None,
+    precomputed: Mapping[str, Optional[float]] | None = None,
 ) -> dict[str, Optional[float]]:
     """Compute all feature values for a player (both base and adjustments).
 
     Unlike the additive combiner, this returns raw feature outputs without
-    combining them — the learned model handles combination.
+    combining them — the learned model handles combination. ``precomputed``
+    carries raw ``compute_batch`` values, as in ``combine_features``.
     """
     if weights is None:
         weights = {}
+    if precomputed is None:
+        precomputed = {}
 
     feature_values: dict[str, Optional[float]] = {}
 
     # First pass: compute base feature and set base_ppg in context
     for feature in features:
         if feature.is_base:
-            val = feature.compute(player_id, position, history_df, nfl_stats_df, context)
+            val = compute_feature(feature, player_id, position, history_df,
+                                  nfl_stats_df, context, precomputed)
             if val is not None:
                 w = weights.get(feature.name, 1.0)
                 val = val * w
@@ -146,13 +245,14 @@ def compute_features_for_player(
         return feature_values
 
     # Update context so adjustment features can use base_ppg
-    context_with_base = {**context, "base_ppg": base_ppg}
+    context_with_base = with_base_ppg(context, base_ppg)
 
     # Second pass: compute adjustment features
     for feature in features:
         if feature.is_base:
             continue
-        val = feature.compute(player_id, position, history_df, nfl_stats_df, context_with_base)
+        val = compute_feature(feature, player_id, position, history_df,
+                              nfl_stats_df, context_with_base, precomputed)
         feature_values[feature.name] = val
 
     return feature_values
@@ -210,9 +310,13 @@ def predict(
     return max(0.0, predicted)
 
 
-def load_model_params(model_name: str) -> dict[str, Any]:
-    """Load trained model parameters from JSON file."""
-    path = TRAINED_MODELS_DIR / f"{model_name}.json"
+def load_model_params(model_name: str, models_dir: Optional[Path] = None) -> dict[str, Any]:
+    """Load trained model parameters from JSON file.
+
+    ``models_dir`` reads from a directory other than ``TRAINED_MODELS_DIR`` —
+    e.g. a held-out retrain's sandbox.
+    """
+    path = (models_dir or TRAINED_MODELS_DIR) / f"{model_name}.json"
     if not path.exists():
         raise FileNotFoundError(
             f"No trained model found at {path}. "
@@ -232,6 +336,7 @@ def combine_features_learned(
     context: dict[str, Any],
     model_params: dict[str, Any],
     weights: dict[str, float] | None = None,
+    precomputed: Mapping[str, Optional[float]] | None = None,
 ) -> tuple[Optional[float], dict[str, Optional[float]]]:
     """Learned combiner entry point — drop-in replacement for combine_features.
 
@@ -240,7 +345,8 @@ def combine_features_learned(
     same format as the additive combiner.
     """
     feature_values = compute_features_for_player(
-        features, player_id, position, history_df, nfl_stats_df, context, weights
+        features, player_id, position, history_df, nfl_stats_df, context, weights,
+        precomputed,
     )
 
     # Check if base feature produced a value
@@ -300,6 +406,73 @@ def predict_residual(
     return max(0.0, base_pred + delta)
 
 
+def predict_batch(
+    features: pd.DataFrame,
+    positions,
+    model_params: dict[str, Any],
+) -> np.ndarray:
+    """:func:`predict` for every row of a wide feature frame at once.
+
+    ``features`` has one column per feature (extra columns are ignored, absent
+    or null values count as 0.0 — as None does in ``predict``); ``positions``
+    aligns with its rows. Returns float64 predictions equal to ``predict`` row
+    for row up to floating-point rounding: the batch is one ``X @ coefficients``
+    matmul, and BLAS may sum the terms in a different order than ``np.dot``
+    does for a single vector (differences are ~1e-15 relative).
+    """
+    saved_columns = model_params.get("feature_names")
+    if saved_columns:
+        raw_feature_names = [c for c in saved_columns if "*" not in c and "^" not in c]
+    else:
+        raw_feature_names = list(features.columns)
+    spec = DesignMatrixSpec.compile(raw_feature_names, model_params["interaction_terms"])
+    X = spec.matrix(features, positions)
+
+    if "scaler_mean" in model_params and "scaler_scale" in model_params:
+        mean = np.array(model_params["scaler_mean"], dtype=np.float64)
+        scale = np.array(model_params["scaler_scale"], dtype=np.float64)
+        scale = np.where(scale == 0, 1.0, scale)
+        X = (X - mean) / scale
+
+    coefficients = np.array(model_params["coefficients"], dtype=np.float64)
+    predicted = X @ coefficients + float(model_params["intercept"])
+    return np.maximum(predicted, 0.0)
+
+
+def predict_residual_batch(
+    features: pd.DataFrame,
+    positions,
+    model_params: dict[str, Any],
+) -> np.ndarray:
+    """:func:`predict_residual` for every row of a wide feature frame at once.
+
+    Runs the nested base chain in batch and applies the residual only to the
+    ``training_filter`` positions. NaN where ``predict_residual`` returns None
+    (the params carry no base model).
+    """
+    base_params = model_params.get("base_model_params")
+    if not base_params:
+        return np.full(len(features), np.nan)
+    if base_params.get("combiner_type") == "residual":
+        base_pred = predict_residual_batch(features, positions, base_params)
+    else:
+        base_pred = predict_batch(features, positions, base_params)
+
+    position_arr = np.asarray(positions, dtype=object)
+    allowed_positions = (model_params.get("training_filter") or {}).get("positions")
+    applies = (
+        np.isin(position_arr, list(allowed_positions)) if allowed_positions
+        else np.ones(len(features), dtype=bool)
+    )
+
+    spec = DesignMatrixSpec.compile(
+        model_params.get("feature_names") or [], model_params.get("interaction_terms") or []
+    )
+    coefficients = np.array(model_params["coefficients"], dtype=np.float64)
+    delta = spec.matrix(features, position_arr) @ coefficients
+    return np.where(applies, np.maximum(base_pred + delta, 0.0), np.maximum(base_pred, 0.0))
+
+
 def combine_features_residual(
     features: list[ProjectionFeature],
     player_id: str,
@@ -309,6 +482,7 @@ def combine_features_residual(
     context: dict[str, Any],
     model_params: dict[str, Any],
     weights: dict[str, float] | None = None,
+    precomputed: Mapping[str, Optional[float]] | None = None,
 ) -> tuple[Optional[float], dict[str, Optional[float]]]:
     """Residual combiner entry point.
 
@@ -318,7 +492,8 @@ def combine_features_residual(
     everything that's passed in and hands it to ``predict_residual``.
     """
     feature_values = compute_features_for_player(
-        features, player_id, position, history_df, nfl_stats_df, context, weights
+        features, player_id, position, history_df, nfl_stats_df, context, weights,
+        precomputed,
     )
 
     base_feature_name = next((f.name for f in features if f.is_base), None)
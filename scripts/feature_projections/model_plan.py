@@ -0,0 +1,319 @@
+"""Compiled per-(model, position) execution plans.
+
+Projecting one player used to re-resolve the model for every call: position
+overrides and merged weights (``_resolve_features_for_position``), the nested
+residual chain (``_resolve_residual_base_features``, which walks ``get_model``
+down every base), the ordered feature-instance list, and — inside
+``predict`` / ``predict_residual`` — the raw-column filter, interaction-term
+parsing and coefficient / scaler arrays of every Ridge layer.
+
+A :class:`ModelPlan` does all of that once per (model, position):
+
+* ``features`` — ordered feature instances (nested residual bases first, then
+  the model's own features), resolved from the caller's feature pool;
+* ``weights`` — model weights merged with the position override;
+* ``layers`` — the Ridge chain with its loaded params, innermost base first,
+  each with its compiled interaction-term layout and numpy arrays.
+
+The per-player loop then only executes the plan. The runner, ``train_model``
+(feature collection) and ``holdout_eval`` (held-out prediction) share it, and
+its predictions are bit-identical to ``learned_combiner.predict`` /
+``predict_residual``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from scripts.feature_projections import profiling
+from scripts.feature_projections.combiner import combine_features
+from scripts.feature_projections.features.base import ProjectionFeature
+from scripts.feature_projections.learned_combiner import (
+    BY_POSITION,
+    POSITIONS,
+    PRODUCT,
+    RAW,
+    SQUARE,
+    DesignMatrixSpec,
+    compute_features_for_player,
+    predict_batch,
+    predict_residual_batch,
+)
+from scripts.feature_projections.model_config import ModelDefinition, get_model
+
+
+def _resolve_features_for_position(
+    model_def: ModelDefinition, position: str
+) -> tuple[list[str], dict[str, float]]:
+    """Return (feature_names, weights) for a position, applying overrides if present."""
+    override = model_def.position_overrides.get(position)
+    if override:
+        # Merge model-level weights with override-level weights (override wins)
+        merged_weights = {**model_def.weights, **override.weights}
+        return override.features, merged_weights
+    return model_def.features, model_def.weights
+
+
+def _resolve_residual_base_features(
+    model_def: ModelDefinition, position: str
+) -> list[str]:
+    """Union of position-resolved features across all nested base models."""
+    if model_def.combiner_type != "residual" or not model_def.base_model_name:
+        return []
+    base_def = get_model(model_def.base_model_name)
+    base_features, _ = _resolve_features_for_position(base_def, position)
+    deeper = _resolve_residual_base_features(base_def, position)
+    return list(dict.fromkeys(list(deeper) + list(base_features)))
+
+
+def _compile_layout(
+    raw_names: list[str], interaction_terms: list[str]
+) -> tuple[tuple[int, str, str], ...]:
+    """``build_feature_vector``'s column layout as a flat op list.
+
+    ``predict`` / ``predict_residual`` restrict the feature values to the
+    layer's raw columns before building the vector, so a term that references
+    any other feature is constant zero — resolved here instead of per player.
+    """
+    return DesignMatrixSpec.compile(raw_names, interaction_terms).ops
+
+
+@dataclass(frozen=True)
+class _RidgeLayer:
+    """One Ridge layer of a model's chain with its compiled layout and arrays."""
+
+    layout: tuple[tuple[int, str, str], ...]
+    coefficients: np.ndarray
+    intercept: float
+    scaler_mean: Optional[np.ndarray]
+    scaler_scale: Optional[np.ndarray]
+    residual: bool
+    # Residual layers trained on a position subset (GH #592) pass the base
+    # prediction through for other positions.
+    applies: bool
+
+    def vector(self, feature_values: Mapping[str, Optional[float]], position: str) -> list[float]:
+        values: list[float] = []
+        get = feature_values.get
+        for op, a, b in self.layout:
+            if op == RAW:
+                val = get(a)
+                values.append(float(val) if val is not None else 0.0)
+            elif op == SQUARE:
+                val = get(a)
+                values.append(float(val) * float(val) if val is not None else 0.0)
+            elif op == BY_POSITION:
+                val = get(a)
+                for pos in POSITIONS:
+                    values.append(float(val) if val is not None and position == pos else 0.0)
+            elif op == PRODUCT:
+                val_a, val_b = get(a), get(b)
+                if val_a is not None and val_b is not None:
+                    values.append(float(val_a) * float(val_b))
+                else:
+                    values.append(0.0)
+            else:
+                values.append(0.0)
+        return values
+
+
+def _compile_layers(
+    params: dict[str, Any],
+    position: str,
+    fallback_raw_names: list[str],
+    residual: bool,
+) -> Optional[list[_RidgeLayer]]:
+    """Flatten a (possibly nested residual) params dict into layers, base first.
+
+    Returns None when the chain can't predict (a residual without its base).
+    """
+    if residual:
+        base_params = params.get("base_model_params")
+        if not base_params:
+            return None
+        layers = _compile_layers(
+            base_params, position, fallback_raw_names,
+            base_params.get("combiner_type") == "residual",
+        )
+        if layers is None:
+            return None
+        allowed = (params.get("training_filter") or {}).get("positions")
+        layers.append(_RidgeLayer(
+            layout=_compile_layout(
+                list(params.get("feature_names") or []),
+                list(params.get("interaction_terms") or []),
+            ),
+            coefficients=np.array(params["coefficients"], dtype=np.float64),
+            intercept=0.0,
+            scaler_mean=None,
+            scaler_scale=None,
+            residual=True,
+            applies=not allowed or position in allowed,
+        ))
+        return layers
+
+    saved_columns = params.get("feature_names")
+    if saved_columns:
+        raw_names = [c for c in saved_columns if "*" not in c and "^" not in c]
+    else:
+        raw_names = list(fallback_raw_names)
+    mean = scale = None
+    if "scaler_mean" in params and "scaler_scale" in params:
+        mean = np.array(params["scaler_mean"], dtype=np.float64)
+        scale = np.array(params["scaler_scale"], dtype=np.float64)
+        scale = np.where(scale == 0, 1.0, scale)
+    return [_RidgeLayer(
+        layout=_compile_layout(raw_names, list(params["interaction_terms"])),
+        coefficients=np.array(params["coefficients"], dtype=np.float64),
+        intercept=float(params["intercept"]),
+        scaler_mean=mean,
+        scaler_scale=scale,
+        residual=False,
+        applies=True,
+    )]
+
+
+@dataclass(frozen=True)
+class ModelPlan:
+    """Everything needed to project one position under one model."""
+
+    model_name: str
+    position: str
+    combiner_type: str
+    feature_names: tuple[str, ...]
+    features: tuple[ProjectionFeature, ...]
+    weights: Optional[dict[str, float]]
+    base_feature: Optional[str]
+    params: Optional[dict[str, Any]]
+    layers: Optional[tuple[_RidgeLayer, ...]]
+
+    @classmethod
+    def compile(
+        cls,
+        model_def: ModelDefinition,
+        position: str,
+        feature_pool: Mapping[str, ProjectionFeature],
+        params: Optional[dict[str, Any]] = None,
+    ) -> "ModelPlan":
+        """Resolve ``model_def`` for ``position`` against ``feature_pool``.
+
+        ``params`` are the trained params (learned / residual models); without
+        them the plan runs the additive combiner, as the runner always has.
+        Residual plans evaluate the union of every nested base layer's features
+        so the full stack can be predicted without re-loading anything.
+        """
+        names, weights = _resolve_features_for_position(model_def, position)
+        base_eff = _resolve_residual_base_features(model_def, position)
+        if base_eff:
+            names = list(dict.fromkeys(list(base_eff) + list(names)))
+        features = tuple(feature_pool[f] for f in names if f in feature_pool)
+        layers = None
+        if params is not None:
+            compiled = _compile_layers(
+                params, position, [f.name for f in features],
+                model_def.combiner_type == "residual",
+            )
+            layers = tuple(compiled) if compiled is not None else None
+        return cls(
+            model_name=model_def.name,
+            position=position,
+            combiner_type=model_def.combiner_type,
+            feature_names=tuple(names),
+            features=features,
+            weights=weights or None,
+            base_feature=next((f.name for f in features if f.is_base), None),
+            params=params,
+            layers=layers,
+        )
+
+    def compute(
+        self,
+        player_id: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+        precomputed: Mapping[str, Optional[float]] | None = None,
+    ) -> dict[str, Optional[float]]:
+        """Raw (weighted) feature values, as ``compute_features_for_player``."""
+        return compute_features_for_player(
+            list(self.features), player_id, self.position, history_df,
+            nfl_stats_df, context, self.weights, precomputed,
+        )
+
+    def predict(self, feature_values: Mapping[str, Optional[float]]) -> Optional[float]:
+        """Run the compiled Ridge chain (``predict`` / ``predict_residual``)."""
+        if self.layers is None:
+            return None
+        pred: Optional[float] = None
+        for layer in self.layers:
+            if not layer.residual:
+                x = np.array(layer.vector(feature_values, self.position), dtype=np.float64)
+                if layer.scaler_mean is not None:
+                    x = (x - layer.scaler_mean) / layer.scaler_scale
+                pred = max(0.0, float(np.dot(x, layer.coefficients) + layer.intercept))
+            elif not layer.applies:
+                pred = max(0.0, pred)
+            else:
+                x = np.array(layer.vector(feature_values, self.position), dtype=np.float64)
+                delta = float(np.dot(x, layer.coefficients))
+                pred = max(0.0, pred + delta)
+        return pred
+
+    def execute(
+        self,
+        player_id: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+        precomputed: Mapping[str, Optional[float]] | None = None,
+    ) -> tuple[Optional[float], dict[str, Optional[float]]]:
+        """Project one player: ``(projected_ppg, feature_values)``."""
+        if self.params is None:
+            return combine_features(
+                list(self.features), player_id, self.position, history_df,
+                nfl_stats_df, context, self.weights, precomputed,
+            )
+        feature_values = self.compute(player_id, history_df, nfl_stats_df, context, precomputed)
+        if self.base_feature and feature_values.get(self.base_feature) is None:
+            return None, feature_values
+        with profiling.stage("predict: ridge chain"):
+            predicted = self.predict(feature_values)
+        return predicted, feature_values
+
+
+class PlanCache:
+    """Lazily compiled plans for one (model, params, feature pool), per position."""
+
+    def __init__(
+        self,
+        model_def: ModelDefinition,
+        feature_pool: Mapping[str, ProjectionFeature],
+        params: Optional[dict[str, Any]] = None,
+    ):
+        self.model_def = model_def
+        self.feature_pool = feature_pool
+        self.params = params
+        self._plans: dict[str, ModelPlan] = {}
+
+    def predict_batch(self, features: pd.DataFrame, positions) -> np.ndarray:
+        """Predictions for every row of a wide feature frame (NaN = no prediction).
+
+        Row for row equal to ``self[position].predict(feature_values)`` up to
+        floating-point rounding, with the whole Ridge chain scored by matrix ops.
+        """
+        if self.params is None:
+            raise ValueError(f"{self.model_def.name}: batch prediction needs trained params")
+        if self.model_def.combiner_type == "residual":
+            return predict_residual_batch(features, positions, self.params)
+        return predict_batch(features, positions, self.params)
+
+    def __getitem__(self, position: str) -> ModelPlan:
+        plan = self._plans.get(position)
+        if plan is None:
+            plan = ModelPlan.compile(self.model_def, position, self.feature_pool, self.params)
+            self._plans[position] = plan
+        return plan
@@ -0,0 +1,323 @@
+"""Opt-in stage / per-feature profiling for projection runs (``--profile``).
+
+When a run is slow there was no way to tell whether the time went to Supabase
+fetches, lookup building, one feature's ``compute()``, the Ridge chain or the
+upserts. With a profiler active:
+
+* **stages** — ``with profiling.stage("fetch: lookups"): ...`` blocks record
+  wall time and call counts. Stages may nest (e.g. ``predict: ridge chain``
+  runs inside ``project: players``), so their shares don't sum to 100%.
+* **features** — feature pools wrapped by :func:`instrument` record per-feature
+  ``compute()`` wall time, calls and the None-result rate, plus the time of the
+  feature's vectorized ``compute_batch`` pass.
+* **PostgREST traffic** — requests and wire bytes per table made during the
+  run, from ``db_client.POSTGREST_TRAFFIC``.
+
+Profiling is off unless a command passes ``--profile``; ``stage()`` is then a
+shared no-op context and ``instrument()`` returns the pool unchanged.
+``--profile-json`` also writes the numbers to
+``.cache/profiles/<label>-<timestamp>-<commit>.json`` so hot spots can be
+tracked across commits. Pool workers (``run --workers``) return their counters
+with each shard; the parent merges them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import pandas as pd
+
+from scripts.db_client import POSTGREST_TRAFFIC, TrafficCounter
+from scripts.feature_projections import holdout_cache
+from scripts.feature_projections.features.base import ProjectionFeature
+
+_repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def profile_dir() -> Path:
+    """``.cache/profiles``, next to the (worktree-shared) holdout cache."""
+    return holdout_cache.CACHE_DIR.parent / "profiles"
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_repo_root,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+class Profiler:
+    """Accumulates stage and feature timings for one command."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.perf_counter()
+        # name -> [seconds, calls]
+        self.stages: dict[str, list[float]] = {}
+        # name -> [compute seconds, compute calls, None results, batch seconds, batch calls]
+        self.features: dict[str, list[float]] = {}
+        # PostgREST traffic: counted since _traffic_base here, plus workers' merged in.
+        self._traffic_base = POSTGREST_TRAFFIC.snapshot()
+        self.traffic: dict[str, list[int]] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - start)
+
+    def add_stage(self, name: str, seconds: float, calls: int = 1) -> None:
+        entry = self.stages.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+
+    def _feature(self, name: str) -> list[float]:
+        return self.features.setdefault(name, [0.0, 0, 0, 0.0, 0])
+
+    def add_feature(self, name: str, seconds: float, is_none: bool) -> None:
+        entry = self._feature(name)
+        entry[0] += seconds
+        entry[1] += 1
+        entry[2] += int(is_none)
+
+    def add_batch(self, name: str, seconds: float) -> None:
+        entry = self._feature(name)
+        entry[3] += seconds
+        entry[4] += 1
+
+    # -- worker hand-off ---------------------------------------------------
+
+    def _traffic(self) -> dict[str, list[int]]:
+        traffic = {table: list(v) for table, v in self.traffic.items()}
+        since = TrafficCounter.since(self._traffic_base, POSTGREST_TRAFFIC.snapshot())
+        for table, counts in since.items():
+            entry = traffic.setdefault(table, [0, 0, 0])
+            for i, v in enumerate(counts):
+                entry[i] += v
+        return traffic
+
+    def drain(self) -> dict[str, Any]:
+        """Counters recorded so far (then cleared), for a pool worker's result."""
+        data = {"stages": self.stages, "features": self.features, "traffic": self._traffic()}
+        self.stages, self.features, self.traffic = {}, {}, {}
+        self._traffic_base = POSTGREST_TRAFFIC.snapshot()
+        return data
+
+    def merge(self, data: dict[str, Any]) -> None:
+        for name, (seconds, calls) in data["stages"].items():
+            self.add_stage(name, seconds, int(calls))
+        for name, values in data["features"].items():
+            entry = self._feature(name)
+            for i, v in enumerate(values):
+                entry[i] += v
+        for table, counts in data.get("traffic", {}).items():
+            entry = self.traffic.setdefault(table, [0, 0, 0])
+            for i, v in enumerate(counts):
+                entry[i] += v
+
+    # -- output ------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "commit": _git_commit(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "stages": [
+                {"stage": name, "seconds": round(seconds, 6), "calls": int(calls)}
+                for name, (seconds, calls) in sorted(
+                    self.stages.items(), key=lambda kv: -kv[1][0]
+                )
+            ],
+            "features": [
+                {
+                    "feature": name,
+                    "compute_seconds": round(v[0], 6),
+                    "compute_calls": int(v[1]),
+                    "none_rate": round(v[2] / v[1], 4) if v[1] else None,
+                    "batch_seconds": round(v[3], 6),
+                    "batch_calls": int(v[4]),
+                }
+                for name, v in sorted(
+                    self.features.items(), key=lambda kv: -(kv[1][0] + kv[1][3])
+                )
+            ],
+            "postgrest": [
+                {"table": table, "requests": v[0], "bytes_sent": v[1], "bytes_received": v[2]}
+                for table, v in sorted(self._traffic().items(), key=lambda kv: -kv[1][2])
+            ],
+        }
+
+    def report(self) -> str:
+        data = self.to_dict()
+        wall = data["wall_seconds"] or 1e-9
+        lines = [
+            f"Profile: {self.label} — {data['wall_seconds']:.2f}s wall"
+            + (f" @ {data['commit']}" if data["commit"] else ""),
+            "",
+            f"{'Stage':<40} {'Seconds':>10} {'% wall':>7} {'Calls':>9}",
+            "-" * 69,
+        ]
+        for row in data["stages"]:
+            lines.append(
+                f"{row['stage']:<40} {row['seconds']:>10.3f} "
+                f"{100 * row['seconds'] / wall:>6.1f}% {row['calls']:>9}"
+            )
+        if data["features"]:
+            lines += [
+                "",
+                f"{'Feature':<32} {'Compute s':>10} {'Calls':>9} {'µs/call':>9} "
+                f"{'None %':>7} {'Batch s':>9}",
+                "-" * 81,
+            ]
+            for row in data["features"]:
+                calls = row["compute_calls"]
+                per_call = 1e6 * row["compute_seconds"] / calls if calls else 0.0
+                none_pct = f"{100 * row['none_rate']:.1f}" if row["none_rate"] is not None else "-"
+                lines.append(
+                    f"{row['feature']:<32} {row['compute_seconds']:>10.3f} {calls:>9} "
+                    f"{per_call:>9.1f} {none_pct:>7} {row['batch_seconds']:>9.3f}"
+                )
+        if data["postgrest"]:
+            lines += [
+                "",
+                f"{'PostgREST table':<32} {'Requests':>9} {'KB sent':>10} {'KB received':>12}",
+                "-" * 66,
+            ]
+            for row in data["postgrest"]:
+                lines.append(
+                    f"{row['table']:<32} {row['requests']:>9} "
+                    f"{row['bytes_sent'] / 1024:>10.1f} {row['bytes_received'] / 1024:>12.1f}"
+                )
+        return "\n".join(lines)
+
+    def write_json(self, path: Optional[Path] = None) -> Path:
+        data = self.to_dict()
+        if path is None:
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            suffix = f"-{data['commit']}" if data["commit"] else ""
+            path = profile_dir() / f"{self.label}-{stamp}{suffix}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+        return path
+
+
+_active: Optional[Profiler] = None
+
+
+def active() -> Optional[Profiler]:
+    return _active
+
+
+def start(label: str) -> Profiler:
+    global _active
+    _active = Profiler(label)
+    return _active
+
+
+def stop() -> Optional[Profiler]:
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def stage(name: str):
+    """Time a block under ``name`` when profiling; a no-op otherwise."""
+    profiler = _active
+    return profiler.stage(name) if profiler is not None else _NULL_STAGE
+
+
+class ProfiledFeature(ProjectionFeature):
+    """Proxy recording a feature's ``compute()`` / ``compute_batch`` timings."""
+
+    def __init__(self, feature: ProjectionFeature, profiler: Profiler):
+        self._feature = feature
+        self._profiler = profiler
+
+    @property
+    def name(self) -> str:
+        return self._feature.name
+
+    @property
+    def is_base(self) -> bool:
+        return self._feature.is_base
+
+    def compute(
+        self,
+        player_id: str,
+        position: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[float]:
+        start = time.perf_counter()
+        value = self._feature.compute(player_id, position, history_df, nfl_stats_df, context)
+        self._profiler.add_feature(self.name, time.perf_counter() - start, value is None)
+        return value
+
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        start = time.perf_counter()
+        result = self._feature.compute_batch(season_frame, context)
+        if result is not None:
+            self._profiler.add_batch(self.name, time.perf_counter() - start)
+        return result
+
+
+def instrument(feature_pool: dict[str, Any]) -> dict[str, Any]:
+    """Wrap a feature pool in :class:`ProfiledFeature` proxies when profiling."""
+    profiler = _active
+    if profiler is None:
+        return feature_pool
+    return {name: ProfiledFeature(feature, profiler) for name, feature in feature_pool.items()}
+
+
+def add_profile_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Print wall time / call counts per stage and per feature",
+    )
+    parser.add_argument(
+        "--profile-json", action="store_true",
+        help="With --profile, also write the profile to .cache/profiles/",
+    )
+
+
+@contextlib.contextmanager
+def profiled(args: argparse.Namespace, label: str) -> Iterator[Optional[Profiler]]:
+    """Profile the enclosed command when ``args.profile`` is set."""
+    if not getattr(args, "profile", False):
+        yield None
+        return
+    profiler = start(label)
+    try:
+        yield profiler
+    finally:
+        stop()
+        print("\n" + profiler.report())
+        if getattr(args, "profile_json", False):
+            print(f"\nProfile written to: {profiler.write_json()}")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import sys
 
 from scripts.config import get_supabase_client
+from scripts.db_io import FETCH_WORKERS, fetch_all_rows, bulk_upsert
 
 
 def promote_model(model_name: str) -> int:
@@ -28,30 +29,22 @@ def promote_model(model_name: str) -> int:
 
     model_id = model_res.data[0]["id"]
 
-    # Fetch all projections for this model (paginated to avoid 1000-row default limit)
-    records = []
-    page_size = 1000
-    offset = 0
-    while True:
-        proj_res = (
-            supabase.table("model_projections")
-            .select("player_id, season, projected_ppg, projected_games")
-            .eq("model_id", model_id)
-            .range(offset, offset + page_size - 1)
-            .execute()
+    # Fetch all projections for this model (keyset-paginated past the 1000-row limit)
+    records = [
+        {
+            "player_id": row["player_id"],
+            "season": row["season"],
+            "projected_ppg": row["projected_ppg"],
+            "projected_games": row.get("projected_games"),
+            "projection_method": model_name,
+        }
+        for row in fetch_all_rows(
+            supabase, "model_projections",
+            "player_id, season, projected_ppg, projected_games",
+            filters=[("eq", "model_id", model_id)],
+            workers=FETCH_WORKERS,
         )
-        page = proj_res.data or []
-        for row in page:
-            records.append({
-                "player_id": row["player_id"],
-                "season": row["season"],
-                "projected_ppg": row["projected_ppg"],
-                "projected_games": row.get("projected_games"),
-                "projection_method": model_name,
-            })
-        if len(page) < page_size:
-            break
-        offset += page_size
+    ]
 
     if not records:
         print(f"No projections found for model '{model_name}'")
@@ -81,14 +74,8 @@ def promote_model(model_name: str) -> int:
             f"for season {season} (kept rookie fallback rows: {rookie_methods})"
         )
 
-    # Batch upsert to player_projections
-    batch_size = 500
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        supabase.table("player_projections").upsert(
-            batch, on_conflict="player_id,season"
-        ).execute()
-        print(f"  Upserted batch {i // batch_size + 1} ({len(batch)} records)")
+    bulk_upsert(supabase, "player_projections", records, on_conflict="player_id,season")
+    print(f"  Upserted {len(records)} records")
 
     # Clear is_active from all models, set on promoted model
     supabase.table("projection_models").update({"is_active": False}).eq(
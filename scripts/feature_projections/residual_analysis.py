@@ -11,7 +11,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import math
 import os
 import sys
@@ -21,7 +20,9 @@ from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
+from scripts.feature_projections.feature_values import feature_dicts, fetch_feature_frame
 
 
 def _compute_distribution_stats(residuals: List[float]) -> dict:
@@ -110,17 +111,15 @@ def collect_residuals(
         # Fetch projections (paginated — a model+season can exceed the
         # 1000-row PostgREST cap).
         proj_rows = fetch_all_rows(
-            supabase, "model_projections", "player_id, projected_ppg, feature_values",
+            supabase, "model_projections", "player_id, projected_ppg",
             filters=[("eq", "model_id", model_id), ("eq", "season", season)],
         )
+        features = feature_dicts(fetch_feature_frame(supabase, model_id, [season]))
         proj_map = {}
         for row in proj_rows:
-            fv = row.get("feature_values") or {}
-            if isinstance(fv, str):
-                fv = json.loads(fv)
             proj_map[row["player_id"]] = {
                 "projected_ppg": float(row["projected_ppg"]),
-                "feature_values": fv,
+                "feature_values": features.get((row["player_id"], season), {}),
             }
 
         # Fetch actuals (paginated — a single season of player_stats can exceed
@@ -405,6 +404,7 @@ def main() -> None:
         default=None,
         help="Output file path (default: stdout only)",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
 
     model_name = args.model
@@ -36,7 +36,8 @@ import math
 from collections import defaultdict
 from typing import Callable, Dict, List, Optional, Tuple
 
-from scripts.config import get_supabase_client, fetch_all_rows, MIN_GAMES
+from scripts.config import add_source_arg, get_supabase_client, MIN_GAMES
+from scripts.db_io import fetch_all_rows
 from scripts.analysis_utils import fetch_multi_season_stats
 from scripts.projection_methods import RookieDraftCapitalPPG
 
@@ -471,6 +472,7 @@ def main() -> None:
         "--output", default="docs/generated/rookie-backtest.md",
         help="Markdown report path. Pass '-' to print to stdout only.",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
 
     holdout_seasons = [int(s) for s in args.seasons.split(",") if s.strip()]
@@ -3,23 +3,51 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
-from scripts.config import get_supabase_client, MIN_GAMES, fetch_all_rows
-from scripts.analysis_utils import fetch_multi_season_stats, fetch_multi_season_nfl_stats
+from scripts.config import get_supabase_client, MIN_GAMES
+from scripts.db_io import fetch_all_rows, bulk_upsert
+from scripts.analysis_utils import get_season_data_store
 from scripts.feature_projections.features import FEATURE_REGISTRY
 from scripts.feature_projections.model_config import ModelDefinition, PositionOverride, get_model
-from scripts.feature_projections.combiner import combine_features
-from scripts.feature_projections.learned_combiner import (
-    combine_features_learned,
-    combine_features_residual,
-    load_model_params,
-)
-from scripts.feature_projections.qb_starters import get_all_starter_ids, is_qb_starter
+from scripts.feature_projections.features.base import ProjectionFeature
+from scripts.feature_projections.learned_combiner import feature_value_frame, load_model_params
+from scripts.feature_projections import profiling
+from scripts.feature_projections.model_plan import ModelPlan, PlanCache
+from scripts.feature_projections.qb_starters import get_all_starter_ids
 from scripts.feature_projections.expected_games import build_expected_games
+from scripts.feature_projections.feature_inputs import (
+    ALL_INPUTS,
+    LOOKUPS,
+    FeatureInputs,
+    resolve_inputs,
+)
+from scripts.feature_projections.feature_store import FeatureStore, InputFingerprinter, open_store
+from scripts.feature_projections.incremental import (
+    load_existing_projections,
+    load_fingerprints,
+    record_changed,
+    save_fingerprints,
+    shared_digest,
+)
+from scripts.feature_projections.season_index import SeasonPlayerIndex, team_history_from_rows
+from scripts.feature_projections.season_aggregates import (
+    POOLING_MIN_GAMES,
+    STARTER_RANK,
+    fetch_position_ppg_moments,
+    fetch_team_season_totals,
+    pooling_k_from_moments,
+    position_ppg_moments,
+    team_aggregates_from_totals,
+    team_season_totals,
+)
+from scripts.feature_projections.context import PlayerContext, SeasonContext
 
 
 def _ensure_model_in_db(supabase, model_def: ModelDefinition) -> str:
@@ -74,30 +102,6 @@ def _collect_feature_names_recursive(model_def: ModelDefinition) -> set[str]:
     return names
 
 
-def _resolve_residual_base_features(
-    model_def: ModelDefinition, position: str
-) -> list[str]:
-    """Union of position-resolved features across all nested base models."""
-    if model_def.combiner_type != "residual" or not model_def.base_model_name:
-        return []
-    base_def = get_model(model_def.base_model_name)
-    base_features, _ = _resolve_features_for_position(base_def, position)
-    deeper = _resolve_residual_base_features(base_def, position)
-    return list(dict.fromkeys(list(deeper) + list(base_features)))
-
-
-def _resolve_features_for_position(
-    model_def: ModelDefinition, position: str
-) -> tuple[list[str], dict[str, float]]:
-    """Return (feature_names, weights) for a position, applying overrides if present."""
-    override = model_def.position_overrides.get(position)
-    if override:
-        # Merge model-level weights with override-level weights (override wins)
-        merged_weights = {**model_def.weights, **override.weights}
-        return override.features, merged_weights
-    return model_def.features, model_def.weights
-
-
 def _compute_positional_mean_ppg(
     history_df: pd.DataFrame,
     players_df: pd.DataFrame,
@@ -105,38 +109,18 @@ def _compute_positional_mean_ppg(
 ) -> dict[str, float]:
     """Compute mean PPG per position from historical player_stats.
 
-    Only includes players who meet the minimum games threshold.
+    Only includes players who meet the minimum games threshold; each player's
+    PPG is averaged across seasons first, then per position.
     Returns dict mapping position -> mean PPG.
     """
-    if history_df.empty or players_df.empty:
-        return {}
-
-    merged = history_df.merge(
-        players_df[["player_id_ref", "position"]],
-        left_on="player_id",
-        right_on="player_id_ref",
-        how="left",
-    )
-
-    # Filter to players meeting min games
-    merged["games_played"] = pd.to_numeric(merged["games_played"], errors="coerce").fillna(0)
-    merged["ppg"] = pd.to_numeric(merged["ppg"], errors="coerce").fillna(0)
-    qualified = merged[merged["games_played"] >= min_games]
-
-    if qualified.empty:
-        return {}
-
-    # Average PPG per player first (across seasons), then per position
-    player_avg = qualified.groupby(["player_id", "position"])["ppg"].mean().reset_index()
-    pos_means = player_avg.groupby("position")["ppg"].mean()
-
-    return {str(pos): float(val) for pos, val in pos_means.items()}
+    moments = position_ppg_moments(history_df, players_df, min_games)
+    return {row.position: float(row.mean_ppg) for row in moments.itertuples(index=False)}
 
 
 def _compute_pooling_k(
     history_df: pd.DataFrame,
     players_df: pd.DataFrame,
-    min_games: int = 10,
+    min_games: int = POOLING_MIN_GAMES,
     min_players: int = 8,
     k_clip: tuple[float, float] = (0.3, 2.0),
 ) -> dict[str, float]:
@@ -155,45 +139,14 @@ def _compute_pooling_k(
     Falls back to 1.0 for any position with too few players to estimate, and
     clips to ``k_clip`` to guard against a thin-fold variance blowing up.
     """
-    if history_df.empty or players_df.empty:
-        return {}
-
-    merged = history_df.merge(
-        players_df[["player_id_ref", "position"]],
-        left_on="player_id",
-        right_on="player_id_ref",
-        how="left",
-    )
-    merged["games_played"] = pd.to_numeric(merged["games_played"], errors="coerce").fillna(0)
-    merged["ppg"] = pd.to_numeric(merged["ppg"], errors="coerce")
-    qualified = merged[(merged["games_played"] >= min_games) & merged["ppg"].notna()]
-    if qualified.empty:
-        return {}
-
-    out: dict[str, float] = {}
-    for position, pos_rows in qualified.groupby("position"):
-        seasons_by_player = pos_rows.groupby("player_id")["ppg"].apply(list)
-        if len(seasons_by_player) < min_players:
-            out[str(position)] = 1.0
-            continue
-        player_means = [float(np.mean(v)) for v in seasons_by_player]
-        within = [float(np.var(v, ddof=1)) for v in seasons_by_player if len(v) >= 2]
-        if len(within) < 2 or len(player_means) < 2:
-            out[str(position)] = 1.0
-            continue
-        sigma2 = float(np.mean(within))
-        m_bar = float(np.mean([len(v) for v in seasons_by_player]))
-        # Var(observed player means) = τ² + σ²/m̄  ⇒  τ² = Var(means) − σ²/m̄.
-        tau2 = max(float(np.var(player_means, ddof=1)) - sigma2 / m_bar, 0.1)
-        k = sigma2 / tau2
-        out[str(position)] = float(min(max(k, k_clip[0]), k_clip[1]))
-    return out
+    moments = position_ppg_moments(history_df, players_df, min_games)
+    return pooling_k_from_moments(moments, min_players, k_clip)
 
 
 def _compute_positional_starter_floor(
     history_df: pd.DataFrame,
     players_df: pd.DataFrame,
-    starter_rank: int = 24,
+    starter_rank: int = STARTER_RANK,
     min_games: int = MIN_GAMES,
 ) -> dict[str, float]:
     """Compute the starter-floor PPG per position from historical player_stats.
@@ -204,37 +157,39 @@ def _compute_positional_starter_floor(
 
     Returns dict mapping position -> starter-floor PPG.
     """
-    if history_df.empty or players_df.empty:
-        return {}
-
-    merged = history_df.merge(
-        players_df[["player_id_ref", "position"]],
-        left_on="player_id",
-        right_on="player_id_ref",
-        how="left",
-    )
-
-    merged["games_played"] = pd.to_numeric(merged["games_played"], errors="coerce").fillna(0)
-    merged["ppg"] = pd.to_numeric(merged["ppg"], errors="coerce").fillna(0)
-    qualified = merged[merged["games_played"] >= min_games]
+    moments = position_ppg_moments(history_df, players_df, min_games, starter_rank)
+    return {row.position: float(row.starter_floor) for row in moments.itertuples(index=False)}
 
-    if qualified.empty:
-        return {}
-
-    # Average PPG per player first (across seasons), then rank within position
-    player_avg = qualified.groupby(["player_id", "position"])["ppg"].mean().reset_index()
 
-    floors: dict[str, float] = {}
-    for position, pos_df in player_avg.groupby("position"):
-        ranked = pos_df.sort_values("ppg", ascending=False).reset_index(drop=True)
-        if len(ranked) >= starter_rank:
-            # PPG of the player at the starter_rank boundary (0-indexed)
-            floors[str(position)] = float(ranked.iloc[starter_rank - 1]["ppg"])
-        else:
-            # Fewer than starter_rank players — use the minimum
-            floors[str(position)] = float(ranked["ppg"].min())
+def _compute_season_aggregates(
+    supabase,
+    seasons: list[int],
+    history_df: pd.DataFrame,
+    nfl_stats_all: pd.DataFrame,
+    players_df: pd.DataFrame,
+) -> tuple[dict[str, Any], dict[str, float], dict[str, float], dict[str, float]]:
+    """(team aggregates, positional means, starter floors, pooling k) for a window.
 
-    return floors
+    Reduced server-side by the migration-035 SQL functions when deployed (tens
+    of rows over RPC), else from the window's frames in Python.
+    """
+    totals = fetch_team_season_totals(supabase, seasons)
+    if totals is None:
+        totals = team_season_totals(nfl_stats_all, players_df)
+    moments = fetch_position_ppg_moments(supabase, seasons, MIN_GAMES, STARTER_RANK)
+    if moments is None:
+        moments = position_ppg_moments(history_df, players_df, MIN_GAMES, STARTER_RANK)
+    pool_moments = moments
+    if POOLING_MIN_GAMES != MIN_GAMES:
+        pool_moments = fetch_position_ppg_moments(supabase, seasons, POOLING_MIN_GAMES)
+        if pool_moments is None:
+            pool_moments = position_ppg_moments(history_df, players_df, POOLING_MIN_GAMES)
+    return (
+        team_aggregates_from_totals(totals),
+        {row.position: float(row.mean_ppg) for row in moments.itertuples(index=False)},
+        {row.position: float(row.starter_floor) for row in moments.itertuples(index=False)},
+        pooling_k_from_moments(pool_moments),
+    )
 
 
 def _build_draft_capital_lookup(supabase) -> dict[str, dict[str, int]]:
@@ -397,6 +352,36 @@ def _build_coaching_lookup(supabase) -> dict[tuple[str, int], dict[str, Any]]:
     return lookup
 
 
+def _build_lookups(supabase, needed: frozenset[str] = frozenset(LOOKUPS)) -> dict[str, Any]:
+    """Season-wide lookups keyed as ``SeasonContext`` accepts them.
+
+    Only the lookups in ``needed`` (``feature_inputs.LOOKUPS`` names) are
+    fetched; the rest are empty so no feature-less run pays for them:
+    draft capital, Vegas implied team totals, opening-day depth-chart tiers,
+    red-zone usage (#671), NGS passing (#674), the QB-ecosystem lookups
+    (#642; the per-season centered QB1 PPG is computed from each season's
+    history window) and the coaching-change signal (spike #651).
+    """
+    def build(name, builder, empty):
+        return builder(supabase) if name in needed else empty
+
+    vegas_lines, vegas_league_means = build("vegas_lines", _build_vegas_lines_lookup, ({}, {}))
+    qb1_by_team, player_team_by_season = build(
+        "qb_ecosystem", _build_qb_ecosystem_lookups, ({}, {})
+    )
+    return {
+        "draft_capital": build("draft_capital", _build_draft_capital_lookup, {}),
+        "vegas_lines": vegas_lines,
+        "vegas_league_means": vegas_league_means,
+        "depth_charts": build("depth_charts", _build_depth_charts_lookup, {}),
+        "qb1_by_team": qb1_by_team,
+        "player_team_by_season": player_team_by_season,
+        "team_coaching": build("team_coaching", _build_coaching_lookup, {}),
+        "red_zone": build("red_zone", _build_red_zone_lookup, {}),
+        "ngs_passing": build("ngs_passing", _build_ngs_passing_lookup, {}),
+    }
+
+
 def _build_qb_ecosystem_lookups(
     supabase,
 ) -> tuple[dict[tuple[str, int], str], dict[tuple[str, int], str]]:
@@ -483,17 +468,37 @@ def _build_player_team_history(
         return {}
 
     player_rows = nfl_stats_all[nfl_stats_all["player_id"] == player_id]
-    if player_rows.empty:
-        return {}
+    return team_history_from_rows(player_rows)
 
-    team_history: dict[int, str] = {}
-    for _, row in player_rows.iterrows():
-        season = int(row["season"]) if pd.notna(row.get("season")) else None
-        team = row.get("recent_team")
-        if season and team and pd.notna(team):
-            team_history[season] = str(team)
 
-    return team_history
+def _build_player_context(
+    season_context: SeasonContext,
+    player_id: str,
+    position: str,
+    players_df: pd.DataFrame,
+    nfl_stats_all: pd.DataFrame,
+    season_index: SeasonPlayerIndex | None = None,
+) -> PlayerContext:
+    """Build a player's feature context over the season's shared context.
+
+    With ``season_index`` the player's metadata row and team history are dict
+    lookups instead of full-frame masks over ``players_df``/``nfl_stats_all``.
+    """
+    if season_index is not None:
+        player_row = season_index.player_row(player_id)
+        team_history = season_index.team_history(player_id)
+    else:
+        matches = players_df[players_df["player_id_ref"] == player_id]
+        player_row = matches.iloc[0] if not matches.empty else None
+        team_history = _build_player_team_history(player_id, nfl_stats_all)
+
+    return season_context.player(
+        player_id,
+        position,
+        birth_date=player_row.get("birth_date") if player_row is not None else None,
+        nfl_team=player_row.get("nfl_team") if player_row is not None else None,
+        team_history=team_history,
+    )
 
 
 def _build_context(
@@ -506,117 +511,77 @@ def _build_context(
     positional_means: dict[str, float] | None = None,
     positional_starter_floors: dict[str, float] | None = None,
     qb_starters: dict[int, dict[str, str | None]] | None = None,
-    draft_capital: dict[str, dict[str, int]] | None = None,
-    vegas_lines: dict[tuple[str, int], dict[str, float]] | None = None,
-    vegas_league_means: dict[int, float] | None = None,
-    depth_charts: dict[tuple[str, int], int] | None = None,
-    qb1_by_team: dict[tuple[str, int], str] | None = None,
-    player_team_by_season: dict[tuple[str, int], str] | None = None,
-    qb_quality: dict[tuple[str, int], float] | None = None,
-    team_coaching: dict[tuple[str, int], dict[str, Any]] | None = None,
-    pooling_k: dict[str, float] | None = None,
-    red_zone: dict[tuple[str, int], dict[str, int]] | None = None,
-    ngs_passing: dict[tuple[str, int], dict[str, float]] | None = None,
-) -> dict[str, Any]:
-    """Build the context dict for a player's feature computation."""
-    context: dict[str, Any] = {"target_season": target_season}
-
-    # Birth date
-    player_row = players_df[players_df["player_id_ref"] == player_id]
-    if not player_row.empty:
-        bd = player_row.iloc[0].get("birth_date")
-        if pd.notna(bd):
-            context["birth_date"] = bd
-
-    # Current team and team offense rating
-    nfl_team = player_row.iloc[0].get("nfl_team") if not player_row.empty else None
-    context["nfl_team"] = nfl_team
-
-    if nfl_team and nfl_team in team_aggregates:
-        team_data = team_aggregates[nfl_team]
-        context["team_offense_rating"] = team_data.get("offense_rating", 0.0)
-        context["team_usage"] = team_data.get("usage_by_season", {})
-
-    # Per-season team history for team_context feature
-    team_history = _build_player_team_history(player_id, nfl_stats_all)
-    context["team_history"] = team_history
-
-    # Per-team offense ratings (all teams) for historical lookups
-    context["all_team_ratings"] = {
-        team: data.get("offense_rating", 0.0)
-        for team, data in team_aggregates.items()
+    season_index: SeasonPlayerIndex | None = None,
+    **lookups: Any,
+) -> PlayerContext:
+    """Build the context for one player's feature computation.
+
+    One-off convenience over :class:`SeasonContext` + ``_build_player_context``;
+    loops build the season context once and call ``_build_player_context``.
+    ``lookups`` are the season-wide lookups ``SeasonContext`` accepts
+    (draft_capital, vegas_lines, depth_charts, qb_quality, pooling_k, ...).
+    """
+    season_context = SeasonContext(
+        target_season, team_aggregates, positional_means,
+        positional_starter_floors, qb_starters, **lookups,
+    )
+    return _build_player_context(
+        season_context, player_id, position, players_df, nfl_stats_all, season_index
+    )
+
+
+def _compute_batch_features(
+    feature_pool: dict[str, Any],
+    history_df: pd.DataFrame,
+    players_df: pd.DataFrame,
+    target_season: int,
+    positional_means: dict[str, float] | None = None,
+) -> dict[str, dict[str, Optional[float]]]:
+    """Run every batch-capable feature once over the whole season window.
+
+    Returns ``feature_name -> {player_id: value}`` for features whose
+    ``compute_batch`` produced a result (None values where ``compute()`` would
+    return None). The per-player loop hands each player's slice to the
+    combiner as ``precomputed``; features without a batch path are absent and
+    fall back to per-player ``compute()``.
+    """
+    if history_df.empty or players_df.empty:
+        return {}
+    # First row per player, matching the per-player loop's ``iloc[0]`` lookup.
+    player_cols = players_df[["player_id_ref", "position", "birth_date"]].drop_duplicates(
+        "player_id_ref"
+    )
+    season_frame = history_df.merge(
+        player_cols,
+        left_on="player_id",
+        right_on="player_id_ref",
+        how="inner",
+    )
+    batch_context = {
+        "target_season": target_season,
+        "positional_means": positional_means or {},
     }
+    out: dict[str, dict[str, Optional[float]]] = {}
+    for fname, feature in feature_pool.items():
+        series = feature.compute_batch(season_frame, batch_context)
+        if series is None:
+            continue
+        out[fname] = {
+            str(pid): (None if pd.isna(val) else float(val))
+            for pid, val in series.items()
+        }
+    return out
 
-    # Positional mean PPG for regression-to-mean feature
-    if positional_means and position in positional_means:
-        context["positional_mean_ppg"] = positional_means[position]
-
-    # Positional starter floor for tiered regression
-    if positional_starter_floors and position in positional_starter_floors:
-        context["positional_starter_floor"] = positional_starter_floors[position]
-
-    # Empirical-Bayes pooling strength k_g for the partial_pooling_eb feature
-    # (GH #667, L3). Per-position; falls back to the feature default if absent.
-    if pooling_k and position in pooling_k:
-        context["pooling_k"] = pooling_k[position]
-
-    # Draft capital (round + overall pick) for the draft_capital_raw feature.
-    if draft_capital is not None:
-        record = draft_capital.get(player_id)
-        if record:
-            context["draft_capital"] = record
-
-    # Vegas implied team totals for the implied_team_total_raw feature. The
-    # feature looks up (effective_team, target_season); the league means let
-    # it center against the season's league average to remove year-over-year
-    # scoring drift.
-    if vegas_lines is not None:
-        context["vegas_lines"] = vegas_lines
-    if vegas_league_means is not None:
-        context["vegas_league_mean_implied"] = vegas_league_means
-
-    # Opening-day depth-chart tiers (player_id, season) -> 1/2/3 for the
-    # depth_chart_position_raw and role_change_raw features.
-    if depth_charts is not None:
-        context["depth_charts"] = depth_charts
-
-    # Red-zone / goal-line usage (player_id, season) -> counts for the
-    # weighted_xfp_redzone base feature (#671).
-    if red_zone is not None:
-        context["red_zone"] = red_zone
-
-    # NGS passing (player_id, season) -> stabilized QB skill metrics for the
-    # QB-only ngs_*_raw features (#674).
-    if ngs_passing is not None:
-        context["ngs_passing"] = ngs_passing
-
-    # QB-ecosystem lookups for the team_qb_quality_raw / team_qb_changed_raw
-    # features (#642): each team's projected QB1, the player's depth-chart team
-    # per season, and the centered QB1 prior PPG keyed by (team, target_season).
-    if qb1_by_team is not None:
-        context["qb1_by_team"] = qb1_by_team
-    if player_team_by_season is not None:
-        context["player_team_by_season"] = player_team_by_season
-    if qb_quality is not None:
-        context["qb_quality"] = qb_quality
-
-    # Per-team-season coaching-change signal for the coaching_change_raw /
-    # coach_tenure_raw features (spike #651). The feature joins via the player's
-    # depth-chart team (player_team_by_season) for team-changer safety.
-    if team_coaching is not None:
-        context["team_coaching"] = team_coaching
-
-    # QB starter designation
-    if qb_starters and position == "QB":
-        # Check if this player is a designated starter in any historical season
-        is_starter = any(
-            is_qb_starter(player_id, s, qb_starters)
-            for s in qb_starters
-        )
-        context["is_qb_starter"] = is_starter
-        context["qb_starters"] = qb_starters
 
-    return context
+def _player_precomputed(
+    batch_values: dict[str, dict[str, Optional[float]]], player_id: str
+) -> dict[str, Optional[float]]:
+    """One player's slice of ``_compute_batch_features`` output."""
+    return {
+        fname: values[player_id]
+        for fname, values in batch_values.items()
+        if player_id in values
+    }
 
 
 def _compute_team_aggregates(
@@ -627,143 +592,204 @@ def _compute_team_aggregates(
     Prefers nfl_stats.recent_team (historical per-season team) when available,
     falling back to players.nfl_team (current team) for backward compatibility.
     """
-    if nfl_stats_all.empty or players_df.empty:
-        return {}
+    return team_aggregates_from_totals(team_season_totals(nfl_stats_all, players_df))
 
-    # Use recent_team from nfl_stats if available, otherwise fall back to players.nfl_team
-    has_recent_team = "recent_team" in nfl_stats_all.columns and nfl_stats_all["recent_team"].notna().any()
 
-    if has_recent_team:
-        # Use the historical team directly from nfl_stats
-        merged = nfl_stats_all.copy()
-        merged["team_for_agg"] = merged["recent_team"]
-    else:
-        # Fall back to joining with players table (current team — legacy behavior)
-        merged = nfl_stats_all.merge(
-            players_df[["player_id_ref", "nfl_team"]],
-            left_on="player_id",
-            right_on="player_id_ref",
-            how="left",
-        )
-        merged["team_for_agg"] = merged["nfl_team"]
+class _SharedFeature(ProjectionFeature):
+    """Proxy that lets every model in a multi-model run share one compute().
 
-    team_aggregates: dict[str, Any] = {}
-
-    for team, team_df in merged.groupby("team_for_agg"):
-        if not team or pd.isna(team):
-            continue
-
-        # Team total points per season
-        season_ppg = {}
-        usage_by_season: dict[int, dict[str, float]] = {}
+    Feature output depends only on the player's inputs plus the ``base_ppg``
+    the combiner injects into the context, so values are memoized on
+    ``(feature name, base_ppg)``. The runner clears the shared memo at the start
+    of every player-season; models with the same base therefore compute each
+    adjustment feature once per player rather than once per model.
+    """
 
-        for season, season_df in team_df.groupby("season"):
-            season = int(season)
-            total_points = season_df["total_points"].fillna(0).sum()
-            season_ppg[season] = float(total_points) / 17.0  # approximate team PPG
+    def __init__(self, feature: ProjectionFeature, memo: dict[tuple[str, Any], Optional[float]]):
+        self._feature = feature
+        self._memo = memo
+
+    @property
+    def name(self) -> str:
+        return self._feature.name
+
+    @property
+    def is_base(self) -> bool:
+        return self._feature.is_base
+
+    def compute(
+        self,
+        player_id: str,
+        position: str,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[float]:
+        key = (self._feature.name, context.get("base_ppg"))
+        if key not in self._memo:
+            self._memo[key] = self._feature.compute(
+                player_id, position, history_df, nfl_stats_df, context
+            )
+        return self._memo[key]
 
-            # Aggregate usage stats per team/season
-            usage_by_season[season] = {
-                "targets": float(season_df["targets"].fillna(0).sum()),
-                "rushing_attempts": float(season_df["rushing_attempts"].fillna(0).sum()),
-            }
+    def compute_batch(
+        self,
+        season_frame: pd.DataFrame,
+        context: dict[str, Any],
+    ) -> Optional[pd.Series]:
+        return self._feature.compute_batch(season_frame, context)
 
-        # Compute offense rating: recency-weighted deviation from league average
-        if season_ppg:
-            avg_team_ppg = sum(season_ppg.values()) / len(season_ppg)
-            team_aggregates[str(team)] = {
-                "avg_ppg": avg_team_ppg,
-                "offense_rating": 0.0,  # will be set after league average is computed
-                "usage_by_season": usage_by_season,
-            }
 
-    # Compute league average and set offense_rating as deviation
-    if team_aggregates:
-        league_avg = sum(t["avg_ppg"] for t in team_aggregates.values()) / len(
-            team_aggregates
-        )
-        for team_data in team_aggregates.values():
-            team_data["offense_rating"] = team_data["avg_ppg"] - league_avg
+def _load_learned_params(model_name: str, model_def: ModelDefinition) -> Optional[dict[str, Any]]:
+    """Trained params for learned/residual models (None for additive).
 
-    return team_aggregates
+    Residual JSON embeds the full base model under base_model_params.
+    """
+    if model_def.combiner_type not in {"learned", "residual"}:
+        return None
+    learned_params = load_model_params(model_name)
+    if model_def.combiner_type == "learned":
+        print(f"Loaded trained model (alpha={learned_params['alpha']}, "
+              f"features={learned_params['training_metadata']['n_features']})")
+    else:
+        base_md = learned_params.get("base_model_params", {}).get("training_metadata", {})
+        print(f"Loaded residual model (alpha={learned_params['alpha']}, "
+              f"residual_features={learned_params['training_metadata']['n_features']}, "
+              f"base={learned_params['base_model_name']}, "
+              f"base_features={base_md.get('n_features')})")
+    return learned_params
+
+
+def _project_player(
+    model_def: ModelDefinition,
+    learned_params: Optional[dict[str, Any]],
+    feature_pool: dict[str, Any],
+    player_id: str,
+    position: str,
+    player_history: pd.DataFrame,
+    player_nfl: pd.DataFrame,
+    context: dict[str, Any],
+    precomputed: dict[str, Optional[float]],
+) -> tuple[Optional[float], dict[str, Optional[float]]]:
+    """Compile the (model, position) plan and project one player with it.
+
+    The run loop keeps one :class:`PlanCache` per model instead; this is the
+    one-off entry point.
+    """
+    plan = ModelPlan.compile(model_def, position, feature_pool, learned_params)
+    return plan.execute(player_id, player_history, player_nfl, context, precomputed)
 
 
 def run_model(
     model_name: str,
     seasons: list[int],
     max_history: int = 3,
+    incremental: bool = False,
+    workers: int = 1,
 ) -> int:
     """Generate projections for a model across specified seasons.
 
-    Returns the number of projections generated.
+    Returns the number of projections generated (incremental mode: upserted).
+    """
+    return run_models([model_name], seasons, max_history, incremental, workers)[model_name]
+
+
+def run_models(
+    model_names: list[str],
+    seasons: list[int],
+    max_history: int = 3,
+    incremental: bool = False,
+    workers: int = 1,
+) -> dict[str, int]:
+    """Generate projections for several models in a single pass.
+
+    Every input (players, draft capital, Vegas, depth charts, red zone, NGS,
+    coaching, history and nfl_stats windows) is loaded once — only the stats
+    columns and lookups the models' features declare (``feature_inputs.py``) —
+    the union of all models' features is computed once per player-season, and
+    each model's combiner is applied to those shared values. Upserts go out
+    per model, so ``model_projections`` ends up exactly as if each model had
+    been run alone.
+
+    With ``incremental=True`` only players whose input fingerprint changed are
+    recomputed and only rows that differ from what is already stored are
+    upserted (see ``incremental.py``).
+
+    With ``workers > 1`` the (target season, player shard) work fans out to a
+    fork-based process pool; results merge in serial order, so the upserted
+    rows are identical to a serial run.
+
+    Returns ``model name -> number of projections generated`` (incremental
+    mode: number of rows upserted).
     """
-    model_def = get_model(model_name)
     supabase = get_supabase_client()
+    model_defs = {name: get_model(name) for name in model_names}
 
-    # Register model in DB
-    model_id = _ensure_model_in_db(supabase, model_def)
-    print(f"Model '{model_name}' registered with id={model_id}")
+    # Register models in DB
+    model_ids: dict[str, str] = {}
+    for name, model_def in model_defs.items():
+        model_ids[name] = _ensure_model_in_db(supabase, model_def)
+        print(f"Model '{name}' registered with id={model_ids[name]}")
 
-    # Compute union of all feature names across the model and any nested
-    # residual base models so every layer of the residual stack can be
+    # Compute union of all feature names across the models and any nested
+    # residual base models so every layer of each residual stack can be
     # evaluated.
-    all_feature_names = _collect_feature_names_recursive(model_def)
+    all_feature_names: list[str] = []
+    for model_def in model_defs.values():
+        all_feature_names.extend(_collect_feature_names_recursive(model_def))
 
     # Instantiate all features into a dict for lookup
     feature_pool: dict[str, Any] = {}
-    for fname in all_feature_names:
+    for fname in dict.fromkeys(all_feature_names):
         if fname not in FEATURE_REGISTRY:
             print(f"Warning: feature '{fname}' not in registry, skipping")
             continue
         feature_pool[fname] = FEATURE_REGISTRY[fname]()
 
-    if not feature_pool:
+    # Stats columns and lookups the run's features read (feature_inputs.py).
+    inputs = resolve_inputs(FEATURE_REGISTRY[fname] for fname in feature_pool)
+
+    totals: dict[str, int] = {name: 0 for name in model_names}
+    active_models = [
+        name for name, model_def in model_defs.items()
+        if any(f in feature_pool for f in _collect_feature_names_recursive(model_def))
+    ]
+    for name in model_names:
+        if name not in active_models:
+            print(f"No valid features found for '{name}', skipping.")
+    if not active_models:
         print("No valid features found, aborting.")
-        return 0
-
-    # Load trained params for learned/residual models. Residual JSON embeds
-    # the full base model under base_model_params.
-    learned_params = None
-    if model_def.combiner_type in {"learned", "residual"}:
-        learned_params = load_model_params(model_name)
-        if model_def.combiner_type == "learned":
-            print(f"Loaded trained model (alpha={learned_params['alpha']}, "
-                  f"features={learned_params['training_metadata']['n_features']})")
-        else:
-            base_md = learned_params.get("base_model_params", {}).get("training_metadata", {})
-            print(f"Loaded residual model (alpha={learned_params['alpha']}, "
-                  f"residual_features={learned_params['training_metadata']['n_features']}, "
-                  f"base={learned_params['base_model_name']}, "
-                  f"base_features={base_md.get('n_features')})")
+        return totals
 
+    learned_by_model = {
+        name: _load_learned_params(name, model_defs[name]) for name in active_models
+    }
+
+    # Persisted raw feature values: only features whose code or inputs
+    # changed since the last run are recomputed.
+    feature_store = open_store()
+    if feature_store is not None:
+        feature_pool = feature_store.wrap(feature_pool)
+    feature_pool = profiling.instrument(feature_pool)
+
+    # Multi-model runs share feature values across models (see _SharedFeature).
+    feature_memo: dict[tuple[str, Any], Optional[float]] = {}
+    if len(active_models) > 1:
+        feature_pool = {
+            fname: _SharedFeature(feature, feature_memo)
+            for fname, feature in feature_pool.items()
+        }
 
     # Fetch players table
-    players_data = fetch_all_rows(supabase, "players", "id, name, position, nfl_team, birth_date, is_college")
+    with profiling.stage("fetch: players"):
+        players_data = fetch_all_rows(supabase, "players", "id, name, position, nfl_team, birth_date, is_college")
     players_df = pd.DataFrame(players_data)
     players_df = players_df.rename(columns={"id": "player_id_ref"})
 
-    # Fetch draft capital once (used across all target seasons)
-    draft_capital_lookup = _build_draft_capital_lookup(supabase)
-
-    # Fetch Vegas implied team totals once (used across all target seasons)
-    vegas_lookup, vegas_league_means = _build_vegas_lines_lookup(supabase)
-
-    # Fetch opening-day depth-chart tiers once (used across all target seasons)
-    depth_charts_lookup = _build_depth_charts_lookup(supabase)
-
-    # Fetch red-zone usage once (used across all target seasons) for #671.
-    red_zone_lookup = _build_red_zone_lookup(supabase)
-
-    # Fetch NGS passing once (used across all target seasons) for #674.
-    ngs_passing_lookup = _build_ngs_passing_lookup(supabase)
-
-    # QB-ecosystem lookups for the team_qb_quality_raw / team_qb_changed_raw
-    # features (#642). Global; the per-season centered QB1 PPG is computed in
-    # the loop from that season's history window.
-    qb1_by_team, player_team_by_season = _build_qb_ecosystem_lookups(supabase)
-
-    # Per-team-season coaching-change signal once (spike #651).
-    coaching_lookup = _build_coaching_lookup(supabase)
+    # Global lookups, each fetched once and shared across all target seasons —
+    # only those some feature of the run declares.
+    with profiling.stage("fetch: lookups"):
+        lookups = _build_lookups(supabase, inputs.lookups)
 
     # Leakage-free expected-games per (player, target season) — the #587 stage-c
     # availability haircut. Built from each player's prior-season games_played
@@ -771,166 +797,455 @@ def run_model(
     # Stored as projected_games so consumers can compute availability-inclusive
     # production without disturbing the rate projection (or its significance gate).
     pos_map = dict(zip(players_df["player_id_ref"], players_df["position"]))
-    games_stats = fetch_all_rows(supabase, "player_stats", "player_id, games_played, season")
-    expected_games = build_expected_games(games_stats, pos_map, seasons, "history")
+    with profiling.stage("fetch: expected games"):
+        games_stats = fetch_all_rows(supabase, "player_stats", "player_id, games_played, season")
+        expected_games = build_expected_games(games_stats, pos_map, seasons, "history")
     print(f"Expected-games (history) estimates: {len(expected_games)} (player, season)")
 
-    total_records = 0
+    run = _RunState(
+        active_models=active_models,
+        model_defs=model_defs,
+        model_ids=model_ids,
+        learned_by_model=learned_by_model,
+        feature_pool=feature_pool,
+        # One compiled plan per (model, position), built on first use.
+        plans={
+            name: PlanCache(model_defs[name], feature_pool, learned_by_model[name])
+            for name in active_models
+        },
+        feature_memo=feature_memo,
+        feature_store=feature_store,
+        players_df=players_df,
+        expected_games=expected_games,
+        fingerprinter=InputFingerprinter() if incremental else None,
+        lookups=lookups,
+        inputs=inputs,
+    )
+
+    # Overlapping history windows share one fetch per season.
+    season_store = get_season_data_store()
 
-    for target_season in seasons:
-        historical_seasons = list(range(target_season - max_history, target_season))
-        print(f"\nGenerating {target_season} projections using history from {historical_seasons}...")
+    def prepare(target_season: int) -> Optional[_SeasonWork]:
+        return _prepare_season(
+            run, supabase, season_store, target_season, max_history
+        )
+
+    store_hits = store_misses = 0
+    use_pool = workers > 1 and _fork_available()
+    if workers > 1 and not use_pool:
+        print("Process pool needs the 'fork' start method; running serially.")
+
+    if use_pool:
+        # Fan out (season, player shard) tasks. All seasons are prepared first
+        # so the forked workers inherit every season's frames and lookups.
+        works = [w for w in (prepare(s) for s in seasons) if w is not None]
+        with profiling.stage("project: process pool"):
+            shard_results = _run_shards_in_pool(run, works, workers)
+        for work, results in zip(works, shard_results):
+            merged = _merge_shards(run, results)
+            store_hits += merged.hits
+            store_misses += merged.misses
+            _write_season(run, supabase, work, merged, totals)
+    else:
+        for target_season in seasons:
+            work = prepare(target_season)
+            if work is None:
+                continue
+            merged = _project_shard(run, work, work.player_ids)
+            store_hits += merged.hits
+            store_misses += merged.misses
+            _write_season(run, supabase, work, merged, totals)
+
+    if feature_store is not None:
+        feature_store.close()
+        print(f"\nFeature store: {store_hits} hits, {store_misses} computed")
+
+    for name in model_names:
+        print(f"\nTotal: {totals[name]} projections generated for model '{name}'")
+    return totals
+
+
+@dataclass
+class _RunState:
+    """Everything the per-player loop needs that is fixed for a whole run."""
+
+    active_models: list[str]
+    model_defs: dict[str, ModelDefinition]
+    model_ids: dict[str, str]
+    learned_by_model: dict[str, Optional[dict[str, Any]]]
+    feature_pool: dict[str, Any]
+    plans: dict[str, PlanCache]
+    feature_memo: dict[tuple[str, Any], Optional[float]]
+    feature_store: Optional[FeatureStore]
+    players_df: pd.DataFrame
+    expected_games: dict[tuple[str, int], float]
+    fingerprinter: Optional[InputFingerprinter]
+    lookups: dict[str, Any]
+    inputs: FeatureInputs = ALL_INPUTS
+
+
+@dataclass
+class _SeasonWork:
+    """One target season's frames, aggregates and (incremental) baselines."""
+
+    target_season: int
+    player_ids: list[str]
+    season_index: SeasonPlayerIndex
+    nfl_stats_all: pd.DataFrame
+    season_context: SeasonContext
+    batch_values: dict[str, dict[str, Optional[float]]]
+    shared_fps: dict[str, str] = field(default_factory=dict)
+    previous_fps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    existing_rows: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+
+
+@dataclass
+class _ShardResult:
+    """Per-model output of projecting a slice of one season's players."""
+
+    records: dict[str, list[dict[str, Any]]]
+    fingerprints: dict[str, dict[str, str]]
+    skipped: dict[str, int]
+    hits: int = 0
+    misses: int = 0
+    # Profiler counters recorded by a pool worker (merged by the parent).
+    profile: Optional[dict[str, Any]] = None
+
+
+def _prepare_season(
+    run: _RunState,
+    supabase,
+    season_store,
+    target_season: int,
+    max_history: int,
+) -> Optional[_SeasonWork]:
+    """Fetch a target season's history window and build its shared state."""
+    historical_seasons = list(range(target_season - max_history, target_season))
+    print(f"\nGenerating {target_season} projections using history from {historical_seasons}...")
 
+    with profiling.stage("fetch: season data"):
         # Fetch historical player_stats
-        history_df = fetch_multi_season_stats(historical_seasons)
+        history_df = season_store.player_stats(
+            historical_seasons, columns=run.inputs.player_stats_columns
+        )
         if history_df.empty:
             print(f"  No historical player_stats data for {historical_seasons}")
-            continue
+            return None
 
         # Fetch historical nfl_stats (paginated — a multi-season window exceeds
         # the 1000-row cap and truncation corrupts team aggregates; GH #562).
-        nfl_stats_all = fetch_multi_season_nfl_stats(historical_seasons)
-        for col in ["total_points", "games_played", "targets", "rushing_attempts",
-                     "passing_yards", "passing_tds", "interceptions", "rushing_yards",
-                     "rushing_tds", "receptions", "receiving_yards", "receiving_tds",
-                     "offense_snaps", "passing_attempts", "completions"]:
-            if col in nfl_stats_all.columns:
-                nfl_stats_all[col] = pd.to_numeric(nfl_stats_all[col], errors="coerce").fillna(0)
-        if "season" in nfl_stats_all.columns:
-            nfl_stats_all["season"] = pd.to_numeric(nfl_stats_all["season"], errors="coerce")
-
-        # Compute team aggregates
-        team_aggregates = _compute_team_aggregates(nfl_stats_all, players_df)
-
-        # Compute positional mean PPG for regression-to-mean feature
-        positional_means = _compute_positional_mean_ppg(history_df, players_df)
-
-        # Compute positional starter floors for tiered regression
-        positional_starter_floors = _compute_positional_starter_floor(history_df, players_df)
-
-        # Empirical-Bayes pooling strength per position (#667, L3).
-        pooling_k = _compute_pooling_k(history_df, players_df)
+        nfl_stats_all = season_store.nfl_stats(
+            historical_seasons, columns=run.inputs.nfl_stats_columns
+        )
+    players_df = run.players_df
+
+    with profiling.stage("build: season aggregates"):
+        # Team aggregates, positional mean PPG (regression-to-mean), positional
+        # starter floors (tiered regression) and empirical-Bayes pooling strength
+        # per position (#667, L3).
+        (team_aggregates, positional_means, positional_starter_floors,
+         pooling_k) = _compute_season_aggregates(
+            supabase, historical_seasons, history_df, nfl_stats_all, players_df
+        )
 
         # Centered QB1 prior PPG per team for this target season (#642).
-        qb_quality = _compute_qb_quality_by_team(history_df, qb1_by_team, target_season)
+        qb_quality = _compute_qb_quality_by_team(
+            history_df, run.lookups["qb1_by_team"], target_season
+        )
 
         # Load QB starter designations for historical + target seasons
         qb_starters = get_all_starter_ids(
             historical_seasons + [target_season], players_df
         )
 
-        # Generate projections for each player
-        records = []
-        for player_id, player_history in history_df.groupby("player_id"):
-            player_id_str = str(player_id)
+    # Vectorized features computed once for the whole season; the
+    # combiners fall back to per-player compute() for everything else.
+    with profiling.stage("build: batch features"):
+        batch_values = _compute_batch_features(
+            run.feature_pool, history_df, players_df, target_season, positional_means
+        )
 
-            # Look up position
-            player_row = players_df[players_df["player_id_ref"] == player_id_str]
-            if player_row.empty:
-                continue
-            position = player_row.iloc[0]["position"]
-            if not position:
-                continue
+    # Group the season's frames by player once; per-player lookups are then
+    # dict hits rather than full-frame masks.
+    with profiling.stage("build: season index"):
+        season_index = SeasonPlayerIndex(history_df, nfl_stats_all, players_df)
+
+    work = _SeasonWork(
+        target_season=target_season,
+        player_ids=season_index.player_ids(),
+        season_index=season_index,
+        nfl_stats_all=nfl_stats_all,
+        # Season-wide context values, shared by every player's context.
+        season_context=SeasonContext(
+            target_season, team_aggregates, positional_means,
+            positional_starter_floors, qb_starters,
+            qb_quality=qb_quality,
+            pooling_k=pooling_k,
+            **run.lookups,
+        ),
+        batch_values=batch_values,
+    )
 
-            # Get player's nfl_stats
-            player_nfl = nfl_stats_all[nfl_stats_all["player_id"] == player_id_str] if not nfl_stats_all.empty else pd.DataFrame()
-
-            # Build context
-            context = _build_context(
-                player_id_str, position, players_df, nfl_stats_all,
-                target_season, team_aggregates, positional_means,
-                positional_starter_floors, qb_starters,
-                draft_capital=draft_capital_lookup,
-                vegas_lines=vegas_lookup,
-                vegas_league_means=vegas_league_means,
-                depth_charts=depth_charts_lookup,
-                qb1_by_team=qb1_by_team,
-                player_team_by_season=player_team_by_season,
-                qb_quality=qb_quality,
-                team_coaching=coaching_lookup,
-                pooling_k=pooling_k,
-                red_zone=red_zone_lookup,
-                ngs_passing=ngs_passing_lookup,
-            )
+    if run.fingerprinter is not None:
+        aggregates = {
+            "team_aggregates": team_aggregates,
+            "positional_means": positional_means,
+            "positional_starter_floors": positional_starter_floors,
+            "pooling_k": pooling_k,
+            "qb_quality": qb_quality,
+        }
+        with profiling.stage("fetch: existing projections"):
+            for name in run.active_models:
+                work.shared_fps[name] = shared_digest(
+                    run.fingerprinter, name, run.learned_by_model[name], aggregates
+                )
+                work.previous_fps[name] = load_fingerprints(name, target_season)
+                work.existing_rows[name] = load_existing_projections(
+                    supabase, run.model_ids[name], target_season
+                )
+    return work
+
+
+def _project_shard(run: _RunState, work: _SeasonWork, player_ids: list[str]) -> _ShardResult:
+    """Project ``player_ids`` (in order) of one season for every active model."""
+    with profiling.stage("project: players"):
+        return _project_players(run, work, player_ids)
+
+
+def _project_players(run: _RunState, work: _SeasonWork, player_ids: list[str]) -> _ShardResult:
+    result = _ShardResult(
+        records={name: [] for name in run.active_models},
+        fingerprints={name: {} for name in run.active_models},
+        skipped={name: 0 for name in run.active_models},
+    )
+    store = run.feature_store
+    hits0, misses0 = (store.hits, store.misses) if store is not None else (0, 0)
+    target_season = work.target_season
+    season_index = work.season_index
+    # Learned-model players awaiting the batched Ridge chain:
+    # (player_id, position, expected games, fingerprint, feature values).
+    pending: dict[str, list[tuple]] = {name: [] for name in run.active_models}
+
+    for player_id_str in player_ids:
+        player_history = season_index.history(player_id_str)
+
+        # Look up position
+        position = season_index.position(player_id_str)
+        if not position:
+            continue
+
+        # Get player's nfl_stats
+        player_nfl = season_index.nfl_stats(player_id_str)
 
-            # Resolve position-specific features. For residual models, the
-            # union of every nested base layer's features is computed so the
-            # full residual stack can be evaluated without re-loading anything.
-            effective_features, effective_weights = _resolve_features_for_position(
-                model_def, position
+        # Build context
+        context = _build_player_context(
+            work.season_context, player_id_str, position, run.players_df,
+            work.nfl_stats_all, season_index,
+        )
+        precomputed = _player_precomputed(work.batch_values, player_id_str)
+        run.feature_memo.clear()
+        eg = run.expected_games.get((player_id_str, target_season))
+
+        if run.fingerprinter is not None:
+            player_fp = run.fingerprinter.player_digest(
+                player_id_str, player_history, player_nfl,
+                dict(context, _position=position, _expected_games=eg,
+                     _precomputed=precomputed),
             )
-            base_eff = _resolve_residual_base_features(model_def, position)
-            if base_eff:
-                effective_features = list(
-                    dict.fromkeys(list(base_eff) + list(effective_features))
-                )
-            player_feature_instances = [
-                feature_pool[f] for f in effective_features if f in feature_pool
-            ]
 
-            # Run combiner
-            if model_def.combiner_type == "residual" and learned_params is not None:
-                projected_ppg, feature_values = combine_features_residual(
-                    player_feature_instances,
-                    player_id_str,
-                    position,
-                    player_history,
-                    player_nfl,
-                    context,
-                    learned_params,
-                    effective_weights or None,
-                )
-            elif learned_params is not None:
-                projected_ppg, feature_values = combine_features_learned(
-                    player_feature_instances,
-                    player_id_str,
-                    position,
-                    player_history,
-                    player_nfl,
-                    context,
-                    learned_params,
-                    effective_weights or None,
+        for name in run.active_models:
+            if run.fingerprinter is not None:
+                prev = work.previous_fps[name]
+                if (
+                    prev["shared"] == work.shared_fps[name]
+                    and prev["players"].get(player_id_str) == player_fp
+                    and player_id_str in work.existing_rows[name]
+                ):
+                    result.fingerprints[name][player_id_str] = player_fp
+                    result.skipped[name] += 1
+                    continue
+
+            fp = player_fp if run.fingerprinter is not None else None
+            plans = run.plans[name]
+            if plans.params is None:
+                projected_ppg, feature_values = plans[position].execute(
+                    player_id_str, player_history, player_nfl, context, precomputed,
                 )
-            else:
-                projected_ppg, feature_values = combine_features(
-                    player_feature_instances,
-                    player_id_str,
-                    position,
-                    player_history,
-                    player_nfl,
-                    context,
-                    effective_weights or None,
-                )
-
-            if projected_ppg is not None:
-                eg = expected_games.get((player_id_str, target_season))
-                records.append({
-                    "model_id": model_id,
-                    "player_id": player_id_str,
-                    "season": target_season,
-                    "projected_ppg": round(float(projected_ppg), 4),
-                    "projected_games": round(float(eg), 2) if eg is not None else None,
-                    "feature_values": json.dumps(
-                        {k: round(v, 4) if v is not None else None for k, v in feature_values.items()}
-                    ),
-                })
+                if projected_ppg is not None:
+                    _emit_record(run, work, result, name, player_id_str, eg, fp,
+                                 float(projected_ppg), feature_values)
+                continue
+            # Learned / residual: features now, Ridge chain once per shard below.
+            plan = plans[position]
+            feature_values = plan.compute(
+                player_id_str, player_history, player_nfl, context, precomputed,
+            )
+            if plan.base_feature and feature_values.get(plan.base_feature) is None:
+                continue
+            pending[name].append((player_id_str, position, eg, fp, feature_values))
 
+    for name, rows in pending.items():
+        if not rows:
+            continue
+        with profiling.stage("predict: ridge chain"):
+            preds = run.plans[name].predict_batch(
+                feature_value_frame([r[4] for r in rows]), [r[1] for r in rows]
+            )
+        for (player_id_str, _position, eg, fp, feature_values), pred in zip(rows, preds):
+            if not np.isnan(pred):
+                _emit_record(run, work, result, name, player_id_str, eg, fp,
+                             float(pred), feature_values)
+
+    if store is not None:
+        store.flush()
+        result.hits = store.hits - hits0
+        result.misses = store.misses - misses0
+    return result
+
+
+def _emit_record(
+    run: _RunState,
+    work: _SeasonWork,
+    result: _ShardResult,
+    name: str,
+    player_id: str,
+    eg: Optional[float],
+    player_fp: Optional[str],
+    projected_ppg: float,
+    feature_values: dict[str, Optional[float]],
+) -> None:
+    """Append one projection row (unless incremental and unchanged)."""
+    record = {
+        "model_id": run.model_ids[name],
+        "player_id": player_id,
+        "season": work.target_season,
+        "projected_ppg": round(projected_ppg, 4),
+        "projected_games": round(float(eg), 2) if eg is not None else None,
+        # A jsonb object: mirrored into model_projection_features
+        # (migration 036) for typed, per-feature reads.
+        "feature_values": {
+            k: round(v, 4) if v is not None else None for k, v in feature_values.items()
+        },
+    }
+    if run.fingerprinter is not None:
+        result.fingerprints[name][player_id] = player_fp
+        if not record_changed(record, work.existing_rows[name].get(player_id)):
+            return
+    result.records[name].append(record)
+
+
+def _merge_shards(run: _RunState, shards: list[_ShardResult]) -> _ShardResult:
+    """Concatenate shard results in shard order (= serial player order)."""
+    merged = _ShardResult(
+        records={name: [] for name in run.active_models},
+        fingerprints={name: {} for name in run.active_models},
+        skipped={name: 0 for name in run.active_models},
+    )
+    for shard in shards:
+        for name in run.active_models:
+            merged.records[name].extend(shard.records[name])
+            merged.fingerprints[name].update(shard.fingerprints[name])
+            merged.skipped[name] += shard.skipped[name]
+        merged.hits += shard.hits
+        merged.misses += shard.misses
+        profiler = profiling.active()
+        if shard.profile is not None and profiler is not None:
+            profiler.merge(shard.profile)
+    return merged
+
+
+def _write_season(
+    run: _RunState,
+    supabase,
+    work: _SeasonWork,
+    result: _ShardResult,
+    totals: dict[str, int],
+) -> None:
+    """Upsert one season's records per model (and persist fingerprints)."""
+    target_season = work.target_season
+    for name in run.active_models:
+        records = result.records[name]
+        if run.fingerprinter is not None:
+            print(f"  {name}: {result.skipped[name]} unchanged inputs skipped, "
+                  f"{len(records)} changed rows to upsert")
         if not records:
-            print(f"  No projections generated for {target_season}")
+            if run.fingerprinter is not None:
+                save_fingerprints(name, target_season, work.shared_fps[name],
+                                  result.fingerprints[name])
+            else:
+                print(f"  No projections generated for {target_season} ({name})")
             continue
 
-        print(f"  Generated {len(records)} projections for {target_season}")
+        print(f"  Generated {len(records)} projections for {target_season} ({name})")
+
+        with profiling.stage("write: upserts"):
+            bulk_upsert(supabase, "model_projections", records,
+                        on_conflict="model_id,player_id,season")
+        print(f"    Upserted {len(records)} records")
+
+        totals[name] += len(records)
+        # Only after the upsert succeeded, so a failed write is retried.
+        if run.fingerprinter is not None:
+            save_fingerprints(name, target_season, work.shared_fps[name],
+                              result.fingerprints[name])
+
 
-        # Batch upsert
-        batch_size = 500
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-            supabase.table("model_projections").upsert(
-                batch, on_conflict="model_id,player_id,season"
-            ).execute()
-            print(f"    Upserted batch {i // batch_size + 1} ({len(batch)} records)")
+# State inherited by forked pool workers: set immediately before the pool is
+# created so the (copy-on-write) season frames and lookups are never pickled.
+_FORK_STATE: Optional[tuple[_RunState, list[_SeasonWork]]] = None
 
-        total_records += len(records)
 
-    print(f"\nTotal: {total_records} projections generated for model '{model_name}'")
-    return total_records
+def _fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _init_pool_worker() -> None:
+    run = _FORK_STATE[0]
+    if run.feature_store is not None:
+        # SQLite connections must not cross a fork; give the child its own.
+        run.feature_store.reopen()
+    profiler = profiling.active()
+    if profiler is not None:
+        profiler.drain()  # the parent's counters so far stay with the parent
+
+
+def _run_shard_task(season_pos: int, player_ids: list[str]) -> _ShardResult:
+    run, works = _FORK_STATE
+    result = _project_shard(run, works[season_pos], player_ids)
+    profiler = profiling.active()
+    if profiler is not None:
+        result.profile = profiler.drain()
+    return result
+
+
+def _shard(player_ids: list[str], n_shards: int) -> list[list[str]]:
+    """Split into ≤ ``n_shards`` contiguous, order-preserving slices."""
+    size = max(1, -(-len(player_ids) // max(1, n_shards)))
+    return [player_ids[i : i + size] for i in range(0, len(player_ids), size)]
+
+
+def _run_shards_in_pool(
+    run: _RunState, works: list[_SeasonWork], workers: int
+) -> list[list[_ShardResult]]:
+    """Project every (season, player shard) on a fork-based process pool.
+
+    Results come back per season in shard order, so merging them reproduces
+    the serial run's record order exactly.
+    """
+    global _FORK_STATE
+    _FORK_STATE = (run, works)
+    try:
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_pool_worker
+        ) as pool:
+            futures = [
+                [
+                    pool.submit(_run_shard_task, pos, shard)
+                    for shard in _shard(work.player_ids, workers)
+                ]
+                for pos, work in enumerate(works)
+            ]
+            return [[f.result() for f in season_futures] for season_futures in futures]
+    finally:
+        _FORK_STATE = None
@@ -0,0 +1,203 @@
+"""Season-window aggregates, computed in Postgres when the SQL functions exist.
+
+Each target season the runner reduces its history window to a few per-team
+and per-position numbers: team usage totals (``team_context`` /
+``usage_share``), positional mean PPG and starter floors (regression to the
+mean) and the empirical-Bayes pooling moments (``partial_pooling``). Migration
+035 ships these reductions as SQL functions:
+
+* ``team_season_totals(p_seasons)`` — one row per (team, season);
+* ``position_ppg_moments(p_seasons, p_min_games, p_starter_rank)`` — one row
+  per position;
+* ``model_seasons_with_actuals(p_model_id)`` — the distinct seasons
+  ``available_model_seasons`` needs.
+
+so a caller receives tens of rows over RPC instead of reducing thousands in
+Python. The ``fetch_*`` helpers (over ``scripts.db_io.call_aggregate``)
+return None when the function isn't deployed (or the client can't RPC, e.g.
+the parquet mirror or a test fake), and the caller falls back to the Python reductions below, which produce the same
+frames from raw rows. ``OTTONEU_SERVER_AGGREGATES=off`` forces the fallback.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from scripts.db_io import call_aggregate
+
+# Rank of the starter-floor player per position, and the games threshold of the
+# pooling-k population (full-ish seasons, GH #667).
+STARTER_RANK = 24
+POOLING_MIN_GAMES = 10
+
+TEAM_TOTAL_COLUMNS = ["team", "season", "total_points", "targets", "rushing_attempts"]
+MOMENT_COLUMNS = [
+    "position", "n_players", "mean_ppg", "starter_floor",
+    "within_var", "n_within", "means_var", "mean_seasons",
+]
+
+# ---------------------------------------------------------------------------
+# Team usage totals
+# ---------------------------------------------------------------------------
+
+def team_season_totals(nfl_stats_all: pd.DataFrame, players_df: pd.DataFrame) -> pd.DataFrame:
+    """Python ``team_season_totals``: summed points / targets / carries per team-season.
+
+    Teams come from ``nfl_stats.recent_team`` (the historical per-season team)
+    when the window has any, else from ``players.nfl_team`` (current team —
+    legacy behaviour).
+    """
+    if nfl_stats_all.empty or players_df.empty:
+        return pd.DataFrame(columns=TEAM_TOTAL_COLUMNS)
+
+    has_recent_team = "recent_team" in nfl_stats_all.columns and nfl_stats_all["recent_team"].notna().any()
+    if has_recent_team:
+        merged = nfl_stats_all.copy()
+        merged["team_for_agg"] = merged["recent_team"]
+    else:
+        merged = nfl_stats_all.merge(
+            players_df[["player_id_ref", "nfl_team"]],
+            left_on="player_id",
+            right_on="player_id_ref",
+            how="left",
+        )
+        merged["team_for_agg"] = merged["nfl_team"]
+
+    rows = []
+    for team, team_df in merged.groupby("team_for_agg", observed=True):
+        if not team or pd.isna(team):
+            continue
+        for season, season_df in team_df.groupby("season"):
+            rows.append({
+                "team": str(team),
+                "season": int(season),
+                "total_points": float(season_df["total_points"].fillna(0).sum()),
+                "targets": float(season_df["targets"].fillna(0).sum()),
+                "rushing_attempts": float(season_df["rushing_attempts"].fillna(0).sum()),
+            })
+    return pd.DataFrame(rows, columns=TEAM_TOTAL_COLUMNS)
+
+
+def team_aggregates_from_totals(totals: pd.DataFrame) -> dict[str, Any]:
+    """``team_aggregates`` context value from per-team-season totals.
+
+    ``avg_ppg`` is the team's mean over seasons of total points / 17;
+    ``offense_rating`` its deviation from the league average of ``avg_ppg``.
+    """
+    team_aggregates: dict[str, Any] = {}
+    if totals.empty:
+        return team_aggregates
+    for team, team_rows in totals.sort_values(["team", "season"]).groupby("team", sort=True):
+        season_ppg = {}
+        usage_by_season: dict[int, dict[str, float]] = {}
+        for row in team_rows.itertuples(index=False):
+            season = int(row.season)
+            season_ppg[season] = float(row.total_points) / 17.0  # approximate team PPG
+            usage_by_season[season] = {
+                "targets": float(row.targets),
+                "rushing_attempts": float(row.rushing_attempts),
+            }
+        team_aggregates[str(team)] = {
+            "avg_ppg": sum(season_ppg.values()) / len(season_ppg),
+            "offense_rating": 0.0,  # set once the league average is known
+            "usage_by_season": usage_by_season,
+        }
+    league_avg = sum(t["avg_ppg"] for t in team_aggregates.values()) / len(team_aggregates)
+    for team_data in team_aggregates.values():
+        team_data["offense_rating"] = team_data["avg_ppg"] - league_avg
+    return team_aggregates
+
+
+def fetch_team_season_totals(supabase, seasons: list[int]) -> Optional[pd.DataFrame]:
+    rows = call_aggregate(supabase, "team_season_totals", {"p_seasons": list(seasons)})
+    if rows is None:
+        return None
+    return pd.DataFrame(rows, columns=TEAM_TOTAL_COLUMNS)
+
+
+# ---------------------------------------------------------------------------
+# Positional PPG moments
+# ---------------------------------------------------------------------------
+
+def position_ppg_moments(
+    history_df: pd.DataFrame,
+    players_df: pd.DataFrame,
+    min_games: int,
+    starter_rank: int = STARTER_RANK,
+) -> pd.DataFrame:
+    """Python ``position_ppg_moments``: per-position stats of per-player mean PPG.
+
+    Over player-seasons with ``games_played >= min_games``, each player's PPG is
+    averaged across seasons; per position this returns the mean of those player
+    means, the ``starter_rank``-th best (the minimum when fewer players), and
+    the pooling moments: mean within-player sample variance (players with 2+
+    seasons), sample variance of player means and mean seasons per player.
+    """
+    if history_df.empty or players_df.empty:
+        return pd.DataFrame(columns=MOMENT_COLUMNS)
+
+    merged = history_df.merge(
+        players_df[["player_id_ref", "position"]],
+        left_on="player_id",
+        right_on="player_id_ref",
+        how="left",
+    )
+    qualified = merged[(merged["games_played"] >= min_games) & merged["ppg"].notna()]
+    if qualified.empty:
+        return pd.DataFrame(columns=MOMENT_COLUMNS)
+
+    per_player = qualified.groupby(["player_id", "position"])["ppg"].agg(["mean", "var", "count"])
+    per_player = per_player.reset_index()
+
+    rows = []
+    for position, pos_df in per_player.groupby("position"):
+        means = pos_df["mean"]
+        ranked = means.sort_values(ascending=False).reset_index(drop=True)
+        within = pos_df.loc[pos_df["count"] >= 2, "var"]
+        rows.append({
+            "position": str(position),
+            "n_players": int(len(pos_df)),
+            "mean_ppg": float(means.mean()),
+            "starter_floor": float(ranked.iloc[starter_rank - 1] if len(ranked) >= starter_rank
+                                   else ranked.min()),
+            "within_var": float(within.mean()) if len(within) else None,
+            "n_within": int(len(within)),
+            "means_var": float(means.var(ddof=1)) if len(means) >= 2 else None,
+            "mean_seasons": float(pos_df["count"].mean()),
+        })
+    return pd.DataFrame(rows, columns=MOMENT_COLUMNS)
+
+
+def pooling_k_from_moments(
+    moments: pd.DataFrame,
+    min_players: int = 8,
+    k_clip: tuple[float, float] = (0.3, 2.0),
+) -> dict[str, float]:
+    """Empirical-Bayes ``k_g = σ²_g / τ²_g`` per position from its PPG moments.
+
+    ``τ²`` comes from Var(observed player means) = τ² + σ²/m̄, floored at 0.1;
+    positions too thin to estimate get 1.0, and k is clipped to ``k_clip``.
+    """
+    out: dict[str, float] = {}
+    for row in moments.itertuples(index=False):
+        if row.n_players < min_players or row.n_within < 2 or row.n_players < 2:
+            out[str(row.position)] = 1.0
+            continue
+        sigma2 = float(row.within_var)
+        tau2 = max(float(row.means_var) - sigma2 / float(row.mean_seasons), 0.1)
+        out[str(row.position)] = float(np.clip(sigma2 / tau2, k_clip[0], k_clip[1]))
+    return out
+
+
+def fetch_position_ppg_moments(
+    supabase, seasons: list[int], min_games: int, starter_rank: int = STARTER_RANK
+) -> Optional[pd.DataFrame]:
+    rows = call_aggregate(supabase, "position_ppg_moments", {
+        "p_seasons": list(seasons), "p_min_games": min_games, "p_starter_rank": starter_rank,
+    })
+    if rows is None:
+        return None
+    return pd.DataFrame(rows, columns=MOMENT_COLUMNS)
@@ -0,0 +1,114 @@
+"""Per-season player index for the projection loops.
+
+The runner, trainer and sweep scripts walk every player in a target season's
+history window and, for each one, need that player's player_stats rows, their
+nfl_stats rows and their ``players`` metadata row. Boolean-masking the full
+frames for every player is O(players × rows); ``SeasonPlayerIndex`` groups the
+three frames once (row offsets from ``groupby().indices``) so each lookup is a
+dict hit plus an ``iloc`` slice and the loop scales linearly with the pool.
+
+Slices are row-for-row identical to the masks they replace (same order, same
+index labels), so feature output does not change.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _group_offsets(df: pd.DataFrame, key: str) -> dict[str, np.ndarray]:
+    """``str(key value) -> positional row offsets`` (ascending, i.e. frame order)."""
+    if df.empty or key not in df.columns:
+        return {}
+    return {str(k): v for k, v in df.groupby(key, sort=True).indices.items()}
+
+
+def team_history_from_rows(player_rows: pd.DataFrame) -> dict[int, str]:
+    """Season -> ``recent_team`` from one player's nfl_stats rows."""
+    if player_rows.empty or "recent_team" not in player_rows.columns:
+        return {}
+    team_history: dict[int, str] = {}
+    for _, row in player_rows.iterrows():
+        season = int(row["season"]) if pd.notna(row.get("season")) else None
+        team = row.get("recent_team")
+        if season and team and pd.notna(team):
+            team_history[season] = str(team)
+    return team_history
+
+
+class SeasonPlayerIndex:
+    """O(1) per-player access to one target season's frames.
+
+    Args:
+        history_df: player_stats rows for the history window (``player_id``).
+        nfl_stats_df: nfl_stats rows for the history window (``player_id``).
+        players_df: the players table with ``player_id_ref`` (renamed ``id``).
+    """
+
+    def __init__(
+        self,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame | None = None,
+        players_df: pd.DataFrame | None = None,
+    ) -> None:
+        self.history_df = history_df
+        self.nfl_stats_df = nfl_stats_df if nfl_stats_df is not None else pd.DataFrame()
+        self.players_df = players_df if players_df is not None else pd.DataFrame()
+
+        self._history_rows = _group_offsets(self.history_df, "player_id")
+        self._nfl_rows = _group_offsets(self.nfl_stats_df, "player_id")
+        # First row per player — the runner's ``player_row.iloc[0]`` semantics.
+        self._player_rows: dict[str, int] = {}
+        if not self.players_df.empty and "player_id_ref" in self.players_df.columns:
+            for offset, pid in enumerate(self.players_df["player_id_ref"].astype(str)):
+                self._player_rows.setdefault(pid, offset)
+        self._team_history: dict[str, dict[int, str]] = {}
+
+    def player_ids(self) -> list[str]:
+        """Player ids with history, in ``history_df.groupby("player_id")`` order."""
+        return list(self._history_rows)
+
+    def iter_history(self) -> Iterator[tuple[str, pd.DataFrame]]:
+        """Drop-in for ``history_df.groupby("player_id")`` with string ids."""
+        for pid, rows in self._history_rows.items():
+            yield pid, self.history_df.iloc[rows]
+
+    def history(self, player_id: str) -> pd.DataFrame:
+        """The player's player_stats rows (empty frame if none)."""
+        rows = self._history_rows.get(player_id)
+        if rows is None:
+            return self.history_df.iloc[0:0]
+        return self.history_df.iloc[rows]
+
+    def nfl_stats(self, player_id: str) -> pd.DataFrame:
+        """The player's nfl_stats rows (empty frame if none)."""
+        if self.nfl_stats_df.empty:
+            return pd.DataFrame()
+        rows = self._nfl_rows.get(player_id)
+        if rows is None:
+            return self.nfl_stats_df.iloc[0:0]
+        return self.nfl_stats_df.iloc[rows]
+
+    def player_row(self, player_id: str) -> Optional[pd.Series]:
+        """The player's (first) ``players`` row, or None if unknown."""
+        offset = self._player_rows.get(player_id)
+        if offset is None:
+            return None
+        return self.players_df.iloc[offset]
+
+    def position(self, player_id: str) -> Optional[str]:
+        row = self.player_row(player_id)
+        if row is None:
+            return None
+        return row.get("position") or None
+
+    def team_history(self, player_id: str) -> dict[int, str]:
+        """Season -> ``recent_team`` from nfl_stats (memoized per player)."""
+        cached = self._team_history.get(player_id)
+        if cached is None:
+            cached = team_history_from_rows(self.nfl_stats(player_id))
+            self._team_history[player_id] = cached
+        return cached
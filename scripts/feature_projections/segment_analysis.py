@@ -19,7 +19,8 @@ from datetime import date, datetime
 # Repo root — used to compute the default report output path below.
 repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
 from scripts.feature_projections.backtest import _compute_metrics
 
 # Default models and seasons
@@ -320,6 +321,7 @@ def main() -> None:
         default=os.path.join(repo_root, "docs", "generated", "segment-analysis.md"),
         help="Output file path (default: docs/generated/segment-analysis.md)",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
 
     model_names = [m.strip() for m in args.models.split(",")]
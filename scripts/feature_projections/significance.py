@@ -44,6 +44,8 @@ from typing import Optional
 
 import numpy as np
 
+from scripts.config import add_source_arg
+from scripts.db_io import QUERY_CACHE
 from scripts.feature_projections.holdout_eval import (
     gather_predictions,
     gather_predictions_rolling,
@@ -301,6 +303,7 @@ def run(
     min_train_season: Optional[int] = None,
     use_cache: bool = True,
     metric: str = "mae",
+    workers: int = 1,
 ) -> dict:
     if metric == "spearman" and position == "ALL":
         raise ValueError(
@@ -313,11 +316,11 @@ def run(
             min_train_season = min(train_seasons)
         folds = rolling_folds(eval_seasons, min_train_season)
         preds, actuals_by_season, pos_map, _ = gather_predictions_rolling(
-            folds, models, use_cache=use_cache
+            folds, models, use_cache=use_cache, workers=workers
         )
     else:
         preds, actuals_by_season, pos_map = gather_predictions(
-            train_seasons, eval_seasons, models, use_cache=use_cache
+            train_seasons, eval_seasons, models, use_cache=use_cache, workers=workers
         )
     if metric == "spearman":
         proj_a, proj_b, act, pids = _paired_preds(
@@ -403,7 +406,13 @@ def main() -> None:
     parser.add_argument("--seed", type=int, default=0)
     parser.add_argument("--no-cache", action="store_true",
                         help="Force a retrain instead of reusing cached held-out predictions (#597).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Retrain independent (fold, model) pairs on N worker processes "
+                             "(default: 1, serial)")
+    add_source_arg(parser)
     args = parser.parse_args()
+    # Nothing here writes, and each bootstrap fold re-reads the same tables.
+    QUERY_CACHE.enable()
 
     train_seasons = [int(s) for s in args.train_seasons.split(",")]
     eval_seasons = [int(s) for s in args.eval_seasons.split(",")]
@@ -426,7 +435,7 @@ def main() -> None:
         args.model_a, args.model_b, train_seasons, eval_seasons,
         position=args.position, iterations=args.iterations, seed=args.seed,
         protocol=args.protocol, min_train_season=args.min_train_season,
-        use_cache=not args.no_cache, metric=args.metric,
+        use_cache=not args.no_cache, metric=args.metric, workers=args.workers,
     )
     _print_result(res, train_seasons, eval_seasons)
 
@@ -21,8 +21,9 @@ from typing import Any, Optional
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
-from scripts.analysis_utils import fetch_multi_season_stats, fetch_multi_season_nfl_stats
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
+from scripts.analysis_utils import get_season_data_store
 from scripts.feature_projections.tuning_protocol import (
     inner_tuning_seasons_str,
     warn_on_confirmation_overlap,
@@ -30,10 +31,12 @@ from scripts.feature_projections.tuning_protocol import (
 from scripts.feature_projections.features import FEATURE_REGISTRY
 from scripts.feature_projections.features.base import ProjectionFeature
 from scripts.feature_projections.combiner import combine_features
+from scripts.feature_projections.context import SeasonContext
+from scripts.feature_projections.season_index import SeasonPlayerIndex
 from scripts.feature_projections.runner import (
     _compute_team_aggregates,
     _compute_positional_mean_ppg,
-    _build_context,
+    _build_player_context,
 )
 
 # The base feature is always included; we sweep these adjustment features
@@ -99,26 +102,19 @@ def _run_combo(
 
     all_results = {}  # type: dict[int, dict[str, dict]]
 
+    # Overlapping history windows share one fetch per season.
+    season_store = get_season_data_store()
+
     for target_season in seasons:
         historical_seasons = list(range(target_season - max_history, target_season))
 
         # Fetch historical player_stats
-        history_df = fetch_multi_season_stats(historical_seasons)
+        history_df = season_store.player_stats(historical_seasons)
         if history_df.empty:
             continue
 
         # Fetch historical nfl_stats (paginated past the 1000-row cap; GH #562).
-        nfl_stats_all = fetch_multi_season_nfl_stats(historical_seasons)
-        for col in [
-            "total_points", "games_played", "targets", "rushing_attempts",
-            "passing_yards", "passing_tds", "interceptions", "rushing_yards",
-            "rushing_tds", "receptions", "receiving_yards", "receiving_tds",
-            "offense_snaps",
-        ]:
-            if col in nfl_stats_all.columns:
-                nfl_stats_all[col] = pd.to_numeric(nfl_stats_all[col], errors="coerce").fillna(0)
-        if "season" in nfl_stats_all.columns:
-            nfl_stats_all["season"] = pd.to_numeric(nfl_stats_all["season"], errors="coerce")
+        nfl_stats_all = season_store.nfl_stats(historical_seasons)
 
         # Compute shared context data
         team_aggregates = _compute_team_aggregates(nfl_stats_all, players_df)
@@ -144,8 +140,10 @@ def _run_combo(
         all_projected = []  # type: list[float]
         all_actual = []  # type: list[float]
 
-        for player_id, player_history in history_df.groupby("player_id"):
-            player_id_str = str(player_id)
+        season_index = SeasonPlayerIndex(history_df, nfl_stats_all, players_df)
+        season_context = SeasonContext(target_season, team_aggregates, positional_means)
+
+        for player_id_str, player_history in season_index.iter_history():
             if player_id_str not in actual_map:
                 continue
 
@@ -154,16 +152,12 @@ def _run_combo(
                 continue
 
             # Get player's nfl_stats
-            player_nfl = (
-                nfl_stats_all[nfl_stats_all["player_id"] == player_id_str]
-                if not nfl_stats_all.empty
-                else pd.DataFrame()
-            )
+            player_nfl = season_index.nfl_stats(player_id_str)
 
             # Build context (same as runner.py)
-            context = _build_context(
-                player_id_str, position, players_df, nfl_stats_all,
-                target_season, team_aggregates, positional_means,
+            context = _build_player_context(
+                season_context, player_id_str, position, players_df,
+                nfl_stats_all, season_index,
             )
 
             # Run combiner
@@ -245,6 +239,7 @@ def main() -> None:
         action="store_true",
         help="Rank combos per position instead of ALL-positions aggregate",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
     seasons = [int(s.strip()) for s in args.seasons.split(",")]
     warn_on_confirmation_overlap(seasons)
@@ -43,12 +43,14 @@ from typing import Any
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
-from scripts.analysis_utils import fetch_multi_season_stats
+from scripts.config import add_source_arg, get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
+from scripts.analysis_utils import get_season_data_store
 from scripts.feature_projections.tuning_protocol import (
     inner_tuning_seasons_str,
     warn_on_confirmation_overlap,
 )
+from scripts.feature_projections.season_index import SeasonPlayerIndex
 from scripts.feature_projections.features.weighted_ppg import (
     WeightedPPGFeature,
     WeightedPPGNoQBTrajectoryFeature,
@@ -119,29 +121,35 @@ def _compute_metrics(projected: list[float], actual: list[float]) -> dict:
 def _fetch_season_data(
     seasons: list[int],
     max_history: int = 4,
-) -> tuple[dict[str, str], dict[int, pd.DataFrame], dict[int, dict[str, float]]]:
+) -> tuple[dict[str, str], dict[int, SeasonPlayerIndex], dict[int, dict[str, float]]]:
     """Fetch everything the sweep needs once, so the grid loop is in-memory only.
 
     Fetches one season beyond the production 3-year window so 4-weight cells
     can be scored; ≤3-weight cells slice back down to the production window
     per player in _run_projections.
 
-    Returns (position map, {season: history_df}, {season: {player_id: actual_ppg}}).
+    Each season's history is grouped into a SeasonPlayerIndex here, once, rather
+    than re-grouped by every grid cell.
+
+    Returns (position map, {season: SeasonPlayerIndex}, {season: {player_id: actual_ppg}}).
     """
     supabase = get_supabase_client()
 
     players_data = fetch_all_rows(supabase, "players", "id, position")
     pos_map = {row["id"]: row["position"] for row in players_data}
 
-    history_by_season: dict[int, pd.DataFrame] = {}
+    history_by_season: dict[int, SeasonPlayerIndex] = {}
     actuals_by_season: dict[int, dict[str, float]] = {}
 
+    # Overlapping history windows share one fetch per season.
+    season_store = get_season_data_store()
+
     for target_season in seasons:
         historical_seasons = list(range(target_season - max_history, target_season))
-        history_df = fetch_multi_season_stats(historical_seasons)
+        history_df = season_store.player_stats(historical_seasons)
         if history_df.empty:
             continue
-        history_by_season[target_season] = history_df
+        history_by_season[target_season] = SeasonPlayerIndex(history_df)
 
         # Paginated — a single season of player_stats can exceed the 1000-row
         # PostgREST cap.
@@ -164,7 +172,7 @@ def _run_projections(
     exponent: float,
     seasons: list[int],
     pos_map: dict[str, str],
-    history_by_season: dict[int, pd.DataFrame],
+    history_by_season: dict[int, SeasonPlayerIndex],
     actuals_by_season: dict[int, dict[str, float]],
 ) -> dict[int, dict[str, dict]]:
     """Score one (weights, exponent) cell of the isolated base feature.
@@ -187,9 +195,9 @@ def _run_projections(
     all_results: dict[int, dict[str, dict]] = {}
 
     for target_season in seasons:
-        history_df = history_by_season.get(target_season)
+        season_index = history_by_season.get(target_season)
         actual_map = actuals_by_season.get(target_season)
-        if history_df is None or not actual_map:
+        if season_index is None or not actual_map:
             continue
 
         position_data: dict[str, tuple[list[float], list[float]]] = {
@@ -198,8 +206,7 @@ def _run_projections(
         all_projected: list[float] = []
         all_actual: list[float] = []
 
-        for player_id, player_history in history_df.groupby("player_id"):
-            player_id_str = str(player_id)
+        for player_id_str, player_history in season_index.iter_history():
             if player_id_str not in actual_map:
                 continue
 
@@ -345,6 +352,7 @@ def main() -> None:
         help="Include 2- and 4-season window variants in the grid (#639). "
              "4-weight cells are sweep-only until max_history is plumbed.",
     )
+    add_source_arg(parser)
     args = parser.parse_args()
     seasons = [int(s.strip()) for s in args.seasons.split(",")]
     exponents = [float(e.strip()) for e in args.exponents.split(",")]
@@ -17,39 +17,38 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import HuberRegressor, Ridge
 from sklearn.preprocessing import StandardScaler
 
-from scripts.config import get_supabase_client, MIN_GAMES, fetch_all_rows
-from scripts.analysis_utils import fetch_multi_season_stats, fetch_multi_season_nfl_stats
+from scripts.config import get_supabase_client, MIN_GAMES
+from scripts.db_io import fetch_all_rows
+from scripts.analysis_utils import get_season_data_store
+from scripts.feature_projections.feature_inputs import resolve_inputs
+from scripts.feature_projections.feature_store import open_store
 from scripts.feature_projections.features import FEATURE_REGISTRY
-from scripts.feature_projections.model_config import get_model
+from scripts.feature_projections.model_config import ModelDefinition, get_model
+from scripts.feature_projections.combiner import compute_feature
 from scripts.feature_projections.runner import (
-    _build_coaching_lookup,
-    _build_context,
-    _build_depth_charts_lookup,
-    _build_draft_capital_lookup,
-    _build_ngs_passing_lookup,
-    _build_qb_ecosystem_lookups,
-    _build_red_zone_lookup,
-    _build_vegas_lines_lookup,
+    _build_lookups,
+    _build_player_context,
     _collect_feature_names_recursive,
-    _compute_pooling_k,
-    _compute_positional_mean_ppg,
+    _compute_batch_features,
     _compute_qb_quality_by_team,
-    _compute_team_aggregates,
-    _resolve_features_for_position,
-    _resolve_residual_base_features,
+    _compute_season_aggregates,
+    _player_precomputed,
 )
+from scripts.feature_projections import profiling, training_cache
+from scripts.feature_projections.context import SeasonContext
+from scripts.feature_projections.model_plan import PlanCache
 from scripts.feature_projections.qb_starters import get_all_starter_ids
+from scripts.feature_projections.season_index import SeasonPlayerIndex
 from scripts.feature_projections.learned_combiner import (
-    build_feature_vector,
-    compute_features_for_player,
-    get_feature_column_names,
+    DesignMatrixSpec,
+    feature_value_frame,
     TRAINED_MODELS_DIR,
 )
 
@@ -61,6 +60,10 @@ ALPHA_CANDIDATES = [0.01, 0.1, 1.0, 10.0, 100.0]
 HUBER_ALPHA_CANDIDATES = [0.0001, 0.001, 0.01, 0.1, 1.0]
 
 
+def _is_huber(regressor_spec: dict | None) -> bool:
+    return bool(regressor_spec and regressor_spec.get("type") == "huber")
+
+
 def _make_linear_estimator(alpha: float, regressor_spec: dict | None, fit_intercept: bool = True):
     """Build the per-fold linear estimator (Ridge by default; Huber if specified).
 
@@ -69,7 +72,7 @@ def _make_linear_estimator(alpha: float, regressor_spec: dict | None, fit_interc
     deviations, linear beyond, so injury-wrecked / role-collapse outlier seasons
     pull the coefficients less. Empty/None → Ridge, byte-identical to before.
     """
-    if regressor_spec and regressor_spec.get("type") == "huber":
+    if _is_huber(regressor_spec):
         return HuberRegressor(
             alpha=alpha,
             epsilon=float(regressor_spec.get("epsilon", 1.35)),
@@ -79,6 +82,159 @@ def _make_linear_estimator(alpha: float, regressor_spec: dict | None, fit_interc
     return Ridge(alpha=alpha, fit_intercept=fit_intercept)
 
 
+def _ridge_alpha_path(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    alphas: list[float],
+    sample_weight: np.ndarray | None = None,
+    fit_intercept: bool = True,
+) -> list[np.ndarray]:
+    """Ridge predictions on ``X_test`` for every alpha from one SVD of ``X_train``.
+
+    Solves the same problem as ``Ridge(alpha, fit_intercept).fit(X_train,
+    y_train, sample_weight)`` — weighted centering when there is an intercept,
+    rows scaled by ``sqrt(w)`` — but decomposes the training matrix once:
+    with ``X = U S Vᵀ`` the coefficients for each alpha are
+    ``V diag(s / (s² + alpha)) Uᵀ y``, so a LOSO fold costs one SVD instead of
+    one fit per candidate. Results match sklearn to floating tolerance.
+    """
+    X = np.asarray(X_train, dtype=np.float64)
+    y = np.asarray(y_train, dtype=np.float64)
+    w = np.ones(len(y)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+    if fit_intercept:
+        X_offset = np.average(X, axis=0, weights=w)
+        y_offset = float(np.average(y, weights=w))
+    else:
+        X_offset = np.zeros(X.shape[1])
+        y_offset = 0.0
+    sqrt_w = np.sqrt(w)
+    U, s, Vt = np.linalg.svd((X - X_offset) * sqrt_w[:, None], full_matrices=False)
+    Uty = U.T @ ((y - y_offset) * sqrt_w)
+    X_test_c = np.asarray(X_test, dtype=np.float64) - X_offset
+
+    preds = []
+    for alpha in alphas:
+        denom = s * s + alpha
+        d = np.divide(s, denom, out=np.zeros_like(s), where=denom > 0)
+        coef = Vt.T @ (d * Uty)
+        preds.append(X_test_c @ coef + y_offset)
+    return preds
+
+
+class _ColumnLayout:
+    """One position's training-cache columns under one model plan.
+
+    Maps each plan feature (and, when draft capital is loaded, the
+    seasons-since-draft pseudo-column) to its cache column. ``cached`` holds
+    the columns already on disk; :meth:`compute` fills in the rest for a
+    player and :meth:`updated` returns the frame to write back.
+    """
+
+    def __init__(self, plan, raw_pool: dict, keys: "training_cache.SeasonKeys",
+                 target_season: int, draft_capital: bool):
+        self.plan = plan
+        self.target_season = int(target_season)
+        base = plan.base_feature
+        self.base_weight = (plan.weights or {}).get(base, 1.0) if base else 1.0
+        self.columns: dict[str, str] = {}
+        if base:
+            self.columns[base] = keys.column(raw_pool[base])
+        for feature in plan.features:
+            if feature.name != base:
+                self.columns[feature.name] = keys.column(
+                    raw_pool[feature.name], self.columns.get(base), self.base_weight
+                )
+        self.draft_column = keys.seasons_since_draft_column() if draft_capital else None
+        self.cached = pd.DataFrame()
+        self._cached_rows: Optional[dict[str, dict[str, float]]] = None
+        self._computed: dict[str, dict[str, float]] = {}
+
+    @property
+    def missing_features(self) -> list[str]:
+        return [name for name, col in self.columns.items() if col not in self.cached.columns]
+
+    @property
+    def wanted(self) -> list[str]:
+        return list(self.columns.values()) + ([self.draft_column] if self.draft_column else [])
+
+    @property
+    def missing(self) -> list[str]:
+        return [col for col in self.wanted if col not in self.cached.columns]
+
+    def _cached(self, player_id: str, column: str) -> Optional[float]:
+        if self._cached_rows is None:
+            self._cached_rows = self.cached.to_dict("index")
+        value = self._cached_rows[player_id][column]
+        return None if pd.isna(value) else float(value)
+
+    def assemble(self, player_id: str) -> tuple[dict[str, Optional[float]], Optional[int]]:
+        """``(feature_values, seasons_since_draft)`` from cached raw columns.
+
+        Mirrors ``compute_features_for_player``: the base (weighted) first,
+        then — only when it is present — the adjustments in plan order.
+        """
+        feature_values: dict[str, Optional[float]] = {}
+        base = self.plan.base_feature
+        if base:
+            value = self._cached(player_id, self.columns[base])
+            feature_values[base] = value * self.base_weight if value is not None else None
+        if not base or feature_values[base] is not None:
+            for feature in self.plan.features:
+                if feature.name != base:
+                    feature_values[feature.name] = self._cached(player_id, self.columns[feature.name])
+        seasons_since_draft = None
+        if self.draft_column:
+            value = self._cached(player_id, self.draft_column)
+            seasons_since_draft = int(value) if value is not None else None
+        return feature_values, seasons_since_draft
+
+    def compute(
+        self, player_id: str, history_df, nfl_stats_df, context, precomputed: dict
+    ) -> tuple[dict[str, Optional[float]], Optional[int]]:
+        """Compute the missing features (cached ones are fed in as precomputed)."""
+        precomputed = dict(precomputed)
+        for name, column in self.columns.items():
+            if column in self.cached.columns:
+                precomputed[name] = self._cached(player_id, column)
+        base = self.plan.base_feature
+        if base and base not in precomputed:
+            # The raw (unweighted) base value is what the cache stores.
+            base_feature = next(f for f in self.plan.features if f.name == base)
+            precomputed[base] = compute_feature(
+                base_feature, player_id, self.plan.position, history_df,
+                nfl_stats_df, context, precomputed,
+            )
+        feature_values = self.plan.compute(
+            player_id, history_df, nfl_stats_df, context, precomputed
+        )
+        raw = {name: (precomputed[base] if name == base else feature_values.get(name))
+               for name in self.columns}
+        for name, column in self.columns.items():
+            if column not in self.cached.columns:
+                self._computed.setdefault(column, {})[player_id] = raw[name]
+
+        seasons_since_draft = None
+        dc = context.get("draft_capital")
+        if dc and isinstance(dc, dict):
+            seasons_since_draft = (
+                self.target_season - int(dc.get("season_drafted", self.target_season))
+            )
+        if self.draft_column and self.draft_column not in self.cached.columns:
+            self._computed.setdefault(self.draft_column, {})[player_id] = seasons_since_draft
+        return feature_values, seasons_since_draft
+
+    def updated(self) -> pd.DataFrame:
+        """The cached columns plus everything computed this run."""
+        frame = self.cached.copy()
+        for column, values in self._computed.items():
+            frame[column] = pd.Series(
+                {pid: np.nan if v is None else float(v) for pid, v in values.items()},
+                dtype="float64",
+            ).reindex(frame.index)
+        return frame
+
+
 def collect_training_data(
     model_name: str,
     seasons: list[int],
@@ -96,28 +252,11 @@ def collect_training_data(
     supabase = get_supabase_client()
 
     # Fetch players
-    players_data = fetch_all_rows(supabase, "players", "id, name, position, nfl_team, birth_date, is_college")
+    with profiling.stage("fetch: players"):
+        players_data = fetch_all_rows(supabase, "players", "id, name, position, nfl_team, birth_date, is_college")
     players_df = pd.DataFrame(players_data)
     players_df = players_df.rename(columns={"id": "player_id_ref"})
 
-    # Fetch draft capital once (used across all training seasons)
-    draft_capital_lookup = _build_draft_capital_lookup(supabase)
-
-    # Fetch Vegas implied team totals once (used across all training seasons)
-    vegas_lookup, vegas_league_means = _build_vegas_lines_lookup(supabase)
-
-    # Fetch opening-day depth-chart tiers once (used across all training seasons)
-    depth_charts_lookup = _build_depth_charts_lookup(supabase)
-    red_zone_lookup = _build_red_zone_lookup(supabase)  # #671
-    ngs_passing_lookup = _build_ngs_passing_lookup(supabase)  # #674
-
-    # QB-ecosystem lookups for team_qb_quality_raw / team_qb_changed_raw (#642);
-    # per-season centered QB1 PPG computed in the loop from that season's history.
-    qb1_by_team, player_team_by_season = _build_qb_ecosystem_lookups(supabase)
-
-    # Per-team-season coaching-change signal once (spike #651).
-    coaching_lookup = _build_coaching_lookup(supabase)
-
     # Instantiate features. Residual stacks pull in features from every
     # nested base so the trainer can compute the base prediction per sample.
     all_feature_names = _collect_feature_names_recursive(model_def)
@@ -126,44 +265,70 @@ def collect_training_data(
         if fname in FEATURE_REGISTRY:
             feature_pool[fname] = FEATURE_REGISTRY[fname]()
 
+    # Only the stats columns and lookups the model's features declare.
+    inputs = resolve_inputs(FEATURE_REGISTRY[fname] for fname in feature_pool)
+    with profiling.stage("fetch: lookups"):
+        # Fetched once, used across all training seasons.
+        lookups = _build_lookups(supabase, inputs.lookups)
+
+    # Raw instances key the training-cache columns (the pool gets wrapped below).
+    raw_pool = dict(feature_pool)
+    dataset_cache = training_cache.open_cache()
+
+    # Reuse feature values materialized by earlier runs / trainings.
+    feature_store = open_store()
+    if feature_store is not None:
+        feature_pool = feature_store.wrap(feature_pool)
+    feature_pool = profiling.instrument(feature_pool)
+
+    # Per-position feature lists / weights resolved once. No params: training
+    # only collects the raw feature values.
+    plans = PlanCache(model_def, feature_pool)
+
     rows = []
 
+    # Overlapping history windows share one fetch per season.
+    season_store = get_season_data_store()
+
     for target_season in seasons:
         historical_seasons = list(range(target_season - max_history, target_season))
         print(f"Collecting features for {target_season} (history: {historical_seasons})...")
 
-        # Fetch historical data
-        history_df = fetch_multi_season_stats(historical_seasons)
-        if history_df.empty:
-            print(f"  No history for {historical_seasons}, skipping")
-            continue
+        with profiling.stage("fetch: season data"):
+            # Fetch historical data
+            history_df = season_store.player_stats(
+                historical_seasons, columns=inputs.player_stats_columns
+            )
+            if history_df.empty:
+                print(f"  No history for {historical_seasons}, skipping")
+                continue
 
-        # Fetch nfl_stats (paginated — a multi-season window exceeds the
-        # 1000-row cap; truncation here corrupted learned-model features and
-        # therefore the trained coefficients; GH #562).
-        nfl_stats_all = fetch_multi_season_nfl_stats(historical_seasons)
-        for col in ["total_points", "games_played", "targets", "rushing_attempts",
-                     "passing_yards", "passing_tds", "interceptions", "rushing_yards",
-                     "rushing_tds", "receptions", "receiving_yards", "receiving_tds",
-                     "offense_snaps", "passing_attempts", "completions"]:
-            if col in nfl_stats_all.columns:
-                nfl_stats_all[col] = pd.to_numeric(nfl_stats_all[col], errors="coerce").fillna(0)
-        if "season" in nfl_stats_all.columns:
-            nfl_stats_all["season"] = pd.to_numeric(nfl_stats_all["season"], errors="coerce")
-
-        # Team aggregates and positional means
-        team_aggregates = _compute_team_aggregates(nfl_stats_all, players_df)
-        positional_means = _compute_positional_mean_ppg(history_df, players_df)
-        pooling_k = _compute_pooling_k(history_df, players_df)  # EB k_g (#667, L3)
-
-        # Centered QB1 prior PPG per team for this target season (#642).
-        qb_quality = _compute_qb_quality_by_team(history_df, qb1_by_team, target_season)
-
-        # QB starters
-        qb_starters = get_all_starter_ids(historical_seasons + [target_season], players_df)
+            # Fetch nfl_stats (paginated — a multi-season window exceeds the
+            # 1000-row cap; truncation here corrupted learned-model features and
+            # therefore the trained coefficients; GH #562).
+            nfl_stats_all = season_store.nfl_stats(
+                historical_seasons, columns=inputs.nfl_stats_columns
+            )
+
+        with profiling.stage("build: season aggregates"):
+            # Team aggregates, positional means and EB k_g (#667, L3); the
+            # training context has never carried starter floors.
+            team_aggregates, positional_means, _floors, pooling_k = _compute_season_aggregates(
+                supabase, historical_seasons, history_df, nfl_stats_all, players_df
+            )
+
+            # Centered QB1 prior PPG per team for this target season (#642).
+            qb_quality = _compute_qb_quality_by_team(
+                history_df, lookups["qb1_by_team"], target_season
+            )
+
+            # QB starters
+            qb_starters = get_all_starter_ids(historical_seasons + [target_season], players_df)
 
         # Fetch actuals for target season
-        actuals_df = fetch_multi_season_stats([target_season])
+        actuals_df = season_store.player_stats(
+            [target_season], columns=inputs.player_stats_columns
+        )
         if actuals_df.empty:
             print(f"  No actuals for {target_season}, skipping")
             continue
@@ -177,86 +342,110 @@ def collect_training_data(
             if games >= MIN_GAMES and ppg > 0:
                 actuals_lookup[pid] = ppg
 
-        # Compute features for each player
-        for player_id, player_history in history_df.groupby("player_id"):
-            player_id_str = str(player_id)
+        season_index = SeasonPlayerIndex(history_df, nfl_stats_all, players_df)
+        season_context = SeasonContext(
+            target_season, team_aggregates, positional_means,
+            qb_starters=qb_starters,
+            qb_quality=qb_quality,
+            pooling_k=pooling_k,
+            **lookups,
+        )
 
+        # Training rows: players with qualifying actuals and a position.
+        candidates = []
+        for player_id_str, player_history in season_index.iter_history():
             if player_id_str not in actuals_lookup:
                 continue
-
-            player_row = players_df[players_df["player_id_ref"] == player_id_str]
-            if player_row.empty:
-                continue
-            position = player_row.iloc[0]["position"]
-            if not position:
-                continue
-
-            player_nfl = nfl_stats_all[nfl_stats_all["player_id"] == player_id_str] if not nfl_stats_all.empty else pd.DataFrame()
-
-            context = _build_context(
-                player_id_str, position, players_df, nfl_stats_all,
-                target_season, team_aggregates, positional_means,
-                qb_starters=qb_starters,
-                draft_capital=draft_capital_lookup,
-                vegas_lines=vegas_lookup,
-                vegas_league_means=vegas_league_means,
-                depth_charts=depth_charts_lookup,
-                red_zone=red_zone_lookup,
-                ngs_passing=ngs_passing_lookup,
-                qb1_by_team=qb1_by_team,
-                player_team_by_season=player_team_by_season,
-                qb_quality=qb_quality,
-                team_coaching=coaching_lookup,
-                pooling_k=pooling_k,
+            position = season_index.position(player_id_str)
+            if position:
+                candidates.append((player_id_str, position, player_history))
+
+        # Raw feature columns per position: served from the training cache
+        # where present, computed (and written back) where not.
+        keys = training_cache.SeasonKeys(
+            target_season, max_history, history_df, nfl_stats_all, actuals_df, players_df,
+            {
+                **season_context, "draft_capital": lookups.get("draft_capital"),
+                "team_aggregates": team_aggregates, "positional_means": positional_means,
+                "pooling_k": pooling_k, "qb_starters": qb_starters,
+            },
+        )
+        layouts = {}
+        for position in dict.fromkeys(pos for _, pos, _ in candidates):
+            layouts[position] = _ColumnLayout(
+                plans[position], raw_pool, keys, target_season, "draft_capital" in inputs.lookups
             )
-
-            effective_features, effective_weights = _resolve_features_for_position(model_def, position)
-            # For residual models, also evaluate every nested base's features
-            # so the trainer can compute the base prediction (and the residual
-            # to fit).
-            base_eff = _resolve_residual_base_features(model_def, position)
-            if base_eff:
-                effective_features = list(dict.fromkeys(list(base_eff) + list(effective_features)))
-            player_feature_instances = [
-                feature_pool[f] for f in effective_features if f in feature_pool
-            ]
-
-            feature_values = compute_features_for_player(
-                player_feature_instances,
-                player_id_str,
-                position,
-                player_history,
-                player_nfl,
-                context,
-                effective_weights or None,
+            player_ids = [pid for pid, pos, _ in candidates if pos == position]
+            layouts[position].cached = (
+                dataset_cache.load(keys.file_key, position, player_ids)
+                if dataset_cache is not None
+                else pd.DataFrame(index=pd.Index(player_ids, name="player_id"))
             )
-
-            # Check base feature exists
-            base_name = next((f.name for f in player_feature_instances if f.is_base), None)
-            if base_name and feature_values.get(base_name) is None:
-                continue
-
-            row_record = {
-                "player_id": player_id_str,
-                "position": position,
-                "season": target_season,
-                "feature_values": feature_values,
-                "actual_ppg": actuals_lookup[player_id_str],
-                # Leakage-free relevance signal for rank-aware training (#643):
-                # the recency-weighted prior-season PPG, computed only from
-                # seasons before the target.
-                "base_ppg": feature_values.get(base_name) if base_name else None,
-            }
-            # Residual models filter on draft seasonality at fit time.
-            dc = context.get("draft_capital")
-            if dc and isinstance(dc, dict):
-                row_record["seasons_since_draft"] = (
-                    int(target_season) - int(dc.get("season_drafted", target_season))
+            if dataset_cache is not None:
+                dataset_cache.hits += len(layouts[position].wanted) - len(layouts[position].missing)
+                dataset_cache.misses += len(layouts[position].missing)
+
+        missing_features = {name for layout in layouts.values() for name in layout.missing_features}
+        batch_values: dict[str, dict[str, Optional[float]]] = {}
+        if missing_features:
+            with profiling.stage("build: batch features"):
+                batch_values = _compute_batch_features(
+                    {name: f for name, f in feature_pool.items() if name in missing_features},
+                    history_df, players_df, target_season, positional_means,
                 )
-            rows.append(row_record)
 
+        # Compute features for each player
+        with profiling.stage("collect: player features"):
+            for player_id_str, position, player_history in candidates:
+                layout = layouts[position]
+                if layout.missing:
+                    context = _build_player_context(
+                        season_context, player_id_str, position, players_df,
+                        nfl_stats_all, season_index,
+                    )
+                    feature_values, seasons_since_draft = layout.compute(
+                        player_id_str, player_history, season_index.nfl_stats(player_id_str),
+                        context, _player_precomputed(batch_values, player_id_str),
+                    )
+                else:
+                    feature_values, seasons_since_draft = layout.assemble(player_id_str)
+
+                # Check base feature exists
+                base_name = layout.plan.base_feature
+                if base_name and feature_values.get(base_name) is None:
+                    continue
+
+                row_record = {
+                    "player_id": player_id_str,
+                    "position": position,
+                    "season": target_season,
+                    "feature_values": feature_values,
+                    "actual_ppg": actuals_lookup[player_id_str],
+                    # Leakage-free relevance signal for rank-aware training (#643):
+                    # the recency-weighted prior-season PPG, computed only from
+                    # seasons before the target.
+                    "base_ppg": feature_values.get(base_name) if base_name else None,
+                }
+                # Residual models filter on draft seasonality at fit time.
+                if seasons_since_draft is not None:
+                    row_record["seasons_since_draft"] = seasons_since_draft
+                rows.append(row_record)
+
+        if dataset_cache is not None:
+            for position, layout in layouts.items():
+                if layout.missing:
+                    dataset_cache.save(keys.file_key, position, layout.updated())
+
+        if feature_store is not None:
+            feature_store.flush()
         print(f"  Collected {sum(1 for r in rows if r['season'] == target_season)} samples")
 
+    if feature_store is not None:
+        feature_store.close()
+        print(f"Feature store: {feature_store.hits} hits, {feature_store.misses} computed")
+    if dataset_cache is not None:
+        print(f"Training cache: {dataset_cache.hits} columns reused, "
+              f"{dataset_cache.misses} computed")
     print(f"Total training samples: {len(rows)}")
     return pd.DataFrame(rows)
 
@@ -343,45 +532,29 @@ def train_ridge_loso(
     """
     if alpha_candidates is None:
         alpha_candidates = (
-            HUBER_ALPHA_CANDIDATES
-            if regressor_spec and regressor_spec.get("type") == "huber"
-            else ALPHA_CANDIDATES
+            HUBER_ALPHA_CANDIDATES if _is_huber(regressor_spec) else ALPHA_CANDIDATES
         )
 
     seasons = sorted(training_data["season"].unique())
     print(f"\nTraining with LOSO CV across seasons: {seasons}")
 
-    # Build feature matrices
-    all_X = []
-    all_y = []
-    all_seasons_col = []
-    all_positions = []
-    all_base_ppg = []
-
-    feature_names = None
-
-    for _, row in training_data.iterrows():
-        fv = row["feature_values"]
-        position = row["position"]
-
-        vector = build_feature_vector(fv, position, interaction_terms)
-        if vector is None:
-            continue
-
-        if feature_names is None:
-            feature_names = get_feature_column_names(list(fv.keys()), interaction_terms)
-
-        all_X.append(vector)
-        all_y.append(row["actual_ppg"])
-        all_seasons_col.append(row["season"])
-        all_positions.append(position)
-        bp = row.get("base_ppg") if hasattr(row, "get") else None
-        all_base_ppg.append(float(bp) if bp is not None else 0.0)
-
-    X = np.array(all_X, dtype=np.float64)
-    y = np.array(all_y, dtype=np.float64)
-    season_arr = np.array(all_seasons_col)
-    base_ppg_arr = np.array(all_base_ppg, dtype=np.float64)
+    # Build the feature matrix in one pass over columns; every row carries the
+    # same feature keys, so the first row's keys fix the layout.
+    spec = DesignMatrixSpec.compile(
+        list(training_data["feature_values"].iloc[0].keys()), interaction_terms
+    )
+    feature_names = spec.column_names
+    all_positions = training_data["position"].tolist()
+    X = spec.matrix(feature_value_frame(training_data["feature_values"]), all_positions)
+    y = training_data["actual_ppg"].to_numpy(dtype=np.float64)
+    season_arr = training_data["season"].to_numpy()
+    if "base_ppg" in training_data.columns:
+        base_ppg_arr = np.array(
+            [float(bp) if bp is not None else 0.0 for bp in training_data["base_ppg"]],
+            dtype=np.float64,
+        )
+    else:
+        base_ppg_arr = np.zeros(len(training_data))
 
     # Rank-aware sample weights (#643); all-ones unless a spec is given.
     sample_weights = compute_sample_weights(
@@ -394,40 +567,47 @@ def train_ridge_loso(
         print(f"Rank-aware sample weights: {sample_weight_spec} "
               f"(mean={sample_weights.mean():.3f}, max={sample_weights.max():.3f})")
 
-    # LOSO cross-validation to select alpha
-    best_alpha = alpha_candidates[0]
-    best_mae = float("inf")
+    # LOSO cross-validation to select alpha. Squared-loss Ridge scores the whole
+    # alpha grid from one SVD per fold; Huber has no closed form and refits.
+    fold_maes: list[list[float]] = [[] for _ in alpha_candidates]
 
-    for alpha in alpha_candidates:
-        fold_maes = []
+    for holdout_season in seasons:
+        train_mask = season_arr != holdout_season
+        test_mask = season_arr == holdout_season
 
-        for holdout_season in seasons:
-            train_mask = season_arr != holdout_season
-            test_mask = season_arr == holdout_season
-
-            if not np.any(train_mask) or not np.any(test_mask):
-                continue
-
-            X_train, X_test = X[train_mask], X[test_mask]
-            y_train, y_test = y[train_mask], y[test_mask]
-            w_train = sample_weights[train_mask]
+        if not np.any(train_mask) or not np.any(test_mask):
+            continue
 
-            # Standardize
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+        X_train, X_test = X[train_mask], X[test_mask]
+        y_train, y_test = y[train_mask], y[test_mask]
+        w_train = sample_weights[train_mask]
+
+        # Standardize
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+
+        if _is_huber(regressor_spec):
+            fold_preds = []
+            for alpha in alpha_candidates:
+                model = _make_linear_estimator(alpha, regressor_spec)
+                model.fit(X_train_scaled, y_train, sample_weight=w_train)
+                fold_preds.append(model.predict(X_test_scaled))
+        else:
+            fold_preds = _ridge_alpha_path(
+                X_train_scaled, y_train, X_test_scaled, alpha_candidates, sample_weight=w_train
+            )
 
-            model = _make_linear_estimator(alpha, regressor_spec)
-            model.fit(X_train_scaled, y_train, sample_weight=w_train)
-            preds = model.predict(X_test_scaled)
+        for maes, preds in zip(fold_maes, fold_preds):
             preds = np.maximum(preds, 0.0)
-
             # The held-out fold is scored unweighted — we tune for true MAE,
             # not weighted MAE (the weights are a fitting device, not the goal).
-            mae = float(np.mean(np.abs(preds - y_test)))
-            fold_maes.append(mae)
+            maes.append(float(np.mean(np.abs(preds - y_test))))
 
-        avg_mae = float(np.mean(fold_maes)) if fold_maes else float("inf")
+    best_alpha = alpha_candidates[0]
+    best_mae = float("inf")
+    for alpha, maes in zip(alpha_candidates, fold_maes):
+        avg_mae = float(np.mean(maes)) if maes else float("inf")
         print(f"  Alpha={alpha:>6.2f} → LOSO MAE: {avg_mae:.4f}")
 
         if avg_mae < best_mae:
@@ -487,6 +667,7 @@ def train_ridge_residual(
     interaction_terms: list[str],
     training_filter: dict[str, Any],
     alpha_candidates: list[float] | None = None,
+    models_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Train a Ridge residual on top of a frozen base model.
 
@@ -499,7 +680,8 @@ def train_ridge_residual(
 
     Returns a dict suitable for JSON serialization. The saved file embeds the
     base model's params alongside the residual coefficients so inference is
-    self-contained.
+    self-contained. ``models_dir`` loads the base from a directory other than
+    ``TRAINED_MODELS_DIR`` (the held-out harness's per-task sandbox).
     """
     from scripts.feature_projections.learned_combiner import (
         load_model_params,
@@ -530,76 +712,65 @@ def train_ridge_residual(
     if filtered.empty:
         raise ValueError("No samples remain after applying training_filter")
 
-    base_params = load_model_params(base_model_name)
+    base_params = load_model_params(base_model_name, models_dir)
     print(f"Loaded base model '{base_model_name}' "
           f"(alpha={base_params['alpha']}, n_features={base_params['training_metadata']['n_features']})")
 
-    # Build (residual_feature_vector, residual_target) pairs
-    all_X: list[list[float]] = []
-    all_y: list[float] = []
-    all_seasons_col: list[int] = []
-    residual_feature_names: list[str] | None = None
-
-    for _, row in filtered.iterrows():
-        fv = row["feature_values"]
-        position = row["position"]
-
-        # Base prediction: feed the FULL feature dict to the base model. The
-        # base predict() builds its own vector from base_params["feature_names"]
-        # in the canonical alphabetical order, so extra keys in `fv` are
-        # ignored — only the features the base model knows about are used.
-        # If the base is itself a residual model (nested residuals), use
-        # predict_residual so its own residual layer is applied. GH #378.
-        if base_params.get("combiner_type") == "residual":
-            base_pred = learned_predict_residual(fv, position, base_params)
-        else:
-            base_pred = learned_predict(fv, position, base_params)
-        if base_pred is None:
-            continue
-
-        # Residual feature vector — restrict feature_values to just the
-        # residual model's features so build_feature_vector orders columns
-        # over only those.
-        residual_fv = {f: fv.get(f) for f in residual_features}
-        vector = build_feature_vector(residual_fv, position, interaction_terms)
-        if vector is None:
-            continue
-
-        if residual_feature_names is None:
-            residual_feature_names = get_feature_column_names(residual_features, interaction_terms)
-
-        residual = float(row["actual_ppg"]) - float(base_pred)
-        all_X.append(vector)
-        all_y.append(residual)
-        all_seasons_col.append(int(row["season"]))
-
-    if not all_X:
+    # Base predictions: feed the FULL feature dict to the base model. The
+    # base predict() builds its own vector from base_params["feature_names"]
+    # in the canonical alphabetical order, so extra keys in `fv` are
+    # ignored — only the features the base model knows about are used.
+    # If the base is itself a residual model (nested residuals), use
+    # predict_residual so its own residual layer is applied. GH #378.
+    base_predict = (
+        learned_predict_residual if base_params.get("combiner_type") == "residual"
+        else learned_predict
+    )
+    positions = filtered["position"].tolist()
+    base_preds = [
+        base_predict(fv, position, base_params)
+        for fv, position in zip(filtered["feature_values"], positions)
+    ]
+    keep = np.array([p is not None for p in base_preds], dtype=bool)
+    if not keep.any():
         raise ValueError("No residual training rows produced")
 
-    X = np.array(all_X, dtype=np.float64)
-    y = np.array(all_y, dtype=np.float64)
-    season_arr = np.array(all_seasons_col)
+    # Residual design matrix over just the residual model's features.
+    spec = DesignMatrixSpec.compile(residual_features, interaction_terms)
+    residual_feature_names = spec.column_names
+    kept = filtered[keep]
+    X = spec.matrix(
+        feature_value_frame(kept["feature_values"]),
+        [p for p, k in zip(positions, keep) if k],
+    )
+    y = kept["actual_ppg"].to_numpy(dtype=np.float64) - np.array(
+        [p for p in base_preds if p is not None], dtype=np.float64
+    )
+    season_arr = kept["season"].to_numpy().astype(int)
+    all_seasons_col = season_arr.tolist()
 
     print(f"Residual feature matrix: {X.shape[0]} samples × {X.shape[1]} features")
     print(f"Residual columns: {residual_feature_names}")
 
     # LOSO CV alpha selection. fit_intercept=False so vets get a 0 contribution.
+    # One SVD per fold covers every alpha candidate.
     seasons = sorted(set(all_seasons_col))
+    fold_maes: list[list[float]] = [[] for _ in alpha_candidates]
+    for holdout in seasons:
+        train_mask = season_arr != holdout
+        test_mask = season_arr == holdout
+        if not np.any(train_mask) or not np.any(test_mask):
+            continue
+        fold_preds = _ridge_alpha_path(
+            X[train_mask], y[train_mask], X[test_mask], alpha_candidates, fit_intercept=False
+        )
+        for maes, preds in zip(fold_maes, fold_preds):
+            maes.append(float(np.mean(np.abs(preds - y[test_mask]))))
+
     best_alpha = alpha_candidates[0]
     best_mae = float("inf")
-
-    for alpha in alpha_candidates:
-        fold_maes: list[float] = []
-        for holdout in seasons:
-            train_mask = season_arr != holdout
-            test_mask = season_arr == holdout
-            if not np.any(train_mask) or not np.any(test_mask):
-                continue
-            model = Ridge(alpha=alpha, fit_intercept=False)
-            model.fit(X[train_mask], y[train_mask])
-            preds = model.predict(X[test_mask])
-            fold_maes.append(float(np.mean(np.abs(preds - y[test_mask]))))
-        avg = float(np.mean(fold_maes)) if fold_maes else float("inf")
+    for alpha, maes in zip(alpha_candidates, fold_maes):
+        avg = float(np.mean(maes)) if maes else float("inf")
         print(f"  Alpha={alpha:>6.2f} → LOSO residual MAE: {avg:.4f}")
         if avg < best_mae:
             best_mae = avg
@@ -634,11 +805,33 @@ def train_ridge_residual(
     }
 
 
+def _train(model_name: str, model_def: ModelDefinition, training_data: pd.DataFrame) -> dict[str, Any]:
+    """Fit the model's Ridge (or residual Ridge) params on collected data."""
+    if model_def.combiner_type == "residual":
+        if not model_def.base_model_name:
+            print(f"Error: residual model '{model_name}' requires base_model_name")
+            sys.exit(1)
+        return train_ridge_residual(
+            training_data,
+            base_model_name=model_def.base_model_name,
+            residual_features=model_def.features,
+            interaction_terms=model_def.interaction_terms,
+            training_filter=model_def.training_filter,
+        )
+    return train_ridge_loso(
+        training_data,
+        model_def.interaction_terms,
+        sample_weight_spec=model_def.sample_weight_spec,
+        regressor_spec=model_def.regressor_spec,
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Train a learned projection model")
     parser.add_argument("--model", required=True, help="Model name from model_config.py")
     parser.add_argument("--seasons", required=True, help="Comma-separated training seasons (e.g., 2022,2023,2024)")
     parser.add_argument("--max-history", type=int, default=3, help="Max seasons of history per projection")
+    profiling.add_profile_args(parser)
     args = parser.parse_args()
 
     model_name = args.model
@@ -656,31 +849,16 @@ def main():
         print(f"Base model: {model_def.base_model_name}")
         print(f"Training filter: {model_def.training_filter}")
 
-    # Collect training data
-    training_data = collect_training_data(model_name, seasons, args.max_history)
-    if training_data.empty:
-        print("No training data collected. Aborting.")
-        sys.exit(1)
-
-    # Train
-    if model_def.combiner_type == "residual":
-        if not model_def.base_model_name:
-            print(f"Error: residual model '{model_name}' requires base_model_name")
+    with profiling.profiled(args, f"train_model-{model_name}"):
+        # Collect training data
+        training_data = collect_training_data(model_name, seasons, args.max_history)
+        if training_data.empty:
+            print("No training data collected. Aborting.")
             sys.exit(1)
-        model_params = train_ridge_residual(
-            training_data,
-            base_model_name=model_def.base_model_name,
-            residual_features=model_def.features,
-            interaction_terms=model_def.interaction_terms,
-            training_filter=model_def.training_filter,
-        )
-    else:
-        model_params = train_ridge_loso(
-            training_data,
-            model_def.interaction_terms,
-            sample_weight_spec=model_def.sample_weight_spec,
-            regressor_spec=model_def.regressor_spec,
-        )
+
+        # Train
+        with profiling.stage("train: ridge"):
+            model_params = _train(model_name, model_def, training_data)
 
     # Save
     TRAINED_MODELS_DIR.mkdir(parents=True, exist_ok=True)
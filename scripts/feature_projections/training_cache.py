@@ -0,0 +1,240 @@
+"""Parquet cache of ``collect_training_data`` feature columns under ``.cache/training``.
+
+``collect_training_data`` recomputes every feature for every player-season on
+every call, and ``holdout_eval`` calls it once per learned model per fold —
+even though the v20–v31 learned / residual family share most of their
+features. This cache stores the raw feature values of one target season and
+one position as a parquet file, one column per feature:
+
+* the **file** is keyed by target season, ``max_history``, the collection code
+  version (context / combiner modules), the league ``SCORING_SETTINGS``
+  (``feature_store.scoring_digest``) and a fingerprint of the data that
+  decides which player-seasons are training rows (the history window's and the
+  target season's core ``player_stats`` columns, plus ``players``);
+* each **column** is keyed by the feature's name and code hash
+  (``feature_store.feature_code_hash``, which also covers the scoring
+  settings), a digest of exactly the inputs it
+  declares (``feature_inputs``: its stats columns and the season context minus
+  the lookups it doesn't read) and — for adjustment features, which see
+  ``base_ppg`` — the base feature's column key and weight.
+
+A model that only adds one feature to a cached one therefore finds every other
+column on disk and computes just the new one; the file is rewritten with the
+new column for the next model. Values are stored raw (before the base
+feature's weight), so the assembled ``feature_values`` match an uncached run.
+
+Disable with ``OTTONEU_TRAINING_CACHE=off``; relocate with
+``OTTONEU_TRAINING_CACHE_DIR``. Clear with
+``python -m scripts.feature_projections.training_cache --clear``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from scripts.feature_projections import holdout_cache
+from scripts.feature_projections.feature_inputs import (
+    PLAYER_STATS_CORE,
+    FeatureInputs,
+    feature_inputs,
+)
+from scripts.feature_projections.feature_store import (
+    InputFingerprinter,
+    _frame_digest,
+    _project,
+    feature_code_hash,
+    scoring_digest,
+)
+from scripts.feature_projections.features.base import ProjectionFeature
+
+_HERE = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that turn a player's inputs into feature calls. Feature modules are
+# covered per column by feature_code_hash.
+_CODE_FILES = [
+    _HERE / "context.py",
+    _HERE / "season_index.py",
+    _HERE / "combiner.py",
+    _HERE / "learned_combiner.py",
+]
+
+# Pseudo-column for the residual trainers' draft-seasonality filter.
+SEASONS_SINCE_DRAFT = "seasons_since_draft"
+
+
+def resolve_cache_dir() -> Path:
+    """``OTTONEU_TRAINING_CACHE_DIR`` or a sibling of the (worktree-shared) holdout cache."""
+    env = os.environ.get("OTTONEU_TRAINING_CACHE_DIR")
+    if env:
+        return Path(env).expanduser()
+    return holdout_cache.CACHE_DIR.parent / "training"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("OTTONEU_TRAINING_CACHE", "on").lower() not in {"0", "off", "false", "no"}
+
+
+_code_version_cache: Optional[str] = None
+
+
+def collection_code_version() -> str:
+    """Hash of the context / combiner modules (memoized per process)."""
+    global _code_version_cache
+    if _code_version_cache is None:
+        h = hashlib.sha256()
+        for path in _CODE_FILES:
+            h.update(path.name.encode())
+            h.update(path.read_bytes())
+        _code_version_cache = h.hexdigest()[:16]
+    return _code_version_cache
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+class SeasonKeys:
+    """File and column keys for one target season's training data.
+
+    ``context_values`` holds everything the season context carries, keyed by
+    context key (lookups, team aggregates, positional means, pooling k, QB
+    starters / quality); a column's key digests only the entries its feature's
+    declared lookups leave in.
+    """
+
+    def __init__(
+        self,
+        target_season: int,
+        max_history: int,
+        history_df: pd.DataFrame,
+        nfl_stats_df: pd.DataFrame,
+        actuals_df: pd.DataFrame,
+        players_df: pd.DataFrame,
+        context_values: dict[str, Any],
+    ):
+        self._history = history_df
+        self._nfl_stats = nfl_stats_df
+        self._context_values = context_values
+        self._fingerprinter = InputFingerprinter()
+        self._players_digest = _frame_digest(players_df)
+        self._inputs_digests: dict[FeatureInputs, str] = {}
+        self.file_key = _digest(
+            collection_code_version(),
+            scoring_digest(),
+            str(int(target_season)),
+            str(int(max_history)),
+            _frame_digest(_project(history_df, PLAYER_STATS_CORE)),
+            _frame_digest(_project(actuals_df, PLAYER_STATS_CORE)),
+            self._players_digest,
+        )
+
+    def inputs_digest(self, inputs: FeatureInputs) -> str:
+        """Digest of the stats columns and context entries ``inputs`` can read."""
+        digest = self._inputs_digests.get(inputs)
+        if digest is None:
+            excluded = inputs.excluded_context_keys()
+            context = {k: v for k, v in self._context_values.items() if k not in excluded}
+            digest = _digest(
+                _frame_digest(_project(self._history, inputs.player_stats_columns)),
+                _frame_digest(_project(self._nfl_stats, inputs.nfl_stats_columns)),
+                self._players_digest,
+                self._fingerprinter.mapping_digest(context),
+            )
+            self._inputs_digests[inputs] = digest
+        return digest
+
+    def column(
+        self,
+        feature: ProjectionFeature,
+        base_column: Optional[str] = None,
+        base_weight: float = 1.0,
+    ) -> str:
+        """Column name for ``feature``'s raw values.
+
+        ``base_column`` / ``base_weight`` key an adjustment feature on the
+        ``base_ppg`` it is computed against; None for the base feature.
+        """
+        key = _digest(
+            feature.name,
+            feature_code_hash(feature),
+            self.inputs_digest(feature_inputs(feature)),
+            base_column or "",
+            repr(float(base_weight)) if base_column else "",
+        )
+        return f"{feature.name}__{key}"
+
+    def seasons_since_draft_column(self) -> str:
+        draft_capital = self._context_values.get("draft_capital") or {}
+        return f"{SEASONS_SINCE_DRAFT}__{_digest(self._fingerprinter.value_digest(draft_capital))}"
+
+
+class TrainingCache:
+    """One parquet file per (season key, position): ``player_id`` + feature columns."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory is not None else resolve_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, file_key: str, position: str) -> Path:
+        return self.directory / f"{file_key}__{position}.parquet"
+
+    def load(self, file_key: str, position: str, player_ids: list[str]) -> pd.DataFrame:
+        """Cached columns indexed by ``player_ids`` (no columns on a miss).
+
+        A file whose players differ from ``player_ids`` is ignored.
+        """
+        empty = pd.DataFrame(index=pd.Index(player_ids, name="player_id"))
+        path = self.path(file_key, position)
+        if not path.exists():
+            return empty
+        try:
+            frame = pd.read_parquet(path)
+        except (OSError, ValueError) as exc:
+            print(f"Training cache unreadable ({path.name}: {exc}); recomputing.")
+            return empty
+        frame["player_id"] = frame["player_id"].astype(str)
+        if set(frame["player_id"]) != set(player_ids) or frame["player_id"].duplicated().any():
+            return empty
+        return frame.set_index("player_id").reindex(player_ids)
+
+    def save(self, file_key: str, position: str, frame: pd.DataFrame) -> None:
+        """Write ``frame`` (indexed by player_id) atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(file_key, position)
+        tmp = path.with_suffix(f".parquet.{os.getpid()}.tmp")
+        out = frame.astype("float64").reset_index()
+        out["player_id"] = out["player_id"].astype(str)
+        out.to_parquet(tmp, index=False)
+        tmp.replace(path)
+
+
+def open_cache() -> Optional[TrainingCache]:
+    """The on-disk cache, or None when disabled."""
+    if not cache_enabled():
+        return None
+    return TrainingCache()
+
+
+if __name__ == "__main__":
+    import argparse
+    import shutil
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the training-dataset cache.")
+    parser.add_argument("--clear", action="store_true", help="Delete the cache directory.")
+    args = parser.parse_args()
+    cache_dir = resolve_cache_dir()
+    if args.clear:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        print(f"Cleared training cache: {cache_dir}")
+    else:
+        print(cache_dir)
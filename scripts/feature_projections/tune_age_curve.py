@@ -25,8 +25,9 @@ from typing import Any
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows, POSITIONS, MIN_GAMES
-from scripts.analysis_utils import fetch_multi_season_stats
+from scripts.config import get_supabase_client, POSITIONS, MIN_GAMES
+from scripts.db_io import fetch_all_rows
+from scripts.analysis_utils import get_season_data_store
 from scripts.feature_projections.tuning_protocol import (
     inner_tuning_seasons_str,
     warn_on_confirmation_overlap,
@@ -96,9 +97,12 @@ def _precompute_base_projections(
 
     results: dict[int, dict[str, tuple[float, float, str, float | None]]] = {}
 
+    # Overlapping history windows share one fetch per season.
+    season_store = get_season_data_store()
+
     for target_season in seasons:
         historical_seasons = list(range(target_season - max_history, target_season))
-        history_df = fetch_multi_season_stats(historical_seasons)
+        history_df = season_store.player_stats(historical_seasons)
         if history_df.empty:
             continue
 
@@ -34,7 +34,8 @@ from __future__ import annotations
 import argparse
 from typing import Dict, List, Optional
 
-from scripts.config import get_supabase_client, fetch_all_rows
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 
 
 def find_pairs(supabase) -> List[Dict[str, str]]:
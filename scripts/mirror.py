@@ -0,0 +1,169 @@
+"""Local parquet mirror of the Supabase tables the analysis tools read — `just sync-mirror`.
+
+Every analysis tool (holdout_eval, significance, the sweeps, diagnostics,
+segment/residual analysis, the availability and rookie backtests) pages the
+same ``players`` / ``player_stats`` / ``nfl_stats`` / ``model_projections`` and
+lookup tables through PostgREST at 1000 rows per request on every invocation.
+This command snapshots those tables once into ``.cache/mirror/<table>.parquet``
+with a ``manifest.json`` of row counts and max ``updated_at`` per table.
+
+Reading from the mirror is a data-source switch in ``scripts/config.py``:
+``OTTONEU_DATA_SOURCE=mirror`` (or ``--source mirror`` on the analysis tools)
+makes ``get_supabase_client()`` return a read-only ``MirrorClient`` (from
+``scripts/mirror_client.py``), so
+``fetch_all_rows`` and the ``analysis_utils`` fetchers read the local files.
+The mirror is a point-in-time copy — re-sync after a scrape or backfill, and
+check freshness with ``--status``.
+
+jsonb columns are stored as JSON text (listed under ``json_columns`` in the
+manifest) and decoded again on read.
+
+Usage:
+    venv/bin/python -m scripts.mirror                        # or: just sync-mirror
+    venv/bin/python -m scripts.mirror --tables players,nfl_stats
+    venv/bin/python -m scripts.mirror --status
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from scripts.config import get_supabase_client, use_data_source
+from scripts.db_io import FETCH_WORKERS, QUERY_CACHE, fetch_all_rows
+from scripts.mirror_client import MIRROR_MANIFEST, load_mirror_manifest, mirror_dir
+
+# Tables read by the projection runner and the analysis tools.
+MIRROR_TABLES = [
+    "players",
+    "player_stats",
+    "nfl_stats",
+    "projection_models",
+    "model_projections",
+    "model_projection_features",
+    "backtest_results",
+    "league_calendar",
+    "draft_capital",
+    "team_vegas_lines",
+    "depth_charts",
+    "team_coaching",
+    "red_zone_usage",
+    "ngs_passing",
+]
+
+
+def _frame(rows: list[dict]) -> tuple[pd.DataFrame, list[str]]:
+    """Rows -> a parquet-writable frame (nullable ints/bools, jsonb as text)."""
+    df = pd.DataFrame.from_records(rows)
+    json_columns = [
+        column for column in df.columns
+        if df[column].map(lambda v: isinstance(v, (dict, list))).any()
+    ]
+    for column in json_columns:
+        df[column] = df[column].map(lambda v: None if v is None else json.dumps(v))
+    # Keep integer / boolean columns with NULLs as such (not float64 / object)
+    # so rows read back match what PostgREST returned.
+    for column in df.columns:
+        kinds = {type(v) for v in df[column] if v is not None and not pd.isna(v)}
+        if kinds == {int}:
+            df[column] = df[column].astype("Int64")
+        elif kinds == {bool}:
+            df[column] = df[column].astype("boolean")
+    return df, json_columns
+
+
+def sync_table(supabase, table: str, directory: Path) -> dict:
+    """Snapshot one table; return its manifest entry."""
+    start = time.perf_counter()
+    rows = fetch_all_rows(supabase, table, workers=FETCH_WORKERS)
+    df, json_columns = _frame(rows)
+    path = directory / f"{table}.parquet"
+    tmp = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp, index=False)
+    tmp.replace(path)
+    QUERY_CACHE.invalidate(table)
+    max_updated = None
+    if "updated_at" in df.columns and df["updated_at"].notna().any():
+        max_updated = str(df["updated_at"].dropna().max())
+    return {
+        "rows": len(df),
+        "columns": list(df.columns),
+        "json_columns": json_columns,
+        "max_updated_at": max_updated,
+        "synced_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def sync_mirror(supabase, tables: Optional[list[str]] = None,
+                directory: Optional[Path] = None) -> dict:
+    """Snapshot ``tables`` (default: all of MIRROR_TABLES) and update the manifest.
+
+    The manifest is rewritten after each table, so an interrupted sync keeps
+    the tables it finished.
+    """
+    directory = directory or mirror_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = load_mirror_manifest(directory)
+    manifest.setdefault("tables", {})
+    for table in tables or MIRROR_TABLES:
+        entry = sync_table(supabase, table, directory)
+        manifest["tables"][table] = entry
+        manifest["synced_at"] = entry["synced_at"]
+        (directory / MIRROR_MANIFEST).write_text(json.dumps(manifest, indent=2))
+        print(f"  {table:<20} {entry['rows']:>8} rows  {entry['seconds']:>7.2f}s")
+    return manifest
+
+
+def print_status(directory: Optional[Path] = None) -> None:
+    directory = directory or mirror_dir()
+    manifest = load_mirror_manifest(directory)
+    if not manifest:
+        print(f"No mirror at {directory} — run `just sync-mirror`.")
+        return
+    print(f"Mirror: {directory}")
+    print(f"{'Table':<20} {'Rows':>8}  {'Max updated_at':<26} Synced at")
+    for table, entry in sorted(manifest.get("tables", {}).items()):
+        print(f"{table:<20} {entry['rows']:>8}  {entry.get('max_updated_at') or '-':<26} "
+              f"{entry['synced_at']}")
+    missing = [t for t in MIRROR_TABLES if t not in manifest.get("tables", {})]
+    if missing:
+        print(f"Not mirrored: {', '.join(missing)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Snapshot Supabase tables into the local parquet mirror")
+    parser.add_argument(
+        "--tables", default=None,
+        help=f"Comma-separated tables to sync (default: {','.join(MIRROR_TABLES)})",
+    )
+    parser.add_argument("--status", action="store_true", help="Print the manifest and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+        return
+
+    tables = [t.strip() for t in args.tables.split(",") if t.strip()] if args.tables else None
+    # The snapshot must come from the live DB even if the shell selects the mirror.
+    use_data_source("supabase")
+    print(f"Syncing mirror to {mirror_dir()} ...")
+    start = time.perf_counter()
+    try:
+        sync_mirror(get_supabase_client(), tables)
+    except Exception as exc:  # pragma: no cover - network failure path
+        print(f"Mirror sync failed: {exc!r}")
+        sys.exit(1)
+    print(f"Done in {time.perf_counter() - start:.1f}s. Read it with --source mirror "
+          f"or OTTONEU_DATA_SOURCE=mirror.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Read-only Supabase stand-in over the local parquet mirror.
+
+`just sync-mirror` (scripts/mirror.py) snapshots the tables the analysis tools
+read into .cache/mirror/<table>.parquet plus a manifest.json. Selecting the
+mirror data source (``OTTONEU_DATA_SOURCE=mirror`` / ``--source mirror``)
+makes ``get_supabase_client()`` return a :class:`MirrorClient`, so
+``fetch_all_rows`` and the ``analysis_utils`` fetchers read those files and
+holdout evals, sweeps and backtests run offline without paging PostgREST 1000
+rows at a time. The mirror is a point-in-time copy: re-sync after a scrape or
+backfill.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+MIRROR_MANIFEST = "manifest.json"
+
+
+def mirror_dir() -> Path:
+    """``OTTONEU_MIRROR_DIR`` or ``.cache/mirror`` in the repo root."""
+    env = os.environ.get("OTTONEU_MIRROR_DIR")
+    if env:
+        return Path(env)
+    return Path(__file__).parent.parent / ".cache" / "mirror"
+
+
+
+def load_mirror_manifest(directory: Optional[Path] = None) -> dict:
+    """The mirror's manifest (``{}`` if it has never been synced)."""
+    path = (directory or mirror_dir()) / MIRROR_MANIFEST
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+# (path, mtime) -> DataFrame, so repeated queries in one process read each file once.
+_mirror_frames: dict[tuple[str, float], pd.DataFrame] = {}
+
+
+def _mirror_frame(directory: Path, table: str) -> pd.DataFrame:
+    path = directory / f"{table}.parquet"
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Table {table!r} is not in the local mirror ({directory}). "
+            f"Run `just sync-mirror` (or `just sync-mirror --tables {table}`)."
+        )
+    key = (str(path), path.stat().st_mtime)
+    frame = _mirror_frames.get(key)
+    if frame is None:
+        frame = pd.read_parquet(path)
+        json_columns = load_mirror_manifest(directory).get("tables", {}).get(table, {}).get("json_columns", [])
+        for column in json_columns:
+            frame[column] = frame[column].map(lambda v: json.loads(v) if isinstance(v, str) else v)
+        _mirror_frames[key] = frame
+    return frame
+
+
+def _mirror_records(frame: pd.DataFrame) -> list[dict]:
+    """Rows as JSON-like dicts (native Python scalars, NULL -> None)."""
+    columns = {
+        column: frame[column].astype(object).where(frame[column].notna(), None).tolist()
+        for column in frame.columns
+    }
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+class _MirrorResponse:
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class _MirrorQuery:
+    """The read subset of the PostgREST query builder, evaluated in pandas.
+
+    Filters follow SQL semantics: comparisons never match NULL.
+    """
+
+    def __init__(self, client: "MirrorClient", table: str):
+        self._client = client
+        self._table = table
+        self._columns: Optional[list[str]] = None
+        self._count = False
+        self._filters: list[tuple[str, str, Any]] = []
+        self._order: list[tuple[str, bool]] = []
+        self._bounds: Optional[tuple[int, int]] = None
+        self._limit: Optional[int] = None
+        self._single: Optional[str] = None
+
+    def select(self, columns: str = "*", count: Optional[str] = None, **_kwargs) -> "_MirrorQuery":
+        names = [c.strip() for c in columns.split(",") if c.strip()]
+        self._columns = None if names == ["*"] else names
+        self._count = count is not None
+        return self
+
+    def _filter(self, op: str, column: str, value: Any) -> "_MirrorQuery":
+        self._filters.append((op, column, value))
+        return self
+
+    def eq(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("eq", column, value)
+
+    def neq(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("neq", column, value)
+
+    def gt(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("gt", column, value)
+
+    def gte(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("gte", column, value)
+
+    def lt(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("lt", column, value)
+
+    def lte(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("lte", column, value)
+
+    def in_(self, column: str, values: Any) -> "_MirrorQuery":
+        return self._filter("in_", column, list(values))
+
+    def is_(self, column: str, value: Any) -> "_MirrorQuery":
+        return self._filter("is_", column, value)
+
+    def match(self, query: dict[str, Any]) -> "_MirrorQuery":
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def order(self, column: str, desc: bool = False, **_kwargs) -> "_MirrorQuery":
+        self._order.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> "_MirrorQuery":
+        self._bounds = (start, end)
+        return self
+
+    def limit(self, size: int, **_kwargs) -> "_MirrorQuery":
+        self._limit = size
+        return self
+
+    def single(self) -> "_MirrorQuery":
+        self._single = "single"
+        return self
+
+    def maybe_single(self) -> "_MirrorQuery":
+        self._single = "maybe"
+        return self
+
+    def _mask(self, frame: pd.DataFrame, op: str, column: str, value: Any) -> np.ndarray:
+        if column not in frame.columns:
+            raise KeyError(f"Column {column!r} is not in mirrored table {self._table!r}")
+        series = frame[column]
+        if op == "is_":
+            if value is None or str(value).lower() == "null":
+                return series.isna()
+            return series.notna() & (series == (str(value).lower() == "true"))
+        present = series.notna().to_numpy()
+        mask = np.zeros(len(series), dtype=bool)
+        values = series[present]
+        if op == "in_":
+            mask[present] = values.isin(value).to_numpy(dtype=bool)
+        else:
+            compare = {
+                "eq": values.__eq__, "neq": values.__ne__,
+                "gt": values.__gt__, "gte": values.__ge__,
+                "lt": values.__lt__, "lte": values.__le__,
+            }[op]
+            mask[present] = compare(value).to_numpy(dtype=bool)
+        return mask
+
+    def execute(self) -> _MirrorResponse:
+        frame = _mirror_frame(self._client.directory, self._table)
+        for op, column, value in self._filters:
+            frame = frame[self._mask(frame, op, column, value)]
+        if self._order:
+            frame = frame.sort_values(
+                [c for c, _ in self._order],
+                ascending=[not desc for _, desc in self._order],
+                kind="stable",
+            )
+        count = len(frame) if self._count else None
+        if self._bounds is not None:
+            start, end = self._bounds
+            frame = frame.iloc[start:end + 1]
+        if self._limit is not None:
+            frame = frame.iloc[:self._limit]
+        if self._columns is not None:
+            missing = [c for c in self._columns if c not in frame.columns]
+            if missing:
+                raise KeyError(f"Columns {missing} are not in mirrored table {self._table!r}")
+            frame = frame[self._columns]
+        rows = _mirror_records(frame)
+        if self._single is not None:
+            if self._single == "single" and len(rows) != 1:
+                raise ValueError(f"single() matched {len(rows)} rows in mirrored table {self._table!r}")
+            return _MirrorResponse(rows[0] if rows else None, count)
+        return _MirrorResponse(rows, count)
+
+    def _read_only(self, *_args, **_kwargs):
+        raise RuntimeError(
+            "The local mirror is read-only; unset OTTONEU_DATA_SOURCE / --source mirror to write."
+        )
+
+    insert = upsert = update = delete = _read_only
+
+
+class MirrorClient:
+    """Read-only stand-in for the Supabase client over the parquet mirror."""
+
+    # Queries are answered from an in-memory frame: fetch_all_rows skips paging.
+    in_memory = True
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory is not None else mirror_dir()
+        self.cache_scope = ("mirror", str(self.directory))
+
+    def table(self, name: str) -> _MirrorQuery:
+        return _MirrorQuery(self, name)
+
+    from_ = table
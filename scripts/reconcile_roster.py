@@ -45,11 +45,8 @@ from datetime import date
 import requests
 from dotenv import load_dotenv
 
-from scripts.config import (
-    LEAGUE_ID,
-    fetch_all_rows,
-    get_supabase_client,
-)
+from scripts.config import LEAGUE_ID, get_supabase_client
+from scripts.db_io import fetch_all_rows
 from scripts.prospect_adopt import choose_prospect_to_adopt
 
 ROSTER_CSV_URL_TEMPLATE = "https://ottoneu.fangraphs.com/football/{league_id}/csv/rosters"
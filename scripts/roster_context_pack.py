@@ -20,7 +20,8 @@ from __future__ import annotations
 import argparse
 from collections import defaultdict
 
-from scripts.config import fetch_all_rows, get_supabase_client
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 
 CAP_PER_TEAM = 400
 NUM_TEAMS = 12
@@ -30,7 +30,8 @@ import asyncio
 
 from playwright.async_api import async_playwright
 
-from scripts.config import fetch_all_rows, get_supabase_client
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 from scripts.season import projection_season
 from scripts.name_utils import normalize_player_name
 
@@ -37,7 +37,8 @@ import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
-from scripts.config import LEAGUE_ID, fetch_all_rows, get_supabase_client
+from scripts.config import LEAGUE_ID, get_supabase_client
+from scripts.db_io import fetch_all_rows
 
 PLAYER_CARD_URL_TEMPLATE = (
     "https://ottoneu.fangraphs.com/football/{league_id}/player_card/{level}/{ottoneu_id}"
@@ -18,7 +18,9 @@ from pathlib import Path
 
 import pandas as pd
 
-from scripts.config import get_supabase_client, fetch_all_rows
+from scripts.analysis_utils import NFL_STATS_SCHEMA, PLAYER_STATS_SCHEMA, load_typed
+from scripts.config import get_supabase_client
+from scripts.db_io import fetch_all_rows
 
 DEFAULT_SEASONS = list(range(2020, 2026))
 OUTPUT_PATH = Path(__file__).parent.parent / "data" / "qb_starters.json"
@@ -38,13 +40,10 @@ def _seed_from_nfl_stats(
         "player_id, season, passing_attempts, games_played, recent_team",
         filters=[("in_", "season", seasons)],
     )
-    nfl_df = pd.DataFrame(nfl_rows)
+    nfl_df = load_typed(nfl_rows, NFL_STATS_SCHEMA)
     if nfl_df.empty:
         return {}, set()
 
-    for col in ["passing_attempts", "games_played", "season"]:
-        nfl_df[col] = pd.to_numeric(nfl_df[col], errors="coerce").fillna(0)
-
     qb_stats = nfl_df[nfl_df["player_id"].isin(qb_ids)].copy()
     if qb_stats.empty:
         return {}, set()
@@ -61,7 +60,7 @@ def _seed_from_nfl_stats(
         season_key = str(season)
         result[season_key] = {}
 
-        for team, team_df in season_data.groupby("recent_team"):
+        for team, team_df in season_data.groupby("recent_team", observed=True):
             if not team or pd.isna(team):
                 continue
             team = str(team)
@@ -113,13 +112,10 @@ def _seed_from_player_stats(
         "player_id, season, total_points, games_played",
         filters=[("in_", "season", seasons)],
     )
-    ps_df = pd.DataFrame(ps_rows)
+    ps_df = load_typed(ps_rows, PLAYER_STATS_SCHEMA)
     if ps_df.empty:
         return {}
 
-    for col in ["total_points", "games_played", "season"]:
-        ps_df[col] = pd.to_numeric(ps_df[col], errors="coerce").fillna(0)
-
     # Filter to QBs
     qb_ps = ps_df[ps_df["player_id"].isin(qb_ids)].copy()
     if qb_ps.empty:
@@ -19,6 +19,7 @@ import pandas as pd
 from supabase import Client
 
 from scripts.config import SCORING_SETTINGS
+from scripts.db_io import bulk_upsert
 from scripts.tasks import TaskResult
 from scripts.name_utils import normalize_player_name
 
@@ -38,7 +39,7 @@ def _calc_points(row: dict) -> float:
 
 def _build_player_lookup(supabase: Client) -> dict[str, str]:
     """Fetch all players from DB and return normalized_name -> uuid dict."""
-    from scripts.config import fetch_all_rows
+    from scripts.db_io import fetch_all_rows
     players = fetch_all_rows(supabase, "players", "id, name")
     lookup: dict[str, str] = {}
     for p in players:
@@ -197,12 +198,8 @@ def run(params: dict, supabase: Client) -> TaskResult:
             sample = sorted(unmatched_names)[:20]
             print(f"  Unmatched sample: {sample}")
 
-        batch_size = 200
-        for i in range(0, len(upsert_rows), batch_size):
-            batch = upsert_rows[i:i + batch_size]
-            supabase.table("player_stats").upsert(
-                batch, on_conflict="player_id,season"
-            ).execute()
+        bulk_upsert(supabase, "player_stats", upsert_rows, on_conflict="player_id,season",
+                    batch_size=200)
 
         print(f"Upserted {len(upsert_rows)} rows to player_stats.")
         return TaskResult(success=True, data={"rows_upserted": len(upsert_rows), "unmatched": len(unmatched_names)})
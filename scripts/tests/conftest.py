@@ -0,0 +1,109 @@
+"""Shared fixtures for the scripts/tests suite.
+
+``harness`` runs ``runner.run_model`` / ``run_models`` end to end against
+in-memory fakes (no Supabase, no lookups) — used by the incremental-refresh,
+profiling, feature-inputs and feature-values tests. ``harness_model`` is the
+model those tests run.
+"""
+
+import pandas as pd
+import pytest
+
+from scripts.feature_projections import runner
+
+MODEL = "v2_age_adjusted"
+
+
+class _FakeTable:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def upsert(self, rows, on_conflict=None):
+        self.db.upserts.append([dict(r) for r in rows])
+        for r in rows:
+            self.db.rows[(r["model_id"], r["player_id"], r["season"])] = dict(r)
+        return self
+
+    def execute(self):
+        return type("Resp", (), {"data": []})()
+
+
+class _FakeDB:
+    def __init__(self):
+        self.rows = {}
+        self.upserts = []
+
+    def table(self, name):
+        return _FakeTable(self, name)
+
+
+class _FakeSeasonStore:
+    def __init__(self, history):
+        self.history = history
+
+    def player_stats(self, seasons, columns=None):
+        return self.history[self.history["season"].isin(seasons)].reset_index(drop=True)
+
+    def nfl_stats(self, seasons, columns=None):
+        return pd.DataFrame()
+
+
+PLAYERS = [
+    {"id": f"p{i}", "name": f"P{i}", "position": pos, "nfl_team": "KC",
+     "birth_date": "1998-01-01", "is_college": False}
+    for i, pos in enumerate(["QB", "RB", "WR", "TE", "WR", "RB"])
+]
+
+
+def _runner_history(bump: float = 0.0):
+    rows = []
+    for i, _ in enumerate(PLAYERS):
+        for season in (2022, 2023, 2024):
+            ppg = 8.0 + i + (season - 2022)
+            if i == 2 and season == 2024:
+                ppg += bump
+            rows.append({"player_id": f"p{i}", "season": season, "ppg": ppg,
+                         "games_played": 16, "total_points": ppg * 16, "snaps": 600,
+                         "pps": 0.2, "h1_snaps": 300, "h1_games": 8, "h2_snaps": 300, "h2_games": 8})
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def harness(monkeypatch, tmp_path):
+    """``runner`` wired to in-memory fakes: returns ``(db, state)``.
+
+    ``db`` records upserts into ``model_projections``; set ``state["history"]``
+    (e.g. to ``state["make_history"](bump=3.0)``) to change the season data the
+    next run reads. ``state["players"]`` is the fetched ``players`` table.
+    """
+    monkeypatch.setenv("OTTONEU_FEATURE_STORE_DIR", str(tmp_path / "features"))
+    db = _FakeDB()
+    state = {"history": _runner_history(), "players": PLAYERS, "make_history": _runner_history}
+
+    def fake_fetch_all_rows(_sb, table, select="*", filters=None, page_size=1000):
+        if table == "players":
+            return [dict(p) for p in PLAYERS]
+        return []  # player_stats games (expected games) — none needed here
+
+    def fake_existing(_sb, model_id, season):
+        return {pid: row for (mid, pid, s), row in db.rows.items() if mid == model_id and s == season}
+
+    monkeypatch.setattr(runner, "get_supabase_client", lambda: db)
+    monkeypatch.setattr(runner, "_ensure_model_in_db", lambda _sb, md: f"id-{md.name}")
+    monkeypatch.setattr(runner, "fetch_all_rows", fake_fetch_all_rows)
+    monkeypatch.setattr(runner, "open_store", lambda: None)
+    monkeypatch.setattr(runner, "get_all_starter_ids", lambda *_a, **_k: {})
+    monkeypatch.setattr(runner, "load_existing_projections", fake_existing)
+    monkeypatch.setattr(runner, "get_season_data_store", lambda: _FakeSeasonStore(state["history"]))
+    for fn in ("_build_draft_capital_lookup", "_build_depth_charts_lookup", "_build_red_zone_lookup",
+               "_build_ngs_passing_lookup", "_build_coaching_lookup"):
+        monkeypatch.setattr(runner, fn, lambda _sb: {})
+    monkeypatch.setattr(runner, "_build_vegas_lines_lookup", lambda _sb: ({}, {}))
+    monkeypatch.setattr(runner, "_build_qb_ecosystem_lookups", lambda _sb: ({}, {}))
+    return db, state
+
+
+@pytest.fixture
+def harness_model():
+    return MODEL
@@ -0,0 +1,96 @@
+"""Stand-in PostgREST client shared by the fetch_all_rows and Postgres backend tests."""
+
+import threading
+
+
+class FakeQuery:
+    """One PostgREST query builder over ``FakeDB.rows`` (eq/gt/order/limit/range)."""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.ops = []
+        self.cap = db.max_rows
+
+    def select(self, cols, count=None, head=None):
+        self.cols = [c.strip() for c in cols.split(",")]
+        self.head = head
+        return self
+
+    def eq(self, col, value):
+        self.ops.append(("eq", col, value))
+        return self
+
+    def gt(self, col, value):
+        self.ops.append(("gt", col, value))
+        return self
+
+    def order(self, col, **_kwargs):
+        self.ops.append(("order", col))
+        return self
+
+    def limit(self, size):
+        self.ops.append(("limit", size))
+        return self
+
+    def range(self, start, end):
+        self.ops.append(("range", start, end))
+        return self
+
+    def upsert(self, _rows):
+        self.cols, self.head = ["*"], None
+        return self
+
+    def execute(self):
+        with self.db.lock:
+            self.db.calls.append(self.ops)
+            fail = self.db.failures.get(tuple(self.ops), 0)
+            if fail:
+                self.db.failures[tuple(self.ops)] = fail - 1
+        if fail:
+            raise ConnectionError("transient")
+        rows = list(self.db.rows)
+        for op in self.ops:
+            if op[0] == "eq":
+                rows = [r for r in rows if r[op[1]] == op[2]]
+            elif op[0] == "gt":
+                rows = [r for r in rows if r[op[1]] > op[2]]
+            elif op[0] == "order":
+                rows = sorted(rows, key=lambda r: r[op[1]])
+            elif op[0] == "limit":
+                rows = rows[:op[1]]
+            elif op[0] == "range":
+                rows = rows[op[1]:op[2] + 1]
+        if self.head:
+            return type("Resp", (), {"data": [], "count": len(rows) + self.db.count_skew})()
+        if self.cap is not None:
+            rows = rows[:self.cap]
+        if self.cols != ["*"]:
+            rows = [{c: r[c] for c in self.cols} for r in rows]
+        else:
+            rows = [dict(r) for r in rows]
+        return type("Resp", (), {"data": rows})()
+
+
+class FakeDB:
+    """In-memory table that records each executed query's ops in ``calls``.
+
+    ``failures`` maps an ops tuple to how many times it raises first;
+    ``count_skew`` offsets ``count=exact`` heads; ``max_rows`` caps responses.
+    """
+
+    def __init__(self, rows):
+        # Stored out of key order, as a heap table would be.
+        self.rows = list(reversed(rows))
+        self.calls = []
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.count_skew = 0
+        self.max_rows = None
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+def fake_rows(n):
+    return [{"id": f"{i:04d}", "model_id": "m1" if i % 2 else "m2", "season": 2025} for i in range(n)]
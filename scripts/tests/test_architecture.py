@@ -11,6 +11,8 @@ See: docs/ARCHITECTURE.md for the rationale behind each rule.
 
 import json
 import re
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -101,7 +103,7 @@ class TestConfigImportPattern:
          `from scripts.config import get_supabase_client`.
     """
 
-    ALLOWED_FILES = {"config.py", "conftest.py"}
+    ALLOWED_FILES = {"config.py", "db_client.py", "conftest.py"}
 
     def test_no_direct_supabase_create_client(self):
         violations = []
@@ -244,10 +246,17 @@ class TestDependencyDirection:
     of importing task internals.
     """
 
+    # Client modules config.get_supabase_client() imports lazily, and the
+    # leaf data-access modules they build on.
+    CLIENT_MODULES = ("db_client", "mirror_client")
+    DATA_ACCESS_MODULES = ("db_io", "db_client", "mirror_client")
+
     def test_config_does_not_import_other_scripts(self):
-        """config.py must be a leaf dependency — no imports from other modules."""
+        """config.py must be a leaf dependency — no imports from other modules
+        beyond the client factories get_supabase_client() defers to."""
         violations = []
-        pattern = re.compile(r"(?:from|import)\s+scripts\.(?!config)")
+        allowed = "|".join(("config",) + self.CLIENT_MODULES)
+        pattern = re.compile(rf"(?:from|import)\s+scripts\.(?!(?:{allowed})\b)")
         source = (SCRIPTS_DIR / "config.py").read_text()
         for lineno, line in enumerate(source.splitlines(), 1):
             if pattern.search(line):
@@ -260,6 +269,55 @@ class TestDependencyDirection:
             "Violations:\n" + "\n".join(violations)
         )
 
+    def test_data_access_modules_do_not_import_config(self):
+        """db_io / db_client / mirror_client sit under config — never above it."""
+        violations = []
+        pattern = re.compile(r"(?:from|import)\s+scripts(?:\.config\b|\s+import\s+config\b)")
+        for name in self.DATA_ACCESS_MODULES:
+            source = (SCRIPTS_DIR / f"{name}.py").read_text()
+            for lineno, line in enumerate(source.splitlines(), 1):
+                if pattern.search(line):
+                    violations.append(f"  scripts/{name}.py:{lineno}: {line.strip()}")
+
+        assert not violations, (
+            "Data-access modules must not import scripts.config.\n"
+            "FIX: config.get_supabase_client() imports the client modules lazily; importing\n"
+            "config back from them creates a cycle. Keep shared constants in the leaf module.\n"
+            "Violations:\n" + "\n".join(violations)
+        )
+
+    def test_analysis_utils_does_not_import_feature_projections(self):
+        """analysis_utils is a shared data layer under feature_projections."""
+        pattern = re.compile(r"(?:from|import)\s+scripts\.feature_projections")
+        source = (SCRIPTS_DIR / "analysis_utils.py").read_text()
+        violations = [
+            f"  scripts/analysis_utils.py:{lineno}: {line.strip()}"
+            for lineno, line in enumerate(source.splitlines(), 1)
+            if pattern.search(line)
+        ]
+        assert not violations, (
+            "analysis_utils.py must not import from scripts.feature_projections.\n"
+            "FIX: feature_projections builds on analysis_utils. Put shared helpers in\n"
+            "scripts/db_io.py (e.g. call_aggregate for SQL-function RPCs) instead.\n"
+            "Violations:\n" + "\n".join(violations)
+        )
+
+    def test_importing_config_stays_light(self):
+        """`import scripts.config` must not pull in pandas, numpy or httpx."""
+        code = (
+            "import sys, scripts.config; "
+            "print(','.join(m for m in ('pandas', 'numpy', 'httpx') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "", (
+            f"scripts.config imported heavy modules: {result.stdout.strip()}\n"
+            "FIX: config.py holds constants and the client factory only. Put data-access code\n"
+            "in scripts/db_io.py, scripts/db_client.py or scripts/mirror_client.py and import\n"
+            "those lazily from get_supabase_client()."
+        )
+
 
 # ===========================================================================
 # Rule 5: No wildcard imports
@@ -393,7 +451,9 @@ class TestFrontendLayerBoundaries:
 # the /depth-charts season selector) — see the "Supabase pagination" section
 # of CLAUDE.md. Keep this list in sync with the TypeScript equivalent in
 # web/__tests__/lib/architecture.test.ts (LARGE_TABLES).
-LARGE_TABLES = ["player_stats", "nfl_stats", "depth_charts", "model_projections"]
+LARGE_TABLES = [
+    "player_stats", "nfl_stats", "depth_charts", "model_projections", "model_projection_features",
+]
 
 
 class TestSupabasePagination:
@@ -405,7 +465,7 @@ class TestSupabasePagination:
     rows, corrupting weighted-PPG bases, team aggregates, backtests and the UI.
 
     FIX: Read through the paginated helper instead of a bare `.table(...).execute()`:
-        from scripts.config import fetch_all_rows
+        from scripts.db_io import fetch_all_rows
         rows = fetch_all_rows(supabase, "player_stats", "player_id, ppg",
                               filters=[("eq", "season", season)])
     (or `_fetch_seasons_paginated` / `fetch_multi_season_stats` in analysis_utils.)
@@ -0,0 +1,95 @@
+"""SeasonContext / PlayerContext keep the old per-player context dict semantics."""
+
+import pandas as pd
+import pytest
+
+from scripts.feature_projections.context import PlayerContext, SeasonContext, with_base_ppg
+from scripts.feature_projections.runner import _build_context
+
+TEAM_AGGREGATES = {
+    "KC": {"offense_rating": 1.5, "usage_by_season": {2024: {"p1": 0.2}}},
+    "NYJ": {"offense_rating": -0.5, "usage_by_season": {}},
+}
+VEGAS = {("KC", 2025): {"implied_team_total": 27.0}}
+QB_STARTERS = {2024: {"KC": "qb1"}}
+
+
+def _season():
+    return SeasonContext(
+        2025, TEAM_AGGREGATES,
+        positional_means={"WR": 9.0, "QB": 15.0},
+        positional_starter_floors={"WR": 12.0},
+        qb_starters=QB_STARTERS,
+        draft_capital={"p1": {"round": 1, "pick": 10}},
+        pooling_k={"WR": 3.0},
+        vegas_lines=VEGAS,
+        vegas_league_means={2025: 22.0},
+    )
+
+
+class TestPlayerContext:
+    def test_matches_legacy_dict(self):
+        ctx = _season().player("p1", "WR", birth_date="1999-01-01", nfl_team="KC",
+                               team_history={2024: "KC"})
+        assert dict(ctx) == {
+            "target_season": 2025,
+            "all_team_ratings": {"KC": 1.5, "NYJ": -0.5},
+            "vegas_lines": VEGAS,
+            "vegas_league_mean_implied": {2025: 22.0},
+            "birth_date": "1999-01-01",
+            "nfl_team": "KC",
+            "team_offense_rating": 1.5,
+            "team_usage": {2024: {"p1": 0.2}},
+            "team_history": {2024: "KC"},
+            "positional_mean_ppg": 9.0,
+            "positional_starter_floor": 12.0,
+            "pooling_k": 3.0,
+            "draft_capital": {"round": 1, "pick": 10},
+        }
+
+    def test_absent_keys_behave_like_a_dict(self):
+        ctx = _season().player("p9", "TE", birth_date=float("nan"), nfl_team=None)
+        for key in ("birth_date", "team_offense_rating", "positional_mean_ppg",
+                    "draft_capital", "is_qb_starter", "base_ppg", "depth_charts"):
+            assert key not in ctx
+            assert ctx.get(key) is None
+            assert ctx.get(key, "d") == "d"
+            with pytest.raises(KeyError):
+                ctx[key]
+        assert "nfl_team" in ctx and ctx["nfl_team"] is None
+        assert len(ctx) == len(list(ctx))
+
+    def test_qb_fields_only_for_qbs(self):
+        season = _season()
+        qb = season.player("qb1", "QB", nfl_team="KC")
+        assert qb["is_qb_starter"] is True and qb["qb_starters"] is QB_STARTERS
+        assert "qb_starters" not in season.player("p1", "WR", nfl_team="KC")
+
+    def test_season_values_are_shared(self):
+        season = _season()
+        a = season.player("p1", "WR", nfl_team="KC")
+        b = season.player("p2", "WR", nfl_team="NYJ")
+        assert a["all_team_ratings"] is b["all_team_ratings"]
+        with pytest.raises(TypeError):
+            season._values["target_season"] = 2030
+
+    def test_with_base_ppg_copies(self):
+        ctx = _season().player("p1", "WR", nfl_team="KC")
+        based = with_base_ppg(ctx, 12.5)
+        assert isinstance(based, PlayerContext)
+        assert based["base_ppg"] == 12.5 and "base_ppg" not in ctx
+        assert dict(based) == dict(ctx, base_ppg=12.5)
+        assert with_base_ppg({"a": 1}, 3.0) == {"a": 1, "base_ppg": 3.0}
+
+    def test_unknown_lookup_rejected(self):
+        with pytest.raises(TypeError):
+            SeasonContext(2025, {}, vegas=VEGAS)
+
+    def test_build_context_wrapper(self):
+        players = pd.DataFrame([{"player_id_ref": "p1", "position": "WR",
+                                 "birth_date": "1999-01-01", "nfl_team": "KC"}])
+        ctx = _build_context("p1", "WR", players, pd.DataFrame(), 2025, TEAM_AGGREGATES,
+                             {"WR": 9.0}, vegas_lines=VEGAS)
+        assert ctx["birth_date"] == "1999-01-01"
+        assert ctx["team_offense_rating"] == 1.5
+        assert ctx["vegas_lines"] is VEGAS
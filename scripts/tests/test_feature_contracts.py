@@ -10,6 +10,7 @@ from __future__ import annotations
 import pytest
 import pandas as pd
 
+from scripts.feature_projections.feature_inputs import LOOKUPS, feature_inputs
 from scripts.feature_projections.features import FEATURE_REGISTRY
 from scripts.feature_projections.features.base import ProjectionFeature
 
@@ -270,3 +271,98 @@ class TestEdgeCases:
             "p1", "WR", STANDARD_HISTORY, pd.DataFrame(), minimal_ctx,
         )
         assert result is None or isinstance(result, (int, float))
+
+
+# ---------------------------------------------------------------------------
+# Contract: declared inputs (feature_inputs.py)
+# ---------------------------------------------------------------------------
+
+def _full_nfl_row(season, **overrides):
+    row = {
+        "season": season, "player_id": "p1", "games_played": 16, "total_points": 200.0,
+        "ppg": 12.5, "recent_team": "KC", "passing_attempts": 520, "completions": 340,
+        "passing_yards": 3900, "passing_tds": 28, "interceptions": 10,
+        "rushing_attempts": 60, "rushing_yards": 300, "rushing_tds": 3,
+        "targets": 110, "receptions": 75, "receiving_yards": 950, "receiving_tds": 7,
+        "receiving_air_yards": 1100, "offense_snaps": 900, "defense_snaps": 0,
+        "st_snaps": 20, "total_snaps": 920, "target_share": 0.24, "air_yards_share": 0.31,
+        "wopr": 0.58, "racr": 0.86, "fg_made_0_39": 0, "pat_made": 0,
+    }
+    row.update(overrides)
+    return row
+
+
+FULL_HISTORY = make_history_df([
+    {"player_id": "p1", "season": s, "ppg": ppg, "games_played": 16, "total_points": ppg * 16,
+     "snaps": 900, "pps": 0.2, "h1_snaps": 420, "h1_games": 8, "h2_snaps": 480, "h2_games": 8}
+    for s, ppg in ((2022, 11.0), (2023, 13.0), (2024, 12.0))
+])
+ROOKIE_HISTORY = FULL_HISTORY[FULL_HISTORY["season"] == 2024].reset_index(drop=True)
+FULL_NFL_STATS = make_nfl_stats_df(
+    [_full_nfl_row(2022), _full_nfl_row(2023, targets=95), _full_nfl_row(2024, rushing_tds=6)]
+)
+
+# Every lookup populated for p1 / KC, so lookup features produce values.
+FULL_CONTEXT = dict(
+    STANDARD_CONTEXT,
+    draft_capital={"season_drafted": 2021, "round": 1, "overall_pick": 12},
+    vegas_lines={("KC", 2025): {"implied_total": 27.5}},
+    vegas_league_mean_implied={2025: 22.0},
+    depth_charts={("p1", 2025): 1, ("p1", 2024): 2},
+    red_zone={("p1", s): {"rz_carries": 12, "gz_carries": 5, "rz_targets": 15, "gz_targets": 6,
+                          "rz_pass_attempts": 70} for s in (2022, 2023, 2024)},
+    ngs_passing={("p1", s): {"attempts": 500, "completion_pct_above_expectation": 2.1,
+                             "avg_air_yards_to_sticks": -0.5, "aggressiveness": 16.0,
+                             "avg_time_to_throw": 2.8, "avg_air_yards_differential": -1.2}
+                 for s in (2022, 2023, 2024)},
+    qb1_by_team={("KC", 2025): "qb9"},
+    player_team_by_season={("p1", 2025): "KC", ("p1", 2024): "KC"},
+    qb_quality={("KC", 2025): 1.5},
+    team_coaching={("KC", 2025): {"head_coach_changed": True, "coach_tenure_years": 1}},
+    pooling_k=1.2,
+)
+
+
+def _same(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return a == pytest.approx(b)
+
+
+class TestDeclaredInputs:
+    """``compute()`` reads nothing beyond the columns / lookups it declares."""
+
+    @pytest.mark.parametrize("feature_name", list(FEATURE_REGISTRY.keys()))
+    def test_declares_inputs(self, feature_name):
+        cls = FEATURE_REGISTRY[feature_name]
+        assert cls.player_stats_columns is not None
+        assert cls.nfl_stats_columns is not None
+        assert cls.lookups is not None
+        assert set(cls.lookups) <= set(LOOKUPS)
+
+    @pytest.mark.parametrize("feature_name", list(FEATURE_REGISTRY.keys()))
+    def test_pruned_inputs_give_same_values(self, feature_name):
+        feature = FEATURE_REGISTRY[feature_name]()
+        inputs = feature_inputs(feature)
+        excluded = inputs.excluded_context_keys()
+        pruned_ctx = {k: v for k, v in FULL_CONTEXT.items() if k not in excluded}
+        for history in (FULL_HISTORY, ROOKIE_HISTORY):
+            pruned_history = history[list(inputs.player_stats_columns)]
+            pruned_nfl = FULL_NFL_STATS[list(inputs.nfl_stats_columns)]
+            for position in ("QB", "RB", "WR", "TE"):
+                full = feature.compute("p1", position, history, FULL_NFL_STATS, dict(FULL_CONTEXT))
+                pruned = feature.compute("p1", position, pruned_history, pruned_nfl, pruned_ctx)
+                assert _same(full, pruned), (feature_name, position, len(history))
+
+    @pytest.mark.parametrize(
+        "feature_name",
+        [name for name, cls in FEATURE_REGISTRY.items() if cls.lookups],
+    )
+    def test_lookup_features_use_their_lookups(self, feature_name):
+        """The parity test above is not vacuous: with the full context these produce values."""
+        feature = FEATURE_REGISTRY[feature_name]()
+        values = [
+            feature.compute("p1", pos, FULL_HISTORY, FULL_NFL_STATS, dict(FULL_CONTEXT))
+            for pos in ("QB", "RB", "WR", "TE")
+        ]
+        assert any(v is not None for v in values)
@@ -0,0 +1,95 @@
+"""Feature-declared inputs: resolution, pruned season fetches, skipped lookups."""
+
+from typing import Any, Optional
+
+import pandas as pd
+import pytest
+
+from scripts.feature_projections import runner
+from scripts.feature_projections.feature_inputs import (
+    LOOKUPS,
+    NFL_STATS_CORE,
+    PLAYER_STATS_CORE,
+    resolve_inputs,
+)
+from scripts.feature_projections.features import FEATURE_REGISTRY
+from scripts.feature_projections.features.base import ProjectionFeature
+from scripts.feature_projections.model_config import get_model
+
+
+class _Undeclared(ProjectionFeature):
+    @property
+    def name(self) -> str:
+        return "undeclared"
+
+    def compute(self, player_id: str, position: str, history_df: pd.DataFrame,
+                nfl_stats_df: pd.DataFrame, context: dict[str, Any]) -> Optional[float]:
+        return None
+
+
+def _model_inputs(model_name):
+    names = runner._collect_feature_names_recursive(get_model(model_name))
+    return resolve_inputs(FEATURE_REGISTRY[n] for n in dict.fromkeys(names))
+
+
+class TestResolveInputs:
+    def test_small_model_needs_only_core(self):
+        inputs = _model_inputs("v1_baseline_weighted_ppg")
+        assert inputs.nfl_stats_columns == NFL_STATS_CORE
+        assert set(inputs.player_stats_columns) == set(PLAYER_STATS_CORE) | {
+            "h1_snaps", "h1_games", "h2_snaps", "h2_games"
+        }
+        assert inputs.lookups == frozenset()
+        assert "draft_capital" in inputs.excluded_context_keys()
+
+    def test_union_over_features(self):
+        inputs = _model_inputs("v46_xfp_redzone")
+        assert {"red_zone", "draft_capital"} <= inputs.lookups
+        assert "receiving_tds" in inputs.nfl_stats_columns
+        assert "fg_made" not in inputs.nfl_stats_columns
+        assert "qb_ecosystem" not in inputs.lookups
+
+    def test_undeclared_feature_means_everything(self):
+        inputs = resolve_inputs([FEATURE_REGISTRY["weighted_ppg"], _Undeclared()])
+        assert inputs.player_stats_columns is None and inputs.nfl_stats_columns is None
+        assert inputs.lookups == frozenset(LOOKUPS)
+
+    def test_unknown_lookup_rejected(self):
+        class Bad(_Undeclared):
+            lookups = ("weather",)
+
+        with pytest.raises(ValueError, match="weather"):
+            resolve_inputs([Bad()])
+
+
+class TestRunFetchesOnlyDeclaredInputs:
+    @pytest.fixture
+    def calls(self, harness, monkeypatch):
+        built: list[str] = []
+        for fn, empty in (("_build_draft_capital_lookup", {}), ("_build_red_zone_lookup", {}),
+                          ("_build_vegas_lines_lookup", ({}, {})),
+                          ("_build_qb_ecosystem_lookups", ({}, {}))):
+            monkeypatch.setattr(runner, fn, lambda _sb, fn=fn, empty=empty: built.append(fn) or empty)
+        seen: list[tuple] = []
+        store = runner.get_season_data_store()
+        original = store.nfl_stats
+
+        def nfl_stats(seasons, columns=None):
+            seen.append(tuple(columns) if columns is not None else None)
+            return original(seasons, columns)
+
+        monkeypatch.setattr(store, "nfl_stats", nfl_stats)
+        monkeypatch.setattr(runner, "get_season_data_store", lambda: store)
+        return built, seen
+
+    def test_small_model_skips_lookups(self, calls):
+        built, seen = calls
+        runner.run_model("v1_baseline_weighted_ppg", [2025])
+        assert built == []
+        assert seen == [NFL_STATS_CORE]
+
+    def test_lookups_follow_the_models_features(self, calls):
+        built, _ = calls
+        runner.run_model("v46_xfp_redzone", [2025])
+        assert "_build_red_zone_lookup" in built and "_build_draft_capital_lookup" in built
+        assert "_build_qb_ecosystem_lookups" not in built
@@ -5,6 +5,7 @@ Tests feature computation, combiner logic, and model config.
 Pure functions with no DB or network dependencies.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
@@ -49,7 +50,7 @@ from scripts.feature_projections.features.coaching_change import (
 )
 from scripts.feature_projections.combiner import combine_features
 from scripts.feature_projections.model_config import get_model, MODELS, ModelDefinition, PositionOverride
-from scripts.feature_projections.runner import _resolve_features_for_position
+from scripts.feature_projections.model_plan import _resolve_features_for_position
 
 
 # ---------------------------------------------------------------------------
@@ -1962,6 +1963,60 @@ class TestBuildFeatureVector:
         assert "usage_share_raw^2" in names
 
 
+
+class TestDesignMatrixSpec:
+    """The compiled, column-wise layout matches build_feature_vector row for row."""
+
+    TERMS = ["usage_share_raw*position", "usage_share_raw^2", "usage_share_raw*base_ppg",
+             "missing_feat^2", "missing_feat*position", "base_ppg*missing_feat", "unknown"]
+
+    def _rows(self, n=200):
+        import numpy as np
+        rng = np.random.default_rng(7)
+        positions = ["QB", "RB", "WR", "TE", "K"]
+        rows = []
+        for i in range(n):
+            rows.append({
+                "base_ppg": float(rng.normal(10, 4)),
+                "usage_share_raw": None if i % 7 == 0 else float(rng.uniform(0, 0.3)),
+                "age_adj": None if i % 5 == 0 else float(rng.normal()),
+            })
+        return rows, [positions[i % len(positions)] for i in range(n)]
+
+    def test_matches_per_row_vectors(self):
+        import numpy as np
+        from scripts.feature_projections.learned_combiner import DesignMatrixSpec, feature_value_frame
+        rows, positions = self._rows()
+        spec = DesignMatrixSpec.compile(list(rows[0].keys()), self.TERMS)
+        X = spec.matrix(feature_value_frame(rows), positions)
+        expected = np.array([build_feature_vector(fv, pos, self.TERMS) for fv, pos in zip(rows, positions)])
+        np.testing.assert_array_equal(X, expected)
+
+    def test_column_names_match_get_feature_column_names(self):
+        from scripts.feature_projections.learned_combiner import DesignMatrixSpec
+        names = ["usage_share_raw", "base_ppg", "age_adj"]
+        spec = DesignMatrixSpec.compile(names, self.TERMS)
+        assert spec.column_names == get_feature_column_names(names, self.TERMS)
+        assert spec.n_columns == len(spec.column_names)
+
+    def test_missing_columns_and_nan_are_zero(self):
+        import numpy as np
+        from scripts.feature_projections.learned_combiner import DesignMatrixSpec
+        spec = DesignMatrixSpec.compile(["a", "b"], ["a*b", "b*position"])
+        frame = pd.DataFrame({"a": [2.0, float("nan")]})
+        X = spec.matrix(frame, ["WR", "RB"])
+        np.testing.assert_array_equal(X, np.zeros((2, 7)) + np.array([[2.0] + [0.0] * 6, [0.0] * 7]))
+
+    def test_thousands_of_rows_are_fast(self):
+        import time
+        from scripts.feature_projections.learned_combiner import DesignMatrixSpec, feature_value_frame
+        rows, positions = self._rows(5000)
+        spec = DesignMatrixSpec.compile(list(rows[0].keys()), self.TERMS)
+        start = time.perf_counter()
+        X = spec.matrix(feature_value_frame(rows), positions)
+        assert X.shape == (5000, spec.n_columns)
+        assert time.perf_counter() - start < 1.0
+
 class TestLearnedPredict:
     """Tests for the Ridge prediction function."""
 
@@ -2706,6 +2761,108 @@ class TestHuberRegressorTraining:
         assert huber["coefficients"][0] > 0 and ridge["coefficients"][0] > 0
 
 
+class TestRidgeAlphaPath:
+    """One-SVD alpha path matches refitting sklearn Ridge per alpha."""
+
+    ALPHAS = [0.01, 0.1, 1.0, 10.0, 100.0]
+
+    def _problem(self, seed=0, n=120, p=6):
+        rng = np.random.default_rng(seed)
+        X = rng.normal(size=(n, p)) * rng.uniform(0.5, 4.0, size=p)
+        y = X @ rng.normal(size=p) + 6.0 + rng.normal(scale=2.0, size=n)
+        return X[:90], y[:90], X[90:], rng.uniform(0.5, 3.0, size=90)
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    @pytest.mark.parametrize("fit_intercept", [True, False])
+    def test_matches_sklearn_per_alpha(self, weighted, fit_intercept):
+        from sklearn.linear_model import Ridge
+        from scripts.feature_projections.train_model import _ridge_alpha_path
+        X_train, y_train, X_test, w = self._problem()
+        w = w if weighted else None
+        path = _ridge_alpha_path(X_train, y_train, X_test, self.ALPHAS,
+                                 sample_weight=w, fit_intercept=fit_intercept)
+        for alpha, preds in zip(self.ALPHAS, path):
+            ref = Ridge(alpha=alpha, fit_intercept=fit_intercept).fit(X_train, y_train, sample_weight=w)
+            np.testing.assert_allclose(preds, ref.predict(X_test), rtol=1e-9, atol=1e-9)
+
+    def test_rank_deficient_train_matrix(self):
+        from sklearn.linear_model import Ridge
+        from scripts.feature_projections.train_model import _ridge_alpha_path
+        X_train, y_train, X_test, _ = self._problem(seed=1)
+        X_train = np.column_stack([X_train, X_train[:, 0], np.zeros(len(X_train))])
+        X_test = np.column_stack([X_test, X_test[:, 0], np.zeros(len(X_test))])
+        (preds,) = _ridge_alpha_path(X_train, y_train, X_test, [1.0])
+        ref = Ridge(alpha=1.0).fit(X_train, y_train)
+        np.testing.assert_allclose(preds, ref.predict(X_test), rtol=1e-9, atol=1e-9)
+
+    def _training_data(self, seed=2):
+        rng = np.random.default_rng(seed)
+        rows = []
+        for season in (2021, 2022, 2023, 2024):
+            for i in range(40):
+                f1, f2 = rng.normal(10, 4), rng.normal(0, 1)
+                rows.append({
+                    "feature_values": {"f1": f1, "f2": f2},
+                    "position": ["QB", "RB", "WR", "TE"][i % 4],
+                    "season": season,
+                    "actual_ppg": max(0.0, 0.8 * f1 + 1.5 * f2 + rng.normal(scale=3.0)),
+                    "base_ppg": f1,
+                })
+        return pd.DataFrame(rows)
+
+    def _loop_loso(self, data, weights):
+        """The per-alpha refit loop train_ridge_loso used to run."""
+        from sklearn.linear_model import Ridge
+        from sklearn.preprocessing import StandardScaler
+        from scripts.feature_projections.learned_combiner import (
+            DesignMatrixSpec, feature_value_frame,
+        )
+        spec = DesignMatrixSpec.compile(["f1", "f2"], ["f1*position"])
+        X = spec.matrix(feature_value_frame(data["feature_values"]), data["position"].tolist())
+        y = data["actual_ppg"].to_numpy()
+        seasons = data["season"].to_numpy()
+        maes = {}
+        for alpha in self.ALPHAS:
+            fold = []
+            for holdout in sorted(set(seasons)):
+                tr, te = seasons != holdout, seasons == holdout
+                scaler = StandardScaler().fit(X[tr])
+                model = Ridge(alpha=alpha).fit(scaler.transform(X[tr]), y[tr], sample_weight=weights[tr])
+                preds = np.maximum(model.predict(scaler.transform(X[te])), 0.0)
+                fold.append(float(np.mean(np.abs(preds - y[te]))))
+            maes[alpha] = float(np.mean(fold))
+        return maes
+
+    @pytest.mark.parametrize("weight_spec", [None, {"scheme": "topn_step", "k": 1.0}])
+    def test_loso_selects_the_loop_alpha(self, weight_spec):
+        from scripts.feature_projections.train_model import compute_sample_weights, train_ridge_loso
+        data = self._training_data()
+        weights = compute_sample_weights(
+            data["base_ppg"].to_numpy(), data["position"].tolist(),
+            data["season"].to_numpy(), weight_spec or {},
+        )
+        maes = self._loop_loso(data, weights)
+        params = train_ridge_loso(data, interaction_terms=["f1*position"],
+                                  sample_weight_spec=weight_spec)
+        assert params["alpha"] == min(self.ALPHAS, key=lambda a: maes[a])
+        assert params["training_metadata"]["loso_mae"] == pytest.approx(
+            maes[params["alpha"]], rel=1e-9
+        )
+
+    def test_huber_keeps_the_refit_loop(self, monkeypatch):
+        from scripts.feature_projections import train_model
+
+        def _no_path(*args, **kwargs):
+            raise AssertionError("Huber has no closed-form alpha path")
+
+        monkeypatch.setattr(train_model, "_ridge_alpha_path", _no_path)
+        params = train_model.train_ridge_loso(
+            self._training_data(), interaction_terms=[],
+            regressor_spec={"type": "huber", "epsilon": 1.35},
+        )
+        assert params["alpha"] in train_model.HUBER_ALPHA_CANDIDATES
+
+
 # ---------------------------------------------------------------------------
 # Rank-aware training sample weights (#643)
 # ---------------------------------------------------------------------------
@@ -2895,3 +3052,154 @@ class TestNGSPassingFeatures:
         val = NGSCPOERawFeature().compute("qb1", "QB", pd.DataFrame(),
                                           self._nfl([2024]), ctx)
         assert val is None
+
+
+# ---------------------------------------------------------------------------
+# compute_batch — vectorized season-window path
+# ---------------------------------------------------------------------------
+
+class TestComputeBatch:
+    """compute_batch must match per-player compute() exactly (or opt out)."""
+
+    PLAYERS = {
+        "qb_vet": ("QB", "1994-03-01"),
+        "rb_vet": ("RB", "1999-11-20"),
+        "wr_young": ("WR", "2002-06-15"),
+        "wr_rookie": ("WR", "2003-01-10"),
+        "te_zero": ("TE", None),
+        "k_vet": ("K", "1990-08-30"),
+    }
+
+    def _history(self) -> pd.DataFrame:
+        return make_history_df([
+            {"player_id": "qb_vet", "season": 2021, "ppg": 18.0, "games_played": 17},
+            {"player_id": "qb_vet", "season": 2022, "ppg": 20.5, "games_played": 12},
+            {"player_id": "qb_vet", "season": 2023, "ppg": 22.1, "games_played": 16},
+            {"player_id": "qb_vet", "season": 2024, "ppg": 19.4, "games_played": 9},
+            {"player_id": "rb_vet", "season": 2023, "ppg": 11.0, "games_played": 3},
+            {"player_id": "rb_vet", "season": 2024, "ppg": 14.2, "games_played": 17},
+            {"player_id": "wr_young", "season": 2022, "ppg": 6.3, "games_played": 10},
+            {"player_id": "wr_young", "season": 2023, "ppg": 9.8, "games_played": 15},
+            {"player_id": "wr_young", "season": 2024, "ppg": 13.1, "games_played": 16},
+            {"player_id": "wr_rookie", "season": 2024, "ppg": 8.0, "games_played": 14,
+             "h1_snaps": 200, "h1_games": 7, "h2_snaps": 300, "h2_games": 7},
+            {"player_id": "te_zero", "season": 2023, "ppg": 0.0, "games_played": 0},
+            {"player_id": "te_zero", "season": 2024, "ppg": 0.0, "games_played": 0},
+            {"player_id": "k_vet", "season": 2024, "ppg": 8.5, "games_played": 17},
+        ])
+
+    def _season_frame(self) -> pd.DataFrame:
+        df = self._history()
+        df["position"] = df["player_id"].map(lambda p: self.PLAYERS[p][0])
+        df["birth_date"] = df["player_id"].map(lambda p: self.PLAYERS[p][1])
+        return df
+
+    def _assert_parity(self, feature, context: dict) -> None:
+        history = self._history()
+        batch = feature.compute_batch(self._season_frame(), context)
+        assert batch is not None
+        for pid, (position, birth_date) in self.PLAYERS.items():
+            ctx = dict(context, birth_date=birth_date)
+            if "positional_means" in context:
+                # _build_context hands compute() its position's mean only.
+                ctx["positional_mean_ppg"] = context["positional_means"].get(position)
+            expected = feature.compute(
+                pid, position, history[history["player_id"] == pid],
+                pd.DataFrame(), ctx,
+            )
+            got = batch.get(pid)
+            if expected is None:
+                assert got is None or pd.isna(got), pid
+            else:
+                assert got == expected, pid
+
+    @pytest.mark.parametrize("feature_cls", [
+        WeightedPPGFeature,
+        WeightedPPGTunedNoQBFeature,
+        WeightedPPGPerPositionTunedFeature,
+        WeightedPPGRookieGrowthFeature,
+        WeightedPPGRookieGrowthNoQBFeature,
+    ])
+    def test_weighted_ppg_variants_match(self, feature_cls):
+        self._assert_parity(feature_cls(), {"target_season": 2025})
+
+    def test_age_curve_matches(self):
+        self._assert_parity(AgeCurveFeature(), {"target_season": 2025})
+
+    @pytest.mark.parametrize("feature_cls", [WeightedPPGFeature, WeightedPPGTunedNoQBFeature])
+    def test_null_ppg_or_games_propagates_like_compute(self, feature_cls):
+        """A NULL games_played / ppg season is NaN in both paths, not a zero."""
+        # Built directly: make_history_df zero-fills NULLs.
+        history = pd.DataFrame([
+            {"player_id": "null_games", "season": 2023, "ppg": 12.0, "games_played": 16.0},
+            {"player_id": "null_games", "season": 2024, "ppg": 15.0, "games_played": None},
+            {"player_id": "null_ppg", "season": 2022, "ppg": None, "games_played": 10.0},
+            {"player_id": "null_ppg", "season": 2023, "ppg": 9.0, "games_played": 17.0},
+            {"player_id": "null_ppg", "season": 2024, "ppg": 11.0, "games_played": 17.0},
+            {"player_id": "clean", "season": 2023, "ppg": 7.0, "games_played": 8.0},
+            {"player_id": "clean", "season": 2024, "ppg": 10.0, "games_played": 17.0},
+        ])
+        feature = feature_cls()
+        batch = feature.compute_batch(history.assign(position="WR", birth_date=None), {})
+        assert batch is not None
+        for pid in ("null_games", "null_ppg", "clean"):
+            expected = feature.compute(pid, "WR", history[history["player_id"] == pid], pd.DataFrame(), {})
+            if pd.isna(expected):
+                assert pd.isna(batch[pid]), pid
+            else:
+                assert batch[pid] == expected, pid
+        assert batch[["null_games", "null_ppg"]].isna().all()
+
+    def test_position_mean_matches(self):
+        means = {"QB": 17.2, "RB": 9.1, "WR": 8.4, "TE": 6.0}
+        self._assert_parity(PositionMeanFeature(), {"positional_means": means})
+
+    def test_naive_prior_ppg_matches(self):
+        self._assert_parity(NaivePriorSeasonPPGFeature(), {"target_season": 2025})
+
+    def test_history_rewriting_subclass_opts_out(self):
+        """xFP-style subclasses override compute() → per-player fallback."""
+        assert WeightedXFPTunedNoQBFeature().compute_batch(self._season_frame(), {}) is None
+
+    def test_default_is_none(self):
+        assert TeamContextFeature().compute_batch(self._season_frame(), {}) is None
+
+    def test_combiner_uses_precomputed(self):
+        """Precomputed raw values replace compute() and still get weighted."""
+        base = WeightedPPGFeature()
+        df = make_history_df([
+            {"season": 2023, "ppg": 10.0, "games_played": 17},
+            {"season": 2024, "ppg": 20.0, "games_played": 17},
+        ])
+        direct, direct_values = combine_features([base], "p1", "QB", df, pd.DataFrame(), {})
+        cached, cached_values = combine_features(
+            [base], "p1", "QB", df, pd.DataFrame(), {},
+            precomputed={"weighted_ppg": direct_values["weighted_ppg"]},
+        )
+        assert cached == direct
+        assert cached_values == direct_values
+
+        overridden, _ = combine_features(
+            [base], "p1", "QB", pd.DataFrame(), pd.DataFrame(), {},
+            precomputed={"weighted_ppg": 12.5},
+        )
+        assert overridden == pytest.approx(12.5)
+
+    def test_runner_batch_helper(self):
+        """_compute_batch_features keeps only batch-capable features, NaN → None."""
+        from scripts.feature_projections.runner import (
+            _compute_batch_features,
+            _player_precomputed,
+        )
+        players_df = pd.DataFrame([
+            {"player_id_ref": pid, "position": pos, "birth_date": bd}
+            for pid, (pos, bd) in self.PLAYERS.items()
+        ])
+        pool = {"weighted_ppg": WeightedPPGFeature(), "team_context": TeamContextFeature()}
+        batch = _compute_batch_features(pool, self._history(), players_df, 2025, {})
+        assert set(batch) == {"weighted_ppg"}
+        assert batch["weighted_ppg"]["te_zero"] is None
+        assert _player_precomputed(batch, "rb_vet") == {
+            "weighted_ppg": batch["weighted_ppg"]["rb_vet"]
+        }
+        assert _player_precomputed(batch, "unknown") == {}
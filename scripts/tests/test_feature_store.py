@@ -0,0 +1,130 @@
+"""Tests for the persistent per-feature value store (.cache/features)."""
+
+import pandas as pd
+import pytest
+
+from scripts import config
+from scripts.feature_projections.combiner import combine_features
+from scripts.feature_projections.feature_store import FeatureStore, feature_code_hash
+from scripts.feature_projections.features.age_curve import AgeCurveFeature
+from scripts.feature_projections.features.team_context import TeamContextFeature
+from scripts.feature_projections.features.weighted_ppg import (
+    WeightedPPGFeature,
+    WeightedPPGTunedNoQBFeature,
+)
+from scripts.feature_projections.features.xfp_redzone import WeightedXFPRedZoneFeature
+
+
+def _history():
+    return pd.DataFrame([
+        {"player_id": "p1", "season": 2023, "ppg": 10.0, "games_played": 17},
+        {"player_id": "p1", "season": 2024, "ppg": 14.0, "games_played": 15},
+    ])
+
+
+def _context():
+    return {
+        "target_season": 2025,
+        "birth_date": "1997-02-01",
+        "team_offense_rating": 2.0,
+        "nfl_team": "KC",
+        "all_team_ratings": {"KC": 2.0},
+        "team_history": {2023: "KC", 2024: "KC"},
+    }
+
+
+def _counting(cls):
+    calls = []
+
+    class Counting(cls):
+        def compute(self, *args, **kwargs):
+            calls.append(1)
+            return super().compute(*args, **kwargs)
+
+    return Counting(), calls
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "features.sqlite"
+
+
+class TestFeatureStore:
+    def test_second_run_served_from_disk(self, store_path):
+        features = [WeightedPPGFeature(), AgeCurveFeature(), TeamContextFeature()]
+        expected = combine_features(features, "p1", "WR", _history(), pd.DataFrame(), _context())
+
+        first = FeatureStore(store_path)
+        got = combine_features(list(first.wrap({f.name: f for f in features}).values()),
+                               "p1", "WR", _history(), pd.DataFrame(), _context())
+        first.close()
+        assert got == expected
+        assert first.misses == 3 and first.hits == 0
+
+        second = FeatureStore(store_path)
+        again = combine_features(list(second.wrap({f.name: f for f in features}).values()),
+                                 "p1", "WR", _history(), pd.DataFrame(), _context())
+        second.close()
+        assert again == expected
+        assert second.hits == 3 and second.misses == 0
+
+    def test_changed_inputs_miss(self, store_path):
+        age, calls = _counting(AgeCurveFeature)
+        store = FeatureStore(store_path)
+        wrapped = store.wrap({"age_curve": age})["age_curve"]
+        ctx = dict(_context(), base_ppg=12.0)
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), ctx)
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), dict(ctx))
+        assert len(calls) == 1
+        # Different base_ppg / history / position → recompute.
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), dict(ctx, base_ppg=13.0))
+        changed = _history().assign(ppg=[10.0, 15.0])
+        wrapped.compute("p1", "WR", changed, pd.DataFrame(), ctx)
+        wrapped.compute("p1", "RB", _history(), pd.DataFrame(), ctx)
+        assert len(calls) == 4
+        store.close()
+
+    def test_changed_scoring_settings_miss(self, store_path, monkeypatch):
+        wpp, calls = _counting(WeightedPPGFeature)
+        store = FeatureStore(store_path)
+        wrapped = store.wrap({"weighted_ppg": wpp})["weighted_ppg"]
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), _context())
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), _context())
+        assert len(calls) == 1
+        monkeypatch.setitem(config.SCORING_SETTINGS, "receiving_tds",
+                            config.SCORING_SETTINGS["receiving_tds"] + 1)
+        wrapped = store.wrap({"weighted_ppg": wpp})["weighted_ppg"]  # the next run
+        wrapped.compute("p1", "WR", _history(), pd.DataFrame(), _context())
+        assert len(calls) == 2
+        store.close()
+
+    def test_none_values_are_cached(self, store_path):
+        team, calls = _counting(TeamContextFeature)
+        store = FeatureStore(store_path)
+        wrapped = store.wrap({"team_context": team})["team_context"]
+        assert wrapped.compute("p1", "WR", _history(), pd.DataFrame(), {"target_season": 2025}) is None
+        assert wrapped.compute("p1", "WR", _history(), pd.DataFrame(), {"target_season": 2025}) is None
+        assert len(calls) == 1
+        store.close()
+
+
+class TestFeatureCodeHash:
+    def test_distinct_per_feature_module(self):
+        assert feature_code_hash(AgeCurveFeature()) != feature_code_hash(TeamContextFeature())
+
+    def test_subclass_hash_covers_parent_module(self):
+        # xfp_redzone subclasses weighted_ppg; both modules feed its hash, so it
+        # differs from the parent's own hash.
+        assert feature_code_hash(WeightedXFPRedZoneFeature()) != feature_code_hash(
+            WeightedPPGTunedNoQBFeature()
+        )
+
+    def test_scoring_settings_change_hash(self, monkeypatch):
+        before = feature_code_hash(AgeCurveFeature())
+        monkeypatch.setitem(config.SCORING_SETTINGS, "receptions", config.SCORING_SETTINGS["receptions"] + 0.5)
+        assert feature_code_hash(AgeCurveFeature()) != before
+
+    def test_patched_constant_changes_hash(self, monkeypatch):
+        before = feature_code_hash(WeightedPPGFeature())
+        monkeypatch.setattr(WeightedPPGFeature, "RECENCY_WEIGHTS", [0.5, 0.3, 0.2])
+        assert feature_code_hash(WeightedPPGFeature()) != before
@@ -0,0 +1,175 @@
+"""Typed feature-values storage: wide-frame readers and the jsonb fallback."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.feature_projections import feature_values, runner
+from scripts.feature_projections.external_sources import ingest_external
+from scripts.feature_projections.feature_values import (
+    FEATURES_TABLE,
+    feature_dicts,
+    fetch_feature_frame,
+)
+
+NARROW = [
+    {"player_id": "p1", "season": 2024, "feature": "weighted_ppg", "value": 12.5},
+    {"player_id": "p1", "season": 2024, "feature": "age_curve", "value": -0.4},
+    {"player_id": "p2", "season": 2024, "feature": "weighted_ppg", "value": 8.0},
+    {"player_id": "p2", "season": 2024, "feature": "age_curve", "value": None},
+    {"player_id": "p1", "season": 2025, "feature": "weighted_ppg", "value": 13.0},
+]
+PROJECTIONS = [
+    {"player_id": "p1", "season": 2024, "feature_values": {"weighted_ppg": 12.5, "age_curve": -0.4}},
+    {"player_id": "p2", "season": 2024, "feature_values": json.dumps({"weighted_ppg": 8.0, "age_curve": None})},
+    {"player_id": "p1", "season": 2025, "feature_values": {"weighted_ppg": 13.0}},
+]
+
+
+class _MissingTable(Exception):
+    code = "PGRST205"
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    state = {"narrow": NARROW}
+
+    def fake_fetch_all_rows(_sb, table, select="*", filters=None):
+        calls.append((table, select, filters))
+        if table == FEATURES_TABLE:
+            if isinstance(state["narrow"], Exception):
+                raise state["narrow"]
+            wanted = {v for op, col, v in filters or [] if col == "feature" for v in v}
+            return [r for r in state["narrow"] if not wanted or r["feature"] in wanted]
+        return list(PROJECTIONS)
+
+    monkeypatch.setattr(feature_values, "fetch_all_rows", fake_fetch_all_rows)
+    return calls, state
+
+
+def _by_player(frame):
+    return frame.set_index(["player_id", "season"])
+
+
+class TestFetchFeatureFrame:
+    def test_narrow_rows_pivot_to_float_columns(self, reads):
+        calls, _ = reads
+        frame = fetch_feature_frame(object(), "m1", [2024, 2025])
+        assert list(frame.columns) == ["player_id", "season", "age_curve", "weighted_ppg"]
+        assert (frame[["age_curve", "weighted_ppg"]].dtypes == np.float64).all()
+        wide = _by_player(frame)
+        assert wide.loc[("p1", 2024), "weighted_ppg"] == 12.5
+        assert np.isnan(wide.loc[("p2", 2024), "age_curve"])
+        assert np.isnan(wide.loc[("p1", 2025), "age_curve"])
+        assert [table for table, *_ in calls] == [FEATURES_TABLE]
+
+    def test_feature_subset_is_filtered_in_the_query(self, reads):
+        calls, _ = reads
+        frame = fetch_feature_frame(object(), "m1", [2024], features=["weighted_ppg", "missing"])
+        assert list(frame.columns) == ["player_id", "season", "weighted_ppg", "missing"]
+        assert frame["missing"].isna().all()
+        (_table, select, filters), = calls
+        assert select == "player_id, season, feature, value"
+        assert ("in_", "feature", ["weighted_ppg", "missing"]) in filters
+        assert ("eq", "model_id", "m1") in filters
+
+    def test_no_rows_gives_an_empty_frame(self, reads):
+        _, state = reads
+        state["narrow"] = []
+        frame = fetch_feature_frame(object(), "m1", [2030], features=["weighted_ppg"])
+        assert frame.empty and list(frame.columns) == ["player_id", "season", "weighted_ppg"]
+
+    @pytest.mark.parametrize("error", [_MissingTable("gone"), FileNotFoundError("mirror")])
+    def test_falls_back_to_jsonb_column(self, reads, error):
+        calls, state = reads
+        narrow = fetch_feature_frame(object(), "m1", [2024, 2025])
+        state["narrow"] = error
+        fallback = fetch_feature_frame(object(), "m1", [2024, 2025])
+        assert calls[-1][0] == "model_projections"
+        pd.testing.assert_frame_equal(
+            _by_player(fallback).sort_index(), _by_player(narrow).sort_index()
+        )
+
+    def test_other_errors_propagate(self, reads):
+        _, state = reads
+        state["narrow"] = RuntimeError("timeout")
+        with pytest.raises(RuntimeError):
+            fetch_feature_frame(object(), "m1", [2024])
+
+    def test_feature_dicts(self, reads):
+        dicts = feature_dicts(fetch_feature_frame(object(), "m1", [2024]))
+        assert dicts[("p2", 2024)] == {"age_curve": None, "weighted_ppg": 8.0}
+
+
+class TestRunnerWritesObjects:
+    def test_feature_values_are_upserted_as_objects(self, harness, harness_model):
+        db, _ = harness
+        runner.run_model(harness_model, [2025])
+        values = [row["feature_values"] for row in db.rows.values()]
+        assert values and all(isinstance(v, dict) for v in values)
+        assert all(isinstance(x, (float, type(None))) for v in values for x in v.values())
+
+
+class _TriggerDB:
+    """``model_projections`` upserts mirrored the way migration 036's trigger does."""
+
+    def __init__(self):
+        self.projections = {}
+        self.narrow = {}
+
+    def table(self, name):
+        db = self
+
+        class _Upsert:
+            def upsert(self, rows, on_conflict=None):
+                for r in rows:
+                    key = (r["model_id"], r["player_id"], r["season"])
+                    db.projections[key] = dict(r)
+                    fv = r["feature_values"]
+                    # jsonb_typeof(...) = 'object' only; strings get no rows.
+                    db.narrow[key] = [
+                        {"player_id": key[1], "season": key[2], "feature": k,
+                         "value": float(v) if isinstance(v, (int, float)) else None}
+                        for k, v in fv.items()
+                    ] if isinstance(fv, dict) else []
+                return self
+
+            def execute(self):
+                return type("Resp", (), {"data": []})()
+
+        assert name == "model_projections"
+        return _Upsert()
+
+    def fetch_all_rows(self, _sb, table, select="*", filters=None):
+        if table == FEATURES_TABLE:
+            return [r for rows in self.narrow.values() for r in rows]
+        return list(self.projections.values())
+
+
+class TestExternalIngest:
+    def test_ingested_snapshots_reach_the_narrow_table(self, monkeypatch):
+        db = _TriggerDB()
+        fp = pd.DataFrame([
+            {"player_name": "A", "position": "QB", "team": "KC", "player_id": "p1",
+             "pass_yds": 4200, "pass_tds": 30, "rush_yds": 200},
+            {"player_name": "B", "position": "WR", "team": "BUF", "player_id": "p2",
+             "receptions": 90, "rec_yds": 1100, "rec_tds": 8},
+        ])
+        monkeypatch.setattr(ingest_external, "get_supabase_client", lambda: db)
+        monkeypatch.setattr(ingest_external, "_ensure_model_in_db", lambda _sb, _md: "m-fp")
+        monkeypatch.setattr(ingest_external, "fetch_all_rows",
+                            lambda *_a, **_k: [{"id": "p1", "name": "A", "position": "QB", "nfl_team": "KC"}])
+        monkeypatch.setattr(ingest_external, "build_player_index", lambda _df: {})
+        monkeypatch.setattr(ingest_external, "fetch_all_positions", lambda _season: fp)
+        monkeypatch.setattr(ingest_external, "match_dataframe", lambda df, _index: df)
+        monkeypatch.setattr(feature_values, "fetch_all_rows", db.fetch_all_rows)
+
+        assert ingest_external.ingest_fantasypros([2025]) == 2
+        assert all(isinstance(r["feature_values"], dict) for r in db.projections.values())
+        frame = _by_player(fetch_feature_frame(db, "m-fp", [2025]))
+        assert frame.loc[("p1", 2025), "pass_yds"] == 4200.0
+        assert frame.loc[("p2", 2025), "rec_yds"] == 1100.0
+        assert frame["source"].isna().all()  # non-numeric values are stored as NULL
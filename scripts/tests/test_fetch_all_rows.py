@@ -0,0 +1,193 @@
+"""fetch_all_rows: keyset pagination by the table's unique key, offset fallback,
+and the concurrent (count + parallel ranges) mode."""
+
+import pytest
+
+from scripts import db_io
+from scripts.db_io import fetch_all_rows, keyset_key
+from scripts.tests.postgrest_fakes import FakeDB, fake_rows
+
+
+class TestKeysetPagination:
+    def test_pages_by_primary_key(self):
+        db = FakeDB(fake_rows(25))
+        rows = fetch_all_rows(db, "model_projections", "id, model_id",
+                              filters=[("eq", "model_id", "m1")], page_size=5)
+        assert [r["id"] for r in rows] == [f"{i:04d}" for i in range(1, 25, 2)]
+        assert len(db.calls) == 3
+        assert db.calls[0] == [("eq", "model_id", "m1"), ("order", "id"), ("limit", 5)]
+        assert db.calls[1][1] == ("gt", "id", "0009")
+        assert not any(op[0] == "range" for call in db.calls for op in call)
+
+    def test_key_added_to_select_and_dropped(self):
+        db = FakeDB(fake_rows(7))
+        rows = fetch_all_rows(db, "player_stats", "season", page_size=3)
+        assert rows == [{"season": 2025}] * 7
+        assert len(db.calls) == 3
+
+    def test_exact_multiple_of_page_size_terminates(self):
+        db = FakeDB(fake_rows(6))
+        assert len(fetch_all_rows(db, "nfl_stats", page_size=3)) == 6
+        assert len(db.calls) == 3
+
+    def test_offset_fallback(self):
+        assert keyset_key("league_calendar") is None
+        assert keyset_key("unknown_table") is None
+        assert keyset_key("oauth_refresh_tokens") == "token_hash"
+        db = FakeDB(fake_rows(5))
+        assert len(fetch_all_rows(db, "league_calendar", page_size=2)) == 5
+        assert db.calls[1] == [("range", 2, 3)]
+        db = FakeDB(fake_rows(5))
+        assert len(fetch_all_rows(db, "players", page_size=2, key=None)) == 5
+        assert db.calls[0] == [("range", 0, 1)]
+
+    def test_caller_supplied_key(self):
+        db = FakeDB(fake_rows(4))
+        rows = fetch_all_rows(db, "transactions", "model_id", page_size=2, key="id")
+        assert len(rows) == 4 and all(set(r) == {"model_id"} for r in rows)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(db_io.time, "sleep", lambda _s: None)
+
+
+class TestConcurrentFetch:
+    def test_counts_then_fetches_ranges_in_order(self):
+        db = FakeDB(fake_rows(23))
+        rows = fetch_all_rows(db, "model_projections", "model_id", page_size=5, workers=3)
+        expected = fetch_all_rows(FakeDB(fake_rows(23)), "model_projections", "model_id", page_size=5)
+        assert rows == expected and len(rows) == 23
+        assert db.calls[0] == []  # count=exact head request
+        ranges = sorted(op for call in db.calls for op in call if op[0] == "range")
+        assert ranges == [("range", o, o + 4) for o in range(0, 25, 5)]
+        assert all(("order", "id") in call for call in db.calls[1:])
+
+    def test_failed_page_retried_individually(self, no_backoff):
+        db = FakeDB(fake_rows(12))
+        db.failures[(("order", "id"), ("range", 5, 9))] = 2
+        rows = fetch_all_rows(db, "nfl_stats", page_size=5, workers=4)
+        assert [r["id"] for r in rows] == [f"{i:04d}" for i in range(12)]
+        assert sum(("range", 5, 9) in call for call in db.calls) == 3
+        assert sum(("range", 0, 4) in call for call in db.calls) == 1
+
+    def test_persistent_failure_raises(self, no_backoff):
+        db = FakeDB(fake_rows(12))
+        db.failures[(("order", "id"), ("range", 10, 14))] = db_io.FETCH_PAGE_RETRIES
+        with pytest.raises(ConnectionError):
+            fetch_all_rows(db, "nfl_stats", page_size=5, workers=2)
+
+    def test_server_cap_below_page_size_falls_back(self):
+        db = FakeDB(fake_rows(12))
+        db.max_rows = 3  # PostgREST max-rows smaller than page_size
+        rows = fetch_all_rows(db, "nfl_stats", page_size=5, workers=2)
+        # Short non-final pages can't be trusted: the read is redone sequentially,
+        # so the result is exactly what the sequential path returns.
+        sequential = FakeDB(fake_rows(12))
+        sequential.max_rows = 3
+        assert rows == fetch_all_rows(sequential, "nfl_stats", page_size=5)
+        assert any(("limit", 5) in call for call in db.calls)
+
+    def test_rows_added_after_count_are_not_dropped(self):
+        db = FakeDB(fake_rows(15))
+        db.count_skew = -5  # count taken before the last 5 rows were inserted
+        rows = fetch_all_rows(db, "nfl_stats", page_size=5, workers=2)
+        assert [r["id"] for r in rows] == [f"{i:04d}" for i in range(15)]
+
+    def test_small_and_keyless_reads_stay_sequential(self):
+        db = FakeDB(fake_rows(4))
+        assert len(fetch_all_rows(db, "nfl_stats", page_size=5, workers=4)) == 4
+        assert not any(op[0] == "range" for call in db.calls for op in call)
+        db = FakeDB(fake_rows(7))
+        assert len(fetch_all_rows(db, "league_calendar", page_size=5, workers=4)) == 7
+        assert db.calls[0] == [("range", 0, 4)]
+
+
+class TestQueryCache:
+    @pytest.fixture(autouse=True)
+    def _enabled(self, monkeypatch):
+        monkeypatch.setattr(db_io.QUERY_CACHE, "enabled", True)
+        yield
+        db_io.QUERY_CACHE.invalidate()
+
+    def test_off_by_default_and_enable_respects_env(self, monkeypatch):
+        monkeypatch.delenv("OTTONEU_QUERY_CACHE", raising=False)
+        cache = db_io.QueryCache()
+        assert not cache.enabled
+        db = FakeDB(fake_rows(3))
+        cache.put(db, ("players",), [{"id": "0000"}])
+        assert cache.get(db, ("players",)) is None
+        cache.enable()
+        assert cache.enabled
+        monkeypatch.setenv("OTTONEU_QUERY_CACHE", "off")
+        cache = db_io.QueryCache()
+        cache.enable()
+        assert not cache.enabled
+
+    def test_repeated_identical_reads_are_free(self):
+        db = FakeDB(fake_rows(7))
+        first = fetch_all_rows(db, "players", "id, model_id", page_size=5)
+        calls = len(db.calls)
+        second = fetch_all_rows(db, "players", "id, model_id", page_size=5)
+        assert second == first and len(db.calls) == calls
+        second[0]["model_id"] = "mutated"
+        assert fetch_all_rows(db, "players", "id, model_id")[0]["model_id"] != "mutated"
+        fetch_all_rows(db, "players", "id, model_id", filters=[("eq", "model_id", "m1")])
+        assert len(db.calls) > calls
+
+    def test_clients_do_not_share_entries(self):
+        fetch_all_rows(FakeDB(fake_rows(3)), "players", "id")
+        assert len(fetch_all_rows(FakeDB(fake_rows(5)), "players", "id")) == 5
+
+    def test_ttl_and_lru(self, monkeypatch):
+        cache = db_io.QueryCache(maxsize=2, ttl=10.0)
+        cache.enabled = True
+        now = [100.0]
+        monkeypatch.setattr(db_io.time, "monotonic", lambda: now[0])
+        client = object()
+        cache.put(client, ("a",), [{"x": 1}])
+        cache.put(client, ("b",), [{"x": 2}])
+        assert cache.get(client, ("a",)) == [{"x": 1}]
+        cache.put(client, ("c",), [{"x": 3}])  # evicts the least recently used ("b")
+        assert cache.get(client, ("b",)) is None and len(cache) == 2
+        now[0] += 11
+        assert cache.get(client, ("a",)) is None
+
+    def test_writes_through_client_invalidate_table(self):
+        db = FakeDB(fake_rows(3))
+        client = db_io.WriteInvalidatingClient(db)
+        seen = []
+        db_io.QUERY_CACHE.add_listener(seen.append)
+        try:
+            fetch_all_rows(client, "players", "id")
+            fetch_all_rows(client, "nfl_stats", "id")
+            calls = len(db.calls)
+            write = client.table("players").upsert([{"id": "0009"}])
+            fetch_all_rows(client, "players", "id")
+            assert len(db.calls) == calls and seen == []  # built, not yet executed
+            write.execute()
+            fetch_all_rows(client, "players", "id")
+            fetch_all_rows(client, "nfl_stats", "id")
+            assert len(db.calls) == calls + 2  # the write, then one re-read
+            assert seen == ["players"]
+        finally:
+            db_io.QUERY_CACHE._listeners.remove(seen.append)
+
+    def test_read_racing_a_write_is_not_cached(self):
+        db = FakeDB(fake_rows(3))
+        client = db_io.WriteInvalidatingClient(db)
+        fetch_rows = db_io._fetch_all_rows
+
+        def write_mid_read(*args, **kwargs):
+            rows = fetch_rows(*args, **kwargs)
+            client.table("players").upsert([{"id": "0009"}]).execute()
+            return rows
+
+        db_io._fetch_all_rows = write_mid_read
+        try:
+            fetch_all_rows(client, "players", "id")
+        finally:
+            db_io._fetch_all_rows = fetch_rows
+        calls = len(db.calls)
+        fetch_all_rows(client, "players", "id")
+        assert len(db.calls) > calls
@@ -4,13 +4,16 @@ Exercises the pure, deterministic core that needs no DB access: the
 expanding-window fold generator and the cluster bootstrap's resampling unit.
 """
 
+import json
+
 import numpy as np
 import pytest
 
-from scripts.feature_projections import holdout_cache
+from scripts.feature_projections import holdout_cache, holdout_eval
 from scripts.feature_projections.backtest import rank_metrics
 from scripts.feature_projections.holdout_eval import (
     _restrict_to_harmonized_population,
+    _retrain_learned,
     rolling_folds,
 )
 from scripts.feature_projections.significance import (
@@ -160,6 +163,67 @@ class TestHoldoutCache:
         assert holdout_cache.load(model, [2021], [2024]) is not None
 
 
+def _fake_retrain(model_name, train_seasons, eval_seasons, models_dir):
+    """Stand-in for a held-out retrain: records what its sandbox held."""
+    sandbox = {path.name: json.loads(path.read_text()) for path in sorted(models_dir.iterdir())}
+    params = {"model": model_name, "train": train_seasons, "sandbox": sandbox}
+    return {s: {"p1": float(len(train_seasons))} for s in eval_seasons}, params
+
+
+class TestRetrainScheduler:
+    CHAIN = ["v26_vegas_residual", "v20_learned_usage", "v25_draft_capital_residual",
+             "v22_advanced_receiving"]
+    FOLDS = [([2021, 2022], [2023]), ([2021, 2022, 2023], [2024])]
+
+    @pytest.fixture(autouse=True)
+    def _sandboxed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(holdout_cache, "CACHE_DIR", tmp_path / "holdout")
+        monkeypatch.setattr(holdout_eval, "_learned_preds_for_eval", _fake_retrain)
+
+    def test_residual_sandbox_holds_only_its_same_fold_base(self):
+        folds = _retrain_learned(self.FOLDS, self.CHAIN, use_cache=True)
+        assert [list(f) for f in folds] == [
+            ["v20_learned_usage", "v22_advanced_receiving",
+             "v25_draft_capital_residual", "v26_vegas_residual"],
+        ] * 2
+        for (train, ev), preds in zip(self.FOLDS, folds):
+            assert preds["v22_advanced_receiving"] == {ev[0]: {"p1": float(len(train))}}
+            stored = holdout_cache.load("v26_vegas_residual", train, ev)["params"]
+            (base_file, base), = stored["sandbox"].items()
+            assert base_file == "v25_draft_capital_residual.json"
+            assert base["train"] == train
+            assert list(base["sandbox"]) == ["v22_advanced_receiving.json"]
+            assert holdout_cache.load("v22_advanced_receiving", train, ev)["params"]["sandbox"] == {}
+
+    def test_pool_matches_serial(self):
+        serial = _retrain_learned(self.FOLDS, self.CHAIN, use_cache=False)
+        pooled = _retrain_learned(self.FOLDS, self.CHAIN, use_cache=False, workers=3)
+        assert pooled == serial
+
+    def test_cache_hit_feeds_dependents_without_retraining(self, monkeypatch):
+        train, ev = self.FOLDS[0]
+        cached = {"model": "cached-base"}
+        holdout_cache.store("v22_advanced_receiving", train, ev, cached, {ev[0]: {"p1": 9.0}})
+        calls = []
+
+        def recording(model_name, *args):
+            calls.append(model_name)
+            return _fake_retrain(model_name, *args)
+
+        monkeypatch.setattr(holdout_eval, "_learned_preds_for_eval", recording)
+        (preds,) = _retrain_learned(self.FOLDS[:1], self.CHAIN[2:], use_cache=True)
+        assert calls == ["v25_draft_capital_residual"]
+        assert preds["v22_advanced_receiving"] == {ev[0]: {"p1": 9.0}}
+        stored = holdout_cache.load("v25_draft_capital_residual", train, ev)["params"]
+        assert stored["sandbox"] == {"v22_advanced_receiving.json": cached}
+
+    def test_base_outside_the_set_leaves_an_empty_sandbox(self):
+        (preds,) = _retrain_learned(self.FOLDS[:1], ["v25_draft_capital_residual"], use_cache=True)
+        assert list(preds) == ["v25_draft_capital_residual"]
+        stored = holdout_cache.load("v25_draft_capital_residual", *self.FOLDS[0])["params"]
+        assert stored["sandbox"] == {}
+
+
 class TestRankMetrics:
     def test_perfect_ordering(self):
         proj = [1.0, 2.0, 3.0, 4.0, 5.0]
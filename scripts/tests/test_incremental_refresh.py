@@ -0,0 +1,83 @@
+"""Incremental projection refresh: skip unchanged players, upsert only diffs."""
+
+import json
+
+from scripts.feature_projections import runner
+from scripts.feature_projections.incremental import record_changed
+
+
+class TestIncrementalRefresh:
+    def test_full_then_noop_then_one_player(self, harness, harness_model):
+        db, state = harness
+        first = runner.run_model(harness_model, [2025], incremental=True)
+        assert first == len(state["players"])
+
+        db.upserts.clear()
+        assert runner.run_model(harness_model, [2025], incremental=True) == 0
+        assert db.upserts == []
+
+        # One player's latest season changes → only that row is rewritten.
+        state["history"] = state["make_history"](bump=3.0)
+        assert runner.run_model(harness_model, [2025], incremental=True) == 1
+        assert [r["player_id"] for batch in db.upserts for r in batch] == ["p2"]
+
+    def test_incremental_rows_match_full_run(self, harness, harness_model):
+        db, state = harness
+        runner.run_model(harness_model, [2025])
+        full = {k: dict(v) for k, v in db.rows.items()}
+        db.rows.clear()
+        runner.run_model(harness_model, [2025], incremental=True)
+        state["history"] = state["make_history"](bump=3.0)
+        runner.run_model(harness_model, [2025], incremental=True)
+        db_full = dict(db.rows)
+        db.rows.clear()
+        runner.run_model(harness_model, [2025])
+        assert db.rows == db_full
+        assert set(full) == set(db_full)
+
+
+class TestParallelRun:
+    """``workers > 1`` fans out to a fork pool; output must match serial."""
+
+    def test_workers_match_serial(self, harness, harness_model):
+        db, _ = harness
+        runner.run_models([harness_model, "v1_baseline_weighted_ppg"], [2024, 2025])
+        serial = [list(batch) for batch in db.upserts]
+        db.upserts.clear()
+        runner.run_models([harness_model, "v1_baseline_weighted_ppg"], [2024, 2025], workers=3)
+        assert db.upserts == serial
+
+    def test_incremental_with_workers(self, harness, harness_model):
+        db, state = harness
+        assert runner.run_model(harness_model, [2025], incremental=True, workers=2) == len(state["players"])
+        db.upserts.clear()
+        state["history"] = state["make_history"](bump=3.0)
+        assert runner.run_model(harness_model, [2025], incremental=True, workers=2) == 1
+        assert [r["player_id"] for batch in db.upserts for r in batch] == ["p2"]
+
+    def test_shards_are_contiguous_and_ordered(self):
+        ids = [f"p{i}" for i in range(7)]
+        shards = runner._shard(ids, 3)
+        assert len(shards) == 3
+        assert [pid for shard in shards for pid in shard] == ids
+        assert runner._shard([], 4) == []
+        assert runner._shard(ids[:2], 8) == [["p0"], ["p1"]]
+
+
+class TestRecordChanged:
+    def _rec(self, ppg=10.0, games=15.0, fv=None):
+        return {"projected_ppg": ppg, "projected_games": games,
+                "feature_values": json.dumps(fv or {"weighted_ppg": 10.0})}
+
+    def test_identical(self):
+        assert not record_changed(self._rec(), self._rec())
+
+    def test_object_and_string_feature_values_compare_equal(self):
+        old = dict(self._rec(), feature_values={"weighted_ppg": 10.0})
+        assert not record_changed(self._rec(), old)
+
+    def test_changes_detected(self):
+        assert record_changed(self._rec(), None)
+        assert record_changed(self._rec(ppg=10.1), self._rec())
+        assert record_changed(self._rec(games=None), self._rec())
+        assert record_changed(self._rec(fv={"weighted_ppg": 10.0, "age_curve": None}), self._rec())
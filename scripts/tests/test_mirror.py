@@ -0,0 +1,147 @@
+"""Local parquet mirror: sync round-trip and the read-only MirrorClient."""
+
+import argparse
+import json
+
+import pytest
+
+from scripts import config, mirror_client
+from scripts.analysis_utils import SeasonDataStore, available_model_seasons
+from scripts.config import add_source_arg
+from scripts.db_io import fetch_all_rows
+from scripts.mirror_client import MirrorClient
+from scripts.mirror import sync_mirror
+
+ROWS = {
+    "player_stats": [
+        {"id": f"ps{i}", "player_id": f"p{i}", "season": 2020 + i % 4, "ppg": 5.5 + i, "games_played": None if i == 3 else 16,
+         "snaps": 100 * i, "total_points": 10.0 * i, "pps": 0.1, "h1_snaps": 50, "h1_games": 8,
+         "h2_snaps": 50, "h2_games": 8, "updated_at": f"2025-01-0{1 + i % 4}T00:00:00+00:00"}
+        for i in range(10)
+    ],
+    "players": [
+        {"id": "u1", "name": "A", "position": "WR", "is_college": False, "nfl_team": "KC"},
+        {"id": "u2", "name": "B", "position": "QB", "is_college": None, "nfl_team": None},
+    ],
+    "model_projections": [
+        {"id": "mp1", "player_id": "p1", "model_id": "m1", "season": 2021, "feature_values": {"weighted_ppg": 9.5}},
+        {"id": "mp2", "player_id": "p2", "model_id": "m1", "season": 2022, "feature_values": None},
+        {"id": "mp3", "player_id": "p3", "model_id": "m2", "season": 2023, "feature_values": {}},
+    ],
+}
+
+
+class _FakeQuery:
+    """Count + keyset pages (order by id, gt, limit) — what fetch_all_rows issues."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.after = None
+        self.size = None
+        self.head = False
+
+    def select(self, _cols, head=None, **_kwargs):
+        self.head = bool(head)
+        return self
+
+    def gt(self, _col, value):
+        self.after = value
+        return self
+
+    def order(self, _col, **_kwargs):
+        return self
+
+    def limit(self, size):
+        self.size = size
+        return self
+
+    def execute(self):
+        rows = [dict(r) for r in self.rows if self.after is None or r["id"] > self.after]
+        if self.head:
+            return type("Resp", (), {"data": [], "count": len(rows)})()
+        return type("Resp", (), {"data": rows[:self.size]})()
+
+
+class _FakeClient:
+    def table(self, name):
+        return _FakeQuery(ROWS[name])
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    monkeypatch.setenv("OTTONEU_MIRROR_DIR", str(tmp_path))
+    sync_mirror(_FakeClient(), list(ROWS), tmp_path)
+    return MirrorClient(tmp_path)
+
+
+class TestSync:
+    def test_manifest(self, mirror, tmp_path):
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        ps = manifest["tables"]["player_stats"]
+        assert ps["rows"] == 10
+        assert ps["max_updated_at"] == "2025-01-04T00:00:00+00:00"
+        assert manifest["tables"]["players"]["max_updated_at"] is None
+        assert manifest["tables"]["model_projections"]["json_columns"] == ["feature_values"]
+
+    def test_round_trip_matches_postgrest_rows(self, mirror):
+        for table, rows in ROWS.items():
+            assert fetch_all_rows(mirror, table) == rows, table
+
+    def test_resync_single_table_keeps_others(self, mirror, tmp_path):
+        sync_mirror(_FakeClient(), ["players"], tmp_path)
+        manifest = mirror_client.load_mirror_manifest(tmp_path)
+        assert set(manifest["tables"]) == set(ROWS)
+
+
+class TestMirrorClient:
+    def test_filters_follow_sql_null_semantics(self, mirror):
+        rows = fetch_all_rows(mirror, "player_stats", "player_id, games_played",
+                              filters=[("in_", "season", [2020, 2023]), ("gte", "games_played", 0)])
+        assert [r["player_id"] for r in rows] == ["p0", "p4", "p7", "p8"]
+        assert fetch_all_rows(mirror, "players", "id", filters=[("neq", "nfl_team", "KC")]) == []
+        nulls = mirror.table("players").select("id").is_("nfl_team", "null").execute().data
+        assert nulls == [{"id": "u2"}]
+
+    def test_order_range_count_and_single(self, mirror):
+        resp = (
+            mirror.table("player_stats").select("player_id, ppg", count="exact")
+            .eq("season", 2021).order("ppg", desc=True).range(0, 1).execute()
+        )
+        assert resp.count == 3
+        assert [r["player_id"] for r in resp.data] == ["p9", "p5"]
+        one = mirror.table("players").select("name").eq("id", "u1").single().execute()
+        assert one.data == {"name": "A"}
+        assert mirror.table("players").select("*").eq("id", "zz").maybe_single().execute().data is None
+
+    def test_read_only_and_missing_table(self, mirror):
+        with pytest.raises(RuntimeError):
+            mirror.table("players").upsert({"id": "u3"})
+        with pytest.raises(FileNotFoundError, match="sync-mirror"):
+            mirror.table("nfl_stats").select("*").execute()
+
+    def test_season_fetchers_read_the_mirror(self, mirror):
+        store = SeasonDataStore(mirror)
+        assert len(store.player_stats([2021, 2022])) == 5
+        assert available_model_seasons(mirror, "m1") == [2022, 2021]
+
+
+class TestDataSourceSwitch:
+    def test_env_selects_mirror_client(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OTTONEU_MIRROR_DIR", str(tmp_path))
+        monkeypatch.setenv(config.DATA_SOURCE_ENV, "mirror")
+        client = config.get_supabase_client()
+        assert isinstance(client, MirrorClient) and client.directory == tmp_path
+
+    def test_source_flag_sets_env(self, monkeypatch):
+        monkeypatch.setenv(config.DATA_SOURCE_ENV, "supabase")  # restored after the test
+        parser = argparse.ArgumentParser()
+        add_source_arg(parser)
+        assert parser.parse_args([]).source is None
+        assert config.data_source() == "supabase"
+        parser.parse_args(["--source", "mirror"])
+        assert config.data_source() == "mirror"
+
+    def test_unknown_source_rejected(self, monkeypatch):
+        monkeypatch.setenv(config.DATA_SOURCE_ENV, "sqlite")
+        with pytest.raises(ValueError):
+            config.data_source()
@@ -0,0 +1,195 @@
+"""Compiled ModelPlan must reproduce the legacy combiner / predict path exactly."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.feature_projections.combiner import combine_features
+from scripts.feature_projections.features import FEATURE_REGISTRY
+from scripts.feature_projections.learned_combiner import (
+    combine_features_learned,
+    combine_features_residual,
+    feature_value_frame,
+    predict,
+    predict_batch,
+    predict_residual,
+    predict_residual_batch,
+)
+from scripts.feature_projections.model_config import MODELS
+from scripts.feature_projections.model_plan import (
+    ModelPlan,
+    PlanCache,
+    _compile_layout,
+    _resolve_features_for_position,
+    _resolve_residual_base_features,
+)
+from scripts.feature_projections.runner import _collect_feature_names_recursive, _load_learned_params
+
+POSITIONS = ("QB", "RB", "WR", "TE")
+
+
+def _history():
+    return pd.DataFrame([
+        {"player_id": "p1", "season": 2022, "ppg": 11.0, "games_played": 15,
+         "total_points": 165.0, "snaps": 700, "pps": 0.2},
+        {"player_id": "p1", "season": 2023, "ppg": 13.5, "games_played": 17,
+         "total_points": 229.5, "snaps": 820, "pps": 0.25},
+        {"player_id": "p1", "season": 2024, "ppg": 12.2, "games_played": 12,
+         "total_points": 146.4, "snaps": 600, "pps": 0.24},
+    ])
+
+
+def _context():
+    return {
+        "target_season": 2025,
+        "birth_date": "1998-05-04",
+        "nfl_team": "KC",
+        "team_history": {2022: "KC", 2023: "KC", 2024: "KC"},
+        "all_team_ratings": {"KC": 1.2},
+        "team_offense_rating": 1.2,
+        "positional_mean_ppg": 9.0,
+        "positional_starter_floor": 12.0,
+    }
+
+
+def _trained_models():
+    out = []
+    for name, model_def in MODELS.items():
+        if model_def.combiner_type not in {"learned", "residual"}:
+            continue
+        try:
+            params = _load_learned_params(name, model_def)
+        except FileNotFoundError:
+            continue
+        out.append((name, model_def, params))
+    return out
+
+
+def _legacy_project(model_def, params, pool, position):
+    names, weights = _resolve_features_for_position(model_def, position)
+    base_eff = _resolve_residual_base_features(model_def, position)
+    if base_eff:
+        names = list(dict.fromkeys(list(base_eff) + list(names)))
+    instances = [pool[f] for f in names if f in pool]
+    args = (instances, "p1", position, _history(), pd.DataFrame(), _context())
+    if model_def.combiner_type == "residual" and params is not None:
+        return combine_features_residual(*args, params, weights or None, {})
+    if params is not None:
+        return combine_features_learned(*args, params, weights or None, {})
+    return combine_features(*args, weights or None, {})
+
+
+class TestModelPlanParity:
+    def test_execute_matches_legacy_combiners(self):
+        for name, model_def in MODELS.items():
+            names = _collect_feature_names_recursive(model_def)
+            if not any(f in FEATURE_REGISTRY for f in names):
+                continue
+            try:
+                params = _load_learned_params(name, model_def)
+            except FileNotFoundError:
+                continue
+            pool = {f: FEATURE_REGISTRY[f]() for f in names if f in FEATURE_REGISTRY}
+            plans = PlanCache(model_def, pool, params)
+            for position in POSITIONS:
+                got = plans[position].execute("p1", _history(), pd.DataFrame(), _context(), {})
+                assert got == _legacy_project(model_def, params, pool, position), (name, position)
+
+    def test_predict_matches_legacy_on_random_values(self):
+        models = _trained_models()
+        assert models
+        rng = np.random.default_rng(7)
+        for name, model_def, params in models:
+            names = sorted(_collect_feature_names_recursive(model_def))
+            for position in POSITIONS:
+                plan = ModelPlan.compile(model_def, position, {}, params)
+                for _ in range(5):
+                    fv = {
+                        f: (None if rng.random() < 0.2 else float(rng.normal(5, 3)))
+                        for f in names
+                    }
+                    legacy = (
+                        predict_residual(fv, position, params)
+                        if model_def.combiner_type == "residual"
+                        else predict(fv, position, params)
+                    )
+                    assert plan.predict(fv) == legacy, (name, position)
+
+    def test_plan_cache_compiles_once_per_position(self):
+        model_def = MODELS["v2_age_adjusted"]
+        plans = PlanCache(model_def, {f: FEATURE_REGISTRY[f]() for f in model_def.features})
+        assert plans["WR"] is plans["WR"]
+        assert plans["WR"] is not plans["QB"]
+        assert plans["WR"].base_feature == "weighted_ppg"
+
+
+
+class TestBatchPrediction:
+    """predict_batch / predict_residual_batch match the scalar path to float rounding."""
+
+    def _season(self, names, n=400, seed=11):
+        rng = np.random.default_rng(seed)
+        rows = [
+            {f: (None if rng.random() < 0.2 else float(rng.normal(5, 3))) for f in names}
+            for _ in range(n)
+        ]
+        positions = [POSITIONS[i % len(POSITIONS)] for i in range(n)]
+        return rows, positions
+
+    def test_every_trained_model_matches_scalar(self):
+        models = _trained_models()
+        assert any(m.combiner_type == "residual" for _, m, _ in models)
+        for name, model_def, params in models:
+            names = sorted(_collect_feature_names_recursive(model_def))
+            rows, positions = self._season(names)
+            residual = model_def.combiner_type == "residual"
+            batch_fn = predict_residual_batch if residual else predict_batch
+            got = batch_fn(feature_value_frame(rows), positions, params)
+            scalar_fn = predict_residual if residual else predict
+            expected = [scalar_fn(fv, pos, params) for fv, pos in zip(rows, positions)]
+            np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12, err_msg=name)
+
+    def test_training_filter_passes_base_through(self):
+        params = next(p for n, _m, p in _trained_models()
+                      if (p.get("training_filter") or {}).get("positions"))
+        allowed = set(params["training_filter"]["positions"])
+        names = sorted(set(params["feature_names"]) | {
+            c for c in params["base_model_params"]["feature_names"] if "*" not in c and "^" not in c
+        })
+        rows, positions = self._season(names, n=40)
+        frame = feature_value_frame(rows)
+        full = predict_residual_batch(frame, positions, params)
+        base = predict_batch(frame, positions, params["base_model_params"])
+        outside = np.array([p not in allowed for p in positions])
+        assert (full[outside] == base[outside]).all()
+        assert (full[~outside] != base[~outside]).any()
+
+    def test_plan_cache_batches_the_chain(self):
+        name, model_def, params = next(m for m in _trained_models() if m[1].combiner_type == "residual")
+        names = sorted(_collect_feature_names_recursive(model_def))
+        rows, positions = self._season(names, n=50)
+        plans = PlanCache(model_def, {}, params)
+        got = plans.predict_batch(feature_value_frame(rows), positions)
+        expected = [plans[pos].predict(fv) for fv, pos in zip(rows, positions)]
+        np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+    def test_missing_base_is_nan(self):
+        got = predict_residual_batch(pd.DataFrame({"a": [1.0, 2.0]}), ["WR", "RB"],
+                                     {"coefficients": [], "feature_names": []})
+        assert np.isnan(got).all()
+
+    def test_season_scores_fast(self):
+        import time
+        name, model_def, params = next(m for m in _trained_models() if m[0] == "v46_xfp_redzone")
+        names = sorted(_collect_feature_names_recursive(model_def))
+        rows, positions = self._season(names, n=1000)
+        frame = feature_value_frame(rows)
+        start = time.perf_counter()
+        predict_batch(frame, positions, params)
+        assert time.perf_counter() - start < 0.1
+
+class TestCompileLayout:
+    def test_terms_outside_the_raw_columns_are_zero(self):
+        ops = _compile_layout(["b", "a"], ["a^2", "c^2", "a*position", "c*position", "a*b", "a*c", "odd"])
+        # raw a, raw b | a^2, 0 | a*position (one op), 4 zeros | a*b, 0 | 0
+        assert [a for _, a, _ in ops[:2]] == ["a", "b"]
+        assert len(ops) == 2 + 2 + 1 + 4 + 2 + 1
@@ -0,0 +1,284 @@
+"""Direct Postgres bulk I/O: SQL translation, COPY upserts, routing from the
+shared helpers, and the PostgREST fallback (against a stand-in connection)."""
+
+import json
+import sys
+
+import pytest
+
+from scripts import db_io
+from scripts.db_io import PostgresBackend, bulk_upsert, fetch_all_rows
+from scripts.tests.postgrest_fakes import FakeDB, FakeQuery, fake_rows
+
+
+class _Copy:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def write_row(self, row):
+        self.conn.copied.append(list(row))
+
+
+class _Cursor:
+    def __init__(self, conn, name):
+        self.conn = conn
+        self.name = name
+        self.itersize = None
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.statements.append((query, list(params or [])))
+        if self.conn.fail_on and self.conn.fail_on in query:
+            raise RuntimeError("constraint violation")
+        if "information_schema" in query:
+            self._result = [(c,) for c in self.conn.json_columns]
+        elif "row_to_json" in query:
+            self._result = [(dict(r),) for r in self.conn.rows]
+
+    def fetchall(self):
+        return list(self._result)
+
+    def __iter__(self):
+        return iter(self._result)
+
+    def copy(self, statement):
+        self.conn.statements.append((statement, []))
+        return _Copy(self.conn)
+
+
+class _Conn:
+    def __init__(self, rows=(), json_columns=()):
+        self.rows = list(rows)
+        self.json_columns = list(json_columns)
+        self.statements = []
+        self.copied = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.cursor_names = []
+        self.fail_on = None
+
+    def cursor(self, name=None):
+        self.cursor_names.append(name)
+        return _Cursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _backend(conn):
+    connects = []
+
+    def connect(dsn):
+        connects.append(dsn)
+        return conn
+
+    backend = PostgresBackend("postgresql://local/test", connect=connect)
+    return backend, connects
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(db_io.QUERY_CACHE, "enabled", True)
+    db_io.QUERY_CACHE.invalidate()
+    yield
+    db_io.QUERY_CACHE.invalidate()
+
+
+class TestReadTranslation:
+    def test_filters_become_parameterised_sql(self):
+        query, params = PostgresBackend("dsn").fetch_sql(
+            "model_projections", "player_id, projected_ppg",
+            filters=[("eq", "model_id", "m1"), ("in_", "season", [2024, 2025]),
+                     ("is_", "nfl_team", None), ("gte", "projected_ppg", 5)],
+            order_by="id",
+        )
+        assert query == (
+            'SELECT row_to_json(t) FROM (SELECT "player_id", "projected_ppg" FROM "model_projections"'
+            ' WHERE "model_id" = %s AND "season" IN (%s, %s) AND "nfl_team" IS NULL'
+            ' AND "projected_ppg" >= %s) t ORDER BY t."id"'
+        )
+        assert params == ["m1", 2024, 2025, 5]
+
+    def test_empty_in_matches_nothing(self):
+        query, params = PostgresBackend("dsn").fetch_sql("players", "*", [("in_", "id", [])])
+        assert 'SELECT * FROM "players" WHERE FALSE' in query and params == []
+
+    def test_untranslatable_reads_stay_on_postgrest(self):
+        assert PostgresBackend.can_fetch("id, name", [("eq", "season", 2025)])
+        assert not PostgresBackend.can_fetch("id, players(name)", None)
+        assert not PostgresBackend.can_fetch("name:player_name", None)
+        assert not PostgresBackend.can_fetch("*", [("ilike", "name", "%smith%")])
+
+
+class TestFetchAllRowsRouting:
+    def test_read_goes_through_one_cursor(self):
+        conn = _Conn(rows=[{"model_id": r["model_id"], "id": r["id"]} for r in fake_rows(5)])
+        backend, _ = _backend(conn)
+        db = FakeDB(fake_rows(5))
+        client = db_io.WriteInvalidatingClient(db, postgres=backend)
+        rows = fetch_all_rows(client, "model_projections", "model_id", workers=4)
+        assert rows == [{"model_id": r["model_id"]} for r in fake_rows(5)]
+        assert db.calls == []
+        (query, _params), = conn.statements
+        assert '"model_id", "id"' in query and query.endswith('ORDER BY t."id"')
+        assert conn.cursor_names == ["fetch_model_projections"] and conn.rollbacks == 1
+
+    def test_offset_table_is_unordered(self):
+        conn = _Conn(rows=[{"season": 2025}])
+        backend, _ = _backend(conn)
+        client = db_io.WriteInvalidatingClient(FakeDB([]), postgres=backend)
+        assert fetch_all_rows(client, "league_calendar") == [{"season": 2025}]
+        assert "ORDER BY" not in conn.statements[0][0]
+
+    def test_untranslated_filter_falls_back_to_rest(self):
+        conn = _Conn()
+        backend, _ = _backend(conn)
+        db = FakeDB(fake_rows(3))
+        db.table = lambda name: _LikeQuery(db, name)
+        client = db_io.WriteInvalidatingClient(db, postgres=backend)
+        rows = fetch_all_rows(client, "players", "id", filters=[("like", "id", "0%")])
+        assert len(rows) == 3 and conn.statements == []
+
+
+class _LikeQuery:
+    """A REST query that accepts ``like`` (the backend does not translate it)."""
+
+    def __init__(self, db, name):
+        self._query = FakeQuery(db, name)
+
+    def like(self, _column, _pattern):
+        return self
+
+    def __getattr__(self, attr):
+        value = getattr(self._query, attr)
+        if not callable(value):
+            return value
+
+        def chained(*args, **kwargs):
+            result = value(*args, **kwargs)
+            return self if result is self._query else result
+        return chained
+
+
+class TestBulkUpsert:
+    def test_copy_then_merge(self):
+        conn = _Conn(json_columns=["feature_values"])
+        backend, connects = _backend(conn)
+        client = db_io.WriteInvalidatingClient(FakeDB([]), postgres=backend)
+        rows = [
+            {"model_id": "m1", "player_id": "p1", "season": 2025, "projected_ppg": 12.5,
+             "feature_values": {"weighted_ppg": 12.0}},
+            {"model_id": "m1", "player_id": "p2", "season": 2025, "projected_ppg": 8.0},
+        ]
+        assert bulk_upsert(client, "model_projections", rows,
+                           on_conflict="model_id,player_id,season") == 2
+        statements = [q for q, _ in conn.statements if "information_schema" not in q]
+        assert statements == [
+            'CREATE TEMP TABLE "_upsert_model_projections" ON COMMIT DROP AS SELECT "model_id", '
+            '"player_id", "season", "projected_ppg", "feature_values" FROM "model_projections" WITH NO DATA',
+            'COPY "_upsert_model_projections" ("model_id", "player_id", "season", "projected_ppg", '
+            '"feature_values") FROM STDIN',
+            'INSERT INTO "model_projections" ("model_id", "player_id", "season", "projected_ppg", '
+            '"feature_values") SELECT "model_id", "player_id", "season", "projected_ppg", '
+            '"feature_values" FROM "_upsert_model_projections" ON CONFLICT ("model_id", "player_id", '
+            '"season") DO UPDATE SET "projected_ppg" = EXCLUDED."projected_ppg", '
+            '"feature_values" = EXCLUDED."feature_values"',
+        ]
+        assert conn.copied == [
+            ["m1", "p1", 2025, 12.5, json.dumps({"weighted_ppg": 12.0})],
+            ["m1", "p2", 2025, 8.0, None],
+        ]
+        assert conn.commits == 1 and connects == ["postgresql://local/test"]
+
+    def test_key_only_rows_do_nothing_on_conflict(self):
+        _create, _copy, merge = PostgresBackend.upsert_sql("player_stats", ["player_id", "season"],
+                                                           "player_id, season")
+        assert merge.endswith('ON CONFLICT ("player_id", "season") DO NOTHING')
+
+    def test_rejects_non_identifiers(self):
+        with pytest.raises(ValueError, match="plain"):
+            PostgresBackend.upsert_sql("players", ["name; drop table players"], "id")
+
+    def test_failed_merge_rolls_back(self):
+        conn = _Conn()
+        conn.fail_on = "INSERT INTO"
+        backend, _ = _backend(conn)
+        with pytest.raises(RuntimeError):
+            backend.upsert("nfl_stats", [{"player_id": "p1", "season": 2025}], "player_id,season")
+        assert conn.rollbacks == 1 and conn.commits == 0
+
+    def test_failed_column_lookup_rolls_back(self):
+        conn = _Conn()
+        conn.fail_on = "information_schema"
+        backend, _ = _backend(conn)
+        with pytest.raises(RuntimeError):
+            backend.upsert("nfl_stats", [{"player_id": "p1", "season": 2025}], "player_id,season")
+        assert conn.rollbacks == 1 and conn.commits == 0
+
+    def test_write_invalidates_memoized_reads(self):
+        conn = _Conn(rows=fake_rows(2))
+        backend, _ = _backend(conn)
+        client = db_io.WriteInvalidatingClient(FakeDB([]), postgres=backend)
+        fetch_all_rows(client, "nfl_stats", "id")
+        fetch_all_rows(client, "nfl_stats", "id")
+        assert sum("row_to_json" in q for q, _ in conn.statements) == 1
+        bulk_upsert(client, "nfl_stats", [{"player_id": "p1", "season": 2025}],
+                    on_conflict="player_id,season")
+        fetch_all_rows(client, "nfl_stats", "id")
+        assert sum("row_to_json" in q for q, _ in conn.statements) == 2
+
+    def test_rest_path_batches(self):
+        batches = []
+
+        class Table:
+            def upsert(self, rows, on_conflict):
+                batches.append((len(rows), on_conflict))
+                return self
+
+            def execute(self):
+                return None
+
+        client = type("Client", (), {"table": lambda self, name: Table()})()
+        rows = [{"player_id": f"p{i}", "season": 2025} for i in range(450)]
+        assert bulk_upsert(client, "player_stats", rows, on_conflict="player_id,season",
+                           batch_size=200) == 450
+        assert batches == [(200, "player_id,season"), (200, "player_id,season"),
+                           (50, "player_id,season")]
+        assert bulk_upsert(client, "player_stats", [], on_conflict="player_id,season") == 0
+
+
+class TestBackendSetup:
+    def test_only_with_database_url(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        assert db_io.postgres_backend() is None
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/ottoneu")
+        backend = db_io.postgres_backend()
+        assert backend is db_io.postgres_backend() and backend.dsn == "postgresql://localhost/ottoneu"
+
+    def test_reconnects_after_fork(self, monkeypatch):
+        conn = _Conn(rows=[])
+        backend, connects = _backend(conn)
+        backend.fetch("players")
+        monkeypatch.setattr(db_io.os, "getpid", lambda: -1)
+        backend.fetch("players")
+        assert len(connects) == 2
+
+    def test_missing_driver_is_explained(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "psycopg", None)
+        with pytest.raises(ImportError, match="postgres"):
+            PostgresBackend("postgresql://localhost/ottoneu").fetch("players")
@@ -0,0 +1,106 @@
+"""Stage / per-feature profiler behind ``--profile``."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from scripts import db_client
+from scripts.feature_projections import profiling, runner
+from scripts.feature_projections.features.team_context import TeamContextFeature
+from scripts.feature_projections.features.weighted_ppg import WeightedPPGFeature
+
+
+@pytest.fixture
+def profiler():
+    prof = profiling.start("test")
+    yield prof
+    profiling.stop()
+
+
+class TestProfiler:
+    def test_inactive_is_a_no_op(self):
+        assert profiling.active() is None
+        pool = {"weighted_ppg": WeightedPPGFeature()}
+        assert profiling.instrument(pool) is pool
+        with profiling.stage("anything"):
+            pass
+
+    def test_stages_and_features(self, profiler):
+        with profiling.stage("fetch: lookups"):
+            pass
+        with profiling.stage("fetch: lookups"):
+            pass
+        pool = profiling.instrument({"team_context": TeamContextFeature()})
+        feature = pool["team_context"]
+        assert feature.name == "team_context" and not feature.is_base
+        history = pd.DataFrame([{"player_id": "p1", "season": 2024, "ppg": 10.0}])
+        assert feature.compute("p1", "WR", history, pd.DataFrame(), {"target_season": 2025}) is None
+
+        data = profiler.to_dict()
+        assert data["stages"][0]["stage"] == "fetch: lookups"
+        assert data["stages"][0]["calls"] == 2
+        (row,) = data["features"]
+        assert row["feature"] == "team_context"
+        assert row["compute_calls"] == 1 and row["none_rate"] == 1.0
+
+    def test_batch_pass_recorded(self, profiler):
+        feature = profiling.instrument({"weighted_ppg": WeightedPPGFeature()})["weighted_ppg"]
+        frame = pd.DataFrame([{"player_id": "p1", "season": 2024, "ppg": 10.0,
+                               "games_played": 16, "position": "WR", "birth_date": None}])
+        assert feature.compute_batch(frame, {"target_season": 2025}) is not None
+        (row,) = profiler.to_dict()["features"]
+        assert row["batch_calls"] == 1 and row["compute_calls"] == 0
+
+    def test_report_is_ranked(self, profiler):
+        profiler.add_stage("small", 0.1)
+        profiler.add_stage("big", 2.0, calls=3)
+        profiler.add_feature("slow", 1.0, False)
+        profiler.add_feature("fast", 0.01, True)
+        report = profiler.report()
+        assert report.index("big") < report.index("small")
+        assert report.index("slow") < report.index("fast")
+
+    def test_drain_and_merge(self, profiler):
+        profiler.add_stage("project: players", 1.0)
+        profiler.add_feature("age_curve", 0.5, True)
+        data = profiler.drain()
+        assert profiler.stages == {} and profiler.features == {}
+        profiler.merge(data)
+        profiler.merge(data)
+        assert profiler.stages["project: players"] == [2.0, 2]
+        assert profiler.features["age_curve"][:3] == [1.0, 2, 2]
+
+    def test_postgrest_traffic_since_start(self, profiler, monkeypatch):
+        traffic = db_client.TrafficCounter()
+        traffic.record("players", 0, 100)
+        monkeypatch.setattr(profiling, "POSTGREST_TRAFFIC", traffic)
+        profiler._traffic_base = traffic.snapshot()
+        traffic.record("players", 0, 2048)
+        traffic.record("model_projections", 4096, 10)
+        worker = profiler.drain()
+        assert worker["traffic"] == {"players": [1, 0, 2048], "model_projections": [1, 4096, 10]}
+        profiler.merge(worker)
+        traffic.record("players", 0, 1024)
+        rows = profiler.to_dict()["postgrest"]
+        assert rows[0] == {"table": "players", "requests": 2, "bytes_sent": 0, "bytes_received": 3072}
+        assert "PostgREST table" in profiler.report()
+
+    def test_write_json(self, profiler, tmp_path):
+        profiler.add_stage("write: upserts", 0.25)
+        path = profiler.write_json(tmp_path / "p.json")
+        data = json.loads(path.read_text())
+        assert data["label"] == "test"
+        assert data["stages"] == [{"stage": "write: upserts", "seconds": 0.25, "calls": 1}]
+
+
+class TestRunProfile:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_models_records_stages_and_features(self, harness, profiler, workers):
+        runner.run_models(["v5_team_context"], [2025], workers=workers)
+        stages = profiler.stages
+        for name in ("fetch: players", "fetch: lookups", "fetch: season data",
+                     "build: batch features", "project: players", "write: upserts"):
+            assert name in stages, name
+        # Per-player compute() calls come back from the pool workers too.
+        assert profiler.features["team_context"][1] == 6
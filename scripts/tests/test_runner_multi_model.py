@@ -0,0 +1,110 @@
+"""Multi-model single-pass runner: shared features must not change output.
+
+``run_models`` computes the union of every model's features once per
+player-season (``_SharedFeature`` memo) and applies each model's combiner to
+the shared values. These tests pin that the per-model projections are
+identical to evaluating each model with its own fresh feature instances.
+"""
+
+import pandas as pd
+import pytest
+
+from scripts.feature_projections.features import FEATURE_REGISTRY
+from scripts.feature_projections.model_config import MODELS
+from scripts.feature_projections.runner import (
+    _SharedFeature,
+    _collect_feature_names_recursive,
+    _load_learned_params,
+    _project_player,
+)
+
+
+def _history():
+    return pd.DataFrame([
+        {"player_id": "p1", "season": 2022, "ppg": 11.0, "games_played": 15,
+         "total_points": 165.0, "snaps": 700, "pps": 0.2},
+        {"player_id": "p1", "season": 2023, "ppg": 13.5, "games_played": 17,
+         "total_points": 229.5, "snaps": 820, "pps": 0.25},
+        {"player_id": "p1", "season": 2024, "ppg": 12.2, "games_played": 12,
+         "total_points": 146.4, "snaps": 600, "pps": 0.24},
+    ])
+
+
+def _context():
+    return {
+        "target_season": 2025,
+        "birth_date": "1998-05-04",
+        "nfl_team": "KC",
+        "team_history": {2022: "KC", 2023: "KC", 2024: "KC"},
+        "all_team_ratings": {"KC": 1.2},
+        "team_offense_rating": 1.2,
+        "positional_mean_ppg": 9.0,
+        "positional_starter_floor": 12.0,
+    }
+
+
+def _loadable_models():
+    out = []
+    for name, model_def in MODELS.items():
+        if not any(f in FEATURE_REGISTRY for f in _collect_feature_names_recursive(model_def)):
+            continue
+        try:
+            params = _load_learned_params(name, model_def)
+        except FileNotFoundError:
+            continue
+        out.append((name, model_def, params))
+    return out
+
+
+class TestSharedFeatureRun:
+    def test_shared_pool_matches_per_model_pool(self):
+        models = _loadable_models()
+        assert len(models) > 10
+        names = {
+            f for _, model_def, _ in models for f in _collect_feature_names_recursive(model_def)
+            if f in FEATURE_REGISTRY
+        }
+        memo = {}
+        shared_pool = {f: _SharedFeature(FEATURE_REGISTRY[f](), memo) for f in names}
+
+        for position in ("QB", "RB", "WR", "TE"):
+            memo.clear()
+            for name, model_def, params in models:
+                fresh_pool = {f: FEATURE_REGISTRY[f]() for f in names}
+                expected = _project_player(
+                    model_def, params, fresh_pool, "p1", position,
+                    _history(), pd.DataFrame(), _context(), {},
+                )
+                got = _project_player(
+                    model_def, params, shared_pool, "p1", position,
+                    _history(), pd.DataFrame(), _context(), {},
+                )
+                assert got == expected, (name, position)
+
+    def test_memo_computes_each_feature_once_per_base(self):
+        calls = []
+
+        class Counting(FEATURE_REGISTRY["age_curve"]):
+            def compute(self, *args, **kwargs):
+                calls.append(1)
+                return super().compute(*args, **kwargs)
+
+        memo = {}
+        feature = _SharedFeature(Counting(), memo)
+        ctx = dict(_context(), base_ppg=12.0)
+        for _ in range(5):
+            feature.compute("p1", "WR", _history(), pd.DataFrame(), ctx)
+        assert len(calls) == 1
+        feature.compute("p1", "WR", _history(), pd.DataFrame(), dict(ctx, base_ppg=13.0))
+        assert len(calls) == 2
+        assert feature.name == "age_curve" and feature.is_base is False
+
+    def test_shared_feature_delegates_batch(self):
+        feature = _SharedFeature(FEATURE_REGISTRY["weighted_ppg"](), {})
+        frame = _history().assign(position="WR", birth_date=None)
+        batch = feature.compute_batch(frame, {"target_season": 2025})
+        assert batch is not None and batch["p1"] == pytest.approx(
+            FEATURE_REGISTRY["weighted_ppg"]().compute(
+                "p1", "WR", _history(), pd.DataFrame(), {}
+            )
+        )
@@ -0,0 +1,181 @@
+"""Season-window aggregates: Python reductions, the RPC path and its fallback."""
+
+import pandas as pd
+import pytest
+
+from scripts import db_io
+from scripts.analysis_utils import available_model_seasons
+from scripts.feature_projections.runner import (
+    _compute_pooling_k,
+    _compute_positional_mean_ppg,
+    _compute_positional_starter_floor,
+    _compute_season_aggregates,
+    _compute_team_aggregates,
+)
+from scripts.feature_projections.season_aggregates import (
+    POOLING_MIN_GAMES,
+    position_ppg_moments,
+    team_season_totals,
+)
+
+
+def _history():
+    rows = []
+    for i in range(30):
+        for season, bump in ((2023, 0.0), (2024, 1.5)):
+            rows.append({"player_id": f"w{i}", "season": season, "ppg": 4.0 + i * 0.5 + bump,
+                         "games_played": 8 + (i % 10)})
+        rows.append({"player_id": f"q{i % 12}", "season": 2022 + i % 3, "ppg": 12.0 + (i % 7),
+                     "games_played": 17})
+    return pd.DataFrame(rows).drop_duplicates(["player_id", "season"])
+
+
+def _players():
+    return pd.DataFrame(
+        [{"player_id_ref": f"w{i}", "position": "WR", "nfl_team": ["KC", "BUF", "DET"][i % 3]}
+         for i in range(30)]
+        + [{"player_id_ref": f"q{i}", "position": "QB", "nfl_team": ["KC", "BUF", "DET"][i % 3]}
+           for i in range(12)]
+    )
+
+
+def _nfl_stats(recent_team=True):
+    rows = []
+    for i in range(30):
+        for season in (2023, 2024):
+            rows.append({"player_id": f"w{i}", "season": season,
+                         "recent_team": ["KC", "BUF", "DET", "NYJ"][(i + season) % 4] if recent_team else None,
+                         "total_points": 50.0 + i, "targets": 40 + i, "rushing_attempts": i % 3})
+    return pd.DataFrame(rows)
+
+
+class _RPC:
+    def __init__(self, client, function, params):
+        self.client, self.function, self.params = client, function, params
+
+    def execute(self):
+        self.client.calls.append((self.function, self.params))
+        result = self.client.results[self.function]
+        if isinstance(result, Exception):
+            raise result
+        return type("Response", (), {"data": result(self.params) if callable(result) else result})()
+
+
+class _RPCClient:
+    """Answers ``rpc`` from the Python reductions — the SQL functions' contract."""
+
+    def __init__(self, history, nfl_stats, players, **overrides):
+        def moments(params):
+            frame = position_ppg_moments(history, players, params["p_min_games"],
+                                         params.get("p_starter_rank", 24))
+            return frame.to_dict("records")
+
+        self.results = {
+            "team_season_totals": team_season_totals(nfl_stats, players).to_dict("records"),
+            "position_ppg_moments": moments,
+            **overrides,
+        }
+        self.calls = []
+
+    def rpc(self, function, params):
+        return _RPC(self, function, params)
+
+
+class _MissingFunction(Exception):
+    code = "PGRST202"
+
+
+@pytest.fixture(autouse=True)
+def _fresh(monkeypatch):
+    monkeypatch.delenv("OTTONEU_SERVER_AGGREGATES", raising=False)
+    db_io._unavailable.clear()
+    yield
+    db_io._unavailable.clear()
+
+
+class TestPythonReductions:
+    def test_team_aggregates_use_recent_team(self):
+        aggregates = _compute_team_aggregates(_nfl_stats(), _players())
+        assert set(aggregates) == {"KC", "BUF", "DET", "NYJ"}
+        assert sum(t["offense_rating"] for t in aggregates.values()) == pytest.approx(0.0)
+        kc = aggregates["KC"]
+        assert set(kc["usage_by_season"]) == {2023, 2024}
+
+    def test_team_aggregates_fall_back_to_current_team(self):
+        aggregates = _compute_team_aggregates(_nfl_stats(recent_team=False), _players())
+        assert set(aggregates) == {"KC", "BUF", "DET"}
+        # w0, w3, ... (10 players) × 2 seasons are on KC.
+        targets = sum(40 + i for i in range(0, 30, 3))
+        assert aggregates["KC"]["usage_by_season"][2024]["targets"] == targets
+
+    def test_floor_is_rank_or_minimum(self):
+        floors = _compute_positional_starter_floor(_history(), _players(), min_games=0, starter_rank=24)
+        # 30 WRs: 24th-best player mean; 12 QBs: thinner than rank → minimum.
+        wr_means = sorted((4.0 + i * 0.5 + 0.75 for i in range(30)), reverse=True)
+        assert floors["WR"] == pytest.approx(wr_means[23])
+        qb = _history()[_history()["player_id"].str.startswith("q")].groupby("player_id")["ppg"].mean()
+        assert floors["QB"] == pytest.approx(qb.min())
+
+    def test_means_match_a_direct_groupby(self):
+        history = _history()
+        means = _compute_positional_mean_ppg(history, _players(), min_games=10)
+        qualified = history[history["games_played"] >= 10]
+        wr = qualified[qualified["player_id"].str.startswith("w")].groupby("player_id")["ppg"].mean()
+        assert means["WR"] == pytest.approx(wr.mean())
+
+
+class TestServerAggregates:
+    def test_rpc_results_match_python(self):
+        history, nfl, players = _history(), _nfl_stats(), _players()
+        client = _RPCClient(history, nfl, players)
+        server = _compute_season_aggregates(client, [2022, 2023, 2024], history, nfl, players)
+        local = _compute_season_aggregates(object(), [2022, 2023, 2024], history, nfl, players)
+        assert server == local
+        functions = [fn for fn, _ in client.calls]
+        assert functions[:2] == ["team_season_totals", "position_ppg_moments"]
+        assert client.calls[0][1] == {"p_seasons": [2022, 2023, 2024]}
+
+    def test_pooling_k_uses_its_own_games_threshold(self):
+        history, nfl, players = _history(), _nfl_stats(), _players()
+        client = _RPCClient(history, nfl, players)
+        *_, pooling_k = _compute_season_aggregates(client, [2023, 2024], history, nfl, players)
+        assert pooling_k == _compute_pooling_k(history, players)
+        assert any(p["p_min_games"] == POOLING_MIN_GAMES for fn, p in client.calls
+                   if fn == "position_ppg_moments")
+
+    def test_empty_rpc_rows_mean_no_aggregates(self):
+        client = _RPCClient(_history(), _nfl_stats(), _players(),
+                            team_season_totals=[], position_ppg_moments=[])
+        teams, means, floors, pooling_k = _compute_season_aggregates(
+            client, [2024], _history(), _nfl_stats(), _players()
+        )
+        assert teams == {} and means == {} and floors == {} and pooling_k == {}
+
+    def test_missing_function_falls_back_once(self):
+        history, nfl, players = _history(), _nfl_stats(), _players()
+        client = _RPCClient(history, nfl, players, team_season_totals=_MissingFunction("gone"))
+        expected = _compute_team_aggregates(nfl, players)
+        for _ in range(2):
+            teams, *_ = _compute_season_aggregates(client, [2023, 2024], history, nfl, players)
+            assert teams == expected
+        assert [fn for fn, _ in client.calls].count("team_season_totals") == 1
+
+    def test_other_errors_propagate(self):
+        client = _RPCClient(_history(), _nfl_stats(), _players(),
+                            team_season_totals=RuntimeError("timeout"))
+        with pytest.raises(RuntimeError):
+            _compute_season_aggregates(client, [2024], _history(), _nfl_stats(), _players())
+
+    def test_env_switch_forces_python(self, monkeypatch):
+        monkeypatch.setenv("OTTONEU_SERVER_AGGREGATES", "off")
+        client = _RPCClient(_history(), _nfl_stats(), _players())
+        _compute_season_aggregates(client, [2024], _history(), _nfl_stats(), _players())
+        assert client.calls == []
+
+
+class TestAvailableModelSeasons:
+    def test_answered_by_rpc(self):
+        client = _RPCClient(pd.DataFrame(), pd.DataFrame(), pd.DataFrame(),
+                            model_seasons_with_actuals=[{"season": 2023}, {"season": 2025}])
+        assert available_model_seasons(client, "m1") == [2025, 2023]
+        assert client.calls == [("model_seasons_with_actuals", {"p_model_id": "m1"})]
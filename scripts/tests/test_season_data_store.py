@@ -0,0 +1,211 @@
+"""Tests for SeasonDataStore (fetch-once season cache for projection windows)."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.analysis_utils import (
+    NFL_STATS_SCHEMA,
+    PLAYER_STATS_SCHEMA,
+    SeasonDataStore,
+    load_typed,
+)
+
+
+class _FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.seasons = None
+        self.after = None
+        self.size = None
+        self.head = False
+
+    def select(self, cols, head=None, **_kwargs):
+        self.head = bool(head)
+        self.cols = cols
+        return self
+
+    def in_(self, _col, values):
+        self.seasons = list(values)
+        return self
+
+    def gt(self, _col, value):
+        self.after = value
+        return self
+
+    def order(self, _col, **_kwargs):
+        return self
+
+    def limit(self, size):
+        self.size = size
+        return self
+
+    def execute(self):
+        if self.after is None and not self.head:
+            self.client.requests.append((self.table, tuple(self.seasons)))
+            self.client.selects.append(self.cols)
+        rows = sorted(
+            (dict(r) for r in self.client.rows[self.table] if int(r["season"]) in self.seasons),
+            key=lambda r: r["id"],
+        )
+        if self.after is not None:
+            rows = [r for r in rows if r["id"] > self.after]
+        if self.head:
+            return type("Resp", (), {"data": [], "count": len(rows)})()
+        return type("Resp", (), {"data": rows[:self.size]})()
+
+
+class _FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+        self.selects = []
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+
+def _client():
+    player_stats = [
+        {"id": f"ps-{season}-{i}", "player_id": f"p{i}", "season": season, "ppg": str(5 + i), "games_played": None,
+         "total_points": 10, "snaps": 0, "pps": 0}
+        for season in (2021, 2022, 2023, 2024)
+        for i in range(3)
+    ]
+    nfl_stats = [
+        {"id": f"ns-{season}-{i}", "player_id": f"p{i}", "season": str(season), "targets": None, "recent_team": "KC"}
+        for season in (2021, 2022, 2023, 2024)
+        for i in range(2)
+    ]
+    return _FakeClient({"player_stats": player_stats, "nfl_stats": nfl_stats})
+
+
+class TestSeasonDataStore:
+    def test_overlapping_windows_fetch_each_season_once(self):
+        client = _client()
+        store = SeasonDataStore(client)
+        first = store.player_stats([2021, 2022, 2023])
+        second = store.player_stats([2022, 2023, 2024])
+        assert len(first) == 9 and len(second) == 9
+        assert client.requests == [
+            ("player_stats", (2021, 2022, 2023)),
+            ("player_stats", (2024,)),
+        ]
+        assert store.fetches == 2
+
+    def test_frames_are_coerced(self):
+        store = SeasonDataStore(_client())
+        ps = store.player_stats([2023])
+        assert ps["ppg"].dtype.kind in "if"
+        assert (ps["games_played"] == 0).all()
+        nfl = store.nfl_stats([2023, 2024])
+        assert (nfl["targets"] == 0).all()
+        assert sorted(nfl["season"].unique()) == [2023, 2024]
+
+    def test_mutating_result_does_not_touch_cache(self):
+        store = SeasonDataStore(_client())
+        df = store.player_stats([2022])
+        df["ppg"] = -1.0
+        assert (store.player_stats([2022])["ppg"] >= 0).all()
+
+    def test_empty_season_cached_as_empty(self):
+        client = _client()
+        store = SeasonDataStore(client)
+        assert store.player_stats([1999]).empty
+        assert store.player_stats([1999]).empty
+        assert len(client.requests) == 1
+
+    def test_window_matches_direct_fetch_rows(self):
+        store = SeasonDataStore(_client())
+        window = store.player_stats([2021, 2022])
+        direct = pd.concat(
+            [store.player_stats([2021]), store.player_stats([2022])], ignore_index=True
+        )
+        pd.testing.assert_frame_equal(window, direct)
+
+    def test_write_invalidation_drops_that_tables_seasons(self):
+        store = SeasonDataStore(_client())
+        store.player_stats([2022])
+        store.nfl_stats([2022])
+        store.invalidate("player_stats")
+        assert store._player_stats == {} and 2022 in store._nfl_stats
+        store.invalidate(None)
+        assert store._nfl_stats == {}
+
+    def test_categories_survive_windows_from_separate_fetches(self):
+        client = _client()
+        client.rows["nfl_stats"][-1]["recent_team"] = "BUF"
+        store = SeasonDataStore(client)
+        store.nfl_stats([2021])
+        nfl = store.nfl_stats([2021, 2024])
+        assert isinstance(nfl["recent_team"].dtype, pd.CategoricalDtype)
+        assert set(nfl["recent_team"]) == {"KC", "BUF"}
+
+    def test_column_subsets_fetch_wider_only_when_needed(self):
+        client = _client()
+        store = SeasonDataStore(client)
+        narrow = store.player_stats([2022], columns=("player_id", "season", "ppg"))
+        assert list(narrow.columns) == ["player_id", "season", "ppg"]
+        wide = store.player_stats([2022], columns=("player_id", "season", "ppg", "snaps"))
+        assert list(wide.columns) == ["player_id", "season", "ppg", "snaps"]
+        assert client.selects == ["player_id, ppg, season, id", "player_id, ppg, season, snaps, id"]
+        again = store.player_stats([2022], columns=("season", "ppg"))
+        assert list(again.columns) == ["season", "ppg"] and len(client.selects) == 2
+        full = store.player_stats([2022])
+        assert "total_points" in full.columns and len(client.selects) == 3
+        store.player_stats([2022], columns=("ppg",))
+        assert len(client.selects) == 3
+
+
+def _nfl_rows(n):
+    teams = ["KC", "BUF", "DAL", None]
+    return [
+        {"id": f"ns-{i}", "player_id": f"player-{i:05d}", "season": 2015 + i % 10,
+         "games_played": 17, "targets": i % 150, "receiving_yards": i % 1800,
+         "passing_attempts": None, "offense_snaps": i % 1100, "target_share": 0.125,
+         "wopr": None, "total_points": None, "ppg": 10.5, "recent_team": teams[i % 4]}
+        for i in range(n)
+    ]
+
+
+class TestLoadTyped:
+    def test_declared_dtypes_and_null_handling(self):
+        df = load_typed(_nfl_rows(8), NFL_STATS_SCHEMA)
+        assert df["season"].dtype == np.int16
+        assert df["targets"].dtype == np.int16
+        assert (df["passing_attempts"] == 0).all()
+        assert df["target_share"].dtype == np.float32
+        assert df["wopr"].isna().all()
+        assert df["ppg"].dtype == np.float64
+        assert (df["total_points"] == 0).all()
+        assert isinstance(df["recent_team"].dtype, pd.CategoricalDtype)
+        assert df["recent_team"].isna().sum() == 2
+        assert df["player_id"].dtype == object
+
+    def test_unrecorded_counts_stay_missing(self):
+        rows = [{"season": 2016, "targets": 80, "receiving_air_yards": None, "total_snaps": None,
+                 "pat_made": None, "offense_snaps": None},
+                {"season": 2024, "targets": 90, "receiving_air_yards": 0, "total_snaps": 0,
+                 "pat_made": 0, "offense_snaps": 650}]
+        df = load_typed(rows, NFL_STATS_SCHEMA)
+        for col in ("receiving_air_yards", "total_snaps", "pat_made"):
+            assert df[col].dtype == np.float32
+            assert np.isnan(df[col].iloc[0]) and df[col].iloc[1] == 0
+        assert df["offense_snaps"].tolist() == [0, 650]
+        ps = load_typed([{"season": 2024, "snaps": 500, "h1_snaps": None, "h2_games": 8}],
+                        PLAYER_STATS_SCHEMA)
+        assert np.isnan(ps["h1_snaps"].iloc[0]) and ps["h2_games"].iloc[0] == 8
+
+    def test_out_of_range_integers_widen(self):
+        df = load_typed([{"season": 2024, "snaps": 40000}], PLAYER_STATS_SCHEMA)
+        assert df["snaps"].dtype == np.int32 and df["snaps"].iloc[0] == 40000
+
+    def test_empty_rows(self):
+        assert load_typed([], PLAYER_STATS_SCHEMA).empty
+
+    def test_typed_frame_is_several_times_smaller(self):
+        rows = _nfl_rows(2000)
+        stats = [c for c in rows[0] if c not in ("id", "player_id")]
+        raw = pd.DataFrame(rows)[stats].memory_usage(deep=True).sum()
+        typed = load_typed(rows, NFL_STATS_SCHEMA)[stats].memory_usage(deep=True).sum()
+        assert typed * 3 < raw
@@ -0,0 +1,78 @@
+"""Tests for SeasonPlayerIndex (per-season O(1) player lookups)."""
+
+import pandas as pd
+import pytest
+
+from scripts.feature_projections.runner import _build_context, _build_player_team_history
+from scripts.feature_projections.season_index import SeasonPlayerIndex
+
+
+@pytest.fixture
+def frames():
+    history = pd.DataFrame([
+        {"player_id": "b", "season": 2023, "ppg": 10.0, "games_played": 17},
+        {"player_id": "a", "season": 2022, "ppg": 5.0, "games_played": 10},
+        {"player_id": "b", "season": 2024, "ppg": 12.0, "games_played": 16},
+        {"player_id": "a", "season": 2024, "ppg": 7.0, "games_played": 12},
+    ])
+    nfl = pd.DataFrame([
+        {"player_id": "a", "season": 2022, "recent_team": "KC", "targets": 30},
+        {"player_id": "b", "season": 2023, "recent_team": "BUF", "targets": 80},
+        {"player_id": "a", "season": 2024, "recent_team": "NYJ", "targets": 50},
+    ])
+    players = pd.DataFrame([
+        {"player_id_ref": "a", "position": "WR", "nfl_team": "NYJ", "birth_date": "2000-01-01"},
+        {"player_id_ref": "b", "position": "RB", "nfl_team": "BUF", "birth_date": None},
+        {"player_id_ref": "a", "position": "TE", "nfl_team": "DAL", "birth_date": None},
+    ])
+    return history, nfl, players
+
+
+class TestSeasonPlayerIndex:
+    def test_iter_history_matches_groupby(self, frames):
+        history, nfl, players = frames
+        idx = SeasonPlayerIndex(history, nfl, players)
+        expected = [(str(pid), g) for pid, g in history.groupby("player_id")]
+        got = list(idx.iter_history())
+        assert [pid for pid, _ in got] == [pid for pid, _ in expected]
+        for (_, g_exp), (_, g_got) in zip(expected, got):
+            pd.testing.assert_frame_equal(g_got, g_exp)
+
+    def test_nfl_slice_matches_mask(self, frames):
+        history, nfl, players = frames
+        idx = SeasonPlayerIndex(history, nfl, players)
+        pd.testing.assert_frame_equal(idx.nfl_stats("a"), nfl[nfl["player_id"] == "a"])
+        assert idx.nfl_stats("zzz").empty
+        assert list(idx.nfl_stats("zzz").columns) == list(nfl.columns)
+
+    def test_empty_nfl_frame(self, frames):
+        history, _, players = frames
+        idx = SeasonPlayerIndex(history, pd.DataFrame(), players)
+        assert idx.nfl_stats("a").empty
+        assert idx.team_history("a") == {}
+
+    def test_player_row_is_first_match(self, frames):
+        history, nfl, players = frames
+        idx = SeasonPlayerIndex(history, nfl, players)
+        assert idx.position("a") == "WR"
+        assert idx.player_row("b")["nfl_team"] == "BUF"
+        assert idx.player_row("missing") is None
+        assert idx.position("missing") is None
+
+    def test_team_history_matches_runner(self, frames):
+        history, nfl, players = frames
+        idx = SeasonPlayerIndex(history, nfl, players)
+        for pid in ("a", "b", "missing"):
+            assert idx.team_history(pid) == _build_player_team_history(pid, nfl)
+
+    def test_build_context_identical_with_index(self, frames):
+        history, nfl, players = frames
+        idx = SeasonPlayerIndex(history, nfl, players)
+        team_aggregates = {"NYJ": {"offense_rating": 1.5, "usage_by_season": {}}}
+        for pid in ("a", "b"):
+            position = idx.position(pid)
+            plain = _build_context(pid, position, players, nfl, 2025, team_aggregates)
+            indexed = _build_context(
+                pid, position, players, nfl, 2025, team_aggregates, season_index=idx
+            )
+            assert plain == indexed
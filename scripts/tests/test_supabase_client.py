@@ -0,0 +1,79 @@
+"""get_supabase_client(): one pooled client per process, and per-table PostgREST traffic."""
+
+import threading
+
+import httpx
+import pytest
+
+from scripts import config, db_client, db_io
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=[{"id": "a"}, {"id": "b"}],
+                          headers={"content-range": "0-1/2"})
+
+
+@pytest.fixture
+def pooled(monkeypatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://project.supabase.co")
+    monkeypatch.setenv("SUPABASE_KEY", "service-key")
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv(config.DATA_SOURCE_ENV, raising=False)
+    transports = []
+    build = db_client._pooled_http_client
+
+    def pooled_http_client():
+        transports.append(httpx.MockTransport(_handler))
+        return build(transport=transports[-1])
+
+    monkeypatch.setattr(db_client, "_pooled_http_client", pooled_http_client)
+    traffic = db_client.TrafficCounter()
+    monkeypatch.setattr(db_client, "POSTGREST_TRAFFIC", traffic)
+    db_client._shared_clients.clear()
+    db_io.QUERY_CACHE.invalidate()
+    yield transports, traffic
+    db_client._shared_clients.clear()
+    db_io.QUERY_CACHE.invalidate()
+
+
+class TestSharedClient:
+    def test_one_client_per_process(self, pooled, monkeypatch):
+        transports, _ = pooled
+        client = config.get_supabase_client()
+        assert config.get_supabase_client() is client and len(transports) == 1
+        monkeypatch.setattr(db_client.os, "getpid", lambda: -1)  # as in a forked worker
+        assert config.get_supabase_client() is not client and len(transports) == 2
+
+    def test_pool_settings(self):
+        http = db_client._pooled_http_client()
+        try:
+            assert http.timeout.connect == db_client.HTTP_CONNECT_TIMEOUT
+            assert http.timeout.read == db_client.HTTP_TIMEOUT
+        finally:
+            http.close()
+
+    def test_traffic_counted_per_table_across_threads(self, pooled):
+        _, traffic = pooled
+        client = config.get_supabase_client()
+
+        def read(table):
+            client.table(table).select("id").execute()
+
+        threads = [threading.Thread(target=read, args=(t,))
+                   for t in ["players"] * 6 + ["nfl_stats"] * 3]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.table("nfl_stats").upsert([{"id": "c"}]).execute()
+        counts = traffic.snapshot()
+        assert counts["players"][0] == 6 and counts["nfl_stats"][0] == 4
+        assert counts["players"][2] > 0 and counts["nfl_stats"][1] > 0
+        assert db_client.TrafficCounter.since({"players": counts["players"]}, counts) == {
+            "nfl_stats": counts["nfl_stats"]
+        }
+
+    def test_table_of(self):
+        assert db_client._table_of(httpx.URL("https://x.supabase.co/rest/v1/players?select=id")) == "players"
+        assert db_client._table_of(httpx.URL("https://x.supabase.co/rest/v1/rpc/fn")) == "rpc/fn"
+        assert db_client._table_of(httpx.URL("https://x.supabase.co/auth/v1/user")) == "/auth/v1/user"
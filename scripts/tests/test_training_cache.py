@@ -0,0 +1,143 @@
+"""Training-dataset cache: cached collection matches a fresh one, columns are reused."""
+
+import pandas as pd
+import pytest
+
+from scripts import config
+from scripts.feature_projections import runner, train_model, training_cache
+from scripts.feature_projections.training_cache import TrainingCache
+
+POSITIONS = ["QB", "RB", "WR", "TE"]
+PLAYERS = [
+    {"id": f"p{i}", "name": f"P{i}", "position": POSITIONS[i % 4], "nfl_team": ["KC", "BUF"][i % 2],
+     "birth_date": f"{1994 + i % 6}-03-01", "is_college": False}
+    for i in range(16)
+]
+DRAFT_CAPITAL = {
+    f"p{i}": {"season_drafted": 2020 + i % 4, "overall_pick": 5 + 11 * i, "round": 1 + i // 4}
+    for i in range(0, 16, 2)
+}
+SEASONS = [2023, 2024]
+
+
+def _history(bump: float = 0.0):
+    rows = []
+    for i, _ in enumerate(PLAYERS):
+        for season in range(2019, 2025):
+            ppg = 6.0 + i * 0.7 + (season - 2019) * 0.4 + (bump if i == 3 and season == 2024 else 0.0)
+            rows.append({"player_id": f"p{i}", "season": season, "ppg": ppg,
+                         "games_played": 10 + (i + season) % 8, "total_points": ppg * 14})
+    return pd.DataFrame(rows)
+
+
+def _nfl_stats():
+    rows = []
+    for i, _ in enumerate(PLAYERS):
+        for season in range(2019, 2025):
+            rows.append({"player_id": f"p{i}", "season": season, "recent_team": ["KC", "BUF"][i % 2],
+                         "games_played": 14, "total_points": 80.0 + i, "targets": 30 + 3 * i,
+                         "rushing_attempts": 10 + i, "receptions": 20 + i})
+    return pd.DataFrame(rows)
+
+
+class _SeasonStore:
+    def __init__(self, history):
+        self.history = history
+
+    def player_stats(self, seasons, columns=None):
+        return self.history[self.history["season"].isin(seasons)].reset_index(drop=True)
+
+    def nfl_stats(self, seasons, columns=None):
+        nfl = _nfl_stats()
+        return nfl[nfl["season"].isin(seasons)].reset_index(drop=True)
+
+
+@pytest.fixture
+def collect(monkeypatch, tmp_path):
+    state = {"history": _history()}
+    caches = []
+
+    def open_cache():
+        if not training_cache.cache_enabled():
+            return None
+        caches.append(TrainingCache(tmp_path / "training"))
+        return caches[-1]
+
+    monkeypatch.setattr(train_model, "get_supabase_client", lambda: object())
+    monkeypatch.setattr(train_model, "fetch_all_rows", lambda *_a, **_k: [dict(p) for p in PLAYERS])
+    monkeypatch.setattr(train_model, "get_season_data_store", lambda: _SeasonStore(state["history"]))
+    monkeypatch.setattr(train_model, "open_store", lambda: None)
+    monkeypatch.setattr(train_model, "get_all_starter_ids", lambda *_a, **_k: {})
+    monkeypatch.setattr(training_cache, "open_cache", open_cache)
+    monkeypatch.setattr(runner, "_build_draft_capital_lookup", lambda _sb: DRAFT_CAPITAL)
+    for fn in ("_build_depth_charts_lookup", "_build_red_zone_lookup",
+               "_build_ngs_passing_lookup", "_build_coaching_lookup"):
+        monkeypatch.setattr(runner, fn, lambda _sb: {})
+    monkeypatch.setattr(runner, "_build_vegas_lines_lookup", lambda _sb: ({}, {}))
+    monkeypatch.setattr(runner, "_build_qb_ecosystem_lookups", lambda _sb: ({}, {}))
+
+    def run(model_name, cached=True):
+        monkeypatch.setenv("OTTONEU_TRAINING_CACHE", "on" if cached else "off")
+        frame = train_model.collect_training_data(model_name, SEASONS)
+        return frame, caches[-1] if cached else None
+
+    return run, state
+
+
+def _records(frame):
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+class TestTrainingCache:
+    def test_cached_collection_matches_uncached(self, collect):
+        run, _ = collect
+        fresh, _ = run("v22_advanced_receiving", cached=False)
+        first, cache = run("v22_advanced_receiving")
+        assert cache.hits == 0 and cache.misses > 0
+        second, cache = run("v22_advanced_receiving")
+        assert cache.misses == 0 and cache.hits > 0
+        assert len(fresh) > 0
+        assert _records(first) == _records(fresh)
+        assert _records(second) == _records(fresh)
+        # Key order fixes the design-matrix layout: base first, then plan order.
+        assert list(second["feature_values"].iloc[0]) == list(fresh["feature_values"].iloc[0])
+
+    def test_added_features_are_the_only_columns_computed(self, collect):
+        run, _ = collect
+        run("v20_learned_usage")
+        frame, cache = run("v22_advanced_receiving")
+        extra = {"target_share_raw", "air_yards_share_raw", "wopr_raw", "racr_raw"}
+        positions = frame.groupby("season")["position"].nunique().sum()
+        assert cache.misses == len(extra) * positions
+        fresh, _ = run("v22_advanced_receiving", cached=False)
+        assert _records(frame) == _records(fresh)
+
+    def test_residual_rows_keep_seasons_since_draft(self, collect):
+        run, _ = collect
+        fresh, _ = run("v25_draft_capital_residual", cached=False)
+        run("v25_draft_capital_residual")
+        again, cache = run("v25_draft_capital_residual")
+        assert cache.misses == 0
+        assert fresh["seasons_since_draft"].notna().any()
+        assert _records(again) == _records(fresh)
+
+    def test_changed_data_misses(self, collect):
+        run, state = collect
+        run("v20_learned_usage")
+        state["history"] = _history(bump=2.5)
+        frame, cache = run("v20_learned_usage")
+        assert cache.misses > 0
+        fresh, _ = run("v20_learned_usage", cached=False)
+        assert _records(frame) == _records(fresh)
+
+    def test_changed_scoring_settings_miss(self, collect, monkeypatch):
+        run, _ = collect
+        run("v20_learned_usage")
+        monkeypatch.setitem(config.SCORING_SETTINGS, "receptions", config.SCORING_SETTINGS["receptions"] + 0.5)
+        _, cache = run("v20_learned_usage")
+        assert cache.hits == 0 and cache.misses > 0
+
+    def test_disabled_cache_writes_nothing(self, collect, tmp_path):
+        run, _ = collect
+        run("v20_learned_usage", cached=False)
+        assert not (tmp_path / "training").exists()
@@ -194,7 +194,7 @@ def upsert_college_projections():
     supabase = get_supabase_client()
     # Paginated fetch — the players table exceeds the 1000-row default page size
     # and a plain .execute() silently truncates, dropping newly-inserted rookies.
-    from scripts.config import fetch_all_rows
+    from scripts.db_io import fetch_all_rows
     players_data = fetch_all_rows(supabase, 'players', 'id, position, is_college')
     players_df = pd.DataFrame(players_data)
     players_df = players_df.rename(columns={'id': 'player_id_ref'})
@@ -324,9 +324,10 @@ def update_projections() -> None:
     active_model = get_active_model_name()
     print(f"Generating projections across seasons {TARGET_SEASONS} using model '{active_model}'...")
 
-    # 1. Run the active model for the target seasons.
-    run_count = run_model(active_model, TARGET_SEASONS)
-    print(f"Generated {run_count} model projections.")
+    # 1. Run the active model for the target seasons. Incremental: only
+    # players whose inputs changed are recomputed, only changed rows written.
+    run_count = run_model(active_model, TARGET_SEASONS, incremental=True)
+    print(f"Upserted {run_count} changed model projections.")
 
     # 2. Promote into player_projections.
     promoted = promote_model(active_model)
@@ -369,6 +369,7 @@ const LARGE_TABLES = [
   "nfl_stats",
   "depth_charts",
   "model_projections",
+  "model_projection_features",
 ];
 
 /**